@@ -6,10 +6,20 @@ functionality for API routers.
 """
 
 import logging
+import uuid
+from typing import Iterable, Mapping, Optional
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import BaseModel
 
-from helpers import ApiToken
+from helpers import (AuthPrincipal, ResponseCache, ResponseCacheEntry,
+                     SessionContext)
+from helpers.json_response import JSONBytesResponse
+from helpers.response_cache import (get_change_version, get_etag,
+                                    is_etag_matched)
+
+RESPONSE_CACHE_CONTROL = "private, no-cache"
 
 
 class BaseRouter():
@@ -20,6 +30,10 @@ class BaseRouter():
     - implementation_check: Checks if a method is implemented.
     - authorization_check: Performs authorization check based on
         whether the API is public or requires an API key.
+    - response_cache_check: Answers a request to a cached endpoint
+        from its ETag or the response cache.
+    - response_cache_store: Returns the response of a cached
+        endpoint with its ETag and stores it in the response cache.
     """
 
     @staticmethod
@@ -45,29 +59,139 @@ class BaseRouter():
             detail="This method is not implemented.")
 
     @staticmethod
-    def authorization_check(is_public: bool, api_key: str) -> dict:
+    def authorization_check(
+        is_public: bool,
+        auth_principal: Optional[AuthPrincipal]
+    ) -> Mapping:
         """
         Performs authorization check based on whether the API is public
         or requires an API key.
 
         Parameters:
         - is_public (bool): Flag indicating whether the API is public.
-        - api_key (str): API key for authorization.
+        - auth_principal (AuthPrincipal): The principal of the API key,
+            from the get_auth_principal dependency, or None if the
+            API key is invalid or missing.
 
         Raises:
         - HTTPException: If the API is not public and the API key is
             invalid or missing (HTTP status code 401).
 
         Returns:
-        - auth_dict (dict): Dictionary containing authorization information.
+        - auth_dict (Mapping): The principal, a read-only mapping
+            of the authorization information.
         """
         if is_public is True:
             return {}
         logging.info("Authorization Required...")
-        auth_dict = ApiToken.validate_token(api_key)
-        if auth_dict is None or len(auth_dict) == 0:
+        if auth_principal is None or len(auth_principal) == 0:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Unauthorized.")
-        logging.info("auth_dict: %s", str(auth_dict))
-        return auth_dict
+        logging.info("auth_dict: %s", auth_principal)
+        return auth_principal
+
+    @staticmethod
+    async def response_cache_check(
+        request: Request,
+        session_context: SessionContext,
+        context_code: uuid.UUID,
+        request_model: Optional[BaseModel] = None,
+        context_model: Optional[type] = None,
+        table_model_list: Iterable[type] = ()
+    ) -> ResponseCacheEntry:
+        """
+        Computes the ETag of a request to a cached endpoint from the
+        change version of the context object and the tables the
+        response is built from, without running the endpoint.
+
+        The cache key is the route, the customer and roles of the
+        API key, the context code and the normalized request model.
+
+        Parameters:
+        - request (Request): The request.
+        - session_context (SessionContext): The session context.
+        - context_code (uuid.UUID): The checked context code.
+        - request_model (BaseModel): The request model, if any.
+        - context_model (type): The model of the context object,
+            whose row version is part of the ETag, or None.
+        - table_model_list (Iterable[type]): The models of the
+            tables whose table version is part of the ETag.
+
+        Returns:
+        - ResponseCacheEntry: The key and ETag of the request. Its
+            response is a 304 Not Modified response when the
+            If-None-Match header has the ETag, or the cached
+            response when the response cache has it.
+        """
+        table_model_list = list(table_model_list)
+        if context_model is None and len(table_model_list) == 0:
+            return ResponseCacheEntry()
+
+        request_values = None
+        if request_model is not None:
+            request_values = request_model.model_dump(mode="json")
+
+        key = ResponseCache.get_key(
+            request.url.path,
+            session_context.customer_code,
+            session_context.role_name_csv,
+            context_code,
+            request_values)
+
+        change_version = await get_change_version(
+            session_context.get_read_session(),
+            context_model,
+            context_code,
+            table_model_list)
+
+        etag = get_etag(key, change_version)
+        headers = {"ETag": etag, "Cache-Control": RESPONSE_CACHE_CONTROL}
+
+        if is_etag_matched(request.headers.get("if-none-match"), etag):
+            logging.info("Response not modified. ETag: %s", etag)
+            return ResponseCacheEntry(
+                key, etag, Response(status_code=304, headers=headers))
+
+        content = ResponseCache.get(key, etag)
+        if content is not None:
+            logging.info("Response cache hit. ETag: %s", etag)
+            return ResponseCacheEntry(
+                key, etag, JSONBytesResponse(content, headers=headers))
+
+        return ResponseCacheEntry(key, etag)
+
+    @staticmethod
+    def response_cache_store(
+        response_cache_entry: ResponseCacheEntry,
+        is_success: bool,
+        response_data: bytes
+    ) -> Response:
+        """
+        Returns the serialized response of an endpoint. When the
+        request is cached and the response is successful, the
+        response has the ETag and is stored in the response cache.
+
+        Parameters:
+        - response_cache_entry (ResponseCacheEntry): The entry from
+            response_cache_check.
+        - is_success (bool): True if the response is successful.
+        - response_data (bytes): The serialized response.
+
+        Returns:
+        - Response: The JSON response.
+        """
+        if not response_cache_entry.etag or is_success is not True:
+            return JSONBytesResponse(response_data)
+
+        ResponseCache.set(
+            response_cache_entry.key,
+            response_cache_entry.etag,
+            response_data)
+
+        return JSONBytesResponse(
+            response_data,
+            headers={
+                "ETag": response_cache_entry.etag,
+                "Cache-Control": RESPONSE_CACHE_CONTROL,
+            })
@@ -17,7 +17,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import apis.models as api_models
 import apis.models.init as api_init_models
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import AuthPrincipal, SessionContext, get_auth_principal
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -64,7 +66,7 @@ class LandAddPlantRouter(BaseRouter):
     async def request_get_init(
         land_code: uuid.UUID = Path(..., description="Land Code"),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Initialize the Land Add Plant process.
@@ -72,7 +74,7 @@ class LandAddPlantRouter(BaseRouter):
         Parameters:
         - land_code: The code of the land to add a plant.
         - session: Database session dependency.
-        - api_key: API key for authorization.
+        - auth_principal: The principal of the API key.
 
         Returns:
         - response: JSON response with initialization details.
@@ -89,7 +91,7 @@ class LandAddPlantRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             LandAddPlantRouterConfig
-            .is_public, api_key)
+            .is_public, auth_principal)
 
         init_request = (
             api_init_models.LandAddPlantInitObjWFGetInitModelRequest()
@@ -134,17 +136,13 @@ class LandAddPlantRouter(BaseRouter):
                 )
                 response.message = f"{e} traceback: {traceback_string}"
                 logging.info(API_LOG_ERROR_FORMAT, response.message)
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "LandAddPlantRouter.request_get_init"
-            " get result:%s",
-            response_data)
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "LandAddPlantRouter.request_get_init"
+                " get result:%s",
+                response_data.decode("utf-8"))
+        return JSONBytesResponse(response_data)
 ##GENTrainingBlock[caseisPostWithIdAvailable]Start
 ##GENLearn[isPostWithIdAvailable=true]Start
 
@@ -162,7 +160,7 @@ class LandAddPlantRouter(BaseRouter):
         request_model: (
             api_models.LandAddPlantPostModelRequest),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Land Add Plant api post endpoint
@@ -172,7 +170,7 @@ class LandAddPlantRouter(BaseRouter):
         - request_model: The request model containing
             the details of the item to be added.
         - session: Database session dependency.
-        - api_key: API key for authorization.
+        - auth_principal: The principal of the API key.
 
         Returns:
         - response: JSON response with the result of the operation.
@@ -191,7 +189,7 @@ class LandAddPlantRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             LandAddPlantRouterConfig.is_public,
-            api_key)
+            auth_principal)
 
         # Start a transaction
         async with session:
@@ -242,12 +240,13 @@ class LandAddPlantRouter(BaseRouter):
                     await session.commit()
                 else:
                     await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "LandAddPlantRouter."
-            "request_post_with_id "
-            "get result:%s",
-            response_data)
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "LandAddPlantRouter."
+                "request_post_with_id "
+                "get result:%s",
+                response_data.decode("utf-8"))
+        return JSONBytesResponse(response_data)
 ##GENLearn[isPostWithIdAvailable=true]End
 ##GENTrainingBlock[caseisPostWithIdAvailable]End
@@ -21,22 +21,33 @@ the following endpoints:
         {land_code}/to-csv:
     Retrieve the Land Plant List
     Report as a CSV file.
+- GET /api/v1_0/land-plant-list/...
+        {land_code}/to-csv-stream:
+    Stream the full Land Plant List
+    Report as a CSV file.
 """
 
 import logging
+import os
 import tempfile  # noqa: F401
 import traceback
 import uuid
 
-from fastapi import APIRouter, Depends, Path  # noqa: F401
-from fastapi.responses import FileResponse  # noqa: F401
+from fastapi import APIRouter, Depends, Path, Request  # noqa: F401
+from fastapi.responses import (FileResponse,  # noqa: F401
+                               JSONResponse, StreamingResponse)
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
 
 import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
+import models
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import (AuthPrincipal, ResponseCacheEntry, SessionContext,
+                     get_auth_principal)
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -66,6 +77,9 @@ class LandPlantListRouterConfig():  # pylint: disable=too-few-public-methods
     is_delete_available: bool = False
     is_public: bool = False
 
+    # response cache, see BaseRouter.response_cache_check
+    get_init_cache_context_model: type = models.Land
+
 
 class LandPlantListRouter(BaseRouter):
     """
@@ -87,18 +101,20 @@ class LandPlantListRouter(BaseRouter):
         ),
         summary="Land Plant List Init Page")
     async def request_get_init(
+        request: Request,
         land_code: uuid.UUID = Path(..., description=LAND_CODE),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the initialization data for the
         Land Plant List page.
 
         Args:
+            request (Request): The request.
             land_code (uuid.UUID): The UUID of the land.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             LandPlantListInitReportGetInitModelResponse:
@@ -120,14 +136,16 @@ class LandPlantListRouter(BaseRouter):
         )
 
         auth_dict = BaseRouter.authorization_check(
-            LandPlantListRouterConfig.is_public, api_key)
+            LandPlantListRouterConfig.is_public, auth_principal)
 
         init_request = (
             api_init_models.
             LandPlantListInitReportGetInitModelRequest()
         )
 
-        # Start a transaction
+        response_cache_entry = ResponseCacheEntry()
+
+        # Start a read-only transaction
         async with session:
             try:
                 logging.info(
@@ -139,6 +157,16 @@ class LandPlantListRouter(BaseRouter):
                     "LandCode",
                     land_code
                 )
+                response_cache_entry = \
+                    await BaseRouter.response_cache_check(
+                        request,
+                        session_context,
+                        land_code,
+                        context_model=(
+                            LandPlantListRouterConfig
+                            .get_init_cache_context_model))
+                if response_cache_entry.response is not None:
+                    return response_cache_entry.response
 
                 logging.info(
                     "LandPlantListRouter."
@@ -167,18 +195,17 @@ class LandPlantListRouter(BaseRouter):
                 traceback_string = "".join(
                     traceback.format_tb(e.__traceback__))
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "LandPlantListRouter."
-            "request_get_init "
-            "result:%s",
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "LandPlantListRouter."
+                "request_get_init "
+                "result:%s",
+                response_data.decode("utf-8"))
+        return BaseRouter.response_cache_store(
+            response_cache_entry,
+            response.success,
             response_data)
-        return response
 ##GENLearn[isGetInitAvailable=true]End
 ##GENTrainingBlock[caseisGetInitAvailable]End
 ##GENTrainingBlock[caseisGetAvailable]Start
@@ -203,7 +230,7 @@ class LandPlantListRouter(BaseRouter):
             api_models.LandPlantListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the Land Plant List
@@ -215,7 +242,7 @@ class LandPlantListRouter(BaseRouter):
             LandPlantListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             api_models.LandPlantListGetModelResponse:
@@ -239,9 +266,9 @@ class LandPlantListRouter(BaseRouter):
                     .LandPlantListGetModelResponse())
 
         auth_dict = BaseRouter.authorization_check(
-            LandPlantListRouterConfig.is_public, api_key)
+            LandPlantListRouterConfig.is_public, auth_principal)
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -279,19 +306,15 @@ class LandPlantListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "LandPlantListRouter"
-            ".request_get_with_id "
-            "result:%s",
-            response_data
-        )
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "LandPlantListRouter"
+                ".request_get_with_id "
+                "result:%s",
+                response_data.decode("utf-8")
+            )
+        return JSONBytesResponse(response_data)
 ##GENLearn[isGetWithIdAvailable=true]End
 ##GENTrainingBlock[caseisGetWithIdAvailable]End
 ##GENTrainingBlock[caseisGetToCsvAvailable]Start
@@ -309,7 +332,7 @@ class LandPlantListRouter(BaseRouter):
             api_models.LandPlantListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Retrieve the Land Plant List
@@ -321,7 +344,7 @@ class LandPlantListRouter(BaseRouter):
             LandPlantListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             FileResponse: The CSV file containing the
@@ -343,7 +366,7 @@ class LandPlantListRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             LandPlantListRouterConfig
-            .is_public, api_key)
+            .is_public, auth_principal)
 
         tmp_file_path = ""
 
@@ -355,7 +378,7 @@ class LandPlantListRouter(BaseRouter):
         ) as tmp_file:
             tmp_file_path = tmp_file.name
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -398,27 +421,137 @@ class LandPlantListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + " traceback:" + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
+        if is_payload_logged():
+            response_data = response.model_dump_json()
+            logging.info(
+                "LandPlantListRouter."
+                "request_get_with_id_to_csv "
+                "get result:%s",
+                response_data
+            )
+
+        output_file_name = (
+            "land_plant_list_"
+            f"{str(land_code)}_{str(uuid.uuid4())}.csv"
+        )
+        return FileResponse(
+            tmp_file_path,
+            media_type='text/csv',
+            filename=output_file_name,
+            background=BackgroundTask(os.remove, tmp_file_path))
+
+    @staticmethod
+    @router.get(
+        "/api/v1_0/land-plant-list"
+        "/{land_code}/to-csv-stream",
+        response_class=StreamingResponse,
+        summary="Land Plant List Report to CSV Stream")
+    async def request_get_with_id_to_csv_stream(
+        land_code: uuid.UUID = Path(..., description=LAND_CODE),
+        request_model:
+            api_models.LandPlantListGetModelRequest = (
+                Depends()),
+        session: AsyncSession = Depends(get_db),
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
+    ):
+        """
+        Stream every row of the Land Plant List
+        Report matching the request filters as a CSV file.
+        The paging fields of the request are ignored.
+
+        Rows are read from the database in chunks while the
+        response is sent, so memory use does not grow with
+        the number of rows and no temporary file is written.
+
+        Args:
+            land_code (uuid.UUID): The unique identifier for the land.
+            request_model (api_models.
+            LandPlantListGetModelRequest):
+                The request model for the API.
+            session (AsyncSession): The database session.
+            auth_principal (AuthPrincipal): The principal of the API key.
+
+        Returns:
+            StreamingResponse: The CSV content of the
+            Land Plant List Report.
+        """
+
         logging.info(
             "LandPlantListRouter."
-            "request_get_with_id_to_csv "
-            "get result:%s",
-            response_data
+            "request_get_with_id_to_csv_stream "
+            "start. landCode:%s",
+            land_code
         )
+        auth_dict = BaseRouter.implementation_check(
+            LandPlantListRouterConfig
+            .is_get_to_csv_available)
+
+        response = (api_models
+                    .LandPlantListGetModelResponse())
+
+        auth_dict = BaseRouter.authorization_check(
+            LandPlantListRouterConfig
+            .is_public, auth_principal)
+
+        try:
+            session_context = SessionContext(auth_dict, session)
+            land_code = session_context.check_context_code(
+                "LandCode",
+                land_code
+            )
+            logging.info(request_model.__dict__)
+            report_manager = \
+                reports.ReportManagerLandPlantList(
+                    session_context)
+            csv_stream = report_manager.stream_csv(
+                land_code,
+                request_model.flavor_code,
+                request_model.some_int_val,
+                request_model.some_big_int_val,
+                request_model.some_float_val,
+                request_model.some_bit_val,
+                request_model.is_edit_allowed,
+                request_model.is_delete_allowed,
+                request_model.some_decimal_val,
+                request_model.some_min_utc_date_time_val,
+                request_model.some_min_date_val,
+                request_model.some_money_val,
+                request_model.some_n_var_char_val,
+                request_model.some_var_char_val,
+                request_model.some_text_val,
+                request_model.some_phone_number,
+                request_model.some_email_address,
+# endset  # noqa: E122
+                request_model.order_by_column_name,
+                request_model.order_by_descending
+            )
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            logging.info(
+                EXCEPTION_OCCURRED,
+                e.__class__.__name__,
+                e
+            )
+            response.request = request_model
+            response.success = False
+            traceback_string = "".join(
+                traceback.format_tb(e.__traceback__)
+            )
+            response.message = str(e) + TRACEBACK + traceback_string
+            logging.info(API_LOG_ERROR_FORMAT, response.message)
+            return JSONResponse(
+                content=response.model_dump(mode="json", by_alias=True))
 
         output_file_name = (
             "land_plant_list_"
             f"{str(land_code)}_{str(uuid.uuid4())}.csv"
         )
-        return FileResponse(
-            tmp_file_path,
+        return StreamingResponse(
+            csv_stream,
             media_type='text/csv',
-            filename=output_file_name)
+            headers={
+                "Content-Disposition":
+                    f'attachment; filename="{output_file_name}"'
+            })
 ##GENLearn[isGetToCsvAvailable=true]End
 ##GENTrainingBlock[caseisGetToCsvAvailable]End
 ##GENTrainingBlock[caseisPostAvailable]Start
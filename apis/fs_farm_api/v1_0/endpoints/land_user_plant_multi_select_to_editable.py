@@ -36,7 +36,9 @@ import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import AuthPrincipal, SessionContext, get_auth_principal
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -90,7 +92,7 @@ class LandUserPlantMultiSelectToEditableRouter(BaseRouter):
         request_model: (
             api_models.LandUserPlantMultiSelectToEditablePostModelRequest),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Land User Plant Multi Select To Editable api post endpoint
@@ -100,7 +102,7 @@ class LandUserPlantMultiSelectToEditableRouter(BaseRouter):
         - request_model: The request model containing
             the details of the item to be added.
         - session: Database session dependency.
-        - api_key: API key for authorization.
+        - auth_principal: The principal of the API key.
 
         Returns:
         - response: JSON response with the result of the operation.
@@ -119,7 +121,7 @@ class LandUserPlantMultiSelectToEditableRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             LandUserPlantMultiSelectToEditableRouterConfig.is_public,
-            api_key)
+            auth_principal)
 
         # Start a transaction
         async with session:
@@ -170,10 +172,11 @@ class LandUserPlantMultiSelectToEditableRouter(BaseRouter):
                     await session.commit()
                 else:
                     await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "LandUserPlantMultiSelectToEditableRouter."
-            "request_post_with_id "
-            "get result:%s",
-            response_data)
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "LandUserPlantMultiSelectToEditableRouter."
+                "request_post_with_id "
+                "get result:%s",
+                response_data.decode("utf-8"))
+        return JSONBytesResponse(response_data)
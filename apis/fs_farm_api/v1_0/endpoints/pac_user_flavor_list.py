@@ -28,15 +28,19 @@ import tempfile  # noqa: F401
 import traceback
 import uuid
 
-from fastapi import APIRouter, Depends, Path  # noqa: F401
+from fastapi import APIRouter, Depends, Path, Request  # noqa: F401
 from fastapi.responses import FileResponse  # noqa: F401
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
+import models
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import (AuthPrincipal, ResponseCacheEntry, SessionContext,
+                     get_auth_principal)
+from helpers.json_response import dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -66,6 +70,12 @@ class PacUserFlavorListRouterConfig():  # pylint: disable=too-few-public-methods
     is_delete_available: bool = False
     is_public: bool = False
 
+    # response cache, see BaseRouter.response_cache_check
+    get_init_cache_context_model: type = models.Pac
+    get_with_id_cache_table_list: tuple = (
+        models.Pac,
+        models.Flavor)
+
 
 class PacUserFlavorListRouter(BaseRouter):
     """
@@ -86,18 +96,20 @@ class PacUserFlavorListRouter(BaseRouter):
         ),
         summary="Pac User Flavor List Init Page")
     async def request_get_init(
+        request: Request,
         pac_code: uuid.UUID = Path(..., description=PAC_CODE),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the initialization data for the
         Pac User Flavor List page.
 
         Args:
+            request (Request): The request.
             pac_code (uuid.UUID): The UUID of the pac.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             PacUserFlavorListInitReportGetInitModelResponse:
@@ -119,14 +131,16 @@ class PacUserFlavorListRouter(BaseRouter):
         )
 
         auth_dict = BaseRouter.authorization_check(
-            PacUserFlavorListRouterConfig.is_public, api_key)
+            PacUserFlavorListRouterConfig.is_public, auth_principal)
 
         init_request = (
             api_init_models.
             PacUserFlavorListInitReportGetInitModelRequest()
         )
 
-        # Start a transaction
+        response_cache_entry = ResponseCacheEntry()
+
+        # Start a read-only transaction
         async with session:
             try:
                 logging.info(
@@ -138,6 +152,16 @@ class PacUserFlavorListRouter(BaseRouter):
                     "PacCode",
                     pac_code
                 )
+                response_cache_entry = \
+                    await BaseRouter.response_cache_check(
+                        request,
+                        session_context,
+                        pac_code,
+                        context_model=(
+                            PacUserFlavorListRouterConfig
+                            .get_init_cache_context_model))
+                if response_cache_entry.response is not None:
+                    return response_cache_entry.response
 
                 logging.info(
                     "PacUserFlavorListRouter."
@@ -166,18 +190,17 @@ class PacUserFlavorListRouter(BaseRouter):
                 traceback_string = "".join(
                     traceback.format_tb(e.__traceback__))
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserFlavorListRouter."
-            "request_get_init "
-            "result:%s",
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PacUserFlavorListRouter."
+                "request_get_init "
+                "result:%s",
+                response_data.decode("utf-8"))
+        return BaseRouter.response_cache_store(
+            response_cache_entry,
+            response.success,
             response_data)
-        return response
 
 
     @staticmethod
@@ -190,24 +213,26 @@ class PacUserFlavorListRouter(BaseRouter):
         ),
         summary="Pac User Flavor List Report")
     async def request_get_with_id(
+        request: Request,
         pac_code: uuid.UUID = Path(..., description=PAC_CODE),
         request_model:
             api_models.PacUserFlavorListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the Pac User Flavor List
         Report for a specific pac code.
 
         Args:
+            request (Request): The request.
             pac_code (uuid.UUID): The unique identifier for the pac.
             request_model (api_models.
             PacUserFlavorListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             api_models.PacUserFlavorListGetModelResponse:
@@ -231,9 +256,11 @@ class PacUserFlavorListRouter(BaseRouter):
                     .PacUserFlavorListGetModelResponse())
 
         auth_dict = BaseRouter.authorization_check(
-            PacUserFlavorListRouterConfig.is_public, api_key)
+            PacUserFlavorListRouterConfig.is_public, auth_principal)
 
-        # Start a transaction
+        response_cache_entry = ResponseCacheEntry()
+
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -241,6 +268,17 @@ class PacUserFlavorListRouter(BaseRouter):
                     "PacCode",
                     pac_code
                 )
+                response_cache_entry = \
+                    await BaseRouter.response_cache_check(
+                        request,
+                        session_context,
+                        pac_code,
+                        request_model,
+                        table_model_list=(
+                            PacUserFlavorListRouterConfig
+                            .get_with_id_cache_table_list))
+                if response_cache_entry.response is not None:
+                    return response_cache_entry.response
                 logging.info(
                     "PacUserFlavorListRouter"
                     ".request_get_with_id "
@@ -271,19 +309,18 @@ class PacUserFlavorListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserFlavorListRouter"
-            ".request_get_with_id "
-            "result:%s",
-            response_data
-        )
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PacUserFlavorListRouter"
+                ".request_get_with_id "
+                "result:%s",
+                response_data.decode("utf-8")
+            )
+        return BaseRouter.response_cache_store(
+            response_cache_entry,
+            response.success,
+            response_data)
 
 
     @staticmethod
@@ -298,7 +335,7 @@ class PacUserFlavorListRouter(BaseRouter):
             api_models.PacUserFlavorListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Retrieve the Pac User Flavor List
@@ -310,7 +347,7 @@ class PacUserFlavorListRouter(BaseRouter):
             PacUserFlavorListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             FileResponse: The CSV file containing the
@@ -332,7 +369,7 @@ class PacUserFlavorListRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             PacUserFlavorListRouterConfig
-            .is_public, api_key)
+            .is_public, auth_principal)
 
         tmp_file_path = ""
 
@@ -344,7 +381,7 @@ class PacUserFlavorListRouter(BaseRouter):
         ) as tmp_file:
             tmp_file_path = tmp_file.name
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -387,18 +424,14 @@ class PacUserFlavorListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + " traceback:" + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserFlavorListRouter."
-            "request_get_with_id_to_csv "
-            "get result:%s",
-            response_data
-        )
+        if is_payload_logged():
+            response_data = response.model_dump_json()
+            logging.info(
+                "PacUserFlavorListRouter."
+                "request_get_with_id_to_csv "
+                "get result:%s",
+                response_data
+            )
 
         output_file_name = (
             "pac_user_flavor_list_"
@@ -28,15 +28,19 @@ import tempfile  # noqa: F401
 import traceback
 import uuid
 
-from fastapi import APIRouter, Depends, Path  # noqa: F401
+from fastapi import APIRouter, Depends, Path, Request  # noqa: F401
 from fastapi.responses import FileResponse  # noqa: F401
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
+import models
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import (AuthPrincipal, ResponseCacheEntry, SessionContext,
+                     get_auth_principal)
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -66,6 +70,9 @@ class PacUserTacListRouterConfig():  # pylint: disable=too-few-public-methods
     is_delete_available: bool = False
     is_public: bool = False
 
+    # response cache, see BaseRouter.response_cache_check
+    get_init_cache_context_model: type = models.Pac
+
 
 class PacUserTacListRouter(BaseRouter):
     """
@@ -86,18 +93,20 @@ class PacUserTacListRouter(BaseRouter):
         ),
         summary="Pac User Tac List Init Page")
     async def request_get_init(
+        request: Request,
         pac_code: uuid.UUID = Path(..., description=PAC_CODE),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the initialization data for the
         Pac User Tac List page.
 
         Args:
+            request (Request): The request.
             pac_code (uuid.UUID): The UUID of the pac.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             PacUserTacListInitReportGetInitModelResponse:
@@ -119,14 +128,16 @@ class PacUserTacListRouter(BaseRouter):
         )
 
         auth_dict = BaseRouter.authorization_check(
-            PacUserTacListRouterConfig.is_public, api_key)
+            PacUserTacListRouterConfig.is_public, auth_principal)
 
         init_request = (
             api_init_models.
             PacUserTacListInitReportGetInitModelRequest()
         )
 
-        # Start a transaction
+        response_cache_entry = ResponseCacheEntry()
+
+        # Start a read-only transaction
         async with session:
             try:
                 logging.info(
@@ -138,6 +149,16 @@ class PacUserTacListRouter(BaseRouter):
                     "PacCode",
                     pac_code
                 )
+                response_cache_entry = \
+                    await BaseRouter.response_cache_check(
+                        request,
+                        session_context,
+                        pac_code,
+                        context_model=(
+                            PacUserTacListRouterConfig
+                            .get_init_cache_context_model))
+                if response_cache_entry.response is not None:
+                    return response_cache_entry.response
 
                 logging.info(
                     "PacUserTacListRouter."
@@ -166,18 +187,17 @@ class PacUserTacListRouter(BaseRouter):
                 traceback_string = "".join(
                     traceback.format_tb(e.__traceback__))
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserTacListRouter."
-            "request_get_init "
-            "result:%s",
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PacUserTacListRouter."
+                "request_get_init "
+                "result:%s",
+                response_data.decode("utf-8"))
+        return BaseRouter.response_cache_store(
+            response_cache_entry,
+            response.success,
             response_data)
-        return response
 
 
     @staticmethod
@@ -195,7 +215,7 @@ class PacUserTacListRouter(BaseRouter):
             api_models.PacUserTacListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the Pac User Tac List
@@ -207,7 +227,7 @@ class PacUserTacListRouter(BaseRouter):
             PacUserTacListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             api_models.PacUserTacListGetModelResponse:
@@ -231,9 +251,9 @@ class PacUserTacListRouter(BaseRouter):
                     .PacUserTacListGetModelResponse())
 
         auth_dict = BaseRouter.authorization_check(
-            PacUserTacListRouterConfig.is_public, api_key)
+            PacUserTacListRouterConfig.is_public, auth_principal)
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -271,19 +291,15 @@ class PacUserTacListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserTacListRouter"
-            ".request_get_with_id "
-            "result:%s",
-            response_data
-        )
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PacUserTacListRouter"
+                ".request_get_with_id "
+                "result:%s",
+                response_data.decode("utf-8")
+            )
+        return JSONBytesResponse(response_data)
 
 
     @staticmethod
@@ -298,7 +314,7 @@ class PacUserTacListRouter(BaseRouter):
             api_models.PacUserTacListGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Retrieve the Pac User Tac List
@@ -310,7 +326,7 @@ class PacUserTacListRouter(BaseRouter):
             PacUserTacListGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             FileResponse: The CSV file containing the
@@ -332,7 +348,7 @@ class PacUserTacListRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             PacUserTacListRouterConfig
-            .is_public, api_key)
+            .is_public, auth_principal)
 
         tmp_file_path = ""
 
@@ -344,7 +360,7 @@ class PacUserTacListRouter(BaseRouter):
         ) as tmp_file:
             tmp_file_path = tmp_file.name
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -387,18 +403,14 @@ class PacUserTacListRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + " traceback:" + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PacUserTacListRouter."
-            "request_get_with_id_to_csv "
-            "get result:%s",
-            response_data
-        )
+        if is_payload_logged():
+            response_data = response.model_dump_json()
+            logging.info(
+                "PacUserTacListRouter."
+                "request_get_with_id_to_csv "
+                "get result:%s",
+                response_data
+            )
 
         output_file_name = (
             "pac_user_tac_list_"
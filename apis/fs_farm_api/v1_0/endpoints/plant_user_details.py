@@ -28,15 +28,19 @@ import tempfile  # noqa: F401
 import traceback
 import uuid
 
-from fastapi import APIRouter, Depends, Path  # noqa: F401
+from fastapi import APIRouter, Depends, Path, Request  # noqa: F401
 from fastapi.responses import FileResponse  # noqa: F401
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
+import models
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import (AuthPrincipal, ResponseCacheEntry, SessionContext,
+                     get_auth_principal)
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -66,6 +70,9 @@ class PlantUserDetailsRouterConfig():  # pylint: disable=too-few-public-methods
     is_delete_available: bool = False
     is_public: bool = False
 
+    # response cache, see BaseRouter.response_cache_check
+    get_init_cache_context_model: type = models.Plant
+
 
 class PlantUserDetailsRouter(BaseRouter):
     """
@@ -86,18 +93,20 @@ class PlantUserDetailsRouter(BaseRouter):
         ),
         summary="Plant User Details Init Page")
     async def request_get_init(
+        request: Request,
         plant_code: uuid.UUID = Path(..., description=PLANT_CODE),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the initialization data for the
         Plant User Details page.
 
         Args:
+            request (Request): The request.
             plant_code (uuid.UUID): The UUID of the plant.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             PlantUserDetailsInitReportGetInitModelResponse:
@@ -119,14 +128,16 @@ class PlantUserDetailsRouter(BaseRouter):
         )
 
         auth_dict = BaseRouter.authorization_check(
-            PlantUserDetailsRouterConfig.is_public, api_key)
+            PlantUserDetailsRouterConfig.is_public, auth_principal)
 
         init_request = (
             api_init_models.
             PlantUserDetailsInitReportGetInitModelRequest()
         )
 
-        # Start a transaction
+        response_cache_entry = ResponseCacheEntry()
+
+        # Start a read-only transaction
         async with session:
             try:
                 logging.info(
@@ -138,6 +149,16 @@ class PlantUserDetailsRouter(BaseRouter):
                     "PlantCode",
                     plant_code
                 )
+                response_cache_entry = \
+                    await BaseRouter.response_cache_check(
+                        request,
+                        session_context,
+                        plant_code,
+                        context_model=(
+                            PlantUserDetailsRouterConfig
+                            .get_init_cache_context_model))
+                if response_cache_entry.response is not None:
+                    return response_cache_entry.response
 
                 logging.info(
                     "PlantUserDetailsRouter."
@@ -166,18 +187,17 @@ class PlantUserDetailsRouter(BaseRouter):
                 traceback_string = "".join(
                     traceback.format_tb(e.__traceback__))
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PlantUserDetailsRouter."
-            "request_get_init "
-            "result:%s",
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PlantUserDetailsRouter."
+                "request_get_init "
+                "result:%s",
+                response_data.decode("utf-8"))
+        return BaseRouter.response_cache_store(
+            response_cache_entry,
+            response.success,
             response_data)
-        return response
 
 
     @staticmethod
@@ -195,7 +215,7 @@ class PlantUserDetailsRouter(BaseRouter):
             api_models.PlantUserDetailsGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the Plant User Details
@@ -207,7 +227,7 @@ class PlantUserDetailsRouter(BaseRouter):
             PlantUserDetailsGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             api_models.PlantUserDetailsGetModelResponse:
@@ -231,9 +251,9 @@ class PlantUserDetailsRouter(BaseRouter):
                     .PlantUserDetailsGetModelResponse())
 
         auth_dict = BaseRouter.authorization_check(
-            PlantUserDetailsRouterConfig.is_public, api_key)
+            PlantUserDetailsRouterConfig.is_public, auth_principal)
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -271,19 +291,15 @@ class PlantUserDetailsRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PlantUserDetailsRouter"
-            ".request_get_with_id "
-            "result:%s",
-            response_data
-        )
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "PlantUserDetailsRouter"
+                ".request_get_with_id "
+                "result:%s",
+                response_data.decode("utf-8")
+            )
+        return JSONBytesResponse(response_data)
 
 
     @staticmethod
@@ -298,7 +314,7 @@ class PlantUserDetailsRouter(BaseRouter):
             api_models.PlantUserDetailsGetModelRequest = (
                 Depends()),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Retrieve the Plant User Details
@@ -310,7 +326,7 @@ class PlantUserDetailsRouter(BaseRouter):
             PlantUserDetailsGetModelRequest):
                 The request model for the API.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             FileResponse: The CSV file containing the
@@ -332,7 +348,7 @@ class PlantUserDetailsRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             PlantUserDetailsRouterConfig
-            .is_public, api_key)
+            .is_public, auth_principal)
 
         tmp_file_path = ""
 
@@ -344,7 +360,7 @@ class PlantUserDetailsRouter(BaseRouter):
         ) as tmp_file:
             tmp_file_path = tmp_file.name
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 session_context = SessionContext(auth_dict, session)
@@ -387,18 +403,14 @@ class PlantUserDetailsRouter(BaseRouter):
                     traceback.format_tb(e.__traceback__)
                 )
                 response.message = str(e) + " traceback:" + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "PlantUserDetailsRouter."
-            "request_get_with_id_to_csv "
-            "get result:%s",
-            response_data
-        )
+        if is_payload_logged():
+            response_data = response.model_dump_json()
+            logging.info(
+                "PlantUserDetailsRouter."
+                "request_get_with_id_to_csv "
+                "get result:%s",
+                response_data
+            )
 
         output_file_name = (
             "plant_user_details_"
@@ -36,7 +36,9 @@ import apis.models as api_models
 import apis.models.init as api_init_models  # noqa: F401
 import reports  # noqa: F401
 from database import get_db
-from helpers import SessionContext, api_key_header
+from helpers import AuthPrincipal, SessionContext, get_auth_principal
+from helpers.json_response import JSONBytesResponse, dump_model_json
+from helpers.payload_logging import is_payload_logged
 
 from .base_router import BaseRouter
 
@@ -88,7 +90,7 @@ class TacRegisterRouter(BaseRouter):
     async def request_get_init(
         tac_code: uuid.UUID = Path(..., description=TAC_CODE),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Get the initialization data for the
@@ -97,7 +99,7 @@ class TacRegisterRouter(BaseRouter):
         Args:
             tac_code (uuid.UUID): The UUID of the tac.
             session (AsyncSession): The database session.
-            api_key (str): The API key for authorization.
+            auth_principal (AuthPrincipal): The principal of the API key.
 
         Returns:
             TacRegisterInitObjWFGetInitModelResponse:
@@ -119,14 +121,14 @@ class TacRegisterRouter(BaseRouter):
         )
 
         auth_dict = BaseRouter.authorization_check(
-            TacRegisterRouterConfig.is_public, api_key)
+            TacRegisterRouterConfig.is_public, auth_principal)
 
         init_request = (
             api_init_models.
             TacRegisterInitObjWFGetInitModelRequest()
         )
 
-        # Start a transaction
+        # Start a read-only transaction
         async with session:
             try:
                 logging.info(
@@ -166,18 +168,14 @@ class TacRegisterRouter(BaseRouter):
                 traceback_string = "".join(
                     traceback.format_tb(e.__traceback__))
                 response.message = str(e) + TRACEBACK + traceback_string
-            finally:
-                if response.success is True:
-                    await session.commit()
-                else:
-                    await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "TacRegisterRouter."
-            "request_get_init "
-            "result:%s",
-            response_data)
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "TacRegisterRouter."
+                "request_get_init "
+                "result:%s",
+                response_data.decode("utf-8"))
+        return JSONBytesResponse(response_data)
 
 
     @staticmethod
@@ -194,7 +192,7 @@ class TacRegisterRouter(BaseRouter):
         request_model: (
             api_models.TacRegisterPostModelRequest),
         session: AsyncSession = Depends(get_db),
-        api_key: str = Depends(api_key_header)
+        auth_principal: AuthPrincipal = Depends(get_auth_principal)
     ):
         """
         Tac Register api post endpoint
@@ -204,7 +202,7 @@ class TacRegisterRouter(BaseRouter):
         - request_model: The request model containing
             the details of the item to be added.
         - session: Database session dependency.
-        - api_key: API key for authorization.
+        - auth_principal: The principal of the API key.
 
         Returns:
         - response: JSON response with the result of the operation.
@@ -223,7 +221,7 @@ class TacRegisterRouter(BaseRouter):
 
         auth_dict = BaseRouter.authorization_check(
             TacRegisterRouterConfig.is_public,
-            api_key)
+            auth_principal)
 
         # Start a transaction
         async with session:
@@ -274,10 +272,11 @@ class TacRegisterRouter(BaseRouter):
                     await session.commit()
                 else:
                     await session.rollback()
-        response_data = response.model_dump_json()
-        logging.info(
-            "TacRegisterRouter."
-            "request_post_with_id "
-            "get result:%s",
-            response_data)
-        return response
+        response_data = dump_model_json(response)
+        if is_payload_logged():
+            logging.info(
+                "TacRegisterRouter."
+                "request_post_with_id "
+                "get result:%s",
+                response_data.decode("utf-8"))
+        return JSONBytesResponse(response_data)
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import models.factory as model_factorys  # noqa: F401
 import pytest
+import reports
 from apis import models as apis_models
 from apis.fs_farm_api.v1_0.endpoints.tests import test_constants
 from database import get_db
@@ -631,6 +632,109 @@ async def test_get_csv_success(
             mock_method.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_get_csv_stream_success(
+    overridden_get_db: AsyncSession,
+    api_key_fixture: str
+):
+    """
+    Test case for successful streaming of CSV data.
+
+    Args:
+        overridden_get_db (AsyncSession): The overridden database session.
+        api_key_fixture (str): The API key fixture.
+
+    Returns:
+        None
+    """
+
+    async def mock_csv_stream():
+        yield b'"plant_code"\r\n'
+        yield b'"00000000-0000-0000-0000-000000000000"\r\n'
+
+    with patch.object(
+        reports.ReportManagerLandPlantList,
+        'stream_csv',
+    ) as mock_method:
+        mock_method.return_value = mock_csv_stream()
+
+        land = await \
+            model_factorys.LandFactory.create_async(
+                overridden_get_db)
+        land_code = land.code
+        test_api_key = api_key_fixture
+        request = await (
+            request_factory.
+            LandPlantListGetModelRequestFactory.
+            create_async(
+                overridden_get_db
+            )
+        )
+        request_dict = request.to_dict_camel_serialized()
+
+        async with AsyncClient(
+            app=app, base_url=test_constants.TEST_DOMAIN
+        ) as ac:
+
+            app.dependency_overrides[get_db] = lambda: overridden_get_db
+            response = await ac.get(
+                "/api/v1_0/land-plant-list"
+                f"/{land_code}/to-csv-stream",
+                params=request_dict,
+                headers={'API_KEY': test_api_key}
+            )
+
+            assert response.status_code == 200
+            assert response.headers['content-type'].startswith(
+                test_constants.REPORT_TO_CSV_MEDIA_TYPE
+            )
+            assert response.text.splitlines() == [
+                '"plant_code"',
+                '"00000000-0000-0000-0000-000000000000"'
+            ]
+            mock_method.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_csv_stream_authorization_failure_bad_api_key(
+    overridden_get_db: AsyncSession
+):
+    """
+    Test the authorization failure with a bad API key
+    when streaming CSV data.
+    """
+
+    land = await \
+        model_factorys.LandFactory.create_async(
+            overridden_get_db)
+    land_code = land.code
+    request = await (
+        request_factory.
+        LandPlantListGetModelRequestFactory.
+        create_async(
+            overridden_get_db
+        )
+    )
+    request_dict = request.to_dict_camel_serialized()
+
+    async with AsyncClient(
+        app=app, base_url=test_constants.TEST_DOMAIN
+    ) as ac:
+
+        app.dependency_overrides[get_db] = lambda: overridden_get_db
+        response = await ac.get(
+            "/api/v1_0/land-plant-list"
+            f"/{land_code}/to-csv-stream",
+            params=request_dict,
+            headers={'API_KEY': 'xxx'}
+        )
+
+        if LandPlantListRouterConfig.is_public is True:
+            assert response.status_code == 200
+        else:
+            assert response.status_code == 401
+
+
 @pytest.mark.asyncio
 async def test_get_csv_authorization_failure_bad_api_key(
     overridden_get_db: AsyncSession
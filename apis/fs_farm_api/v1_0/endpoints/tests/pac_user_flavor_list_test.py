@@ -56,6 +56,67 @@ async def test_init_success(
         assert response.json()['success'] is True
 
 
+@pytest.mark.asyncio
+async def test_init_not_modified(
+    overridden_get_db: AsyncSession,
+    api_key_fixture: str
+):
+    """
+    Test that the initialization endpoint answers 304 Not Modified
+    while the ETag matches, and a new ETag once the pac changes.
+    """
+
+    pac = await \
+        model_factorys.PacFactory.create_async(
+            overridden_get_db)
+    pac_code = pac.code
+    # the GET session is read-only, so it
+    # rolls back data that is not committed
+    await overridden_get_db.commit()
+    test_api_key = api_key_fixture
+    async with AsyncClient(
+        app=app, base_url=test_constants.TEST_DOMAIN
+    ) as ac:
+
+        app.dependency_overrides[get_db] = lambda: overridden_get_db
+        response = await ac.get(
+            "/api/v1_0/pac-user-flavor-list"
+            f"/{pac_code}/init",
+            headers={'API_KEY': test_api_key}
+        )
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+
+        with patch.object(
+            apis_models.init.PacUserFlavorListInitReportGetInitModelRequest,
+            'process_request',
+            new_callable=AsyncMock
+        ) as mock_method:
+            response = await ac.get(
+                "/api/v1_0/pac-user-flavor-list"
+                f"/{pac_code}/init",
+                headers={'API_KEY': test_api_key,
+                         'If-None-Match': etag}
+            )
+            assert response.status_code == 304
+            assert response.headers['ETag'] == etag
+            mock_method.assert_not_awaited()
+
+        pac = await overridden_get_db.merge(pac)
+        pac.name = "changed"
+        await overridden_get_db.commit()
+
+        response = await ac.get(
+            "/api/v1_0/pac-user-flavor-list"
+            f"/{pac_code}/init",
+            headers={'API_KEY': test_api_key,
+                     'If-None-Match': etag}
+        )
+        assert response.status_code == 200
+        assert response.json()['success'] is True
+        assert response.headers['ETag'] != etag
+
+
 @pytest.mark.asyncio
 async def test_init_authorization_failure_bad_api_key(
     overridden_get_db: AsyncSession
@@ -62,6 +62,14 @@ class LandPlantListGetModelRequest(CamelModel):
         default="",
         alias="forceErrorMessage",
         description="Force Error Message")
+    is_keyset_paging: bool = Field(
+        default=False,
+        alias="isKeysetPaging",
+        description="Is Keyset Paging")
+    cursor: str = Field(
+        default="",
+        alias="cursor",
+        description="Cursor")
     flavor_code: uuid.UUID = Field(
         default_factory=lambda: uuid.UUID(
             '00000000-0000-0000-0000-000000000000'
@@ -529,8 +537,21 @@ class LandPlantListGetModelResponse(
                 request.page_number,
                 request.item_count_per_page,
                 request.order_by_column_name,
-                request.order_by_descending
+                request.order_by_descending,
+                request.is_keyset_paging,
+                request.cursor
             )
+            if request.is_keyset_paging:
+                self.next_cursor = generator.next_cursor
+                self.has_more_pages = self.next_cursor != ""
+            else:
+                self.load_page_info(
+                    request.page_number,
+                    request.item_count_per_page,
+                    request.order_by_column_name,
+                    request.order_by_descending,
+                    int(generator.total_row_count)
+                )
             self.items = []
             for item in items:
                 report_item = \
@@ -5,6 +5,7 @@ This module contains the ListModel class, which represents a
 list of items with pagination and sorting information.
 """
 
+import math
 from typing import List
 from pydantic import Field
 from helpers.pydantic_serialization import CamelModel
@@ -27,6 +28,11 @@ class ListModel(CamelModel):
         records_filtered (int): The number of records filtered in the list.
         message (str): A message associated with the list.
         app_version (str): The version of the application.
+        next_cursor (str): The cursor of the next page when
+            keyset paging is used, empty if there are no more items.
+        page_count (int): The number of pages in the list.
+        has_more_pages (bool): Indicates whether
+            there are pages after this one.
         validation_errors (List[ValidationErrorItem]): A list
             of validation errors, if any.
     """
@@ -67,6 +73,51 @@ class ListModel(CamelModel):
         default="",
         description="App Version")
 
+    next_cursor: str = Field(
+        default="",
+        description="Next Cursor")
+
+    page_count: int = Field(
+        default=0,
+        description="Page Count")
+
+    has_more_pages: bool = Field(
+        default=False,
+        description="Has More Pages")
+
     validation_errors: List[ValidationErrorItem] = Field(
         default_factory=list,
         description="Validation Errors")
+
+    def load_page_info(
+        self,
+        page_number: int,
+        item_count_per_page: int,
+        order_by_column_name: str,
+        order_by_descending: bool,
+        records_total: int
+    ):
+        """
+        Sets the paging and sorting information of the list
+        from the request and the total number of records.
+
+        Args:
+            page_number (int): The page number of the list.
+            item_count_per_page (int): The number of items per page.
+            order_by_column_name (str): The column
+                name the list is ordered by.
+            order_by_descending (bool): Indicates
+                whether the list is ordered in descending order.
+            records_total (int): The total number of records.
+        """
+        self.page_number = page_number
+        self.item_count_per_page = item_count_per_page
+        self.order_by_column_name = order_by_column_name
+        self.order_by_descending = order_by_descending
+        self.records_total = records_total
+        self.records_filtered = records_total
+        self.page_count = 0
+        if item_count_per_page > 0:
+            self.page_count = math.ceil(
+                records_total / item_count_per_page)
+        self.has_more_pages = page_number < self.page_count
@@ -404,3 +404,26 @@ async def test_process_request(session_context, report_request, report_items):
                 report_item.test_conditional_async_flow_req_link_pac_code
             assert response_item.conditional_btn_example_link_plant_code == \
                 report_item.conditional_btn_example_link_plant_code
+
+
+def test_load_page_info():
+    """
+    Test the load_page_info method of the
+    LandPlantListGetModelResponse class.
+    """
+    response = LandPlantListGetModelResponse()
+
+    response.load_page_info(2, 10, "SomeIntVal", True, 25)
+
+    assert response.page_number == 2
+    assert response.item_count_per_page == 10
+    assert response.order_by_column_name == "SomeIntVal"
+    assert response.order_by_descending is True
+    assert response.records_total == 25
+    assert response.records_filtered == 25
+    assert response.page_count == 3
+    assert response.has_more_pages is True
+
+    response.load_page_info(3, 10, "SomeIntVal", True, 25)
+
+    assert response.has_more_pages is False
@@ -64,6 +64,7 @@ class DynaFlowTaskTypeBusObj(DynaFlowTaskTypeDynaFlowsBusObj):
     # description
     # displayOrder
     # isActive
+    # isCPUBound
     # lookupEnumName
     # maxRetryCount
     # name
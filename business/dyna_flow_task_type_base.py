@@ -381,6 +381,48 @@ class DynaFlowTaskTypeBaseBusObj(BaseBusObj):
                 "is_active must be a boolean.")
 
         self.dyna_flow_task_type.is_active = value
+    # isCPUBound
+
+    @property
+    def is_cpu_bound(self):
+        """
+        Get the Is CPU Bound flag from the
+        DynaFlowTaskType object.
+
+        :return: The Is CPU Bound flag.
+        :raises AttributeError: If the
+            DynaFlowTaskType object is not initialized.
+        """
+
+        if not self.dyna_flow_task_type:
+            raise AttributeError(
+                NOT_INITIALIZED_ERROR_MESSAGE
+            )
+
+        return self.dyna_flow_task_type.is_cpu_bound
+
+    @is_cpu_bound.setter
+    def is_cpu_bound(self, value: bool):
+        """
+        Set the Is CPU Bound flag for the
+        DynaFlowTaskType object.
+
+        :param value: The Is CPU Bound flag value.
+        :raises AttributeError: If the
+            DynaFlowTaskType object is not initialized.
+        :raises ValueError: If the Is CPU Bound flag is not a boolean.
+        """
+
+        if not self.dyna_flow_task_type:
+            raise AttributeError(
+                NOT_INITIALIZED_ERROR_MESSAGE
+            )
+
+        if not isinstance(value, bool):
+            raise ValueError(
+                "is_cpu_bound must be a boolean.")
+
+        self.dyna_flow_task_type.is_cpu_bound = value
     # lookupEnumName
 
     @property
@@ -523,6 +565,7 @@ class DynaFlowTaskTypeBaseBusObj(BaseBusObj):
     # description
     # displayOrder
     # isActive
+    # isCPUBound
     # lookupEnumName
     # maxRetryCount
     # name
@@ -983,6 +1026,8 @@ class DynaFlowTaskTypeBaseBusObj(BaseBusObj):
             random.randint(0, 100))
         self.dyna_flow_task_type.is_active = (
             random.choice([True, False]))
+        self.dyna_flow_task_type.is_cpu_bound = (
+            random.choice([True, False]))
         self.dyna_flow_task_type.lookup_enum_name = "".join(
             random.choices("abcdefghijklmnopqrstuvwxyz", k=10))
         self.dyna_flow_task_type.max_retry_count = (
@@ -1065,6 +1110,7 @@ class DynaFlowTaskTypeBaseBusObj(BaseBusObj):
     # description
     # displayOrder
     # isActive
+    # isCPUBound
     # lookupEnumName
     # maxRetryCount
     # name
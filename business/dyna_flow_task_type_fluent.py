@@ -69,6 +69,20 @@ class DynaFlowTaskTypeFluentBusObj(DynaFlowTaskTypeBaseBusObj):
 
         self.is_active = value
         return self
+    # isCPUBound
+
+    def set_prop_is_cpu_bound(self, value: bool):
+        """
+        Set the Is CPU Bound flag for the
+        DynaFlowTaskType object.
+
+        :param value: The Is CPU Bound flag value.
+        :return: The updated
+            DynaFlowTaskTypeBusObj instance.
+        """
+
+        self.is_cpu_bound = value
+        return self
     # lookupEnumName
 
     def set_prop_lookup_enum_name(self, value: str):
@@ -118,6 +132,7 @@ class DynaFlowTaskTypeFluentBusObj(DynaFlowTaskTypeBaseBusObj):
     # description
     # displayOrder
     # isActive
+    # isCPUBound
     # lookupEnumName
     # maxRetryCount
     # name
@@ -246,6 +246,51 @@ class DynaFlowTypeScheduleBaseBusObj(BaseBusObj):
 
         self.dyna_flow_type_schedule.last_update_user_id = value
 
+    # cronExpression
+
+    @property
+    def cron_expression(self):
+        """
+        Get the Cron Expression from the
+        DynaFlowTypeSchedule object.
+
+        :return: The Cron Expression.
+        :raises AttributeError: If the
+            DynaFlowTypeSchedule object is not initialized.
+        """
+
+        if not self.dyna_flow_type_schedule:
+            raise AttributeError(
+                NOT_INITIALIZED_ERROR_MESSAGE
+            )
+
+        if self.dyna_flow_type_schedule.cron_expression is None:
+            return ""
+
+        return self.dyna_flow_type_schedule.cron_expression
+
+    @cron_expression.setter
+    def cron_expression(self, value):
+        """
+        Set the Cron Expression for the
+        DynaFlowTypeSchedule object.
+
+        :param value: The Cron Expression value.
+        :raises AttributeError: If the
+            DynaFlowTypeSchedule object is not initialized.
+        :raises AssertionError: If the
+            Cron Expression
+            is not a string.
+        """
+
+        if not self.dyna_flow_type_schedule:
+            raise AttributeError(
+                NOT_INITIALIZED_ERROR_MESSAGE
+            )
+
+        assert isinstance(value, str), \
+            "cron_expression must be a string"
+        self.dyna_flow_type_schedule.cron_expression = value
     # DynaFlowTypeID
     # frequencyInHours
 
@@ -506,6 +551,7 @@ class DynaFlowTypeScheduleBaseBusObj(BaseBusObj):
             )
 
         return self.dyna_flow_type_schedule.dyna_flow_type_code_peek
+    # cronExpression
     # frequencyInHours
     # isActive
     # lastUTCDateTime
@@ -961,6 +1007,8 @@ class DynaFlowTypeScheduleBaseBusObj(BaseBusObj):
             raise AttributeError(
                 NOT_INITIALIZED_ERROR_MESSAGE
             )
+        self.dyna_flow_type_schedule.cron_expression = "".join(
+            random.choices("abcdefghijklmnopqrstuvwxyz", k=10))
         self.dyna_flow_type_schedule.dyna_flow_type_id = random.choice(
             await managers_and_enums.DynaFlowTypeManager(
                 self._session_context).get_list()).dyna_flow_type_id
@@ -1049,6 +1097,7 @@ class DynaFlowTypeScheduleBaseBusObj(BaseBusObj):
         :rtype: int
         """
         return self.dyna_flow_type_schedule_id
+    # cronExpression
     # DynaFlowTypeID
     # frequencyInHours
     # isActive
@@ -24,6 +24,20 @@ class DynaFlowTypeScheduleFluentBusObj(DynaFlowTypeScheduleBaseBusObj):
     Base DynaFlowTypeSchedule Business Object
     """
 
+    # cronExpression
+
+    def set_prop_cron_expression(self, value: str):
+        """
+        Set the Cron Expression for the
+        DynaFlowTypeSchedule object.
+
+        :param value: The Cron Expression value.
+        :return: The updated
+            DynaFlowTypeScheduleBusObj instance.
+        """
+
+        self.cron_expression = value
+        return self
     # DynaFlowTypeID
     # frequencyInHours
 
@@ -104,6 +118,7 @@ class DynaFlowTypeScheduleFluentBusObj(DynaFlowTypeScheduleBaseBusObj):
         """
         self.dyna_flow_type_id = value
         return self
+    # cronExpression
     # frequencyInHours
     # isActive
     # lastUTCDateTime
@@ -8,6 +8,7 @@ business object for a
 Plant.
 """
 
+import uuid  # noqa: F401
 from typing import List
 
 import managers as managers_and_enums  # noqa: F401
@@ -62,6 +63,88 @@ class PlantBusObj(PlantDynaFlowsBusObj):
             result.append(plant_bus_obj)
 
         return result
+
+    @staticmethod
+    async def load_from_code_list(
+        session_context: SessionContext,
+        code_list: List[uuid.UUID]
+    ):
+        """
+        Load the PlantBusObj objects
+        for a list of codes in a single query.
+
+        Args:
+            session_context (SessionContext): The session context.
+            code_list (List[uuid.UUID]): The codes of the
+                plants to load.
+
+        Returns:
+            List[PlantBusObj]: The
+                loaded PlantBusObj objects.
+                Codes that are not found are skipped.
+
+        Raises:
+            ValueError: If a code is not a UUID.
+        """
+        for code in code_list:
+            if not isinstance(code, uuid.UUID):
+                raise ValueError(
+                    "code must be a UUID")
+
+        plant_manager = managers_and_enums.PlantManager(
+            session_context)
+        obj_list = await plant_manager.get_by_code_list(
+            code_list)
+
+        return await PlantBusObj.to_bus_obj_list(
+            session_context,
+            obj_list)
+
+    @staticmethod
+    async def save_bulk(
+        session_context: SessionContext,
+        bus_obj_list: List["PlantBusObj"]
+    ):
+        """
+        Save a list of PlantBusObj
+        objects with a single flush.
+
+        New plants are added and
+        existing plants are updated.
+
+        Args:
+            session_context (SessionContext): The session context.
+            bus_obj_list (List[PlantBusObj]): The
+                business objects to save.
+
+        Returns:
+            List[PlantBusObj]: The
+                saved business objects.
+
+        Raises:
+            AttributeError: If a plant
+                object is not initialized.
+        """
+        plants_to_add = []
+        for plant_bus_obj in bus_obj_list:
+            if not plant_bus_obj.plant:
+                raise AttributeError(NOT_INITIALIZED_ERROR_MESSAGE)
+
+            plant = plant_bus_obj.plant
+            if plant.plant_id > 0:
+                plant.last_update_user_id = \
+                    session_context.customer_code
+            else:
+                plant.insert_user_id = \
+                    session_context.customer_code
+                plant.last_update_user_id = \
+                    session_context.customer_code
+                plants_to_add.append(plant)
+
+        session_context.session.add_all(plants_to_add)
+        await session_context.session.flush()
+
+        return bus_obj_list
 # endset
     # isDeleteAllowed
     # isEditAllowed
@@ -136,6 +136,8 @@ class TestDynaFlowTaskTypeBaseBusObj:
                           int)
         assert isinstance(new_bus_obj.is_active,
                           bool)
+        assert isinstance(new_bus_obj.is_cpu_bound,
+                          bool)
         assert isinstance(new_bus_obj.lookup_enum_name,
                           str)
         assert isinstance(new_bus_obj.max_retry_count,
@@ -652,6 +654,38 @@ class TestDynaFlowTaskTypeBaseBusObj:
         with pytest.raises(ValueError):
             mock_sess_base_bus_obj.is_active = \
                 "not-a-boolean"
+    # isCPUBound
+
+    def test_is_cpu_bound(
+            self, mock_sess_base_bus_obj, dyna_flow_task_type):
+        """
+        Test case for the
+        is_cpu_bound property.
+        """
+        dyna_flow_task_type.is_cpu_bound = True
+        assert mock_sess_base_bus_obj \
+            .is_cpu_bound is True
+
+    def test_is_cpu_bound_setter(
+            self, mock_sess_base_bus_obj):
+        """
+        Test case for the
+        is_cpu_bound setter.
+        """
+        mock_sess_base_bus_obj.is_cpu_bound = \
+            True
+        assert mock_sess_base_bus_obj \
+            .is_cpu_bound is True
+
+    def test_is_cpu_bound_invalid_value(
+            self, mock_sess_base_bus_obj):
+        """
+        Test case for setting an invalid value for the
+        is_cpu_bound property.
+        """
+        with pytest.raises(ValueError):
+            mock_sess_base_bus_obj.is_cpu_bound = \
+                "not-a-boolean"
     # lookupEnumName
 
     def test_lookup_enum_name(
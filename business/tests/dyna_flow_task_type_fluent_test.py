@@ -25,6 +25,7 @@ class MockDynaFlowTaskTypeBaseBusObj:
         self.description = None
         self.display_order = None
         self.is_active = None
+        self.is_cpu_bound = None
         self.lookup_enum_name = None
         self.max_retry_count = None
         self.name = None
@@ -72,6 +73,15 @@ class TestDynaFlowTaskTypeFluentBusObj:
         result = new_fluent_bus_obj.set_prop_is_active(True)
         assert new_fluent_bus_obj.is_active is True
         assert result is new_fluent_bus_obj
+    # isCPUBound
+
+    def test_set_prop_is_cpu_bound(self, new_fluent_bus_obj):
+        """
+        Test setting the is_cpu_bound property.
+        """
+        result = new_fluent_bus_obj.set_prop_is_cpu_bound(True)
+        assert new_fluent_bus_obj.is_cpu_bound is True
+        assert result is new_fluent_bus_obj
     # lookupEnumName
 
     def test_set_prop_lookup_enum_name(self, new_fluent_bus_obj):
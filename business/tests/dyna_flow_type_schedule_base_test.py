@@ -130,6 +130,8 @@ class TestDynaFlowTypeScheduleBaseBusObj:
 
         assert new_bus_obj.last_update_user_id == uuid.UUID(int=0)
 
+        assert isinstance(new_bus_obj.cron_expression,
+                          str)
         assert isinstance(new_bus_obj.dyna_flow_type_id,
                           int)
         assert isinstance(new_bus_obj.frequency_in_hours,
@@ -554,6 +556,39 @@ class TestDynaFlowTypeScheduleBaseBusObj:
         """
         with pytest.raises(ValueError):
             mock_sess_base_bus_obj.insert_user_id = "not-a-uuid"
+    # cronExpression
+
+    def test_cron_expression(
+            self, mock_sess_base_bus_obj, dyna_flow_type_schedule):
+        """
+        Test case for the
+        cron_expression property.
+        """
+        dyna_flow_type_schedule.cron_expression = \
+            "0 6 * * *"
+        assert mock_sess_base_bus_obj \
+            .cron_expression == "0 6 * * *"
+
+    def test_cron_expression_setter(
+            self, mock_sess_base_bus_obj):
+        """
+        Test case for the
+        cron_expression setter.
+        """
+        mock_sess_base_bus_obj.cron_expression = \
+            "0 6 * * *"
+        assert mock_sess_base_bus_obj \
+            .cron_expression == "0 6 * * *"
+
+    def test_cron_expression_invalid_value(
+            self, mock_sess_base_bus_obj):
+        """
+        Test case for setting an invalid value for the
+        cron_expression property.
+        """
+        with pytest.raises(AssertionError):
+            mock_sess_base_bus_obj.cron_expression = \
+                123
     # DynaFlowTypeID
     # frequencyInHours
 
@@ -22,6 +22,7 @@ class MockDynaFlowTypeScheduleBaseBusObj:
     DynaFlowTypeScheduleFluentBusObj class.
     """
     def __init__(self):
+        self.cron_expression = None
         self.dyna_flow_type_id = None
         self.frequency_in_hours = None
         self.is_active = None
@@ -42,6 +43,17 @@ class TestDynaFlowTypeScheduleFluentBusObj:
         session_context = SessionContext({}, session=session)
         return DynaFlowTypeScheduleFluentBusObj(
             session_context)
+    # cronExpression
+
+    def test_set_prop_cron_expression(self, new_fluent_bus_obj):
+        """
+        Test setting the cron_expression property.
+        """
+        result = new_fluent_bus_obj.set_prop_cron_expression(
+            "0 6 * * *")
+        assert new_fluent_bus_obj.cron_expression == \
+            "0 6 * * *"
+        assert result is new_fluent_bus_obj
     # DynaFlowTypeID
     # frequencyInHours
 
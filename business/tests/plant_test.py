@@ -122,6 +122,53 @@ class TestPlantBusObj:
                 empty_obj_list)
 
         assert len(bus_obj_list) == 0
+
+    @pytest.mark.asyncio
+    async def test_load_from_code_list_and_save_bulk(
+            self, session, new_obj):
+        """
+        Test the load_from_code_list and
+        save_bulk methods.
+        """
+        session_context = SessionContext({}, session)
+        other_obj = await PlantFactory.create_async(
+            session)
+
+        bus_obj_list = await \
+            PlantBusObj.load_from_code_list(
+                session_context,
+                [new_obj.code, other_obj.code])
+
+        assert len(bus_obj_list) == 2
+
+        new_bus_obj = PlantBusObj(
+            session_context,
+            await PlantFactory.build_async(session))
+        bus_obj_list.append(new_bus_obj)
+
+        for bus_obj in bus_obj_list:
+            bus_obj.some_int_val = 42
+
+        await PlantBusObj.save_bulk(
+            session_context, bus_obj_list)
+
+        assert new_bus_obj.plant_id > 0
+        for plant in [new_obj, other_obj]:
+            await session.refresh(plant)
+            assert plant.some_int_val == 42
+
+    @pytest.mark.asyncio
+    async def test_load_from_code_list_invalid_code(
+            self, session):
+        """
+        Test the load_from_code_list method
+        with a code that is not a UUID.
+        """
+        session_context = SessionContext({}, session)
+
+        with pytest.raises(ValueError):
+            await PlantBusObj.load_from_code_list(
+                session_context, ["not-a-uuid"])
 # endset
     # isDeleteAllowed
     # isEditAllowed
@@ -25,6 +25,78 @@ DATABASE_URL = os.getenv('DATABASE_URL',
 TEST_DATABASE_URL = os.getenv('TEST_DATABASE_URL',
                               config['database']['TEST_DATABASE_URL'])
 
+READ_REPLICA_DATABASE_URL = \
+    os.getenv(
+        'READ_REPLICA_DATABASE_URL',
+        config['database']['READ_REPLICA_DATABASE_URL']
+    )
+
+DATABASE_POOL_SIZE = \
+    int(os.getenv(
+        'DATABASE_POOL_SIZE',
+        config['database']['DATABASE_POOL_SIZE']
+    ))
+
+DATABASE_MAX_OVERFLOW = \
+    int(os.getenv(
+        'DATABASE_MAX_OVERFLOW',
+        config['database']['DATABASE_MAX_OVERFLOW']
+    ))
+
+DATABASE_POOL_TIMEOUT = \
+    float(os.getenv(
+        'DATABASE_POOL_TIMEOUT',
+        config['database']['DATABASE_POOL_TIMEOUT']
+    ))
+
+DATABASE_POOL_RECYCLE = \
+    int(os.getenv(
+        'DATABASE_POOL_RECYCLE',
+        config['database']['DATABASE_POOL_RECYCLE']
+    ))
+
+DATABASE_POOL_PRE_PING = \
+    str_to_bool(os.getenv(
+        'DATABASE_POOL_PRE_PING',
+        config['database']['DATABASE_POOL_PRE_PING']
+    ))
+
+DATABASE_STATEMENT_CACHE_SIZE = \
+    int(os.getenv(
+        'DATABASE_STATEMENT_CACHE_SIZE',
+        config['database']['DATABASE_STATEMENT_CACHE_SIZE']
+    ))
+
+DATABASE_ISOLATION_LEVEL = \
+    os.getenv(
+        'DATABASE_ISOLATION_LEVEL',
+        config['database']['DATABASE_ISOLATION_LEVEL']
+    )
+
+DATABASE_READ_ONLY_ISOLATION_LEVEL = \
+    os.getenv(
+        'DATABASE_READ_ONLY_ISOLATION_LEVEL',
+        config['database']['DATABASE_READ_ONLY_ISOLATION_LEVEL']
+    )
+
+DATABASE_FAST_START = \
+    str_to_bool(os.getenv(
+        'DATABASE_FAST_START',
+        config['database']['DATABASE_FAST_START']
+    ))
+
+DYNAFLOW_DATABASE_POOL_SIZE = \
+    int(os.getenv(
+        'DYNAFLOW_DATABASE_POOL_SIZE',
+        config['database']['DYNAFLOW_DATABASE_POOL_SIZE']
+    ))
+
+DYNAFLOW_DATABASE_MAX_OVERFLOW = \
+    int(os.getenv(
+        'DYNAFLOW_DATABASE_MAX_OVERFLOW',
+        config['database']['DYNAFLOW_DATABASE_MAX_OVERFLOW']
+    ))
+
 API_KEY_SECRET = os.getenv('API_KEY_SECRET',
                            config['apis']['API_KEY_SECRET'])
 
@@ -50,6 +122,121 @@ IS_DYNAFLOW_TASK_PROCESSOR = \
         config['dyna_flow_processor']['IS_DYNAFLOW_TASK_PROCESSOR']
     ))
 
+DYNAFLOW_TASK_MAX_CONCURRENCY = \
+    int(os.getenv(
+        'DYNAFLOW_TASK_MAX_CONCURRENCY',
+        config['dyna_flow_processor']['DYNAFLOW_TASK_MAX_CONCURRENCY']
+    ))
+
+IS_DYNAFLOW_TASK_SCHEDULER_USED = \
+    str_to_bool(os.getenv(
+        'IS_DYNAFLOW_TASK_SCHEDULER_USED',
+        config['dyna_flow_processor']['IS_DYNAFLOW_TASK_SCHEDULER_USED']
+    ))
+
+DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS']
+    ))
+
+DYNAFLOW_DAEMON_MIN_POLL_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_DAEMON_MIN_POLL_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_DAEMON_MIN_POLL_SECONDS']
+    ))
+
+DYNAFLOW_DAEMON_MAX_POLL_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_DAEMON_MAX_POLL_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_DAEMON_MAX_POLL_SECONDS']
+    ))
+
+DYNAFLOW_NOTIFY_CHANNEL = \
+    os.getenv(
+        'DYNAFLOW_NOTIFY_CHANNEL',
+        config['dyna_flow_processor']['DYNAFLOW_NOTIFY_CHANNEL']
+    )
+
+DYNAFLOW_MAINTENANCE_INTERVAL_MINUTES = \
+    float(os.getenv(
+        'DYNAFLOW_MAINTENANCE_INTERVAL_MINUTES',
+        config['dyna_flow_processor']['DYNAFLOW_MAINTENANCE_INTERVAL_MINUTES']
+    ))
+
+DYNAFLOW_SCHEDULE_CATCH_UP_POLICY = \
+    os.getenv(
+        'DYNAFLOW_SCHEDULE_CATCH_UP_POLICY',
+        config['dyna_flow_processor']['DYNAFLOW_SCHEDULE_CATCH_UP_POLICY']
+    )
+
+DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT = \
+    int(os.getenv(
+        'DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT',
+        config['dyna_flow_processor']['DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT']
+    ))
+
+DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS',
+        config['dyna_flow_processor'][
+            'DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS']
+    ))
+
+DYNAFLOW_SCHEDULE_RELOAD_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_SCHEDULE_RELOAD_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_SCHEDULE_RELOAD_SECONDS']
+    ))
+
+DYNAFLOW_METRICS_HOST = \
+    os.getenv(
+        'DYNAFLOW_METRICS_HOST',
+        config['dyna_flow_processor']['DYNAFLOW_METRICS_HOST']
+    )
+
+DYNAFLOW_METRICS_PORT = \
+    int(os.getenv(
+        'DYNAFLOW_METRICS_PORT',
+        config['dyna_flow_processor']['DYNAFLOW_METRICS_PORT']
+    ))
+
+DYNAFLOW_METRICS_LOG_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_METRICS_LOG_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_METRICS_LOG_SECONDS']
+    ))
+
+DYNAFLOW_ARCHIVE_AFTER_DAYS = \
+    float(os.getenv(
+        'DYNAFLOW_ARCHIVE_AFTER_DAYS',
+        config['dyna_flow_processor']['DYNAFLOW_ARCHIVE_AFTER_DAYS']
+    ))
+
+DYNAFLOW_ARCHIVE_BATCH_SIZE = \
+    int(os.getenv(
+        'DYNAFLOW_ARCHIVE_BATCH_SIZE',
+        config['dyna_flow_processor']['DYNAFLOW_ARCHIVE_BATCH_SIZE']
+    ))
+
+DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT = \
+    int(os.getenv(
+        'DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT',
+        config['dyna_flow_processor']['DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT']
+    ))
+
+DYNAFLOW_ARCHIVE_FOLDER = \
+    os.getenv(
+        'DYNAFLOW_ARCHIVE_FOLDER',
+        config['dyna_flow_processor']['DYNAFLOW_ARCHIVE_FOLDER']
+    )
+
+DYNAFLOW_CPU_POOL_MAX_WORKERS = \
+    int(os.getenv(
+        'DYNAFLOW_CPU_POOL_MAX_WORKERS',
+        config['dyna_flow_processor']['DYNAFLOW_CPU_POOL_MAX_WORKERS']
+    ))
+
 
 DYNAFLOW_TASK_RESULT_QUEUE_NAME = \
     os.getenv(
@@ -70,8 +257,69 @@ DYNAFLOW_TASK_PROCESSOR_QUEUE_NAME = \
         config['dyna_flow_processor']['DYNAFLOW_TASK_PROCESSOR_QUEUE_NAME']
     )
 
+DYNAFLOW_QUEUE_BACKEND = \
+    os.getenv(
+        'DYNAFLOW_QUEUE_BACKEND',
+        config['dyna_flow_processor']['DYNAFLOW_QUEUE_BACKEND']
+    )
+
+DYNAFLOW_QUEUE_SQLITE_PATH = \
+    os.getenv(
+        'DYNAFLOW_QUEUE_SQLITE_PATH',
+        config['dyna_flow_processor']['DYNAFLOW_QUEUE_SQLITE_PATH']
+    )
+
+DYNAFLOW_QUEUE_VISIBILITY_TIMEOUT_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_QUEUE_VISIBILITY_TIMEOUT_SECONDS',
+        config['dyna_flow_processor'][
+            'DYNAFLOW_QUEUE_VISIBILITY_TIMEOUT_SECONDS']
+    ))
+
+DYNAFLOW_QUEUE_BATCH_SIZE = \
+    int(os.getenv(
+        'DYNAFLOW_QUEUE_BATCH_SIZE',
+        config['dyna_flow_processor']['DYNAFLOW_QUEUE_BATCH_SIZE']
+    ))
+
+DYNAFLOW_QUEUE_MAX_WAIT_SECONDS = \
+    float(os.getenv(
+        'DYNAFLOW_QUEUE_MAX_WAIT_SECONDS',
+        config['dyna_flow_processor']['DYNAFLOW_QUEUE_MAX_WAIT_SECONDS']
+    ))
+
 AZURE_SERVICE_BUS_CONNECTION_STRING = \
     os.getenv(
         'AZURE_SERVICE_BUS_CONNECTION_STRING',
         config['dyna_flow_processor']['AZURE_SERVICE_BUS_CONNECTION_STRING']
     )
+
+LOOKUP_CACHE_TTL_SECONDS = \
+    float(os.getenv(
+        'LOOKUP_CACHE_TTL_SECONDS',
+        config['cache']['LOOKUP_CACHE_TTL_SECONDS']
+    ))
+
+AUTH_TOKEN_CACHE_TTL_SECONDS = \
+    float(os.getenv(
+        'AUTH_TOKEN_CACHE_TTL_SECONDS',
+        config['cache']['AUTH_TOKEN_CACHE_TTL_SECONDS']
+    ))
+
+AUTH_TOKEN_CACHE_MAX_SIZE = \
+    int(os.getenv(
+        'AUTH_TOKEN_CACHE_MAX_SIZE',
+        config['cache']['AUTH_TOKEN_CACHE_MAX_SIZE']
+    ))
+
+RESPONSE_CACHE_MAX_SIZE = \
+    int(os.getenv(
+        'RESPONSE_CACHE_MAX_SIZE',
+        config['cache']['RESPONSE_CACHE_MAX_SIZE']
+    ))
+
+PAYLOAD_LOG_SAMPLE_RATE = \
+    float(os.getenv(
+        'PAYLOAD_LOG_SAMPLE_RATE',
+        config['logging']['PAYLOAD_LOG_SAMPLE_RATE']
+    ))
@@ -1,18 +1,44 @@
 # current_runtime.py  # pylint: disable=duplicate-code # noqa: E501
 
 """
-This module contains the code for initializing various
-managers in the application.
+This module contains the code for initializing the database
+and the various managers in the application.
+
+At startup, initialize_database creates the missing tables and
+indexes and seeds the lookup rows. The version of the schema and
+lookup seed it ran with is kept in the SchemaVersion row. With
+DATABASE_FAST_START, a process whose version matches that row
+skips the table reflection and the seeding, and reads one row.
 """
 
+import hashlib
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
 import managers
+from config import DATABASE_FAST_START
 from helpers.session_context import SessionContext
+from models import Base, SchemaVersion
+from models.base import create_missing_indexes
+from models.schema_version import SCHEMA_VERSION_ID
+
+# increase when the seeded lookup rows change
+# without a change to the lookup enums
+SEED_VERSION = 1
 
 
 async def initialize(session_context: SessionContext):
     """
     Initializes various managers in the application.
 
+    Each lookup manager seeds its missing lookup rows with
+    one SELECT of the seeded names and one INSERT per table.
+
     Args:
         session_context (SessionContext): The session context object.
 
@@ -31,7 +57,6 @@ async def initialize(session_context: SessionContext):
     await managers.OrganizationManager(session_context).initialize()
     await managers.OrgApiKeyManager(session_context).initialize()
     await managers.OrgCustomerManager(session_context).initialize()
-    await managers.PacManager(session_context).initialize()
     await managers.PlantManager(session_context).initialize()
     await managers.RoleManager(session_context).initialize()
     await managers.TacManager(session_context).initialize()
@@ -40,7 +65,150 @@ async def initialize(session_context: SessionContext):
     await managers.DynaFlowTaskManager(session_context).initialize()
     await managers.DynaFlowTypeManager(session_context).initialize()
     await managers.DynaFlowTaskTypeManager(session_context).initialize()
-    await managers.DynaFlowTypeManager(session_context).initialize()
     await managers.DFTDependencyManager(session_context).initialize()
     await managers.DFMaintenanceManager(session_context).initialize()
 # endset
+
+
+def get_schema_version() -> str:
+    """
+    Returns the version of the schema and lookup seed of
+    this code: a hash of the tables, columns and indexes of
+    the models, the lookup enums and SEED_VERSION.
+
+    Returns:
+        str: The version.
+    """
+    version_hash = hashlib.sha256()
+
+    def add(*value_list) -> None:
+        version_hash.update(repr(value_list).encode("utf-8"))
+
+    for table in Base.metadata.sorted_tables:
+        add("table", table.name)
+        for column in table.columns:
+            add("column", column.name, repr(column.type),
+                column.nullable, column.primary_key)
+        for index in sorted(table.indexes, key=lambda x: x.name or ""):
+            add("index", index.name,
+                [column.name for column in index.columns])
+
+    enum_list = [
+        value for value in vars(managers).values()
+        if isinstance(value, type) and issubclass(value, Enum)
+    ]
+    for enum_class in sorted(enum_list, key=lambda x: x.__name__):
+        add("enum", enum_class.__name__,
+            [member.value for member in enum_class])
+
+    add("seed", SEED_VERSION)
+
+    return version_hash.hexdigest()
+
+
+async def is_database_current(db_engine: AsyncEngine, version: str) -> bool:
+    """
+    Returns True if the SchemaVersion row of the
+    database has the given version.
+
+    Args:
+        db_engine (AsyncEngine): The engine of the database.
+        version (str): The version of this code.
+
+    Returns:
+        bool: False if the row is missing, is older, or
+            the table does not exist yet.
+    """
+    # pylint: disable=protected-access
+    try:
+        async with db_engine.connect() as conn:
+            result = await conn.execute(
+                select(SchemaVersion._version)
+                .where(SchemaVersion._schema_version_id == SCHEMA_VERSION_ID))
+            return result.scalar() == version
+    except DBAPIError:
+        return False
+
+
+async def initialize_database(
+    db_engine: AsyncEngine,
+    session_local
+) -> None:
+    """
+    Creates the missing tables and indexes, seeds the lookup
+    rows and records the version in the SchemaVersion row.
+
+    With DATABASE_FAST_START, nothing is done when the
+    SchemaVersion row already has the version of this code.
+    Without it, the tables are checked and the lookup rows
+    seeded on every start, as the seeding only adds the
+    missing rows.
+
+    The seeding runs in one transaction that starts by updating
+    the SchemaVersion row, so processes that start at the same
+    time seed one after the other. With DATABASE_FAST_START, a
+    process that finds the version recorded by another one
+    skips the seeding.
+
+    Args:
+        db_engine (AsyncEngine): The engine of the database.
+        session_local: The sessionmaker of the seeding session.
+
+    Returns:
+        None
+    """
+    # pylint: disable=protected-access
+    version = get_schema_version()
+
+    if DATABASE_FAST_START and \
+            await is_database_current(db_engine, version):
+        logging.info("Database version %s is current. Fast start.",
+                     version)
+        return
+
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
+
+    try:
+        async with db_engine.begin() as conn:
+            result = await conn.execute(
+                select(SchemaVersion._schema_version_id)
+                .where(SchemaVersion._schema_version_id == SCHEMA_VERSION_ID))
+            if result.scalar() is None:
+                await conn.execute(
+                    insert(SchemaVersion).values({
+                        SchemaVersion._schema_version_id:
+                            SCHEMA_VERSION_ID,
+                        SchemaVersion._version: "",
+                    }))
+    except IntegrityError:
+        # inserted by another process
+        pass
+
+    async with session_local() as session:
+        # lock the row until the seeding is committed
+        await session.execute(
+            update(SchemaVersion)
+            .where(SchemaVersion._schema_version_id == SCHEMA_VERSION_ID)
+            .values({
+                SchemaVersion._last_update_utc_date_time:
+                    datetime.now(timezone.utc),
+            }))
+
+        result = await session.execute(
+            select(SchemaVersion._version)
+            .where(SchemaVersion._schema_version_id == SCHEMA_VERSION_ID))
+
+        if result.scalar() != version or not DATABASE_FAST_START:
+            session_context = SessionContext({}, session)
+            await initialize(session_context)
+
+            await session.execute(
+                update(SchemaVersion)
+                .where(SchemaVersion._schema_version_id == SCHEMA_VERSION_ID)
+                .values({SchemaVersion._version: version}))
+
+        await session.commit()
+
+    logging.info("Database version %s is initialized.", version)
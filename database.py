@@ -1,31 +1,294 @@
 # database.py  # pylint: disable=duplicate-code # noqa: E501
 """
 This module provides functions for interacting with the database.
+
+Two engines are created so the API and the DynaFlow processor
+do not compete for the same connection pool:
+
+- engine: used by the API.
+- dyna_flow_engine: used by the DynaFlow processor.
+
+When READ_REPLICA_DATABASE_URL is set, a third engine,
+read_engine, serves the reads of GET requests.
+
+GET requests only read, so their sessions are read-only: they
+do not autoflush, their transactions are never committed, and
+where the dialect supports it the transactions are started
+READ ONLY.
 """
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from typing import Any, Dict, FrozenSet
+
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    create_async_engine)
 from sqlalchemy.orm import sessionmaker
-from config import DATABASE_URL
+from config import (DATABASE_ISOLATION_LEVEL, DATABASE_MAX_OVERFLOW,
+                    DATABASE_POOL_PRE_PING, DATABASE_POOL_RECYCLE,
+                    DATABASE_POOL_SIZE, DATABASE_POOL_TIMEOUT,
+                    DATABASE_READ_ONLY_ISOLATION_LEVEL,
+                    DATABASE_STATEMENT_CACHE_SIZE, DATABASE_URL,
+                    DYNAFLOW_DATABASE_MAX_OVERFLOW,
+                    DYNAFLOW_DATABASE_POOL_SIZE,
+                    READ_REPLICA_DATABASE_URL, str_to_bool)
+
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+
+READ_ONLY_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD"})
+
+
+def get_engine_options(
+    database_url: str,
+    pool_size: int,
+    max_overflow: int
+) -> Dict[str, Any]:
+    """
+    Returns the create_async_engine keyword arguments for the
+    given database url, based on the pool settings in config.ini.
+
+    SQLite uses a NullPool or StaticPool, so the pool sizing
+    options are only passed to other databases.
+
+    Args:
+        database_url (str): The database url.
+        pool_size (int): The number of connections kept in the pool.
+        max_overflow (int): The number of connections allowed
+            above the pool size.
+
+    Returns:
+        Dict[str, Any]: The engine keyword arguments.
+    """
+    url = make_url(database_url)
+
+    options: Dict[str, Any] = {
+        "echo": False,
+        "pool_pre_ping": DATABASE_POOL_PRE_PING,
+    }
+
+    if url.get_backend_name() != "sqlite":
+        options["pool_size"] = pool_size
+        options["max_overflow"] = max_overflow
+        options["pool_timeout"] = DATABASE_POOL_TIMEOUT
+        options["pool_recycle"] = DATABASE_POOL_RECYCLE
+
+    if url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size":
+                DATABASE_STATEMENT_CACHE_SIZE,
+        }
+
+    if DATABASE_ISOLATION_LEVEL:
+        options["isolation_level"] = DATABASE_ISOLATION_LEVEL
+
+    return options
+
+
+def get_read_only_execution_options(
+    database_url: str
+) -> Dict[str, Any]:
+    """
+    Returns the execution options that make the transactions
+    of an engine for the given database url read-only.
+
+    PostgreSQL starts the transactions READ ONLY. When
+    DATABASE_READ_ONLY_ISOLATION_LEVEL is set, for example to
+    SNAPSHOT on SQL Server or REPEATABLE READ on PostgreSQL,
+    the transactions read one snapshot of the database.
+    Other databases get no options.
+
+    Args:
+        database_url (str): The database url.
+
+    Returns:
+        Dict[str, Any]: The execution options.
+    """
+    url = make_url(database_url)
+
+    options: Dict[str, Any] = {}
+
+    if url.get_backend_name() == "postgresql":
+        options["postgresql_readonly"] = True
+
+    if DATABASE_READ_ONLY_ISOLATION_LEVEL:
+        options["isolation_level"] = DATABASE_READ_ONLY_ISOLATION_LEVEL
+
+    return options
+
+
+def get_read_only_engine(
+    read_write_engine: AsyncEngine,
+    database_url: str
+) -> AsyncEngine:
+    """
+    Returns an engine that shares the connection pool of
+    the given engine and starts read-only transactions.
+
+    Args:
+        read_write_engine (AsyncEngine): The engine.
+        database_url (str): The database url of the engine.
+
+    Returns:
+        AsyncEngine: The read-only engine, or the given engine
+            when the database has no read-only options.
+    """
+    options = get_read_only_execution_options(database_url)
+
+    if not options:
+        return read_write_engine
 
+    return read_write_engine.execution_options(**options)
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+
+def get_pool_stats(pool_engine: AsyncEngine) -> Dict[str, Any]:
+    """
+    Returns the connection pool statistics of an engine,
+    for monitoring.
+
+    Args:
+        pool_engine (AsyncEngine): The engine.
+
+    Returns:
+        Dict[str, Any]: The pool class and status, plus the
+            size, checked in, checked out and overflow counts
+            when the pool keeps connections.
+    """
+    pool = pool_engine.pool
+
+    stats: Dict[str, Any] = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status(),
+    }
+
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+
+    return stats
+
+
+def get_api_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the connection pool statistics of the engines
+    the API uses: the API engine and, when configured, the
+    read replica engine. The DynaFlow processor runs in its
+    own process, so its engine is not reported here.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The statistics by engine role.
+    """
+    result = {
+        "api": get_pool_stats(engine),
+    }
+
+    if read_engine is not None:
+        result["read_replica"] = get_pool_stats(read_engine)
+
+    return result
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    **get_engine_options(
+        DATABASE_URL,
+        DATABASE_POOL_SIZE,
+        DATABASE_MAX_OVERFLOW))
+
+dyna_flow_engine = create_async_engine(
+    DATABASE_URL,
+    **get_engine_options(
+        DATABASE_URL,
+        DYNAFLOW_DATABASE_POOL_SIZE,
+        DYNAFLOW_DATABASE_MAX_OVERFLOW))
+
+read_engine = None
+if READ_REPLICA_DATABASE_URL:
+    read_engine = create_async_engine(
+        READ_REPLICA_DATABASE_URL,
+        **get_engine_options(
+            READ_REPLICA_DATABASE_URL,
+            DATABASE_POOL_SIZE,
+            DATABASE_MAX_OVERFLOW))
 
 async_session_local = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
 
+read_only_session_local = sessionmaker(
+    bind=get_read_only_engine(engine, DATABASE_URL),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    info={"read_only": True}
+)
+
+read_session_local = None
+if read_engine is not None:
+    read_session_local = sessionmaker(
+        bind=get_read_only_engine(read_engine, READ_REPLICA_DATABASE_URL),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        info={"read_only": True}
+    )
+
+dyna_flow_session_local = sessionmaker(
+    bind=dyna_flow_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 
-async def get_db():
+async def get_db(request: Request = None):  # type: ignore
     """
     Returns an asynchronous context manager for the database session.
 
+    GET and HEAD requests get a read-only session. It does not
+    autoflush, and its transaction is never committed; it is
+    rolled back when the session is closed.
+
+    For these requests, when a read replica is configured, the read
+    replica session is put in the session info as "read_session"
+    so SessionContext.get_read_session can route reads to it.
+    Sending the X-Read-Your-Writes: true header keeps the reads
+    of the request on the primary database.
+
     Usage:
         async with get_db() as db:
             # Use the database session here
 
+    Args:
+        request (Request): The current request, if any.
+
+    Returns:
+        AsyncGenerator[AsyncSession, None]: An
+        asynchronous generator that yields the database session.
+
+    """
+    if request is None or request.method not in READ_ONLY_METHODS:
+        async with async_session_local() as db:  # type: ignore # noqa: E501
+            yield db
+        return
+
+    async with read_only_session_local() as db:  # type: ignore # noqa: E501
+        if read_session_local is None:
+            yield db
+            return
+
+        async with read_session_local() as read_db:  # type: ignore # noqa: E501
+            db.info["read_session"] = read_db
+            db.info["read_your_writes"] = str_to_bool(
+                request.headers.get(READ_YOUR_WRITES_HEADER, ""))
+            yield db
+
+
+async def get_dyna_flow_db():
+    """
+    Returns an asynchronous context manager for a database session
+    of the DynaFlow processor engine.
+
     Returns:
         AsyncGenerator[AsyncSession, None]: An
         asynchronous generator that yields the database session.
 
     """
-    async with async_session_local() as db:  # type: ignore # noqa: E501
+    async with dyna_flow_session_local() as db:  # type: ignore # noqa: E501
         yield db
@@ -0,0 +1,282 @@
+# df_processor/dyna_flow_archiver.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the `DynaFlowArchiver` class, which moves
+finished DynaFlows out of the tables the DynaFlow processor polls.
+
+A DynaFlow is archived when it is completed or canceled, was last
+updated more than the retention age ago, and nothing pending still
+depends on it:
+- none of its tasks is pending (not completed and not canceled).
+- no pending DynaFlow has it as its `dependency_dyna_flow_id`.
+- no pending task of another DynaFlow depends on one of its tasks,
+    by `dependency_dyna_flow_task_id` or a `DFTDependency` row.
+
+Each batch of DynaFlows is written with its tasks and the
+`DFTDependency` rows of those tasks to a gzip compressed JSON lines
+file, one DynaFlow per line, and then deleted in the same
+transaction. A batch whose delete fails is exported again by the
+next run, so an export may hold a DynaFlow twice; the rows keep
+their codes to tell them apart.
+
+The export files are the only copy of the deleted rows, so the
+archive is off by default and DYNAFLOW_ARCHIVE_FOLDER has to be an
+absolute path, on a volume that outlives the processor, before
+DYNAFLOW_ARCHIVE_AFTER_DAYS can enable it.
+"""
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import and_, exists, or_
+from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
+
+import managers as managers_and_enums  # noqa: F401
+from config import (DYNAFLOW_ARCHIVE_AFTER_DAYS, DYNAFLOW_ARCHIVE_BATCH_SIZE,
+                    DYNAFLOW_ARCHIVE_FOLDER)
+from helpers.session_context import SessionContext
+from models import DFTDependency, DynaFlow, DynaFlowTask
+
+
+def _is_pending(dyna_flow_task) -> object:
+    """
+    Returns the condition of a pending task of the
+    DynaFlowTask model or one of its aliases.
+    """
+    # pylint: disable=protected-access
+    return and_(
+        dyna_flow_task._is_completed == False,  # noqa: E712
+        dyna_flow_task._is_canceled == False,  # noqa: E712
+    )
+
+
+class DynaFlowArchiver:
+    """
+    Exports and deletes finished DynaFlows, their tasks and
+    their DFTDependency rows, one bounded batch at a time.
+
+    Attributes:
+        archive_after_days (float): The retention age of a finished
+            DynaFlow. 0 disables the archive.
+        batch_size (int): The number of DynaFlows of a batch.
+        archive_folder (str): The absolute path of the folder
+            of the export files.
+
+    Raises:
+        ValueError: If the archive is enabled and archive_folder
+            is not an absolute path.
+    """
+
+    def __init__(
+        self,
+        archive_after_days: float = DYNAFLOW_ARCHIVE_AFTER_DAYS,
+        batch_size: int = DYNAFLOW_ARCHIVE_BATCH_SIZE,
+        archive_folder: str = DYNAFLOW_ARCHIVE_FOLDER
+    ):
+        self.archive_after_days = archive_after_days
+        self.batch_size = max(1, batch_size)
+        self.archive_folder = archive_folder
+
+        if self.is_enabled() and not os.path.isabs(archive_folder):
+            raise ValueError(
+                "DYNAFLOW_ARCHIVE_FOLDER must be an absolute path "
+                "on durable storage when DYNAFLOW_ARCHIVE_AFTER_DAYS "
+                f"is set, not '{archive_folder}'.")
+
+    def is_enabled(self) -> bool:
+        """
+        Returns True if finished DynaFlows are archived.
+        """
+        return self.archive_after_days > 0
+
+    def get_archive_before_utc_date_time(self) -> datetime:
+        """
+        Returns the last update time before which
+        a finished DynaFlow is archived.
+        """
+        return datetime.now(timezone.utc) - \
+            timedelta(days=self.archive_after_days)
+
+    async def get_archivable_dyna_flow_id_list(
+        self,
+        session_context: SessionContext,
+        before_utc_date_time: datetime
+    ) -> List[int]:
+        """
+        Returns the ids of the next batch of DynaFlows
+        to archive, oldest first.
+        """
+        # pylint: disable=protected-access
+        dependent_dyna_flow = aliased(DynaFlow)
+        own_dyna_flow_task = aliased(DynaFlowTask)
+        dependent_dyna_flow_task = aliased(DynaFlowTask)
+
+        dyna_flow_id = DynaFlow._dyna_flow_id
+        own_task_id = own_dyna_flow_task._dyna_flow_task_id
+        dependent_task_id = dependent_dyna_flow_task._dyna_flow_task_id
+        dependency_task_id = \
+            dependent_dyna_flow_task._dependency_dyna_flow_task_id
+
+        has_pending_task = exists().where(
+            DynaFlowTask._dyna_flow_id == dyna_flow_id,
+            _is_pending(DynaFlowTask))
+
+        has_pending_dependent_dyna_flow = exists().where(
+            dependent_dyna_flow._dependency_dyna_flow_id == dyna_flow_id,
+            dependent_dyna_flow._is_completed == False,  # noqa: E712
+            dependent_dyna_flow._is_canceled == False)  # noqa: E712
+
+        has_pending_dependent_task = exists().where(
+            own_dyna_flow_task._dyna_flow_id == dyna_flow_id,
+            dependency_task_id == own_task_id,
+            _is_pending(dependent_dyna_flow_task))
+
+        has_pending_dft_dependency = exists().where(
+            own_dyna_flow_task._dyna_flow_id == dyna_flow_id,
+            DFTDependency._dependency_df_task_id == own_task_id,
+            DFTDependency._dyna_flow_task_id == dependent_task_id,
+            _is_pending(dependent_dyna_flow_task))
+
+        result = await session_context.session.execute(
+            select(DynaFlow._dyna_flow_id)
+            .where(
+                or_(
+                    DynaFlow._is_completed == True,  # noqa: E712
+                    DynaFlow._is_canceled == True),  # noqa: E712
+                DynaFlow._last_update_utc_date_time < before_utc_date_time,
+                ~has_pending_task,
+                ~has_pending_dependent_dyna_flow,
+                ~has_pending_dependent_task,
+                ~has_pending_dft_dependency,
+            )
+            .order_by(DynaFlow._dyna_flow_id)
+            .limit(self.batch_size)
+        )
+        return list(result.scalars().all())
+
+    async def archive_batch(
+        self,
+        session_context: SessionContext,
+        before_utc_date_time: datetime
+    ) -> int:
+        """
+        Exports and deletes the next batch of DynaFlows
+        in the transaction of the session context.
+        The caller commits.
+
+        Returns the number of DynaFlows archived.
+        """
+        # pylint: disable=protected-access
+        session = session_context.session
+
+        dyna_flow_id_list = await self.get_archivable_dyna_flow_id_list(
+            session_context,
+            before_utc_date_time)
+
+        if len(dyna_flow_id_list) == 0:
+            return 0
+
+        dyna_flow_manager = \
+            managers_and_enums.DynaFlowManager(session_context)
+        dyna_flow_task_manager = \
+            managers_and_enums.DynaFlowTaskManager(session_context)
+        dft_dependency_manager = \
+            managers_and_enums.DFTDependencyManager(session_context)
+
+        dyna_flow_list = (await session.execute(
+            select(DynaFlow)
+            .where(DynaFlow._dyna_flow_id.in_(dyna_flow_id_list))
+            .order_by(DynaFlow._dyna_flow_id)
+        )).scalars().all()
+
+        dyna_flow_task_list = (await session.execute(
+            select(DynaFlowTask)
+            .where(DynaFlowTask._dyna_flow_id.in_(dyna_flow_id_list))
+            .order_by(DynaFlowTask._dyna_flow_task_id)
+        )).scalars().all()
+
+        dyna_flow_task_id_list = [
+            x.dyna_flow_task_id for x in dyna_flow_task_list]
+
+        dft_dependency_list = (await session.execute(
+            select(DFTDependency)
+            .where(DFTDependency._dyna_flow_task_id.in_(
+                dyna_flow_task_id_list))
+            .order_by(DFTDependency._dft_dependency_id)
+        )).scalars().all()
+
+        dyna_flow_id_by_task_id = {
+            x.dyna_flow_task_id: x.dyna_flow_id
+            for x in dyna_flow_task_list
+        }
+
+        line_by_dyna_flow_id: Dict[int, dict] = {
+            dyna_flow.dyna_flow_id: {
+                "dyna_flow": dyna_flow_manager.to_dict(dyna_flow),
+                "dyna_flow_task_list": [],
+                "dft_dependency_list": [],
+            }
+            for dyna_flow in dyna_flow_list
+        }
+        for dyna_flow_task in dyna_flow_task_list:
+            line_by_dyna_flow_id[dyna_flow_task.dyna_flow_id][
+                "dyna_flow_task_list"].append(
+                    dyna_flow_task_manager.to_dict(dyna_flow_task))
+        for dft_dependency in dft_dependency_list:
+            line_by_dyna_flow_id[dyna_flow_id_by_task_id[
+                dft_dependency.dyna_flow_task_id]][
+                "dft_dependency_list"].append(
+                    dft_dependency_manager.to_dict(dft_dependency))
+
+        self.write_export(
+            dyna_flow_id_list,
+            list(line_by_dyna_flow_id.values()))
+
+        await dft_dependency_manager.delete_bulk(
+            [x.dft_dependency_id for x in dft_dependency_list])
+        await dyna_flow_task_manager.delete_bulk(dyna_flow_task_id_list)
+        await dyna_flow_manager.delete_bulk(dyna_flow_id_list)
+
+        for obj in [*dft_dependency_list, *dyna_flow_task_list,
+                    *dyna_flow_list]:
+            session.expunge(obj)
+
+        print(f"Archived {len(dyna_flow_list)} DynaFlows, "
+              f"{len(dyna_flow_task_list)} DynaFlowTasks and "
+              f"{len(dft_dependency_list)} DFTDependencies")
+        return len(dyna_flow_list)
+
+    def write_export(
+        self,
+        dyna_flow_id_list: List[int],
+        line_list: List[dict]
+    ) -> str:
+        """
+        Writes the lines of a batch to a new gzip compressed
+        JSON lines file, synced to disk before the rows
+        are deleted.
+
+        Returns the path of the file.
+        """
+        os.makedirs(self.archive_folder, exist_ok=True)
+
+        file_name = (
+            "dyna_flow_archive_"
+            f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')}_"
+            f"{dyna_flow_id_list[0]}_{dyna_flow_id_list[-1]}.jsonl.gz")
+        path = os.path.join(self.archive_folder, file_name)
+        temp_path = path + ".tmp"
+
+        with open(temp_path, "wb") as file:
+            with gzip.GzipFile(fileobj=file, mode="wb") as gzip_file:
+                for line in line_list:
+                    gzip_file.write(
+                        json.dumps(line, default=str).encode("utf-8"))
+                    gzip_file.write(b"\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, path)
+        return path
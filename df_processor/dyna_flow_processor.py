@@ -14,6 +14,13 @@ The `DynaFlowProcessor` class has the following attributes:
     task master is enabled.
 - `_is_dyna_flow_task_processor`: A boolean indicating whether the DynaFlow
     task processor is enabled.
+- `_task_max_concurrency`: The maximum number of DynaFlow tasks run at
+    the same time from the database.
+- `_queue_batch_size`: The number of queue messages received at a time.
+- `_queue_max_wait_seconds`: How long to wait for the first queue message.
+- `_daemon_min_poll_seconds`: The daemon poll interval while there is work.
+- `_daemon_max_poll_seconds`: The longest daemon poll interval when idle.
+- `_is_stop_requested`: A boolean indicating whether the daemon should stop.
 - `_queue_manager`: An instance of the `QueueManager` class for managing the
     task queues.
 - `_explicit_instance_id`: The explicit instance ID of the DynaFlowProcessor.
@@ -24,9 +31,15 @@ The `DynaFlowProcessor` class has the following attributes:
 - `_custom_temp_folder`: An instance of the `CustomTempFolder` class for
     managing temporary files.
 - `_pac_code`: The UUID of the PAC (Process Automation Control) code.
+- `_metrics_server`: The server of the metrics endpoint, if it is enabled.
+- `_process_pool`: The process pool lane of the CPU-bound tasks, enabled
+    by DYNAFLOW_CPU_POOL_MAX_WORKERS.
 
 The `DynaFlowProcessor` class has the following methods:
-- `run()`: Runs the DynaFlowProcessor application.
+- `run()`: Runs the DynaFlowProcessor application until there is no work.
+- `run_daemon()`: Runs the DynaFlowProcessor application until it is
+    stopped, waiting for work between passes.
+- `request_stop()`: Requests the daemon to stop after the running tasks.
 - `init_app()`: Initializes the application.
 - `get_message_count_async(queue_name)`: Gets the count of messages in a queue.
 - `get_instance_id()`: Gets the explicit instance ID of the DynaFlowProcessor.
@@ -34,21 +47,61 @@ The `DynaFlowProcessor` class has the following methods:
     processing.
 - `claim_dyna_flow_maintenace_for_processing()`: Claims DynaFlow
     maintenance for processing.
+- `archive_finished_dyna_flows()`: Exports and deletes the finished
+    DynaFlows older than DYNAFLOW_ARCHIVE_AFTER_DAYS.
+- `log_metrics_snapshot()`: Prints the processor metrics as one
+    JSON line.
+
+The task wait and run times, retries, claim conflicts and backlog
+sizes are recorded in the metrics of
+`df_processor.dyna_flow_processor_metrics`. They are served at
+http://DYNAFLOW_METRICS_HOST:DYNAFLOW_METRICS_PORT/metrics when
+DYNAFLOW_METRICS_PORT is set, and printed every
+DYNAFLOW_METRICS_LOG_SECONDS by the daemon.
 """
+import asyncio
+import json
+import signal
 import sys
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, List, Optional
 
 import managers as managers_and_enums  # noqa: F401
 from business import (DFMaintenanceBusObj, DynaFlowBusObj, DynaFlowTaskBusObj,
                       DynaFlowTaskTypeBusObj, DynaFlowTypeBusObj, PacBusObj,
                       TriStateFilterBusObj)
-from config import (DYNAFLOW_TASK_DEAD_QUEUE_NAME,
+from config import (DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT,
+                    DYNAFLOW_CPU_POOL_MAX_WORKERS,
+                    DYNAFLOW_DAEMON_MAX_POLL_SECONDS,
+                    DYNAFLOW_DAEMON_MIN_POLL_SECONDS,
+                    DYNAFLOW_MAINTENANCE_INTERVAL_MINUTES,
+                    DYNAFLOW_METRICS_HOST, DYNAFLOW_METRICS_LOG_SECONDS,
+                    DYNAFLOW_METRICS_PORT, DYNAFLOW_NOTIFY_CHANNEL,
+                    DYNAFLOW_QUEUE_BATCH_SIZE, DYNAFLOW_QUEUE_MAX_WAIT_SECONDS,
+                    DYNAFLOW_TASK_DEAD_QUEUE_NAME,
+                    DYNAFLOW_TASK_MAX_CONCURRENCY,
                     DYNAFLOW_TASK_PROCESSOR_QUEUE_NAME,
-                    DYNAFLOW_TASK_RESULT_QUEUE_NAME, IS_DYNAFLOW_TASK_MASTER,
-                    IS_DYNAFLOW_TASK_PROCESSOR, IS_DYNAFLOW_TASK_QUEUE_USED)
-from database import engine, get_db
+                    DYNAFLOW_TASK_RESULT_QUEUE_NAME,
+                    DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS,
+                    IS_DYNAFLOW_TASK_MASTER, IS_DYNAFLOW_TASK_PROCESSOR,
+                    IS_DYNAFLOW_TASK_QUEUE_USED,
+                    IS_DYNAFLOW_TASK_SCHEDULER_USED)
+from database import dyna_flow_engine, get_dyna_flow_db
+from df_processor.dyna_flow_archiver import DynaFlowArchiver
+from df_processor.dyna_flow_processor_metrics import (
+    DYNA_FLOW_ARCHIVED_TOTAL, DYNA_FLOW_BACKLOG, DYNA_FLOW_CLAIM_TOTAL,
+    DYNA_FLOW_PROCESSOR_PASS_SECONDS, DYNA_FLOW_QUEUE_MESSAGE_TOTAL,
+    DYNA_FLOW_SCHEDULED_TOTAL, DYNA_FLOW_TASK_RETRY_TOTAL,
+    DYNA_FLOW_TASK_RUN_SECONDS, DYNA_FLOW_TASK_RUN_TOTAL,
+    DYNA_FLOW_TASK_WAIT_SECONDS, OUTCOME_CANCELED, OUTCOME_ERROR,
+    OUTCOME_FAILED, OUTCOME_SKIPPED, OUTCOME_SUCCESSFUL, UNKNOWN_TASK_TYPE,
+    get_wait_seconds)
+from df_processor.dyna_flow_task_process_pool import DynaFlowTaskProcessPool
+from df_processor.dyna_flow_task_scheduler import DynaFlowTaskScheduler
+from df_processor.dyna_flow_type_schedule_engine import \
+    DynaFlowTypeScheduleEngine
 from dyna_flows.dyna_flow_factory import DynaFlowFactory  # noqa: F401
 from flows.flow_factory import FlowFactory  # noqa: F401
 from helpers.session_context import SessionContext
@@ -56,6 +109,8 @@ from reports import (ReportItemPacConfigDynaFlowDFTBuildToDoList,
                      ReportItemPacConfigDynaFlowTaskRunToDoList)
 from services.custom_temp_folder import CustomTempFolder
 from services.machine_identifier import MachineIdentifier
+from services.metrics import metrics_registry, start_metrics_server
+from services.queue_backend import QueueMessage
 from services.queue_manager import QueueManager
 
 
@@ -79,6 +134,12 @@ class DynaFlowProcessor:
               f"{IS_DYNAFLOW_TASK_MASTER}")
         print(f"IS_DYNAFLOW_TASK_PROCESSOR: "
               f"{IS_DYNAFLOW_TASK_PROCESSOR}")
+        print(f"DYNAFLOW_TASK_MAX_CONCURRENCY: "
+              f"{DYNAFLOW_TASK_MAX_CONCURRENCY}")
+        print(f"IS_DYNAFLOW_TASK_SCHEDULER_USED: "
+              f"{IS_DYNAFLOW_TASK_SCHEDULER_USED}")
+        print(f"DYNAFLOW_CPU_POOL_MAX_WORKERS: "
+              f"{DYNAFLOW_CPU_POOL_MAX_WORKERS}")
 
         self._task_result_queue_name = DYNAFLOW_TASK_RESULT_QUEUE_NAME
         self._task_dead_queue_name = DYNAFLOW_TASK_DEAD_QUEUE_NAME
@@ -86,6 +147,29 @@ class DynaFlowProcessor:
         self._is_task_queue_used = IS_DYNAFLOW_TASK_QUEUE_USED
         self._is_dyna_flow_task_master = IS_DYNAFLOW_TASK_MASTER
         self._is_dyna_flow_task_processor = IS_DYNAFLOW_TASK_PROCESSOR
+        self._task_max_concurrency = max(1, DYNAFLOW_TASK_MAX_CONCURRENCY)
+        self._daemon_min_poll_seconds = max(
+            0.1, DYNAFLOW_DAEMON_MIN_POLL_SECONDS)
+        self._daemon_max_poll_seconds = max(
+            self._daemon_min_poll_seconds, DYNAFLOW_DAEMON_MAX_POLL_SECONDS)
+        self._queue_batch_size = max(1, DYNAFLOW_QUEUE_BATCH_SIZE)
+        self._queue_max_wait_seconds = DYNAFLOW_QUEUE_MAX_WAIT_SECONDS
+        self._is_stop_requested = False
+        self._wake_event = None
+        self._notify_connection = None
+        self._notify_driver_connection = None
+        self._is_notify_listener_used = False
+        self._task_scheduler = None
+        self._schedule_engine = DynaFlowTypeScheduleEngine()
+        self._archiver = DynaFlowArchiver()
+        self._process_pool = DynaFlowTaskProcessPool(
+            DYNAFLOW_CPU_POOL_MAX_WORKERS)
+        self._metrics_server = None
+        self._metrics_log_seconds = DYNAFLOW_METRICS_LOG_SECONDS
+
+        if IS_DYNAFLOW_TASK_SCHEDULER_USED is True:
+            self._task_scheduler = DynaFlowTaskScheduler(
+                DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS)
 
         print("self._is_task_queue_used: "
               f"{self._is_task_queue_used}")
@@ -133,49 +217,383 @@ class DynaFlowProcessor:
 
         print(f"GetInstanceID() : {self.get_instance_id()}")
 
+        await self.start_metrics_server()
+
         self._custom_temp_folder.clear_temp_folder()
 
         await self.request_scheduled_dyna_flows()
 
         await self.cleanup_my_past_dyna_flow_tasks()
 
+        work_count = 1
+
+        while work_count > 0:
+            work_count = await self.run_pass()
+
+        await self.log_metrics_snapshot()
+
+        await self.stop_metrics_server()
+
+        self._process_pool.shutdown()
+
+        if self._is_task_queue_used is True:
+            await self._queue_manager.close()
+        print("DynaFlowProcessor completed")
+
+    async def run_daemon(self):
+        """
+        Run the DynaFlowProcessor until it is stopped.
+
+        After a pass that found work the next pass starts after
+        the minimum poll interval. Each idle pass doubles the
+        interval, up to the maximum poll interval. On PostgreSQL
+        the processor also listens on DYNAFLOW_NOTIFY_CHANNEL, so
+        a requested DynaFlow starts the next pass right away. When
+        the listen connection drops, the daemon wakes up, polls and
+        reconnects it before the next wait, retrying every pass
+        until the database is back.
+
+        SIGTERM and SIGINT stop the daemon once the running
+        tasks are done.
+
+        The processor metrics are printed every
+        DYNAFLOW_METRICS_LOG_SECONDS.
+        """
+        print("Starting DynaFlowProcessor daemon")
+
+        await self.init_app()
+
+        print(f"GetInstanceID() : {self.get_instance_id()}")
+
+        self._is_stop_requested = False
+        self._wake_event = asyncio.Event()
+
+        self.add_stop_signal_handlers()
+
+        await self.start_dyna_flow_listener()
+
+        await self.start_metrics_server()
+
+        metrics_logger = None
+        if self._metrics_log_seconds > 0:
+            metrics_logger = asyncio.create_task(
+                self.log_metrics_periodically())
+
+        self._custom_temp_folder.clear_temp_folder()
+
+        await self.cleanup_my_past_dyna_flow_tasks()
+
+        poll_seconds = self._daemon_min_poll_seconds
+        next_schedule_request = 0.0
+
+        try:
+            while self._is_stop_requested is not True:
+
+                loop_time = asyncio.get_running_loop().time()
+                if loop_time >= next_schedule_request:
+                    await self.request_scheduled_dyna_flows()
+                    next_schedule_request = \
+                        loop_time + self._daemon_max_poll_seconds
+
+                self._wake_event.clear()
+
+                await self.reconnect_dyna_flow_listener()
+
+                work_count = await self.run_pass()
+
+                if self._is_stop_requested is True:
+                    break
+
+                if work_count > 0:
+                    poll_seconds = self._daemon_min_poll_seconds
+                else:
+                    poll_seconds = min(
+                        poll_seconds * 2,
+                        self._daemon_max_poll_seconds)
+
+                wait_seconds = poll_seconds
+
+                # wake up when the next schedule is due
+                next_fire_utc_date_time = self._schedule_engine \
+                    .get_next_fire_utc_date_time()
+                if self._is_dyna_flow_task_master is True and \
+                        next_fire_utc_date_time is not None:
+                    fire_delay = next_fire_utc_date_time - \
+                        datetime.now(timezone.utc)
+                    wait_seconds = min(
+                        wait_seconds,
+                        max(
+                            self._daemon_min_poll_seconds,
+                            fire_delay.total_seconds()))
+
+                if await self.wait_for_wake(wait_seconds) is True:
+                    poll_seconds = self._daemon_min_poll_seconds
+        finally:
+            await self.stop_dyna_flow_listener()
+
+            if metrics_logger is not None:
+                metrics_logger.cancel()
+
+            await self.log_metrics_snapshot()
+
+            await self.stop_metrics_server()
+
+            self._process_pool.shutdown()
+
+            if self._is_task_queue_used is True:
+                await self._queue_manager.close()
+        print("DynaFlowProcessor daemon stopped")
+
+    async def wait_for_wake(self, wait_seconds: float) -> bool:
+        """
+        Wait up to wait_seconds for a notification or a stop.
+
+        Returns True if the daemon was woken up
+        before the wait ended.
+        """
+        print(f"Waiting {wait_seconds} seconds for work")
+
+        try:
+            await asyncio.wait_for(
+                self._wake_event.wait(),
+                timeout=wait_seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def request_stop(self):
+        """
+        Request the daemon to stop. Tasks that are
+        already running are finished first.
+        """
+        print("DynaFlowProcessor stop requested")
+        self._is_stop_requested = True
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def add_stop_signal_handlers(self):
+        """
+        Stop the daemon on SIGTERM and SIGINT.
+        """
+        loop = asyncio.get_running_loop()
+        for stop_signal in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(stop_signal, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # add_signal_handler is not available on Windows
+                signal.signal(
+                    stop_signal,
+                    lambda signum, frame: loop.call_soon_threadsafe(
+                        self.request_stop))
+
+    async def start_dyna_flow_listener(self):
+        """
+        Listen for requested DynaFlow notifications.
+        Only available on PostgreSQL with asyncpg.
+        """
+        if dyna_flow_engine.dialect.driver != "asyncpg":
+            print("DynaFlow notifications not available, polling only")
+            return
+
+        self._is_notify_listener_used = True
+
+        try:
+            self._notify_connection = await dyna_flow_engine.connect()
+            raw_connection = \
+                await self._notify_connection.get_raw_connection()
+            self._notify_driver_connection = \
+                raw_connection.driver_connection
+            self._notify_driver_connection.add_termination_listener(
+                self.on_dyna_flow_listener_terminated)
+            await self._notify_driver_connection.add_listener(
+                DYNAFLOW_NOTIFY_CHANNEL,
+                self.on_dyna_flow_notification)
+            print(f"Listening on {DYNAFLOW_NOTIFY_CHANNEL}")
+        except Exception as e:
+            print(f'Error occurred: {e}')
+            await self.stop_dyna_flow_listener()
+
+    def is_dyna_flow_listener_connected(self) -> bool:
+        """
+        Return True if the listen connection is open.
+        """
+        return self._notify_driver_connection is not None and \
+            self._notify_driver_connection.is_closed() is not True
+
+    async def reconnect_dyna_flow_listener(self):
+        """
+        Reconnect the listener when its connection dropped
+        or could not be opened. Notifications sent while it was
+        down are lost, so the pass that follows polls the
+        database for them.
+        """
+        if self._is_notify_listener_used is not True or \
+                self.is_dyna_flow_listener_connected():
+            return
+
+        print("DynaFlow notification connection lost, reconnecting")
+        await self.stop_dyna_flow_listener()
+        await self.start_dyna_flow_listener()
+
+    async def stop_dyna_flow_listener(self):
+        """
+        Stop listening for requested DynaFlow notifications.
+        """
+        if self._notify_connection is None:
+            return
+
+        try:
+            if self._notify_driver_connection is not None and \
+                    self._notify_driver_connection.is_closed() is True:
+                # do not return the dropped connection to the pool
+                await self._notify_connection.invalidate()
+            await self._notify_connection.close()
+        except Exception as e:
+            print(f'Error occurred: {e}')
+        self._notify_connection = None
+        self._notify_driver_connection = None
+
+    def on_dyna_flow_notification(
+        self,
+        connection,
+        pid,
+        channel,
+        payload
+    ):  # pylint: disable=unused-argument
+        """
+        Start the next daemon pass when a
+        DynaFlow is requested.
+        """
+        print(f"DynaFlow requested: {payload}")
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def on_dyna_flow_listener_terminated(
+        self,
+        connection
+    ):  # pylint: disable=unused-argument
+        """
+        Wake the daemon when the listen connection drops,
+        so it polls and reconnects the listener.
+        """
+        print("DynaFlow notification connection terminated")
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    async def start_metrics_server(self):
+        """
+        Serve the processor metrics at /metrics
+        when DYNAFLOW_METRICS_PORT is set.
+        """
+        if DYNAFLOW_METRICS_PORT <= 0 or self._metrics_server is not None:
+            return
+
+        try:
+            self._metrics_server = await start_metrics_server(
+                DYNAFLOW_METRICS_HOST,
+                DYNAFLOW_METRICS_PORT)
+            print(f"Serving metrics at http://{DYNAFLOW_METRICS_HOST}:"
+                  f"{DYNAFLOW_METRICS_PORT}/metrics")
+        except Exception as e:
+            print(f'Error occurred: {e}')
+
+    async def stop_metrics_server(self):
+        """
+        Stop serving the processor metrics.
+        """
+        if self._metrics_server is None:
+            return
+
+        self._metrics_server.close()
+        await self._metrics_server.wait_closed()
+        self._metrics_server = None
+
+    async def log_metrics_periodically(self):
+        """
+        Print the processor metrics every
+        DYNAFLOW_METRICS_LOG_SECONDS, until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self._metrics_log_seconds)
+            await self.log_metrics_snapshot()
+
+    async def log_metrics_snapshot(self):
+        """
+        Print the processor metrics as one JSON line.
+        The queue backlog is counted first.
+        """
+        try:
+            if self._is_task_queue_used is True:
+                for queue_name in (
+                        self._task_processor_queue_name,
+                        self._task_result_queue_name,
+                        self._task_dead_queue_name):
+                    DYNA_FLOW_BACKLOG.set(
+                        await self._queue_manager.get_message_count_async(
+                            queue_name),
+                        backlog_type=f"queue:{queue_name}")
+
+            print(json.dumps({
+                "dyna_flow_processor_metrics": {
+                    "instance_id": self._explicit_instance_id,
+                    "utc_date_time": datetime.now(timezone.utc).isoformat(),
+                    "metrics": metrics_registry.get_snapshot(),
+                }
+            }))
+        except Exception as e:
+            print(f'Error occurred: {e}')
+
+    async def run_pass(self) -> int:
+        """
+        Run one pass of the DynaFlowProcessor.
+
+        Returns the number of DynaFlows, tasks and
+        result messages found.
+        """
+        start = time.monotonic()
+        work_count = await self.run_pass_work()
+        DYNA_FLOW_PROCESSOR_PASS_SECONDS.observe(
+            time.monotonic() - start,
+            outcome="work" if work_count > 0 else "idle")
+        return work_count
+
+    async def run_pass_work(self) -> int:
+        """
+        Run the work of one pass of the DynaFlowProcessor.
+
+        Returns the number of DynaFlows, tasks and
+        result messages found.
+        """
         run_to_do_count = 0
         build_to_do_count = 0
         result_message_count = 0
-        first_run = True
-
-        while (run_to_do_count > 0 or
-                build_to_do_count > 0 or
-                result_message_count > 0 or
-                first_run is True):
+        scheduled_count = 0
 
-            run_to_do_count = 0
-            build_to_do_count = 0
-            result_message_count = 0
+        if self._is_dyna_flow_task_master is True:
 
-            first_run = False
+            scheduled_count = await self.request_due_scheduled_dyna_flows()
 
-            if self._is_dyna_flow_task_master is True:
+            if self._is_task_queue_used is True:
+                result_message_count = await \
+                    self.process_dyna_flow_queue_task_results()
 
-                if self._is_task_queue_used is True:
-                    result_message_count = await \
-                        self.process_dyna_flow_queue_task_results()
+            build_to_do_count = await self.build_dyna_flow_tasks()
 
-                build_to_do_count = await self.build_dyna_flow_tasks()
+            if self._is_task_queue_used is True:
 
-                if self._is_task_queue_used is True:
+                run_to_do_count = await self.serve_dyna_flow_tasks()
 
-                    run_to_do_count = await self.serve_dyna_flow_tasks()
+                result_message_count = await \
+                    self.process_dyna_flow_queue_task_results()
 
-                    result_message_count = await \
-                        self.process_dyna_flow_queue_task_results()
+        if self._is_dyna_flow_task_processor is True:
+            if self._is_task_queue_used is True:
+                await self.run_dyna_flow_queue_tasks()
+            else:
+                run_to_do_count = await self.run_dyna_flow_db_tasks()
 
-            if self._is_dyna_flow_task_processor is True:
-                if self._is_task_queue_used is True:
-                    await self.run_dyna_flow_queue_tasks()
-                else:
-                    run_to_do_count = await self.run_dyna_flow_db_tasks()
-        print("DynaFlowProcessor completed")
+        return run_to_do_count + build_to_do_count + \
+            result_message_count + scheduled_count
 
     async def init_app(self):
         """
@@ -242,6 +660,9 @@ class DynaFlowProcessor:
     async def request_scheduled_dyna_flows(self):
         """
         Request scheduled DynaFlows for processing.
+
+        The processor that claims the DynaFlow maintenance
+        also archives the finished DynaFlows.
         """
         print("Requesting scheduled DynaFlows for processing")
         ownership = await self.claim_dyna_flow_maintenace_for_processing()
@@ -249,7 +670,9 @@ class DynaFlowProcessor:
         if ownership is not True:
             return
 
-        async for session in get_db():
+        await self.archive_finished_dyna_flows()
+
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -321,7 +744,8 @@ class DynaFlowProcessor:
                     .set_prop_last_scheduled_df_process_request_utc_date_time(
                         datetime.now(timezone.utc)) \
                     .set_prop_next_scheduled_df_process_request_utc_date_time(
-                        datetime.now(timezone.utc) + timedelta(minutes=30))
+                        datetime.now(timezone.utc) + timedelta(
+                            minutes=DYNAFLOW_MAINTENANCE_INTERVAL_MINUTES))
 
                 await df_mainenance_bus_obj.save()
 
@@ -334,6 +758,87 @@ class DynaFlowProcessor:
                 await session.close()
         print("Scheduled DynaFlows requested")
 
+    async def archive_finished_dyna_flows(self) -> int:
+        """
+        Archive the finished DynaFlows older than
+        DYNAFLOW_ARCHIVE_AFTER_DAYS, each batch in its own
+        transaction, up to DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT
+        batches. The rest is left for the next maintenance.
+
+        Returns the number of DynaFlows archived.
+        """
+        if self._archiver.is_enabled() is not True:
+            return 0
+
+        print("Archiving finished DynaFlows")
+        archived_count = 0
+        before_utc_date_time = \
+            self._archiver.get_archive_before_utc_date_time()
+
+        for _ in range(DYNAFLOW_ARCHIVE_MAX_BATCH_COUNT):
+
+            if self._is_stop_requested is True:
+                break
+
+            batch_count = 0
+
+            async for session in get_dyna_flow_db():
+
+                session_context = self.build_session_context(session)
+
+                try:
+
+                    batch_count = await self._archiver.archive_batch(
+                        session_context,
+                        before_utc_date_time)
+
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    print(f'Error occurred: {e}')
+                    batch_count = 0
+                finally:
+                    await session.close()
+
+            archived_count += batch_count
+            DYNA_FLOW_ARCHIVED_TOTAL.inc(batch_count)
+
+            if batch_count < self._archiver.batch_size:
+                break
+
+        print(f"{archived_count} finished DynaFlows archived")
+        return archived_count
+
+    async def request_due_scheduled_dyna_flows(self) -> int:
+        """
+        Request the DynaFlows of the due
+        DynaFlowTypeSchedules.
+
+        Returns the number of DynaFlows requested.
+        """
+        dyna_flow_count = 0
+
+        async for session in get_dyna_flow_db():
+
+            session_context = self.build_session_context(session)
+
+            try:
+
+                dyna_flow_count = await self._schedule_engine.tick(
+                    session_context)
+
+                await session.commit()
+                DYNA_FLOW_SCHEDULED_TOTAL.inc(dyna_flow_count)
+            except Exception as e:
+                await session.rollback()
+                print(f'Error occurred: {e}')
+                dyna_flow_count = 0
+                # the heap may hold fire times that were not saved
+                self._schedule_engine.request_reload()
+            finally:
+                await session.close()
+        return dyna_flow_count
+
     async def claim_dyna_flow_maintenace_for_processing(
         self
     ) -> bool:
@@ -343,7 +848,7 @@ class DynaFlowProcessor:
         print("Claiming DynaFlow maintenance for processing")
         ownership = True
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -439,7 +944,7 @@ class DynaFlowProcessor:
         Cleanup past DynaFlow tasks.
         """
         print("Cleaning up past DynaFlow tasks")
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -501,36 +1006,213 @@ class DynaFlowProcessor:
     async def process_dyna_flow_queue_task_results(self):
         """
         Process DynaFlow queue task results.
+
+        The results are received in batches of DYNAFLOW_QUEUE_BATCH_SIZE
+        messages. Only the first receive waits for a message, the next
+        ones drain what is already in the queue. The task states of a
+        batch are saved in one transaction and the messages are
+        completed together.
         """
         print("Processing DynaFlow queue task results")
         message_count = 0
+        max_wait_time = self._queue_max_wait_seconds
 
         while True:
-            message = await self._queue_manager.read_next_message(
-                self._task_result_queue_name
+            message_list = await self._queue_manager.read_messages(
+                self._task_result_queue_name,
+                self._queue_batch_size,
+                max_wait_time
             )
-            if len(message) == 0:
+            if len(message_list) == 0:
+                break
+            message_count += len(message_list)
+            print(f"{len(message_list)} messages found...")
+
+            saved_code_dict = await self.save_dyna_flow_task_message_list(
+                message_list)
+
+            self.record_queue_messages(
+                self._task_result_queue_name,
+                len(message_list),
+                saved_code_dict)
+
+            await self.refresh_task_scheduler([
+                code
+                for code in saved_code_dict.values()
+                if code is not None
+            ])
+
+            await self.send_dead_messages(message_list, saved_code_dict)
+
+            await self._queue_manager.mark_messages_as_completed(
+                self._task_result_queue_name, message_list)
+
+            if len(message_list) < self._queue_batch_size:
                 break
-            message_count += 1
-            print("Message found...")
-            # not necessary. worker is saving it currently
-            # try:
-            #     dyna_flow_task =
-            #   self.create_dyna_flow_task_from_message(message)
-            #     await self.save_dyna_flow_task(dyna_flow_task)
-            # except Exception as ex:
-            #     print("Error reading message")
-            #     await self.send_message_async(
-            #         self._task_dead_queue_name,
-            #         message)
-            #     print(str(ex))
-            await self._queue_manager.mark_message_as_completed(
-                self._task_result_queue_name, message)
+            max_wait_time = 0
 
         print("DynaFlow queue task results processed")
 
         return message_count
 
+    async def save_dyna_flow_task_message_list(
+        self,
+        message_list: List[QueueMessage],
+        is_claimed: bool = False
+    ) -> Dict[str, Optional[uuid.UUID]]:
+        """
+        Save the DynaFlow task states of a batch of
+        queue messages in one transaction.
+
+        If the batch fails, the messages are saved one at a
+        time, so that one bad message does not fail the others.
+
+        Returns the saved DynaFlow task code by message id,
+        with None for the messages that were skipped.
+        """
+        saved_code_dict = await self.save_dyna_flow_task_message_batch(
+            message_list,
+            is_claimed)
+
+        if saved_code_dict is not None:
+            return saved_code_dict
+
+        saved_code_dict = {}
+        if len(message_list) > 1:
+            for message in message_list:
+                saved = await self.save_dyna_flow_task_message_batch(
+                    [message],
+                    is_claimed)
+                if saved is not None:
+                    saved_code_dict.update(saved)
+        return saved_code_dict
+
+    async def save_dyna_flow_task_message_batch(
+        self,
+        message_list: List[QueueMessage],
+        is_claimed: bool
+    ) -> Optional[Dict[str, Optional[uuid.UUID]]]:
+        """
+        Save the DynaFlow task states of queue
+        messages in one transaction.
+
+        With is_claimed, the tasks are also assigned to
+        this processor.
+
+        A message older than its DynaFlow task (lower
+        last_change_code) is skipped: its task is not
+        saved and it maps to None. This covers a task
+        another processor already claimed, as the claim
+        saves the task. With is_claimed, a message of a
+        completed or canceled task is skipped too.
+
+        Returns the saved DynaFlow task code by message id,
+        or None if the transaction failed.
+        """
+        saved_code_dict = None
+
+        async for session in get_dyna_flow_db():
+
+            session_context = self.build_session_context(session)
+
+            try:
+
+                result = {}
+
+                for message in message_list:
+                    data = json.loads(message.body)
+
+                    dyna_flow_task = DynaFlowTaskBusObj(session_context)
+
+                    await dyna_flow_task.load_from_code(
+                        uuid.UUID(str(data["code"])))
+
+                    if dyna_flow_task.last_change_code > \
+                            data.get("last_change_code", 0):
+                        print(f"Skipping stale message for DynaFlowTask "
+                              f"{dyna_flow_task.code}")
+                        result[message.message_id] = None
+                        continue
+
+                    if is_claimed is True and (
+                            dyna_flow_task.is_completed is True or (
+                                dyna_flow_task.is_canceled is True)):
+                        print(f"Skipping message for finished DynaFlowTask "
+                              f"{dyna_flow_task.code}")
+                        result[message.message_id] = None
+                        continue
+
+                    await dyna_flow_task.load_from_json(message.body)
+
+                    if is_claimed is True:
+                        dyna_flow_task.processor_identifier = \
+                            self.get_instance_id()
+
+                    # stamps the last update user and time
+                    await dyna_flow_task.save()
+
+                    result[message.message_id] = dyna_flow_task.code
+
+                await session.commit()
+                saved_code_dict = result
+            except Exception as e:
+                print(f'Error occurred: {e}')
+                await session.rollback()
+            finally:
+                await session.close()
+        return saved_code_dict
+
+    def record_queue_messages(
+        self,
+        queue_name: str,
+        message_count: int,
+        saved_code_dict: Dict[str, Optional[uuid.UUID]]
+    ):
+        """
+        Count the received queue messages that were
+        saved, skipped and sent to the dead queue.
+        """
+        saved_count = len([
+            code
+            for code in saved_code_dict.values()
+            if code is not None
+        ])
+        DYNA_FLOW_QUEUE_MESSAGE_TOTAL.inc(
+            saved_count,
+            queue=queue_name,
+            outcome="saved")
+        DYNA_FLOW_QUEUE_MESSAGE_TOTAL.inc(
+            len(saved_code_dict) - saved_count,
+            queue=queue_name,
+            outcome="skipped")
+        DYNA_FLOW_QUEUE_MESSAGE_TOTAL.inc(
+            message_count - len(saved_code_dict),
+            queue=queue_name,
+            outcome="dead")
+
+    async def send_dead_messages(
+        self,
+        message_list: List[QueueMessage],
+        saved_code_dict: Dict[str, Optional[uuid.UUID]]
+    ):
+        """
+        Send the messages that could not
+        be saved to the dead queue.
+        """
+        dead_message_list = [
+            message.body
+            for message in message_list
+            if message.message_id not in saved_code_dict
+        ]
+
+        if len(dead_message_list) == 0:
+            return
+
+        print(f"Sending {len(dead_message_list)} messages to the dead queue")
+        await self._queue_manager.send_messages_async(
+            self._task_dead_queue_name,
+            dead_message_list)
+
     async def send_message_async(self, queue_name, message):
         """
         Send a message to a queue.
@@ -547,8 +1229,6 @@ class DynaFlowProcessor:
 
         build_to_do_list = await self.get_task_build_todo_list()
 
-        dyna_flow_type_list = await self.get_dyna_flow_type_list()
-
         build_to_do_count = len(build_to_do_list)
 
         print(
@@ -556,11 +1236,29 @@ class DynaFlowProcessor:
             "DynaFlows that need tasks built"
         )
 
-        for item in build_to_do_list:
-            await self.build_tasks_for_dyna_flow(
-                item.dyna_flow_code,
-                dyna_flow_type_list
-            )
+        pending_code_list = [
+            item.dyna_flow_code for item in build_to_do_list]
+
+        while len(pending_code_list) > 0:
+            if self._is_stop_requested is True:
+                print("Stop requested, not building more DynaFlows")
+                break
+
+            # claim a window of DynaFlows right before their build,
+            # so a stop or crash leaves the rest of the list unclaimed
+            claimed_code_list = \
+                await self.claim_dyna_flow_list_for_task_build(
+                    pending_code_list,
+                    self._task_max_concurrency)
+
+            pending_code_list = pending_code_list[len(
+                self.get_claim_attempted_code_list(
+                    pending_code_list,
+                    claimed_code_list,
+                    self._task_max_concurrency)):]
+
+            for dyna_flow_code in claimed_code_list:
+                await self.build_tasks_for_dyna_flow(dyna_flow_code)
         print("DynaFlow tasks built")
         return build_to_do_count
 
@@ -573,7 +1271,7 @@ class DynaFlowProcessor:
         print("Getting task build to-do list")
         build_to_do_list = []
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -598,6 +1296,10 @@ class DynaFlowProcessor:
                             tri_state_no.code),
                         item_count_per_page=100)
 
+                DYNA_FLOW_BACKLOG.set(
+                    len(build_to_do_list),
+                    backlog_type="task_build")
+
                 await session.commit()
             except Exception as e:
                 await session.rollback()
@@ -616,7 +1318,7 @@ class DynaFlowProcessor:
         print("Getting DynaFlow type list")
         dyna_flow_type_list = []
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -647,7 +1349,7 @@ class DynaFlowProcessor:
         print("Getting DynaFlow task type list")
         dyna_flow_task_type_list = []
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -672,22 +1374,14 @@ class DynaFlowProcessor:
 
     async def build_tasks_for_dyna_flow(
         self,
-        dyna_flow_code: uuid.UUID,
-        dyna_flow_type_list: List[DynaFlowTypeBusObj]
+        dyna_flow_code: uuid.UUID
     ):
         """
-        Build tasks for a DynaFlow.
+        Build tasks for a DynaFlow
+        claimed by this processor.
         """
         print(f"Building tasks for DynaFlow {dyna_flow_code}")
-        task_ownership = await self.claim_dyna_flow_for_task_build(
-            dyna_flow_code,
-            dyna_flow_type_list
-        )
-
-        if task_ownership is not True:
-            return
-
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -740,71 +1434,124 @@ class DynaFlowProcessor:
                 await session.close()
         print("Tasks built for DynaFlow")
 
-    async def claim_dyna_flow_for_task_build(
+    async def claim_dyna_flow_list_for_task_build(
         self,
-        dyna_flow_code: uuid.UUID,
-        dyna_flow_type_list: List[DynaFlowTypeBusObj]
-    ) -> bool:
+        dyna_flow_code_list: List[uuid.UUID],
+        item_count: Optional[int] = None
+    ) -> List[uuid.UUID]:
         """
-        Claim a DynaFlow for task build
+        Claim DynaFlows for task build
+        with a single statement. DynaFlows
+        already claimed by another processor
+        are skipped.
+
+        With item_count, at most that many DynaFlows
+        are claimed, in the order of the list.
         """
-        print(f"Claiming DynaFlow for task build {dyna_flow_code}")
-        task_ownership = True
+        print(f"Claiming {len(dyna_flow_code_list)} "
+              "DynaFlows for task build")
+        claimed_code_list = []
 
-        async for session in get_db():
+        if len(dyna_flow_code_list) == 0:
+            return claimed_code_list
+
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
             try:
 
-                dyna_flow = DynaFlowBusObj(session_context)
-                await dyna_flow.load_from_code(dyna_flow_code)
-
-                if dyna_flow.is_task_creation_started is True:
-                    task_ownership = False
-                    return task_ownership
-
-                dyna_flow.is_task_creation_started = True
-
-                dyna_flow.task_creation_processor_identifier = \
-                    self.get_instance_id()
+                dyna_flow_manager = managers_and_enums.DynaFlowManager(
+                    session_context)
 
-                dyna_flow_type = next(
-                    (
-                        x
-                        for x in dyna_flow_type_list
-                        if x.dyna_flow_type_id == dyna_flow.dyna_flow_type_id
-                    ),
-                    None
+                dyna_flow_list = await dyna_flow_manager.claim_for_task_build(
+                    dyna_flow_code_list,
+                    self.get_instance_id(),
+                    item_count
                 )
 
-                assert dyna_flow_type is not None
-
-                dyna_flow.priority_level = \
-                    dyna_flow_type.priority_level
-
-                await dyna_flow.save()
+                claimed_code_list = [x.code for x in dyna_flow_list]
 
                 await session.commit()
+
+                self.record_claim(
+                    "task_build",
+                    len(self.get_claim_attempted_code_list(
+                        dyna_flow_code_list,
+                        claimed_code_list,
+                        item_count)),
+                    len(claimed_code_list))
             except Exception as e:
                 print(f'Error occurred: {e}')
                 await session.rollback()
-                task_ownership = False
+                claimed_code_list = []
+                DYNA_FLOW_CLAIM_TOTAL.inc(
+                    len(dyna_flow_code_list[:item_count]),
+                    claim_type="task_build",
+                    outcome=OUTCOME_ERROR)
             finally:
                 await session.close()
-        print("DynaFlow claimed for task build")
-        return task_ownership
+        print(f"{len(claimed_code_list)} DynaFlows claimed for task build")
+        return claimed_code_list
+
+    def record_claim(
+        self,
+        claim_type: str,
+        requested_count: int,
+        claimed_count: int
+    ):
+        """
+        Count the claimed items and the items
+        claimed by another processor first.
+        """
+        if claimed_count > 0:
+            DYNA_FLOW_CLAIM_TOTAL.inc(
+                claimed_count,
+                claim_type=claim_type,
+                outcome="claimed")
+        if requested_count > claimed_count:
+            DYNA_FLOW_CLAIM_TOTAL.inc(
+                requested_count - claimed_count,
+                claim_type=claim_type,
+                outcome="conflict")
+
+    def get_claim_attempted_code_list(
+        self,
+        code_list: List[uuid.UUID],
+        claimed_code_list: List[uuid.UUID],
+        item_count: Optional[int]
+    ) -> List[uuid.UUID]:
+        """
+        Get the leading codes of the list that a claim of
+        at most item_count items tried to claim.
+
+        The claim tries the codes in order until item_count
+        are claimed, so once they are, the codes after the
+        last claimed one were not tried.
+        """
+        if item_count is None or len(claimed_code_list) < item_count:
+            return list(code_list)
+        return list(code_list[:code_list.index(claimed_code_list[-1]) + 1])
 
     async def get_task_run_todo_list(
         self
     ) -> List[ReportItemPacConfigDynaFlowTaskRunToDoList]:
         """
         Get the task run to-do list
+
+        With IS_DYNAFLOW_TASK_SCHEDULER_USED, the list comes
+        from the in-memory task scheduler instead of the task
+        run to-do list query. The scheduler is seeded again
+        every DYNAFLOW_TASK_SCHEDULER_RESYNC_SECONDS. In between,
+        the tasks created since the last call are added, and
+        the dependencies the blocked tasks wait on are read
+        again, so tasks completed by another processor unblock
+        their dependents on the next call.
         """
         print("Getting task run to-do list")
         run_to_do_list = []
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -815,145 +1562,224 @@ class DynaFlowProcessor:
                 await pac.load_from_enum(
                     pac_enum=managers_and_enums.PacEnum.UNKNOWN)
 
-                tri_state_no = TriStateFilterBusObj(session_context)
-                await tri_state_no.load_from_enum(
-                    tri_state_filter_enum=(
-                        managers_and_enums.TriStateFilterEnum.NO)
-                )
+                if self._task_scheduler is not None:
+                    if self._task_scheduler.is_resync_due():
+                        await self._task_scheduler.seed(
+                            session_context,
+                            pac.pac_id)
+                    else:
+                        await self._task_scheduler.load_new_dyna_flow_tasks(
+                            session_context,
+                            pac.pac_id)
+                        await self._task_scheduler.refresh_blocking_edges(
+                            session_context)
+
+                    run_to_do_list = self._task_scheduler.get_ready_list(
+                        item_count=100)
+
+                    DYNA_FLOW_BACKLOG.set(
+                        self._task_scheduler.pending_count,
+                        backlog_type="task_run")
+                else:
+                    tri_state_no = TriStateFilterBusObj(session_context)
+                    await tri_state_no.load_from_enum(
+                        tri_state_filter_enum=(
+                            managers_and_enums.TriStateFilterEnum.NO)
+                    )
 
-                run_to_do_list = await pac. \
-                    generate_report_pac_config_dyna_flow_task_run_to_do_list(
-                        order_by_column_name="DynaFlowPriorityLevel",
-                        order_by_descending=True,
-                        is_run_task_debug_required_tri_state_filter_code=(
-                            tri_state_no.code),
-                        item_count_per_page=100)
+                    run_to_do_list = await pac. \
+                        generate_report_pac_config_dyna_flow_task_run_to_do_list(  # noqa: E501
+                            order_by_column_name="DynaFlowPriorityLevel",
+                            order_by_descending=True,
+                            is_run_task_debug_required_tri_state_filter_code=(
+                                tri_state_no.code),
+                            item_count_per_page=100)
+
+                    DYNA_FLOW_BACKLOG.set(
+                        len(run_to_do_list),
+                        backlog_type="task_run")
 
                 await session.commit()
             except Exception as e:
                 await session.rollback()
                 print(f'Error occurred: {e}')
+                if self._task_scheduler is not None:
+                    self._task_scheduler.request_resync()
             finally:
                 await session.close()
         print("Task run to-do list retrieved")
         return run_to_do_list
 
-    async def claim_dyna_flow_task_for_task_run(
+    async def claim_dyna_flow_task_list_for_task_run(
         self,
-        dyna_flow_task_code: uuid.UUID,
-        dyna_flow_task_type_list: List[DynaFlowTaskTypeBusObj]
-    ) -> bool:
+        dyna_flow_task_code_list: List[uuid.UUID],
+        item_count: Optional[int] = None
+    ) -> Dict[uuid.UUID, bool]:
         """
-        Claim a DynaFlow task for task run
+        Claim DynaFlow tasks for task run
+        with a single statement. DynaFlow tasks
+        already claimed by another processor
+        are skipped.
+
+        With item_count, at most that many tasks
+        are claimed, in the order of the list.
+
+        Returns the is_parallel_run_allowed value
+        of each claimed task by task code, in the
+        order of the list.
         """
-        print(f"Claiming DynaFlow task for task run {dyna_flow_task_code}")
-        task_ownership = True
+        print(f"Claiming {len(dyna_flow_task_code_list)} "
+              "DynaFlow tasks for task run")
+        claimed_code_dict = {}
+
+        if len(dyna_flow_task_code_list) == 0:
+            return claimed_code_dict
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
             try:
 
-                dyna_flow_task = DynaFlowTaskBusObj(session_context)
-                await dyna_flow_task.load_from_code(dyna_flow_task_code)
+                dyna_flow_task_manager = \
+                    managers_and_enums.DynaFlowTaskManager(session_context)
 
-                if dyna_flow_task.is_started is True:
-                    task_ownership = False
-                    return task_ownership
+                dyna_flow_task_list = await dyna_flow_task_manager. \
+                    claim_for_task_run(
+                        dyna_flow_task_code_list,
+                        self.get_instance_id(),
+                        item_count
+                    )
 
-                dyna_flow_task.is_started = True
-                dyna_flow_task.started_utc_date_time = \
-                    datetime.now(timezone.utc)
-                dyna_flow_task.processor_identifier = self.get_instance_id()
-
-                dyna_flow_task_type = next(
-                    (
-                        x
-                        for x in dyna_flow_task_type_list
-                        if x.dyna_flow_task_type_id == (
-                            dyna_flow_task.dyna_flow_task_type_id)
-                    ),
-                    None
-                )
+                claimed_code_dict = {
+                    x.code: x.is_parallel_run_allowed is True
+                    for x in dyna_flow_task_list
+                }
+
+                await session.commit()
+
+                self.record_claim(
+                    "task_run",
+                    len(self.get_claim_attempted_code_list(
+                        dyna_flow_task_code_list,
+                        list(claimed_code_dict),
+                        item_count)),
+                    len(claimed_code_dict))
+            except Exception as e:
+                print(f'Error occurred: {e}')
+                await session.rollback()
+                claimed_code_dict = {}
+                DYNA_FLOW_CLAIM_TOTAL.inc(
+                    len(dyna_flow_task_code_list[:item_count]),
+                    claim_type="task_run",
+                    outcome=OUTCOME_ERROR)
+                if self._task_scheduler is not None:
+                    self._task_scheduler.request_resync()
+            finally:
+                await session.close()
+
+        if self._task_scheduler is not None:
+            # tasks that were tried but not claimed are
+            # started or completed by another processor
+            for dyna_flow_task_code in self.get_claim_attempted_code_list(
+                    dyna_flow_task_code_list,
+                    list(claimed_code_dict),
+                    item_count):
+                self._task_scheduler.on_dyna_flow_task_claimed(
+                    dyna_flow_task_code)
+        print(f"{len(claimed_code_dict)} DynaFlow tasks claimed for task run")
+        return claimed_code_dict
+
+    async def refresh_task_scheduler(
+        self,
+        dyna_flow_task_code_list: List[uuid.UUID]
+    ):
+        """
+        Apply the saved state of DynaFlow tasks
+        and their DynaFlows to the task scheduler.
+        """
+        if self._task_scheduler is None or \
+                len(dyna_flow_task_code_list) == 0:
+            return
 
-                assert dyna_flow_task_type is not None
+        async for session in get_dyna_flow_db():
 
-                dyna_flow_task.max_retry_count = \
-                    dyna_flow_task_type.max_retry_count
+            session_context = self.build_session_context(session)
 
-                await dyna_flow_task.save()
+            try:
+
+                await self._task_scheduler.refresh_dyna_flow_tasks(
+                    session_context,
+                    dyna_flow_task_code_list)
 
                 await session.commit()
             except Exception as e:
-                print(f'Error occurred: {e}')
                 await session.rollback()
-                task_ownership = False
+                print(f'Error occurred: {e}')
+                self._task_scheduler.request_resync()
             finally:
                 await session.close()
-        print("DynaFlow task claimed for task run")
-        return task_ownership
 
-    async def get_dyna_flow_task_json(
+    async def get_dyna_flow_task_json_list(
         self,
-        dyna_flow_task_code: uuid.UUID
-    ) -> str:
+        dyna_flow_task_code_list: List[uuid.UUID]
+    ) -> List[str]:
         """
-        Get the JSON representation of a DynaFlow task
+        Get the JSON representation of DynaFlow tasks
         """
         print(
             "Getting JSON representation of "
-            f"DynaFlow task {dyna_flow_task_code}")
-        json = ""
-        async for session in get_db():
+            f"{len(dyna_flow_task_code_list)} DynaFlow tasks")
+        json_list = []
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
             try:
 
-                dyna_flow_task = DynaFlowTaskBusObj(session_context)
+                for dyna_flow_task_code in dyna_flow_task_code_list:
 
-                await dyna_flow_task.load_from_code(dyna_flow_task_code)
+                    dyna_flow_task = DynaFlowTaskBusObj(session_context)
+
+                    await dyna_flow_task.load_from_code(dyna_flow_task_code)
 
-                json = dyna_flow_task.to_json()
+                    json_list.append(dyna_flow_task.to_json())
 
                 await session.commit()
             except Exception as e:
                 print(f'Error occurred: {e}')
                 await session.rollback()
+                json_list = []
             finally:
                 await session.close()
-        print("JSON representation of DynaFlow task retrieved")
-        return json
+        print("JSON representation of DynaFlow tasks retrieved")
+        return json_list
 
-    async def serve_dyna_flow_task(
+    async def serve_dyna_flow_task_list(
         self,
-        dyna_flow_task_code: uuid.UUID,
-        dyna_flow_task_type_list: List[DynaFlowTaskTypeBusObj]
+        dyna_flow_task_code_list: List[uuid.UUID]
     ):
         """
-        Serve a DynaFlow task
+        Serve DynaFlow tasks claimed by this
+        processor, in batches of queue messages
         """
-        print(f"Serving DynaFlow task {dyna_flow_task_code}")
+        print(f"Serving {len(dyna_flow_task_code_list)} DynaFlow tasks")
         if self._is_task_queue_used is not True:
             return
 
-        task_ownership = await self.claim_dyna_flow_task_for_task_run(
-            dyna_flow_task_code,
-            dyna_flow_task_type_list
-        )
-
-        if task_ownership is not True:
-            return
+        for index in range(
+                0, len(dyna_flow_task_code_list), self._queue_batch_size):
+            code_batch = dyna_flow_task_code_list[
+                index:index + self._queue_batch_size]
 
-        print(f"Sending Queue Message dft {str(dyna_flow_task_code)}")
+            json_list = await self.get_dyna_flow_task_json_list(code_batch)
 
-        json = await self.get_dyna_flow_task_json(dyna_flow_task_code)
+            print(f"Sending {len(json_list)} Queue Messages")
 
-        await self.send_message_async(
-            self._task_processor_queue_name,
-            json)
-        print("DynaFlow task served")
+            await self._queue_manager.send_messages_async(
+                self._task_processor_queue_name,
+                json_list)
+        print("DynaFlow tasks served")
 
     async def serve_dyna_flow_tasks(self):
         """
@@ -965,23 +1791,16 @@ class DynaFlowProcessor:
 
         run_to_do_list = await self.get_task_run_todo_list()
 
-        dyna_flow_task_type_list = await self.get_dyna_flow_task_type_list()
-
         run_to_do_count = len(run_to_do_list)
 
         print(f"Found {run_to_do_count} "
               "DynaFlowTasks that need to be run")
 
-        count = 0
-
-        for item in run_to_do_list:
-            count += 1
+        claimed_code_dict = await self.claim_dyna_flow_task_list_for_task_run(
+            [item.dyna_flow_task_code for item in run_to_do_list]
+        )
 
-            print(f"Checking DynaFlowTask #{str(count)} of {run_to_do_count}"
-                  f" : {str(item.dyna_flow_task_code)}")
-            await self.serve_dyna_flow_task(
-                item.dyna_flow_task_code,
-                dyna_flow_task_type_list)
+        await self.serve_dyna_flow_task_list(list(claimed_code_dict))
         print("DynaFlow tasks served")
         return run_to_do_count
 
@@ -989,129 +1808,328 @@ class DynaFlowProcessor:
         """
         Run DynaFlow tasks from the
         database
+
+        Tasks are started in priority order. Tasks that allow
+        a parallel run are run at the same time, up to
+        DYNAFLOW_TASK_MAX_CONCURRENCY tasks, each with its own
+        session. A task that does not allow a parallel run waits
+        for the running tasks to finish and then runs alone.
+
+        Tasks are claimed right before they start: the parallel
+        tasks next in the list in one claim of up to the free
+        slots, and a serial task once the running tasks have
+        finished, so its started time is not stamped while
+        it waits.
+
+        Tasks locked by a DFTDependency are not in the to-do
+        list, so they are picked up by a later call once
+        their dependencies are successful.
         """
         print("Running DynaFlow tasks from the database")
         run_to_do_list = await self.get_task_run_todo_list()
 
-        dyna_flow_task_type_list = await self.get_dyna_flow_task_type_list()
-
         run_to_do_count = len(run_to_do_list)
 
         print(f"Found {run_to_do_count} "
               "DynaFlowTasks that need to be run")
 
-        count = 0
+        is_parallel_run_allowed_dict = \
+            await self.get_dyna_flow_task_parallel_run_allowed_dict(
+                [item.dyna_flow_task_code for item in run_to_do_list])
 
-        for item in run_to_do_list:
-            count += 1
+        semaphore = asyncio.Semaphore(self._task_max_concurrency)
+        running_task_list = []
 
-            print(f"Checking DynaFlowTask #{str(count)} of {run_to_do_count}"
-                  f" : {str(item.dyna_flow_task_code)}")
-            await self.run_dyna_flow_db_task(
-                item.dyna_flow_task_code,
-                dyna_flow_task_type_list)
+        # tasks deleted since the to-do list was read are skipped
+        pending_code_list = [
+            item.dyna_flow_task_code
+            for item in run_to_do_list
+            if item.dyna_flow_task_code in is_parallel_run_allowed_dict
+        ]
+
+        if self._is_dyna_flow_task_processor is not True:
+            pending_code_list = []
+
+        while len(pending_code_list) > 0:
+            if self._is_stop_requested is True:
+                print("Stop requested, not starting more DynaFlowTasks")
+                break
+
+            dyna_flow_task_code = pending_code_list[0]
+
+            if self._task_max_concurrency == 1 or \
+                    is_parallel_run_allowed_dict[
+                        dyna_flow_task_code] is not True:
+                await self.wait_for_dyna_flow_db_tasks(running_task_list)
+                running_task_list = []
+
+                pending_code_list = pending_code_list[1:]
+
+                claimed_code_dict = await \
+                    self.claim_dyna_flow_task_list_for_task_run(
+                        [dyna_flow_task_code])
+
+                if dyna_flow_task_code in claimed_code_dict:
+                    await self.run_dyna_flow_task(dyna_flow_task_code)
+                continue
+
+            # wait for a free slot, then take the other free
+            # slots, before claiming so that tasks are claimed
+            # and started in priority order
+            await semaphore.acquire()
+            slot_count = 1
+            while semaphore.locked() is not True:
+                await semaphore.acquire()
+                slot_count += 1
+
+            parallel_code_list = []
+            for code in pending_code_list:
+                if is_parallel_run_allowed_dict[code] is not True:
+                    break
+                parallel_code_list.append(code)
+
+            claimed_code_dict = await \
+                self.claim_dyna_flow_task_list_for_task_run(
+                    parallel_code_list,
+                    slot_count)
+
+            pending_code_list = pending_code_list[len(
+                self.get_claim_attempted_code_list(
+                    parallel_code_list,
+                    list(claimed_code_dict),
+                    slot_count)):]
+
+            for _ in range(slot_count - len(claimed_code_dict)):
+                semaphore.release()
+
+            for code in claimed_code_dict:
+                print(f"Starting DynaFlowTask {str(code)}")
+                running_task_list.append(
+                    asyncio.create_task(
+                        self.run_dyna_flow_task_in_slot(
+                            semaphore,
+                            code)))
+
+        await self.wait_for_dyna_flow_db_tasks(running_task_list)
         print("DynaFlow tasks run from the database")
         return run_to_do_count
 
-    async def run_dyna_flow_db_task(
+    async def get_dyna_flow_task_parallel_run_allowed_dict(
         self,
-        dyna_flow_task_code: uuid.UUID,
-        dyna_flow_task_type_list: List[DynaFlowTaskTypeBusObj]
-    ):
+        dyna_flow_task_code_list: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, bool]:
         """
-        Run a DynaFlow task from the
-        database
+        Get the is_parallel_run_allowed value
+        of DynaFlow tasks by task code,
+        without claiming them.
         """
-        print(f"Running DynaFlow task from the database {dyna_flow_task_code}")
-        if self._is_dyna_flow_task_processor is not True:
-            return
+        is_parallel_run_allowed_dict = {}
 
-        task_ownership = await self.claim_dyna_flow_task_for_task_run(
-            dyna_flow_task_code,
-            dyna_flow_task_type_list
-        )
+        if len(dyna_flow_task_code_list) == 0:
+            return is_parallel_run_allowed_dict
+
+        async for session in get_dyna_flow_db():
+
+            session_context = self.build_session_context(session)
+
+            try:
+
+                dyna_flow_task_manager = \
+                    managers_and_enums.DynaFlowTaskManager(session_context)
+
+                is_parallel_run_allowed_dict = await dyna_flow_task_manager. \
+                    get_parallel_run_allowed_dict(dyna_flow_task_code_list)
+
+                await session.commit()
+            except Exception as e:
+                print(f'Error occurred: {e}')
+                await session.rollback()
+            finally:
+                await session.close()
+        return is_parallel_run_allowed_dict
 
-        if task_ownership is not True:
+    async def run_dyna_flow_task_in_slot(
+        self,
+        semaphore: asyncio.Semaphore,
+        dyna_flow_task_code: uuid.UUID
+    ):
+        """
+        Run a claimed DynaFlow task
+        and release its concurrency
+        slot when done
+        """
+        try:
+            await self.run_dyna_flow_task(
+                dyna_flow_task_code,
+                clear_temp_folder=False)
+        finally:
+            semaphore.release()
+
+    async def wait_for_dyna_flow_db_tasks(
+        self,
+        running_task_list: List[asyncio.Task]
+    ):
+        """
+        Wait for the running DynaFlow
+        tasks to finish
+        """
+        if len(running_task_list) == 0:
             return
 
-        await self.run_dyna_flow_task(dyna_flow_task_code)
+        print(f"Waiting for {len(running_task_list)} "
+              "running DynaFlowTasks")
 
-        print("DynaFlow task run from the database")
+        result_list = await asyncio.gather(
+            *running_task_list,
+            return_exceptions=True)
+
+        for result in result_list:
+            if isinstance(result, Exception):
+                print(f'Error occurred: {result}')
 
     async def run_dyna_flow_queue_tasks(self):
         """
         Run DynaFlow tasks from the
         queue
+
+        The task messages are received in batches of
+        DYNAFLOW_QUEUE_BATCH_SIZE. The tasks of a batch are
+        assigned to this processor in one transaction, then run.
+        The locks of the messages not yet completed are renewed
+        while the tasks run. Each message is completed once its
+        task has run, and the skipped and dead messages before
+        the runs, so a lost lock does not redeliver finished work.
         """
         print("Running DynaFlow tasks from the queue")
-        print("Checking for message...")
-
-        while True:
-            message = await self._queue_manager.read_next_message(
-                self._task_processor_queue_name
+        print("Checking for messages...")
+        max_wait_time = self._queue_max_wait_seconds
+
+        while self._is_stop_requested is not True:
+            message_list = await self._queue_manager.read_messages(
+                self._task_processor_queue_name,
+                self._queue_batch_size,
+                max_wait_time
             )
-            if len(message) == 0:
+            if len(message_list) == 0:
                 break
-            print("Message found...")
-            try:
-                print("Building DynaFlowTask busobj using json data")
-
-                task_code = uuid.UUID(int=0)
-
-                success = False
-
-                async for session in get_db():
+            print(f"{len(message_list)} messages found...")
 
-                    session_context = self.build_session_context(session)
+            # the lock renewer reads this list, so completed
+            # messages are removed from it
+            pending_message_list = list(message_list)
+            lock_renewer = asyncio.create_task(
+                self.renew_message_locks(
+                    self._task_processor_queue_name,
+                    pending_message_list))
 
-                    try:
-
-                        dyna_flow_task = DynaFlowTaskBusObj(session_context)
-
-                        await dyna_flow_task.load_from_json(
-                            str(message))
-
-                        dyna_flow_task.processor_identifier = \
-                            self.get_instance_id()
+            try:
+                saved_code_dict = await \
+                    self.save_dyna_flow_task_message_list(
+                        message_list,
+                        is_claimed=True)
+
+                self.record_queue_messages(
+                    self._task_processor_queue_name,
+                    len(message_list),
+                    saved_code_dict)
+
+                await self.send_dead_messages(message_list, saved_code_dict)
+
+                run_message_list = [
+                    message
+                    for message in message_list
+                    if saved_code_dict.get(message.message_id) is not None
+                ]
+                await self.complete_pending_messages(
+                    pending_message_list,
+                    [
+                        message
+                        for message in message_list
+                        if saved_code_dict.get(message.message_id) is None
+                    ])
+
+                for message in run_message_list:
+                    await self.run_dyna_flow_task(
+                        saved_code_dict[message.message_id])
+                    await self.complete_pending_messages(
+                        pending_message_list,
+                        [message])
+            finally:
+                lock_renewer.cancel()
 
-                        await dyna_flow_task.save()
+            if len(message_list) < self._queue_batch_size:
+                break
+            max_wait_time = 0
+        print("DynaFlow tasks run from the queue")
 
-                        task_code = dyna_flow_task.code
+    async def complete_pending_messages(
+        self,
+        pending_message_list: List[QueueMessage],
+        message_list: List[QueueMessage]
+    ):
+        """
+        Complete messages of the task processor queue and
+        remove them from the pending messages whose
+        locks are renewed.
+        """
+        for message in message_list:
+            pending_message_list.remove(message)
 
-                        await session.commit()
-                    except Exception as e:
-                        print(f'Error occurred: {e}')
-                        await session.rollback()
-                    finally:
-                        await session.close()
+        await self._queue_manager.mark_messages_as_completed(
+            self._task_processor_queue_name, message_list)
 
-                    if success is not True:
-                        raise Exception(
-                            "error resetting processor id in task")
+    async def renew_message_locks(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage]
+    ):
+        """
+        Renew the locks of queue messages when half of the
+        time left on them has passed, until cancelled.
 
-                    await self.run_dyna_flow_task(task_code)
+        The time left comes from the queue backend, as a
+        backend may lock the messages for the lock duration
+        of the queue instead of the visibility timeout.
 
-            except Exception as ex:
-                print("Error reading message...")
+        The message list is read on each renewal, so the
+        messages removed from it are no longer renewed.
+        """
+        while True:
+            lock_seconds = self._queue_manager.get_lock_seconds(
+                message_list)
+            await asyncio.sleep(max(1.0, lock_seconds / 2))
+            try:
+                await self._queue_manager.renew_message_locks(
+                    queue_name,
+                    list(message_list))
+            except Exception as e:
                 print(f'Error occurred: {e}')
-                await self.send_message_async(
-                    self._task_dead_queue_name,
-                    message)
-                print(str(ex))
-            await self._queue_manager.mark_message_as_completed(
-                self._task_processor_queue_name, message)
-        print("DynaFlow tasks run from the queue")
 
     async def run_dyna_flow_task(
             self,
-            dyna_flow_task_code: uuid.UUID):
+            dyna_flow_task_code: uuid.UUID,
+            clear_temp_folder: bool = True):
         """
         Run a DynaFlow task.
+
+        The temp folder is shared by the processor, so it is
+        not cleared for tasks that run in parallel.
+
+        The wait time, run time and outcome of the task
+        are recorded by task type.
+
+        The flow of a CPU-bound task type runs in the process
+        pool when it is enabled. The started task is committed
+        first, so the worker can load and update it, and the
+        task is refreshed before it is marked completed.
         """
         print(f"Running DynaFlow task {dyna_flow_task_code}")
         success = False
+        task_type_name = UNKNOWN_TASK_TYPE
+        outcome = OUTCOME_ERROR
+        start = time.monotonic()
 
-        async for session in get_db():
+        async for session in get_dyna_flow_db():
 
             session_context = self.build_session_context(session)
 
@@ -1121,25 +2139,47 @@ class DynaFlowProcessor:
 
                 await dyna_flow_task.load_from_code(dyna_flow_task_code)
 
-                self._custom_temp_folder.clear_temp_folder()
+                # get dyna flow task type of dyna flow task
+                dyna_flow_task_type = await \
+                    dyna_flow_task.get_dyna_flow_task_type_id_bus_obj()
+
+                task_type_name = dyna_flow_task_type.lookup_enum_name
+
+                if clear_temp_folder is True:
+                    self._custom_temp_folder.clear_temp_folder()
 
                 dyna_flow_task.started_utc_date_time = \
                     datetime.now(timezone.utc)
                 dyna_flow_task.is_started = True
                 await dyna_flow_task.save()
 
+                wait_seconds = get_wait_seconds(
+                    dyna_flow_task.requested_utc_date_time,
+                    dyna_flow_task.min_start_utc_date_time,
+                    dyna_flow_task.started_utc_date_time)
+                if wait_seconds is not None:
+                    DYNA_FLOW_TASK_WAIT_SECONDS.observe(
+                        wait_seconds,
+                        task_type=task_type_name)
+
                 dyna_flow = await dyna_flow_task.get_dyna_flow_id_bus_obj()
                 if dyna_flow.is_started is not True:
-                    dyna_flow.is_started = True
-                    dyna_flow.started_utc_date_time = \
-                        datetime.now(timezone.utc)
-                    await dyna_flow.save()
+                    # conditional update, so parallel tasks of
+                    # the same dyna_flow do not conflict
+                    dyna_flow_manager = managers_and_enums.DynaFlowManager(
+                        session_context)
+                    await dyna_flow_manager.mark_started(
+                        dyna_flow.dyna_flow_id,
+                        datetime.now(timezone.utc))
+                    await dyna_flow.refresh()
 
                 if dyna_flow.is_completed is True:
                     print("DynaFlowTask already completed.  Skipping Run.")
+                    outcome = OUTCOME_SKIPPED
 
                 elif dyna_flow.is_cancel_requested is True:
                     print("DynaFlowTask cancel requested.")
+                    outcome = OUTCOME_CANCELED
                     dyna_flow_task.is_canceled = True
                     await dyna_flow_task.save()
                     if dyna_flow.is_cancel_requested is True:
@@ -1158,27 +2198,44 @@ class DynaFlowProcessor:
                             dyna_flow.is_canceled = True
                             await dyna_flow.save()
                 else:
-                    # get dyna flow task type of dyna flow task
-                    dyna_flow_task_type = await \
-                        dyna_flow_task.get_dyna_flow_task_type_id_bus_obj()
-
                     print(
                         "run dataflow task "
                         f"{dyna_flow_task_type.lookup_enum_name}"
                     )
 
-                    # create flow of requested dynaflowtask using factory
-                    flow = FlowFactory.create_instance(
-                        f"Flow{dyna_flow_task_type.lookup_enum_name}",
-                        session_context
-                    )
+                    flow_name = \
+                        f"Flow{dyna_flow_task_type.lookup_enum_name}"
+                    is_run_in_process_pool = \
+                        self._process_pool.is_enabled() and \
+                        dyna_flow_task_type.is_cpu_bound is True
+
+                    flow = None
+                    if is_run_in_process_pool is True:
+                        await session.commit()
+                    else:
+                        # create flow of requested dynaflowtask using factory
+                        flow = FlowFactory.create_instance(
+                            flow_name,
+                            session_context
+                        )
 
                     # run process fn
                     try:
-                        await flow.process(dyna_flow_task)
+                        if is_run_in_process_pool is True:
+                            try:
+                                await self._process_pool.run_flow(
+                                    dyna_flow_task.code,
+                                    flow_name)
+                            finally:
+                                await dyna_flow_task.refresh()
+                        else:
+                            await flow.process(dyna_flow_task)
                         dyna_flow_task.is_successful = True
                         success = True
-                    except Exception:
+                        outcome = OUTCOME_SUCCESSFUL
+                    except Exception as e:
+                        print(f'Error occurred: {e}')
+                        outcome = OUTCOME_FAILED
                         # if ((dynaFlowTask.MaxRetryCount > 0 && dynaFlowTask.RetryCount >= dynaFlowTask.MaxRetryCount) ||
                         #     dynaFlowTask.MaxRetryCount == 0)
                         # {
@@ -1204,11 +2261,21 @@ class DynaFlowProcessor:
             except Exception as e:
                 print(f'Error occurred: {e}')
                 await session.rollback()
+                success = False
+                outcome = OUTCOME_ERROR
             finally:
                 await session.close()
 
+        DYNA_FLOW_TASK_RUN_SECONDS.observe(
+            time.monotonic() - start,
+            task_type=task_type_name,
+            outcome=outcome)
+        DYNA_FLOW_TASK_RUN_TOTAL.inc(
+            task_type=task_type_name,
+            outcome=outcome)
+
         if success is not True:
-            async for session in get_db():
+            async for session in get_dyna_flow_db():
 
                 session_context = self.build_session_context(session)
 
@@ -1234,6 +2301,8 @@ class DynaFlowProcessor:
                         dyna_flow_task.is_completed = False
                         print(f"Request Retry Attempt "
                               f"{str(dyna_flow_task.retry_count)}")
+                        DYNA_FLOW_TASK_RETRY_TOTAL.inc(
+                            task_type=task_type_name)
                     await dyna_flow_task.save()
 
                     await session.commit()
@@ -1243,6 +2312,9 @@ class DynaFlowProcessor:
                 finally:
                     await session.close()
 
+        if self._is_task_queue_used is not True:
+            await self.refresh_task_scheduler([dyna_flow_task_code])
+
         if self._is_task_queue_used is True:
 
             print(f"sending to result queue dft "
@@ -0,0 +1,109 @@
+# df_processor/dyna_flow_processor_metrics.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the metrics recorded by the DynaFlowProcessor.
+
+Task metrics are labelled with the DynaFlowTaskType lookup enum
+name (task_type) and, once the task is done, its outcome:
+- `successful`: the flow process completed.
+- `failed`: the flow process raised an error.
+- `canceled`: the DynaFlow cancel was requested.
+- `skipped`: the DynaFlow was already completed.
+- `error`: the task could not be loaded or saved.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from services.metrics import metrics_registry
+
+OUTCOME_SUCCESSFUL = "successful"
+OUTCOME_FAILED = "failed"
+OUTCOME_CANCELED = "canceled"
+OUTCOME_SKIPPED = "skipped"
+OUTCOME_ERROR = "error"
+
+UNKNOWN_TASK_TYPE = "unknown"
+
+DYNA_FLOW_TASK_WAIT_SECONDS = metrics_registry.histogram(
+    "dyna_flow_task_wait_seconds",
+    "Time from a DynaFlowTask being requested, or its retry "
+    "becoming due, to it being started.",
+    ["task_type"])
+
+DYNA_FLOW_TASK_RUN_SECONDS = metrics_registry.histogram(
+    "dyna_flow_task_run_seconds",
+    "Time to run a DynaFlowTask.",
+    ["task_type", "outcome"])
+
+DYNA_FLOW_TASK_RUN_TOTAL = metrics_registry.counter(
+    "dyna_flow_task_run_total",
+    "DynaFlowTasks run.",
+    ["task_type", "outcome"])
+
+DYNA_FLOW_TASK_RETRY_TOTAL = metrics_registry.counter(
+    "dyna_flow_task_retry_total",
+    "DynaFlowTask retries requested.",
+    ["task_type"])
+
+DYNA_FLOW_CLAIM_TOTAL = metrics_registry.counter(
+    "dyna_flow_claim_total",
+    "DynaFlows and DynaFlowTasks this processor tried to claim. "
+    "A conflict is an item claimed by another processor first.",
+    ["claim_type", "outcome"])
+
+DYNA_FLOW_BACKLOG = metrics_registry.gauge(
+    "dyna_flow_backlog",
+    "Items found by the last to-do list or queue count.",
+    ["backlog_type"])
+
+DYNA_FLOW_QUEUE_MESSAGE_TOTAL = metrics_registry.counter(
+    "dyna_flow_queue_message_total",
+    "Queue messages received, by queue and outcome.",
+    ["queue", "outcome"])
+
+DYNA_FLOW_SCHEDULED_TOTAL = metrics_registry.counter(
+    "dyna_flow_scheduled_total",
+    "DynaFlows requested by the DynaFlowTypeSchedules.")
+
+DYNA_FLOW_ARCHIVED_TOTAL = metrics_registry.counter(
+    "dyna_flow_archived_total",
+    "Finished DynaFlows archived.")
+
+DYNA_FLOW_PROCESSOR_PASS_SECONDS = metrics_registry.histogram(
+    "dyna_flow_processor_pass_seconds",
+    "Time to run one DynaFlowProcessor pass.",
+    ["outcome"])
+
+
+def get_wait_seconds(
+    requested_utc_date_time: Optional[datetime],
+    min_start_utc_date_time: Optional[datetime],
+    started_utc_date_time: datetime
+) -> Optional[float]:
+    """
+    Returns the seconds a task waited to start, from the later of
+    its requested time and its min start time, or None if the
+    task has no requested time.
+    """
+    if requested_utc_date_time is None:
+        return None
+
+    ready_utc_date_time = _to_utc(requested_utc_date_time)
+    if min_start_utc_date_time is not None:
+        ready_utc_date_time = max(
+            ready_utc_date_time,
+            _to_utc(min_start_utc_date_time))
+
+    return max(
+        0.0,
+        (_to_utc(started_utc_date_time) - ready_utc_date_time)
+        .total_seconds())
+
+
+def _to_utc(value: datetime) -> datetime:
+    """
+    Treats a naive date time as UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
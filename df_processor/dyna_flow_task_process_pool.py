@@ -0,0 +1,197 @@
+# df_processor/dyna_flow_task_process_pool.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the `DynaFlowTaskProcessPool` class, the
+process pool lane of the DynaFlowProcessor for the tasks of a
+DynaFlowTaskType with `is_cpu_bound` set.
+
+The flow of a CPU-bound task runs in a worker process, so it does
+not hold up the event loop of the processor, which keeps claiming
+and running the other tasks. Each worker process has its own event
+loop, engine and sessions, created when the worker starts. The
+workers are started with the spawn method, so they share no
+connections with the processor.
+
+The processor keeps the task state bookkeeping. It commits the
+started task before the flow is sent to the pool, and marks the task
+completed when the flow returns. The worker commits the changes of
+the flow, or rolls them back if the flow raises an error, and returns
+the error to the processor as a `DynaFlowTaskProcessError`.
+"""
+import asyncio
+import multiprocessing
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from business import DynaFlowTaskBusObj
+from config import DATABASE_URL, DYNAFLOW_CPU_POOL_MAX_WORKERS
+from database import get_engine_options
+from flows.flow_factory import FlowFactory
+from helpers.session_context import SessionContext
+
+# the event loop and sessionmaker of a worker process
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_session_local = None
+
+
+class DynaFlowTaskProcessError(Exception):
+    """
+    Raised in the processor when the flow of a
+    task raised an error in a worker process.
+    """
+
+
+def init_worker(database_url: str):
+    """
+    Creates the event loop, engine and sessionmaker
+    of a worker process.
+    """
+    # pylint: disable=global-statement
+    global _worker_loop, _worker_session_local
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+    worker_engine = create_async_engine(
+        database_url,
+        **get_engine_options(database_url, 1, 0))
+
+    _worker_session_local = sessionmaker(
+        bind=worker_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+
+def run_flow_in_worker(
+    dyna_flow_task_code: str,
+    flow_name: str
+) -> Optional[str]:
+    """
+    Runs the flow of a task in a worker process.
+
+    Returns None if the flow completed, or the
+    error of the flow.
+    """
+    assert _worker_loop is not None, "The worker is not initialized"
+
+    return _worker_loop.run_until_complete(
+        _run_flow(uuid.UUID(dyna_flow_task_code), flow_name))
+
+
+async def _run_flow(
+    dyna_flow_task_code: uuid.UUID,
+    flow_name: str
+) -> Optional[str]:
+    """
+    Loads the task and runs its flow in
+    a session of the worker process.
+    """
+    async with _worker_session_local() as session:  # type: ignore # noqa: E501
+        session_context = SessionContext({}, session)
+        session_context.role_name_csv = "Config"
+        session_context.user_name = "System"
+        session_context.session_code = uuid.uuid4()
+
+        try:
+            dyna_flow_task = DynaFlowTaskBusObj(session_context)
+
+            await dyna_flow_task.load_from_code(dyna_flow_task_code)
+
+            flow = FlowFactory.create_instance(flow_name, session_context)
+
+            await flow.process(dyna_flow_task)
+
+            await session.commit()
+            return None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            await session.rollback()
+            traceback.print_exc()
+            return f"{type(e).__name__}: {e}"
+
+
+class DynaFlowTaskProcessPool:
+    """
+    Runs the flows of CPU-bound tasks in a pool of worker
+    processes, at most max_workers at a time.
+
+    Attributes:
+        max_workers (int): The number of worker processes.
+            0 disables the pool, and CPU-bound tasks run on
+            the event loop like the other tasks.
+        database_url (str): The database of the workers.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DYNAFLOW_CPU_POOL_MAX_WORKERS,
+        database_url: str = DATABASE_URL
+    ):
+        self.max_workers = max(0, max_workers)
+        self.database_url = database_url
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def is_enabled(self) -> bool:
+        """
+        Returns True if CPU-bound tasks run in the pool.
+        """
+        return self.max_workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        Returns the executor, starting it on first use.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.database_url,))
+        return self._executor
+
+    async def run_flow(
+        self,
+        dyna_flow_task_code: uuid.UUID,
+        flow_name: str
+    ):
+        """
+        Runs the flow of a task in a worker process and
+        waits for it without blocking the event loop.
+
+        Raises:
+            DynaFlowTaskProcessError: If the flow raised
+                an error in the worker.
+            BrokenProcessPool: If a worker process died. The
+                pool is started again for the next task.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+
+        async with self._semaphore:
+            executor = self._get_executor()
+            try:
+                error = await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    run_flow_in_worker,
+                    str(dyna_flow_task_code),
+                    flow_name)
+            except BrokenProcessPool:
+                if self._executor is executor:
+                    self._executor = None
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        if error is not None:
+            raise DynaFlowTaskProcessError(error)
+
+    def shutdown(self):
+        """
+        Stops the worker processes after their running flows.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,580 @@
+# df_processor/dyna_flow_task_scheduler.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the `DynaFlowTaskScheduler` class, an
+in-memory dependency graph of the DynaFlow tasks that are not
+completed yet. The DynaFlow processor uses it to find the tasks
+that are ready to run instead of running the task run to-do
+list query on every pass.
+
+A pending task is blocked by an edge for each of:
+- its `dependency_dyna_flow_task_id`, until that task is
+    completed and successful, or canceled.
+- its DynaFlow's `dependency_dyna_flow_id`, until that DynaFlow
+    is completed and successful, or canceled.
+- each of its `DFTDependency` rows, until the dependency task
+    is successful or canceled.
+
+These are the same rules as the
+`pac_config_dyna_flow_task_run_to_do_list` query. Each task keeps
+its count of blocking edges, and a task with no blocking edge is
+in the ready set. A change event only updates the tasks that
+depend on the changed task or DynaFlow. Dependencies completed by
+another processor are read back with `refresh_blocking_edges`,
+one query for all the tasks and one for all the DynaFlows the
+blocked tasks wait on.
+"""
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_
+from sqlalchemy.future import select
+
+from helpers.session_context import SessionContext
+from models import DFTDependency, DynaFlow, DynaFlowTask
+from reports import ReportItemPacConfigDynaFlowTaskRunToDoList
+
+TASK_EDGE = "task"
+DFT_DEPENDENCY_EDGE = "dft_dependency"
+DYNA_FLOW_EDGE = "dyna_flow"
+
+Edge = Tuple[str, int]
+
+
+def _to_utc(value: Optional[datetime]) -> datetime:
+    """
+    Returns the datetime as an aware UTC datetime.
+    The database returns naive UTC datetimes.
+    """
+    if value is None:
+        return datetime(1753, 1, 1, tzinfo=timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class DynaFlowTaskNode:  # pylint: disable=too-few-public-methods
+    """
+    A pending DynaFlow task of the dependency graph.
+    """
+    __slots__ = (
+        "dyna_flow_task_id",
+        "code",
+        "dyna_flow_id",
+        "priority_level",
+        "min_start_utc_date_time",
+        "is_started",
+        "is_run_task_debug_required",
+        "blocking_edges",
+    )
+
+    def __init__(
+        self,
+        dyna_flow_task_id: int,
+        code: uuid.UUID,
+        dyna_flow_id: int,
+        priority_level: int = 0,
+        min_start_utc_date_time: Optional[datetime] = None,
+        is_started: bool = False,
+        is_run_task_debug_required: bool = False
+    ):
+        self.dyna_flow_task_id = dyna_flow_task_id
+        self.code = uuid.UUID(str(code))
+        self.dyna_flow_id = dyna_flow_id
+        self.priority_level = priority_level or 0
+        self.min_start_utc_date_time = _to_utc(min_start_utc_date_time)
+        self.is_started = is_started is True
+        self.is_run_task_debug_required = \
+            is_run_task_debug_required is True
+        self.blocking_edges: Set[Edge] = set()
+
+
+class DynaFlowTaskScheduler:
+    """
+    The in-memory dependency graph of the pending DynaFlow tasks.
+
+    The graph is seeded from the database with `seed`. New tasks
+    are added with `load_new_dyna_flow_tasks`, and the state of
+    the tasks this processor runs is applied with
+    `refresh_dyna_flow_tasks`. Because other processors can
+    change tasks too, the processor seeds the graph again every
+    `resync_seconds`.
+    """
+
+    def __init__(self, resync_seconds: float = 300):
+        self.resync_seconds = resync_seconds
+        self._seeded_at: Optional[float] = None
+        self._nodes: Dict[int, DynaFlowTaskNode] = {}
+        self._node_ids_by_code: Dict[uuid.UUID, int] = {}
+        self._dependents: Dict[Edge, Set[int]] = {}
+        self._ready_ids: Set[int] = set()
+        self._max_dyna_flow_task_id = 0
+
+    @property
+    def pending_count(self) -> int:
+        """
+        The number of pending tasks in the graph.
+        """
+        return len(self._nodes)
+
+    def is_resync_due(self) -> bool:
+        """
+        Returns True if the graph was never seeded,
+        or was seeded more than resync_seconds ago.
+        """
+        return self._seeded_at is None or \
+            time.monotonic() - self._seeded_at >= self.resync_seconds
+
+    def request_resync(self):
+        """
+        Seeds the graph again on the next call.
+        """
+        self._seeded_at = None
+
+    def clear(self):
+        """
+        Removes all the tasks from the graph.
+        """
+        self._nodes = {}
+        self._node_ids_by_code = {}
+        self._dependents = {}
+        self._ready_ids = set()
+        self._max_dyna_flow_task_id = 0
+
+    async def seed(
+        self,
+        session_context: SessionContext,
+        pac_id: int
+    ):
+        """
+        Replaces the graph with the pending tasks of the pac.
+        """
+        # pylint: disable=protected-access
+        self.clear()
+        await self.load_dyna_flow_tasks(
+            session_context,
+            and_(
+                DynaFlow._pac_id == pac_id,
+                DynaFlowTask._is_completed == False,  # noqa: E712
+                DynaFlowTask._is_canceled == False,  # noqa: E712
+            ))
+        self._seeded_at = time.monotonic()
+        print(f"DynaFlowTaskScheduler seeded with {self.pending_count} "
+              f"pending tasks, {len(self._ready_ids)} unblocked")
+
+    async def load_new_dyna_flow_tasks(
+        self,
+        session_context: SessionContext,
+        pac_id: int
+    ):
+        """
+        Adds the pending tasks of the pac created since the
+        last load, found by their increasing id.
+        """
+        # pylint: disable=protected-access
+        max_dyna_flow_task_id = self._max_dyna_flow_task_id
+        await self.load_dyna_flow_tasks(
+            session_context,
+            and_(
+                DynaFlow._pac_id == pac_id,
+                DynaFlowTask._dyna_flow_task_id > max_dyna_flow_task_id,
+                DynaFlowTask._is_completed == False,  # noqa: E712
+                DynaFlowTask._is_canceled == False,  # noqa: E712
+            ))
+
+    async def refresh_blocking_edges(
+        self,
+        session_context: SessionContext
+    ):
+        """
+        Reads the state of the tasks and DynaFlows that the
+        blocked tasks wait on, and unblocks the tasks whose
+        dependency was completed or canceled by another
+        processor since the last seed.
+        """
+        dependency_task_id_list = sorted({
+            edge[1] for edge in self._dependents
+            if edge[0] != DYNA_FLOW_EDGE
+        })
+        dependency_dyna_flow_id_list = sorted({
+            edge[1] for edge in self._dependents
+            if edge[0] == DYNA_FLOW_EDGE
+        })
+
+        dependency_task_states = await self._get_dyna_flow_task_states(
+            session_context,
+            dependency_task_id_list)
+        for dyna_flow_task_id in dependency_task_id_list:
+            state = dependency_task_states.get(dyna_flow_task_id)
+            for edge_type in (TASK_EDGE, DFT_DEPENDENCY_EDGE):
+                if self.is_edge_satisfied(edge_type, state):
+                    self._satisfy_edge((edge_type, dyna_flow_task_id))
+
+        dependency_dyna_flow_states = await self._get_dyna_flow_states(
+            session_context,
+            dependency_dyna_flow_id_list)
+        for dyna_flow_id in dependency_dyna_flow_id_list:
+            if self.is_edge_satisfied(
+                    DYNA_FLOW_EDGE,
+                    dependency_dyna_flow_states.get(dyna_flow_id)):
+                self._satisfy_edge((DYNA_FLOW_EDGE, dyna_flow_id))
+
+    async def refresh_dyna_flow_tasks(
+        self,
+        session_context: SessionContext,
+        dyna_flow_task_code_list: List[uuid.UUID]
+    ):  # pylint: disable=protected-access
+        """
+        Reads the state of the given tasks and of their
+        DynaFlows, and applies it to the graph.
+        """
+        session = session_context.session
+
+        for index in range(0, len(dyna_flow_task_code_list), 500):
+            result = await session.execute(
+                select(
+                    DynaFlowTask._dyna_flow_task_id,
+                    DynaFlowTask._is_started,
+                    DynaFlowTask._is_completed,
+                    DynaFlowTask._is_successful,
+                    DynaFlowTask._is_canceled,
+                    DynaFlowTask._min_start_utc_date_time,
+                    DynaFlow._dyna_flow_id,
+                    DynaFlow._is_completed,
+                    DynaFlow._is_successful,
+                    DynaFlow._is_canceled,
+                )
+                .join(DynaFlow,
+                      DynaFlow._dyna_flow_id == DynaFlowTask._dyna_flow_id)
+                .where(DynaFlowTask._code.in_(  # type: ignore
+                    [str(code) for code in
+                     dyna_flow_task_code_list[index:index + 500]]))
+            )
+            for row in result.all():
+                self.on_dyna_flow_task_changed(
+                    row[0],
+                    is_started=row[1],
+                    is_completed=row[2],
+                    is_successful=row[3],
+                    is_canceled=row[4],
+                    min_start_utc_date_time=row[5])
+                self.on_dyna_flow_changed(
+                    row[6],
+                    is_completed=row[7],
+                    is_successful=row[8],
+                    is_canceled=row[9])
+
+    async def load_dyna_flow_tasks(
+        self,
+        session_context: SessionContext,
+        task_filter
+    ):  # pylint: disable=protected-access
+        """
+        Loads the tasks matching the filter, their DFTDependency
+        rows and the state of the tasks and DynaFlows they
+        depend on, and adds them to the graph.
+        """
+        session = session_context.session
+
+        result = await session.execute(
+            select(
+                DynaFlowTask._dyna_flow_task_id,
+                DynaFlowTask._code,
+                DynaFlowTask._dyna_flow_id,
+                DynaFlowTask._dependency_dyna_flow_task_id,
+                DynaFlowTask._min_start_utc_date_time,
+                DynaFlowTask._is_started,
+                DynaFlowTask._is_run_task_debug_required,
+                DynaFlow._priority_level,
+                DynaFlow._dependency_dyna_flow_id,
+            )
+            .join(DynaFlow,
+                  DynaFlow._dyna_flow_id == DynaFlowTask._dyna_flow_id)
+            .where(task_filter)
+        )
+        task_rows = result.all()
+
+        task_ids = [row[0] for row in task_rows]
+
+        dft_dependency_rows = []
+        for index in range(0, len(task_ids), 500):
+            result = await session.execute(
+                select(
+                    DFTDependency._dyna_flow_task_id,
+                    DFTDependency._dependency_df_task_id,
+                )
+                .where(DFTDependency._dyna_flow_task_id.in_(  # type: ignore
+                    task_ids[index:index + 500]))
+            )
+            dft_dependency_rows.extend(result.all())
+
+        dependency_task_ids = {
+            row[3] for row in task_rows if row[3]
+        } | {
+            row[1] for row in dft_dependency_rows if row[1]
+        }
+        dependency_dyna_flow_ids = {
+            row[8] for row in task_rows if row[8]
+        }
+
+        dependency_task_states = await self._get_dyna_flow_task_states(
+            session_context,
+            list(dependency_task_ids))
+
+        dependency_dyna_flow_states = await self._get_dyna_flow_states(
+            session_context,
+            list(dependency_dyna_flow_ids))
+
+        dft_dependency_ids_by_task: Dict[int, List[int]] = {}
+        for dyna_flow_task_id, dependency_df_task_id in dft_dependency_rows:
+            dft_dependency_ids_by_task.setdefault(
+                dyna_flow_task_id, []).append(dependency_df_task_id)
+
+        for row in task_rows:
+            node = DynaFlowTaskNode(
+                dyna_flow_task_id=row[0],
+                code=row[1],
+                dyna_flow_id=row[2],
+                priority_level=row[7],
+                min_start_utc_date_time=row[4],
+                is_started=row[5],
+                is_run_task_debug_required=row[6])
+
+            edges = []
+            if row[3] and not self.is_edge_satisfied(
+                    TASK_EDGE, dependency_task_states.get(row[3])):
+                edges.append((TASK_EDGE, row[3]))
+            if row[8] and not self.is_edge_satisfied(
+                    DYNA_FLOW_EDGE, dependency_dyna_flow_states.get(row[8])):
+                edges.append((DYNA_FLOW_EDGE, row[8]))
+            for dependency_df_task_id in dft_dependency_ids_by_task.get(
+                    row[0], []):
+                if dependency_df_task_id and not self.is_edge_satisfied(
+                        DFT_DEPENDENCY_EDGE,
+                        dependency_task_states.get(dependency_df_task_id)):
+                    edges.append((DFT_DEPENDENCY_EDGE, dependency_df_task_id))
+
+            self.add_node(node, edges)
+
+    @staticmethod
+    async def _get_dyna_flow_task_states(
+        session_context: SessionContext,
+        dyna_flow_task_id_list: List[int]
+    ) -> Dict[int, Tuple]:
+        """
+        Returns the (is_completed, is_successful, is_canceled)
+        state of each of the tasks by id.
+        """
+        # pylint: disable=protected-access
+        states = {}
+        for index in range(0, len(dyna_flow_task_id_list), 500):
+            result = await session_context.session.execute(
+                select(
+                    DynaFlowTask._dyna_flow_task_id,
+                    DynaFlowTask._is_completed,
+                    DynaFlowTask._is_successful,
+                    DynaFlowTask._is_canceled,
+                )
+                .where(DynaFlowTask._dyna_flow_task_id.in_(  # type: ignore
+                    dyna_flow_task_id_list[index:index + 500]))
+            )
+            for row in result.all():
+                states[row[0]] = tuple(row[1:])
+        return states
+
+    @staticmethod
+    async def _get_dyna_flow_states(
+        session_context: SessionContext,
+        dyna_flow_id_list: List[int]
+    ) -> Dict[int, Tuple]:
+        """
+        Returns the (is_completed, is_successful, is_canceled)
+        state of each of the DynaFlows by id.
+        """
+        # pylint: disable=protected-access
+        states = {}
+        for index in range(0, len(dyna_flow_id_list), 500):
+            result = await session_context.session.execute(
+                select(
+                    DynaFlow._dyna_flow_id,
+                    DynaFlow._is_completed,
+                    DynaFlow._is_successful,
+                    DynaFlow._is_canceled,
+                )
+                .where(DynaFlow._dyna_flow_id.in_(  # type: ignore
+                    dyna_flow_id_list[index:index + 500]))
+            )
+            for row in result.all():
+                states[row[0]] = tuple(row[1:])
+        return states
+
+    @staticmethod
+    def is_edge_satisfied(
+        edge_type: str,
+        state: Optional[Tuple[Optional[bool], Optional[bool],
+                              Optional[bool]]]
+    ) -> bool:
+        """
+        Returns True if a dependency with the given
+        (is_completed, is_successful, is_canceled) state
+        no longer blocks its dependents. A dependency
+        that does not exist does not block.
+        """
+        if state is None:
+            return True
+
+        is_completed, is_successful, is_canceled = state
+
+        if is_canceled is True:
+            return True
+
+        if edge_type == DFT_DEPENDENCY_EDGE:
+            return is_successful is True
+
+        return is_completed is True and is_successful is True
+
+    def add_node(
+        self,
+        node: DynaFlowTaskNode,
+        edges: Iterable[Edge]
+    ):
+        """
+        Adds a pending task and its blocking edges to the
+        graph, replacing the task if it is already there.
+        """
+        self.remove_node(node.dyna_flow_task_id)
+
+        self._nodes[node.dyna_flow_task_id] = node
+        self._node_ids_by_code[node.code] = node.dyna_flow_task_id
+        self._max_dyna_flow_task_id = max(
+            self._max_dyna_flow_task_id, node.dyna_flow_task_id)
+
+        for edge in edges:
+            node.blocking_edges.add(edge)
+            self._dependents.setdefault(edge, set()).add(
+                node.dyna_flow_task_id)
+
+        if len(node.blocking_edges) == 0:
+            self._ready_ids.add(node.dyna_flow_task_id)
+
+    def remove_node(self, dyna_flow_task_id: int):
+        """
+        Removes a task from the graph.
+        """
+        node = self._nodes.pop(dyna_flow_task_id, None)
+        if node is None:
+            return
+
+        self._node_ids_by_code.pop(node.code, None)
+        self._ready_ids.discard(dyna_flow_task_id)
+
+        for edge in node.blocking_edges:
+            dependent_ids = self._dependents.get(edge)
+            if dependent_ids is None:
+                continue
+            dependent_ids.discard(dyna_flow_task_id)
+            if len(dependent_ids) == 0:
+                del self._dependents[edge]
+
+    def _satisfy_edge(self, edge: Edge):
+        """
+        Unblocks the tasks that wait on the edge.
+        """
+        for dependent_id in self._dependents.pop(edge, set()):
+            node = self._nodes.get(dependent_id)
+            if node is None:
+                continue
+            node.blocking_edges.discard(edge)
+            if len(node.blocking_edges) == 0:
+                self._ready_ids.add(dependent_id)
+
+    def on_dyna_flow_task_claimed(self, code: uuid.UUID):
+        """
+        Marks a task as started, so it is not ready
+        until it is reset for a retry.
+        """
+        dyna_flow_task_id = self._node_ids_by_code.get(uuid.UUID(str(code)))
+        if dyna_flow_task_id is not None:
+            self._nodes[dyna_flow_task_id].is_started = True
+
+    def on_dyna_flow_task_changed(
+        self,
+        dyna_flow_task_id: int,
+        is_started: Optional[bool],
+        is_completed: Optional[bool],
+        is_successful: Optional[bool],
+        is_canceled: Optional[bool],
+        min_start_utc_date_time: Optional[datetime] = None
+    ):
+        """
+        Applies the new state of a task. A completed or
+        canceled task leaves the graph, and the tasks that
+        depend on it are unblocked.
+        """
+        node = self._nodes.get(dyna_flow_task_id)
+
+        if is_completed is True or is_canceled is True:
+            self.remove_node(dyna_flow_task_id)
+        elif node is not None:
+            node.is_started = is_started is True
+            if min_start_utc_date_time is not None:
+                node.min_start_utc_date_time = _to_utc(
+                    min_start_utc_date_time)
+
+        state = (is_completed, is_successful, is_canceled)
+        for edge_type in (TASK_EDGE, DFT_DEPENDENCY_EDGE):
+            if self.is_edge_satisfied(edge_type, state):
+                self._satisfy_edge((edge_type, dyna_flow_task_id))
+
+    def on_dyna_flow_changed(
+        self,
+        dyna_flow_id: int,
+        is_completed: Optional[bool],
+        is_successful: Optional[bool],
+        is_canceled: Optional[bool]
+    ):
+        """
+        Applies the new state of a DynaFlow, unblocking
+        the tasks of the DynaFlows that depend on it.
+        """
+        if self.is_edge_satisfied(
+                DYNA_FLOW_EDGE,
+                (is_completed, is_successful, is_canceled)):
+            self._satisfy_edge((DYNA_FLOW_EDGE, dyna_flow_id))
+
+    def get_ready_list(
+        self,
+        item_count: int = 100,
+        now: Optional[datetime] = None
+    ) -> List[ReportItemPacConfigDynaFlowTaskRunToDoList]:
+        """
+        Returns the tasks that can run now, highest
+        DynaFlow priority level first, in the shape of
+        the task run to-do list report items.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        ready_node_list = [
+            node
+            for node in (
+                self._nodes[node_id] for node_id in self._ready_ids
+            )
+            if node.is_started is not True
+            if node.is_run_task_debug_required is not True
+            if node.min_start_utc_date_time <= now
+        ]
+        ready_node_list.sort(
+            key=lambda node: (-node.priority_level, node.dyna_flow_task_id))
+        ready_node_list = ready_node_list[:item_count]
+
+        result = []
+        for node in ready_node_list:
+            item = ReportItemPacConfigDynaFlowTaskRunToDoList()
+            item.dyna_flow_task_code = node.code
+            item.is_run_task_debug_required = \
+                node.is_run_task_debug_required
+            item.dyna_flow_priority_level = node.priority_level
+            result.append(item)
+        return result
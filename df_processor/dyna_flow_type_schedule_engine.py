@@ -0,0 +1,348 @@
+# df_processor/dyna_flow_type_schedule_engine.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the `DynaFlowTypeScheduleEngine` class,
+which requests the DynaFlows of the due `DynaFlowTypeSchedule`
+rows.
+
+A schedule fires on its `cron_expression` when it is set, or
+every `frequency_in_hours` hours otherwise. The engine keeps a
+min-heap of the next fire time of the active schedules, so a
+tick with nothing due does not query the database. When a
+schedule is due, the due schedules are claimed with one
+indexed query on `next_utc_date_time`, their DynaFlows are
+added in bulk and their next fire time is saved.
+
+Runs missed while no processor was running are handled by
+the catch-up policy:
+- once: one DynaFlow for all the missed runs.
+- all: one DynaFlow per missed run, up to
+    DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT.
+- skip: no DynaFlow for a run missed by more than
+    DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS.
+"""
+import heapq
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from croniter import croniter
+
+import managers as managers_and_enums
+from config import (DYNAFLOW_SCHEDULE_CATCH_UP_POLICY,
+                    DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT,
+                    DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS,
+                    DYNAFLOW_SCHEDULE_RELOAD_SECONDS)
+from helpers.session_context import SessionContext
+from models import DynaFlowTypeSchedule
+
+CATCH_UP_ONCE = "once"
+CATCH_UP_ALL = "all"
+CATCH_UP_SKIP = "skip"
+
+CATCH_UP_POLICY_LIST = [CATCH_UP_ONCE, CATCH_UP_ALL, CATCH_UP_SKIP]
+
+# a schedule with no valid cron expression or frequency
+# is checked again after this delay
+INVALID_SCHEDULE_RETRY_DELAY = timedelta(hours=1)
+
+NEVER_UTC_DATE_TIME = datetime(1753, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_utc(value: Optional[datetime]) -> datetime:
+    """
+    Returns the datetime as an aware UTC datetime.
+    The database returns naive UTC datetimes.
+    """
+    if value is None:
+        return NEVER_UTC_DATE_TIME
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def get_next_fire_utc_date_time(
+    cron_expression: str,
+    frequency_in_hours: int,
+    anchor_utc_date_time: datetime,
+    after_utc_date_time: datetime
+) -> Optional[datetime]:
+    """
+    Returns the first fire time of a schedule after
+    after_utc_date_time, or None if the schedule has
+    no valid cron expression or frequency.
+
+    A frequency schedule fires every frequency_in_hours
+    hours from anchor_utc_date_time, so a late run does
+    not shift the next ones.
+    """
+    cron_expression = (cron_expression or "").strip()
+
+    if len(cron_expression) > 0:
+        if not croniter.is_valid(cron_expression):
+            return None
+        return croniter(
+            cron_expression,
+            after_utc_date_time).get_next(datetime)
+
+    if frequency_in_hours is None or frequency_in_hours <= 0:
+        return None
+
+    step = timedelta(hours=frequency_in_hours)
+    if after_utc_date_time < anchor_utc_date_time:
+        return anchor_utc_date_time
+    step_count = (after_utc_date_time - anchor_utc_date_time) // step + 1
+    return anchor_utc_date_time + step * step_count
+
+
+def get_fire_utc_date_time_list(
+    dyna_flow_type_schedule: DynaFlowTypeSchedule,
+    now: datetime,
+    catch_up_policy: str = CATCH_UP_ONCE,
+    max_catch_up_count: int = 10,
+    misfire_grace_seconds: float = 300
+) -> Tuple[List[datetime], Optional[datetime]]:
+    """
+    Returns the fire times of a due schedule to request
+    a DynaFlow for, and its next fire time after now.
+
+    A schedule that never ran fires once, now.
+    """
+    cron_expression = dyna_flow_type_schedule.cron_expression
+    frequency_in_hours = dyna_flow_type_schedule.frequency_in_hours
+    due_utc_date_time = _to_utc(dyna_flow_type_schedule.next_utc_date_time)
+
+    next_utc_date_time = get_next_fire_utc_date_time(
+        cron_expression,
+        frequency_in_hours,
+        due_utc_date_time,
+        now)
+
+    if next_utc_date_time is None:
+        return [], None
+
+    if _to_utc(dyna_flow_type_schedule.last_utc_date_time) <= \
+            NEVER_UTC_DATE_TIME or due_utc_date_time <= NEVER_UTC_DATE_TIME:
+        return [now], next_utc_date_time
+
+    if catch_up_policy == CATCH_UP_SKIP:
+        if (now - due_utc_date_time).total_seconds() > \
+                misfire_grace_seconds:
+            return [], next_utc_date_time
+        return [due_utc_date_time], next_utc_date_time
+
+    if catch_up_policy == CATCH_UP_ALL:
+        fire_list = [due_utc_date_time]
+        while len(fire_list) < max(1, max_catch_up_count):
+            fire_utc_date_time = get_next_fire_utc_date_time(
+                cron_expression,
+                frequency_in_hours,
+                due_utc_date_time,
+                fire_list[-1])
+            if fire_utc_date_time is None or fire_utc_date_time > now:
+                break
+            fire_list.append(fire_utc_date_time)
+        return fire_list, next_utc_date_time
+
+    return [due_utc_date_time], next_utc_date_time
+
+
+class DynaFlowTypeScheduleEngine:
+    """
+    Requests the DynaFlows of the due DynaFlowTypeSchedules.
+
+    The heap holds the next fire time of each active schedule,
+    loaded with `reload` and updated as schedules fire. Changes
+    made to the schedules outside of the engine are picked up
+    by the next reload, every `reload_seconds`.
+    """
+
+    claim_item_count: int = 500
+
+    def __init__(
+        self,
+        catch_up_policy: str = DYNAFLOW_SCHEDULE_CATCH_UP_POLICY,
+        max_catch_up_count: int = DYNAFLOW_SCHEDULE_MAX_CATCH_UP_COUNT,
+        misfire_grace_seconds: float = DYNAFLOW_SCHEDULE_MISFIRE_GRACE_SECONDS,
+        reload_seconds: float = DYNAFLOW_SCHEDULE_RELOAD_SECONDS
+    ):
+        catch_up_policy = catch_up_policy.strip().lower()
+        if catch_up_policy not in CATCH_UP_POLICY_LIST:
+            raise ValueError(
+                f"Unknown schedule catch up policy: {catch_up_policy}")
+
+        self.catch_up_policy = catch_up_policy
+        self.max_catch_up_count = max_catch_up_count
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self.reload_seconds = reload_seconds
+        self._loaded_at: Optional[float] = None
+        self._heap: List[Tuple[datetime, int]] = []
+        self._next_by_id: Dict[int, datetime] = {}
+
+    def is_reload_due(self) -> bool:
+        """
+        Returns True if the heap was never loaded,
+        or was loaded more than reload_seconds ago.
+        """
+        return self._loaded_at is None or \
+            time.monotonic() - self._loaded_at >= self.reload_seconds
+
+    def request_reload(self):
+        """
+        Reloads the heap on the next tick.
+        """
+        self._loaded_at = None
+
+    def push(self, dyna_flow_type_schedule_id: int, next_utc_date_time):
+        """
+        Sets the next fire time of a schedule.
+        """
+        next_utc_date_time = _to_utc(next_utc_date_time)
+        self._next_by_id[dyna_flow_type_schedule_id] = next_utc_date_time
+        heapq.heappush(
+            self._heap,
+            (next_utc_date_time, dyna_flow_type_schedule_id))
+
+    async def reload(self, session_context: SessionContext):
+        """
+        Loads the next fire time of the active schedules.
+        """
+        dyna_flow_type_schedule_manager = \
+            managers_and_enums.DynaFlowTypeScheduleManager(session_context)
+
+        next_list = await dyna_flow_type_schedule_manager \
+            .get_next_utc_date_time_list()
+
+        self._next_by_id = {}
+        self._heap = []
+        for dyna_flow_type_schedule_id, next_utc_date_time in next_list:
+            next_utc_date_time = _to_utc(next_utc_date_time)
+            self._next_by_id[dyna_flow_type_schedule_id] = next_utc_date_time
+            self._heap.append(
+                (next_utc_date_time, dyna_flow_type_schedule_id))
+        heapq.heapify(self._heap)
+
+        self._loaded_at = time.monotonic()
+        print(f"DynaFlowTypeScheduleEngine loaded "
+              f"{len(self._next_by_id)} active schedules")
+
+    def get_next_fire_utc_date_time(self) -> Optional[datetime]:
+        """
+        Returns the earliest next fire time of
+        the active schedules, or None if there
+        are no active schedules.
+        """
+        while len(self._heap) > 0:
+            next_utc_date_time, dyna_flow_type_schedule_id = self._heap[0]
+            if self._next_by_id.get(dyna_flow_type_schedule_id) == \
+                    next_utc_date_time:
+                return next_utc_date_time
+            # the schedule fired or was reloaded since
+            heapq.heappop(self._heap)
+        return None
+
+    async def tick(
+        self,
+        session_context: SessionContext,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Requests the DynaFlows of the due schedules.
+        Does not query the database unless a schedule
+        is due or the heap reload is due.
+
+        Returns the number of DynaFlows requested.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        if self.is_reload_due():
+            await self.reload(session_context)
+
+        next_utc_date_time = self.get_next_fire_utc_date_time()
+        if next_utc_date_time is None or next_utc_date_time > now:
+            return 0
+
+        return await self.fire_due_schedules(session_context, now)
+
+    async def fire_due_schedules(
+        self,
+        session_context: SessionContext,
+        now: Optional[datetime] = None
+    ) -> int:
+        """
+        Claims the due schedules, adds their DynaFlows in
+        bulk and saves their next fire time, in the
+        transaction of the session context.
+
+        Returns the number of DynaFlows requested.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        dyna_flow_type_schedule_manager = \
+            managers_and_enums.DynaFlowTypeScheduleManager(session_context)
+        dyna_flow_manager = \
+            managers_and_enums.DynaFlowManager(session_context)
+
+        dyna_flow_list = []
+        claimed_count = 0
+
+        while True:
+            dyna_flow_type_schedule_list = \
+                await dyna_flow_type_schedule_manager.claim_due(
+                    now,
+                    self.claim_item_count)
+
+            for dyna_flow_type_schedule in dyna_flow_type_schedule_list:
+                fire_list, next_utc_date_time = get_fire_utc_date_time_list(
+                    dyna_flow_type_schedule,
+                    now,
+                    self.catch_up_policy,
+                    self.max_catch_up_count,
+                    self.misfire_grace_seconds)
+
+                if next_utc_date_time is None:
+                    print(f"DynaFlowTypeSchedule "
+                          f"{dyna_flow_type_schedule.code} has no valid "
+                          "cron expression or frequency")
+                    next_utc_date_time = now + INVALID_SCHEDULE_RETRY_DELAY
+
+                for fire_utc_date_time in fire_list:
+                    dyna_flow = await dyna_flow_manager.build(
+                        pac_id=dyna_flow_type_schedule.pac_id,
+                        dyna_flow_type_id=(
+                            dyna_flow_type_schedule.dyna_flow_type_id),
+                        description="Scheduled DynaFlow",
+                        requested_utc_date_time=now,
+                        subject_code=dyna_flow_type_schedule.code,
+                        param_1=fire_utc_date_time.isoformat(),
+                    )
+                    dyna_flow_list.append(dyna_flow)
+
+                if len(fire_list) > 0:
+                    dyna_flow_type_schedule.last_utc_date_time = now
+                dyna_flow_type_schedule.next_utc_date_time = \
+                    next_utc_date_time
+
+                self.push(
+                    dyna_flow_type_schedule.dyna_flow_type_schedule_id,
+                    next_utc_date_time)
+
+            claimed_count += len(dyna_flow_type_schedule_list)
+
+            # the schedules must be saved before the next claim,
+            # which would otherwise find them due again
+            await session_context.session.flush()
+
+            if len(dyna_flow_type_schedule_list) < self.claim_item_count:
+                break
+
+        if len(dyna_flow_list) > 0:
+            await dyna_flow_manager.add_bulk(dyna_flow_list)
+            for dyna_flow in dyna_flow_list:
+                dyna_flow.root_dyna_flow_id = dyna_flow.dyna_flow_id
+            await session_context.session.flush()
+
+        print(f"{claimed_count} DynaFlowTypeSchedules due, "
+              f"{len(dyna_flow_list)} DynaFlows requested")
+        return len(dyna_flow_list)
@@ -2,12 +2,11 @@
 """
 This module contains the main function for the df processor.
 """
+import argparse
 import asyncio
 
-from database import get_db, engine
-from helpers.session_context import SessionContext
+from database import dyna_flow_engine, dyna_flow_session_local
 import current_runtime
-from models import Base
 from df_processor.dyna_flow_processor import DynaFlowProcessor
 
 
@@ -15,26 +14,32 @@ async def init_db():
     """
     Create the database tables
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    await current_runtime.initialize_database(
+        dyna_flow_engine, dyna_flow_session_local)
 
-    async for session in get_db():
-        session_context = SessionContext({}, session)
-        await current_runtime.initialize(session_context)
-        await session.commit()
-        break
 
-
-async def main():
+async def main(is_daemon: bool = False):
     """
     - Initialize the database
     - run to df processor
+
+    With is_daemon, the processor keeps running and waits
+    for work until it gets SIGTERM.
     """
     await init_db()
 
     processor = DynaFlowProcessor()
-    await processor.run()
+    if is_daemon:
+        await processor.run_daemon()
+    else:
+        await processor.run()
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and wait for work")
+    args = parser.parse_args()
+    asyncio.run(main(args.daemon))
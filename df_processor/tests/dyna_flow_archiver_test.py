@@ -0,0 +1,276 @@
+# df_processor/tests/dyna_flow_archiver_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access
+"""
+This module contains unit tests for the `DynaFlowArchiver` class.
+"""
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+import pytest
+from df_processor.dyna_flow_archiver import DynaFlowArchiver
+from helpers.session_context import SessionContext
+from models import DFTDependency, DynaFlow, DynaFlowTask
+from models.factory import (DFTDependencyFactory, DynaFlowFactory,
+                            DynaFlowTaskFactory)
+
+
+async def _create_dyna_flow(
+    session: AsyncSession,
+    is_completed: bool = True,
+    dependency_dyna_flow_id: int = 0
+) -> DynaFlow:
+    """
+    Creates a DynaFlow in the given state.
+    """
+    dyna_flow = await DynaFlowFactory.create_async(session)
+    dyna_flow.is_completed = is_completed
+    dyna_flow.is_canceled = False
+    dyna_flow.dependency_dyna_flow_id = dependency_dyna_flow_id
+    await session.flush()
+    return dyna_flow
+
+
+async def _create_dyna_flow_task(
+    session: AsyncSession,
+    dyna_flow: DynaFlow,
+    is_completed: bool = True,
+    dependency_dyna_flow_task_id: int = 0
+) -> DynaFlowTask:
+    """
+    Creates a DynaFlowTask of the DynaFlow in the given state.
+    """
+    dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+    dyna_flow_task.dyna_flow_id = dyna_flow.dyna_flow_id
+    dyna_flow_task.is_completed = is_completed
+    dyna_flow_task.is_canceled = False
+    dyna_flow_task.dependency_dyna_flow_task_id = \
+        dependency_dyna_flow_task_id
+    await session.flush()
+    return dyna_flow_task
+
+
+async def _create_dft_dependency(
+    session: AsyncSession,
+    dyna_flow_task: DynaFlowTask,
+    dependency_dyna_flow_task: DynaFlowTask
+) -> DFTDependency:
+    """
+    Creates a DFTDependency of a DynaFlowTask on another one.
+    """
+    dft_dependency = await DFTDependencyFactory.create_async(session)
+    dft_dependency.dyna_flow_task_id = dyna_flow_task.dyna_flow_task_id
+    dft_dependency.dependency_df_task_id = \
+        dependency_dyna_flow_task.dyna_flow_task_id
+    await session.flush()
+    return dft_dependency
+
+
+async def _finish_other_rows(
+    session: AsyncSession,
+    dyna_flow_list: List[DynaFlow],
+    dyna_flow_task_list: List[DynaFlowTask]
+) -> None:
+    """
+    Marks the other DynaFlows and DynaFlowTasks, created as
+    parents by the factories, finished and independent, so their
+    random dependency ids do not block the rows of the test.
+    """
+    await session.execute(
+        update(DynaFlow)
+        .where(DynaFlow._dyna_flow_id.not_in(
+            [x.dyna_flow_id for x in dyna_flow_list]))
+        .values({
+            DynaFlow._is_completed: True,
+            DynaFlow._is_canceled: False,
+            DynaFlow._dependency_dyna_flow_id: 0,
+        }))
+    await session.execute(
+        update(DynaFlowTask)
+        .where(DynaFlowTask._dyna_flow_task_id.not_in(
+            [x.dyna_flow_task_id for x in dyna_flow_task_list]))
+        .values({
+            DynaFlowTask._is_completed: True,
+            DynaFlowTask._is_canceled: False,
+            DynaFlowTask._dependency_dyna_flow_task_id: 0,
+        }))
+
+
+def _get_before_utc_date_time() -> datetime:
+    """
+    Returns a retention time after every row of the test.
+    """
+    return datetime.now(timezone.utc) + timedelta(days=1)
+
+
+def test_disabled_by_default():
+    """
+    Test that the archive is off without a retention age.
+    """
+    archiver = DynaFlowArchiver(archive_after_days=0, archive_folder="")
+
+    assert archiver.is_enabled() is False
+
+
+def test_relative_archive_folder_is_rejected():
+    """
+    Test that an enabled archive requires an absolute folder.
+    """
+    with pytest.raises(ValueError):
+        DynaFlowArchiver(
+            archive_after_days=30,
+            archive_folder="dyna_flow_archive")
+
+    with pytest.raises(ValueError):
+        DynaFlowArchiver(archive_after_days=30, archive_folder="")
+
+
+@pytest.mark.asyncio
+async def test_get_archivable_dyna_flow_id_list(
+    session: AsyncSession,
+    tmp_path
+):
+    """
+    Test that a finished DynaFlow is archivable only while
+    nothing pending depends on it.
+    """
+    archivable = await _create_dyna_flow(session)
+    archivable_task = await _create_dyna_flow_task(session, archivable)
+
+    pending = await _create_dyna_flow(session, is_completed=False)
+
+    with_pending_task = await _create_dyna_flow(session)
+    pending_task = await _create_dyna_flow_task(
+        session, with_pending_task, is_completed=False)
+
+    with_pending_dependent_flow = await _create_dyna_flow(session)
+    dependent_flow = await _create_dyna_flow(
+        session,
+        is_completed=False,
+        dependency_dyna_flow_id=with_pending_dependent_flow.dyna_flow_id)
+
+    with_pending_dependent_task = await _create_dyna_flow(session)
+    depended_on_task = await _create_dyna_flow_task(
+        session, with_pending_dependent_task)
+    dependent_task_flow = await _create_dyna_flow(
+        session, is_completed=False)
+    dependent_task = await _create_dyna_flow_task(
+        session,
+        dependent_task_flow,
+        is_completed=False,
+        dependency_dyna_flow_task_id=depended_on_task.dyna_flow_task_id)
+
+    with_pending_dft_dependency = await _create_dyna_flow(session)
+    dft_depended_on_task = await _create_dyna_flow_task(
+        session, with_pending_dft_dependency)
+    dft_dependent_flow = await _create_dyna_flow(
+        session, is_completed=False)
+    dft_dependent_task = await _create_dyna_flow_task(
+        session, dft_dependent_flow, is_completed=False)
+    await _create_dft_dependency(
+        session, dft_dependent_task, dft_depended_on_task)
+
+    await _finish_other_rows(
+        session,
+        [archivable, pending, with_pending_task,
+         with_pending_dependent_flow, dependent_flow,
+         with_pending_dependent_task, dependent_task_flow,
+         with_pending_dft_dependency, dft_dependent_flow],
+        [archivable_task, pending_task, depended_on_task,
+         dependent_task, dft_depended_on_task, dft_dependent_task])
+
+    archiver = DynaFlowArchiver(
+        archive_after_days=30,
+        batch_size=1000,
+        archive_folder=str(tmp_path))
+
+    dyna_flow_id_list = await archiver.get_archivable_dyna_flow_id_list(
+        SessionContext({}, session),
+        _get_before_utc_date_time())
+
+    assert archivable.dyna_flow_id in dyna_flow_id_list
+    for dyna_flow in [pending, with_pending_task,
+                      with_pending_dependent_flow, dependent_flow,
+                      with_pending_dependent_task, dependent_task_flow,
+                      with_pending_dft_dependency, dft_dependent_flow]:
+        assert dyna_flow.dyna_flow_id not in dyna_flow_id_list
+
+    before_list = await archiver.get_archivable_dyna_flow_id_list(
+        SessionContext({}, session),
+        datetime.now(timezone.utc) - timedelta(days=1))
+
+    assert archivable.dyna_flow_id not in before_list
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_exports_every_deleted_row(
+    session: AsyncSession,
+    tmp_path
+):
+    """
+    Test that archive_batch writes every row it deletes
+    to the export, and leaves a DynaFlow with a pending
+    dependent in the tables.
+    """
+    dyna_flow = await _create_dyna_flow(session)
+    first_task = await _create_dyna_flow_task(session, dyna_flow)
+    second_task = await _create_dyna_flow_task(session, dyna_flow)
+    dft_dependency = await _create_dft_dependency(
+        session, second_task, first_task)
+
+    kept = await _create_dyna_flow(session)
+    dependent_flow = await _create_dyna_flow(
+        session,
+        is_completed=False,
+        dependency_dyna_flow_id=kept.dyna_flow_id)
+
+    await _finish_other_rows(
+        session,
+        [dyna_flow, kept, dependent_flow],
+        [first_task, second_task])
+
+    async def get_code_set(model) -> set:
+        result = await session.execute(select(model._code))
+        return set(result.scalars().all())
+
+    before = {model: await get_code_set(model)
+              for model in [DynaFlow, DynaFlowTask, DFTDependency]}
+
+    archiver = DynaFlowArchiver(
+        archive_after_days=30,
+        batch_size=1000,
+        archive_folder=str(tmp_path))
+
+    archived_count = await archiver.archive_batch(
+        SessionContext({}, session),
+        _get_before_utc_date_time())
+
+    deleted = {model: before[model] - await get_code_set(model)
+               for model in before}
+
+    assert archived_count == len(deleted[DynaFlow])
+    assert dyna_flow.code in deleted[DynaFlow]
+    assert kept.code not in deleted[DynaFlow]
+    assert {first_task.code, second_task.code} <= deleted[DynaFlowTask]
+    assert dft_dependency.code in deleted[DFTDependency]
+
+    exported = {model: set() for model in before}
+    file_name_list = os.listdir(tmp_path)
+    assert len(file_name_list) == 1
+    with gzip.open(tmp_path / file_name_list[0], "rt") as file:
+        for line in file:
+            row = json.loads(line)
+            exported[DynaFlow].add(row["dyna_flow"]["code"])
+            exported[DynaFlowTask].update(
+                x["code"] for x in row["dyna_flow_task_list"])
+            exported[DFTDependency].update(
+                x["code"] for x in row["dft_dependency_list"])
+
+    for model, code_set in deleted.items():
+        assert exported[model] == {str(x) for x in code_set}
@@ -0,0 +1,139 @@
+# df_processor/tests/dyna_flow_processor_claim_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for when the
+`DynaFlowProcessor` class claims the DynaFlows it builds
+and the DynaFlow tasks it runs.
+"""
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from df_processor.dyna_flow_processor import DynaFlowProcessor
+
+
+@pytest.fixture(scope="function")
+def processor():
+    """
+    Fixture that returns a `DynaFlowProcessor`.
+    """
+    dyna_flow_processor_obj = DynaFlowProcessor()
+    dyna_flow_processor_obj._is_dyna_flow_task_processor = True
+    yield dyna_flow_processor_obj
+    dyna_flow_processor_obj._process_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_build_dyna_flow_tasks_claims_a_window(
+    processor: DynaFlowProcessor,
+    monkeypatch
+):
+    """
+    Test that the DynaFlows are claimed in windows of the
+    max concurrency right before their build, that a DynaFlow
+    another processor claimed first is made up by the next
+    one, and that a stop leaves the rest of the list unclaimed.
+    """
+    processor._task_max_concurrency = 2
+    code_list = [uuid.uuid4() for _ in range(5)]
+    taken_code = code_list[1]
+    event_list = []
+
+    async def get_task_build_todo_list():
+        return [SimpleNamespace(dyna_flow_code=x) for x in code_list]
+
+    async def claim_dyna_flow_list_for_task_build(
+            dyna_flow_code_list, item_count=None):
+        event_list.append(("claim", dyna_flow_code_list, item_count))
+        return [x for x in dyna_flow_code_list if x != taken_code][
+            :item_count]
+
+    async def build_tasks_for_dyna_flow(dyna_flow_code):
+        event_list.append(("build", dyna_flow_code))
+        if dyna_flow_code == code_list[2]:
+            processor.request_stop()
+
+    monkeypatch.setattr(
+        processor, "get_task_build_todo_list", get_task_build_todo_list)
+    monkeypatch.setattr(
+        processor, "claim_dyna_flow_list_for_task_build",
+        claim_dyna_flow_list_for_task_build)
+    monkeypatch.setattr(
+        processor, "build_tasks_for_dyna_flow", build_tasks_for_dyna_flow)
+
+    assert await processor.build_dyna_flow_tasks() == 5
+
+    assert event_list == [
+        ("claim", code_list, 2),
+        ("build", code_list[0]),
+        ("build", code_list[2]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_db_tasks_claims_serial_task_last(
+    processor: DynaFlowProcessor,
+    monkeypatch
+):
+    """
+    Test that a serial task is claimed only after the running
+    parallel tasks finish, that the parallel tasks are claimed
+    together in one window of the free slots, and that a task
+    another processor claimed first is not run.
+    """
+    processor._task_max_concurrency = 2
+    parallel_code_list = [uuid.uuid4() for _ in range(2)]
+    serial_code = uuid.uuid4()
+    taken_code = uuid.uuid4()
+    code_list = [*parallel_code_list, serial_code, taken_code]
+    event_list = []
+    claim_list = []
+
+    async def get_task_run_todo_list():
+        return [SimpleNamespace(dyna_flow_task_code=x) for x in code_list]
+
+    async def get_dyna_flow_task_parallel_run_allowed_dict(
+            dyna_flow_task_code_list):
+        return {
+            x: x in parallel_code_list or x == taken_code
+            for x in dyna_flow_task_code_list
+        }
+
+    async def claim_dyna_flow_task_list_for_task_run(
+            dyna_flow_task_code_list, item_count=None):
+        event_list.append(("claim", dyna_flow_task_code_list[0]))
+        claim_list.append((dyna_flow_task_code_list, item_count))
+        return {
+            x: x != serial_code
+            for x in [
+                x for x in dyna_flow_task_code_list if x != taken_code
+            ][:item_count]
+        }
+
+    async def run_dyna_flow_task(dyna_flow_task_code, **kwargs):
+        event_list.append(("start", dyna_flow_task_code))
+        await asyncio.sleep(0.05)
+        event_list.append(("finish", dyna_flow_task_code))
+
+    monkeypatch.setattr(
+        processor, "get_task_run_todo_list", get_task_run_todo_list)
+    monkeypatch.setattr(
+        processor, "get_dyna_flow_task_parallel_run_allowed_dict",
+        get_dyna_flow_task_parallel_run_allowed_dict)
+    monkeypatch.setattr(
+        processor, "claim_dyna_flow_task_list_for_task_run",
+        claim_dyna_flow_task_list_for_task_run)
+    monkeypatch.setattr(
+        processor, "run_dyna_flow_task", run_dyna_flow_task)
+
+    assert await processor.run_dyna_flow_db_tasks() == 4
+
+    assert claim_list[0] == (parallel_code_list, 2)
+    serial_claim_index = event_list.index(("claim", serial_code))
+    for parallel_code in parallel_code_list:
+        assert event_list.index(("finish", parallel_code)) < \
+            serial_claim_index
+    assert event_list[serial_claim_index + 1] == ("start", serial_code)
+    assert ("claim", taken_code) in event_list
+    assert ("start", taken_code) not in event_list
@@ -0,0 +1,232 @@
+# df_processor/tests/dyna_flow_processor_concurrency_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the concurrent run of the
+DynaFlow tasks of the `DynaFlowProcessor` class: the
+concurrency limit, the priority order and the DFTDependency
+order of the tasks.
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import current_runtime
+import pytest
+from df_processor import dyna_flow_processor
+from df_processor.dyna_flow_processor import DynaFlowProcessor
+from helpers.session_context import SessionContext
+from managers import DynaFlowTaskManager, PacEnum, PacManager
+from models import DynaFlow, DynaFlowTask
+from models.factory import (DFTDependencyFactory, DynaFlowFactory,
+                            DynaFlowTaskFactory)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 2, 3])
+async def test_run_dyna_flow_db_tasks_concurrency_limit(
+    monkeypatch,
+    max_concurrency
+):
+    """
+    Test that no more than the max concurrency of parallel
+    tasks run at a time, that the limit is reached, that the
+    first claim takes a window of all the slots, and that the
+    tasks start in the order of the to-do list.
+    """
+    processor = DynaFlowProcessor()
+    processor._is_dyna_flow_task_processor = True
+    processor._task_max_concurrency = max_concurrency
+
+    code_list = [uuid.uuid4() for _ in range(7)]
+    start_list = []
+    claim_list = []
+    running_count_list = [0]
+    max_running_count_list = [0]
+
+    async def get_task_run_todo_list():
+        return [SimpleNamespace(dyna_flow_task_code=x) for x in code_list]
+
+    async def get_dyna_flow_task_parallel_run_allowed_dict(
+            dyna_flow_task_code_list):
+        return {x: True for x in dyna_flow_task_code_list}
+
+    async def claim_dyna_flow_task_list_for_task_run(
+            dyna_flow_task_code_list, item_count=None):
+        claim_list.append(dyna_flow_task_code_list[:item_count])
+        return {x: True for x in dyna_flow_task_code_list[:item_count]}
+
+    async def run_dyna_flow_task(dyna_flow_task_code, **kwargs):  # pylint: disable=unused-argument # noqa: E501
+        start_list.append(dyna_flow_task_code)
+        running_count_list[0] += 1
+        max_running_count_list[0] = max(
+            max_running_count_list[0], running_count_list[0])
+        await asyncio.sleep(0.02)
+        running_count_list[0] -= 1
+
+    monkeypatch.setattr(
+        processor, "get_task_run_todo_list", get_task_run_todo_list)
+    monkeypatch.setattr(
+        processor, "get_dyna_flow_task_parallel_run_allowed_dict",
+        get_dyna_flow_task_parallel_run_allowed_dict)
+    monkeypatch.setattr(
+        processor, "claim_dyna_flow_task_list_for_task_run",
+        claim_dyna_flow_task_list_for_task_run)
+    monkeypatch.setattr(
+        processor, "run_dyna_flow_task", run_dyna_flow_task)
+
+    try:
+        assert await processor.run_dyna_flow_db_tasks() == len(code_list)
+    finally:
+        processor._process_pool.shutdown()
+
+    assert start_list == code_list
+    assert claim_list[0] == code_list[:max_concurrency]
+    assert max_running_count_list[0] == max_concurrency
+    assert running_count_list[0] == 0
+
+
+@pytest_asyncio.fixture(scope="function")
+async def processor(session: AsyncSession, monkeypatch):
+    """
+    Fixture that returns a `DynaFlowProcessor` whose sessions
+    run in savepoints of the test session, with the lookup
+    rows seeded, and whose task runs only complete the task
+    and record the run order.
+    """
+    async def get_dyna_flow_db():
+        async with AsyncSession(
+                bind=session.bind,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint") as db:
+            yield db
+
+    monkeypatch.setattr(
+        dyna_flow_processor, "get_dyna_flow_db", get_dyna_flow_db)
+
+    await current_runtime.initialize(SessionContext({}, session))
+    await session.commit()
+
+    dyna_flow_processor_obj = DynaFlowProcessor()
+    dyna_flow_processor_obj._is_dyna_flow_task_processor = True
+    dyna_flow_processor_obj._task_max_concurrency = 4
+    dyna_flow_processor_obj.run_list = []
+
+    # the savepoints of the runs share the test connection,
+    # so they must not interleave
+    savepoint_lock = asyncio.Lock()
+
+    async def run_dyna_flow_task(dyna_flow_task_code, **kwargs):  # pylint: disable=unused-argument # noqa: E501
+        dyna_flow_processor_obj.run_list.append(dyna_flow_task_code)
+        async with savepoint_lock:
+            async for db in get_dyna_flow_db():
+                dyna_flow_task_manager = DynaFlowTaskManager(
+                    SessionContext({}, db))
+                dyna_flow_task = await dyna_flow_task_manager.get_by_code(
+                    dyna_flow_task_code)
+                dyna_flow_task.is_completed = True
+                dyna_flow_task.is_successful = True
+                await db.commit()
+
+    monkeypatch.setattr(
+        dyna_flow_processor_obj, "run_dyna_flow_task", run_dyna_flow_task)
+
+    yield dyna_flow_processor_obj
+    dyna_flow_processor_obj._process_pool.shutdown()
+
+
+async def _create_dyna_flow(
+    session: AsyncSession,
+    priority_level: int
+) -> DynaFlow:
+    """
+    Creates a DynaFlow of the unknown Pac that is ready
+    to run and depends on no other DynaFlow.
+    """
+    pac = await PacManager(SessionContext({}, session)).from_enum(
+        PacEnum.UNKNOWN)
+
+    dyna_flow = await DynaFlowFactory.create_async(session)
+    dyna_flow.pac_id = pac.pac_id
+    dyna_flow.priority_level = priority_level
+    dyna_flow.dependency_dyna_flow_id = 0
+    dyna_flow.is_canceled = False
+    dyna_flow.is_completed = False
+    await session.flush()
+    return dyna_flow
+
+
+async def _create_dyna_flow_task(
+    session: AsyncSession,
+    dyna_flow: DynaFlow
+) -> DynaFlowTask:
+    """
+    Creates a DynaFlowTask of the DynaFlow that is ready
+    to run and depends on no other DynaFlowTask.
+    """
+    dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+    dyna_flow_task.dyna_flow_id = dyna_flow.dyna_flow_id
+    dyna_flow_task.dependency_dyna_flow_task_id = 0
+    dyna_flow_task.is_canceled = False
+    dyna_flow_task.is_started = False
+    dyna_flow_task.is_completed = False
+    dyna_flow_task.is_successful = False
+    dyna_flow_task.is_parallel_run_allowed = True
+    dyna_flow_task.is_run_task_debug_required = False
+    dyna_flow_task.min_start_utc_date_time = \
+        datetime.utcnow() - timedelta(hours=1)
+    await session.flush()
+    return dyna_flow_task
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_db_tasks_priority_order(
+    processor: DynaFlowProcessor,
+    session: AsyncSession
+):
+    """
+    Test that the tasks of the DynaFlow with the
+    higher priority level are started first.
+    """
+    low_dyna_flow = await _create_dyna_flow(session, 1)
+    high_dyna_flow = await _create_dyna_flow(session, 9)
+    low_task = await _create_dyna_flow_task(session, low_dyna_flow)
+    high_task = await _create_dyna_flow_task(session, high_dyna_flow)
+    await session.commit()
+
+    assert await processor.run_dyna_flow_db_tasks() == 2
+
+    assert processor.run_list == [high_task.code, low_task.code]
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_db_tasks_dependency_order(
+    processor: DynaFlowProcessor,
+    session: AsyncSession
+):
+    """
+    Test that a task locked by a DFTDependency is not run
+    with the task it depends on, even if both allow a
+    parallel run, and is run once that task is successful.
+    """
+    dyna_flow = await _create_dyna_flow(session, 1)
+    first_task = await _create_dyna_flow_task(session, dyna_flow)
+    second_task = await _create_dyna_flow_task(session, dyna_flow)
+
+    dft_dependency = await DFTDependencyFactory.create_async(session)
+    dft_dependency.dyna_flow_task_id = second_task.dyna_flow_task_id
+    dft_dependency.dependency_df_task_id = first_task.dyna_flow_task_id
+    await session.commit()
+
+    assert await processor.run_dyna_flow_db_tasks() == 1
+
+    assert processor.run_list == [first_task.code]
+
+    assert await processor.run_dyna_flow_db_tasks() == 1
+
+    assert processor.run_list == [first_task.code, second_task.code]
+
+    assert await processor.run_dyna_flow_db_tasks() == 0
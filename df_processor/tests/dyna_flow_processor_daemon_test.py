@@ -0,0 +1,269 @@
+# df_processor/tests/dyna_flow_processor_daemon_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the daemon mode of the
+`DynaFlowProcessor` class: the poll backoff, the wake up
+on a notification, the stop and the reconnect of the
+notification listener.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from df_processor import dyna_flow_processor
+from df_processor.dyna_flow_processor import DynaFlowProcessor
+
+
+async def _do_nothing(*args, **kwargs):  # pylint: disable=unused-argument
+    """
+    Replaces the daemon steps that need a database.
+    """
+
+
+@pytest.fixture(scope="function")
+def processor(monkeypatch):
+    """
+    Fixture that returns a `DynaFlowProcessor` whose daemon
+    steps outside of the poll loop do nothing.
+    """
+    dyna_flow_processor_obj = DynaFlowProcessor()
+    dyna_flow_processor_obj._is_task_queue_used = False
+    dyna_flow_processor_obj._is_dyna_flow_task_master = False
+    dyna_flow_processor_obj._metrics_log_seconds = 0
+    dyna_flow_processor_obj._daemon_min_poll_seconds = 1
+    dyna_flow_processor_obj._daemon_max_poll_seconds = 8
+
+    for name in ["init_app", "start_metrics_server",
+                 "stop_metrics_server", "log_metrics_snapshot",
+                 "cleanup_my_past_dyna_flow_tasks",
+                 "request_scheduled_dyna_flows"]:
+        monkeypatch.setattr(dyna_flow_processor_obj, name, _do_nothing)
+    monkeypatch.setattr(
+        dyna_flow_processor_obj, "add_stop_signal_handlers",
+        lambda: None)
+
+    yield dyna_flow_processor_obj
+    dyna_flow_processor_obj._process_pool.shutdown()
+
+
+def _script_passes(
+    processor: DynaFlowProcessor,
+    monkeypatch,
+    work_count_list: list,
+    is_woken_list: list
+) -> list:
+    """
+    Makes each daemon pass return the next work count and
+    each wait return the next woken value, and stops the
+    daemon after the last pass. Returns the list the wait
+    seconds are recorded in.
+    """
+    work_count_list = list(work_count_list)
+    is_woken_list = list(is_woken_list)
+    wait_seconds_list = []
+
+    async def run_pass():
+        work_count = work_count_list.pop(0)
+        if len(work_count_list) == 0:
+            processor.request_stop()
+        return work_count
+
+    async def wait_for_wake(wait_seconds):
+        wait_seconds_list.append(wait_seconds)
+        return is_woken_list.pop(0)
+
+    monkeypatch.setattr(processor, "run_pass", run_pass)
+    monkeypatch.setattr(processor, "wait_for_wake", wait_for_wake)
+    return wait_seconds_list
+
+
+@pytest.mark.asyncio
+async def test_run_daemon_poll_backoff(
+    processor: DynaFlowProcessor,
+    monkeypatch
+):
+    """
+    Test that each idle pass doubles the poll interval up to
+    the maximum, and that a pass with work or a wake up
+    resets it to the minimum.
+    """
+    wait_seconds_list = _script_passes(
+        processor,
+        monkeypatch,
+        [1, 0, 0, 0, 0, 0, 0, 0, 0],
+        [False, False, False, False, True, False, False, False])
+
+    await processor.run_daemon()
+
+    assert wait_seconds_list == [1, 2, 4, 8, 8, 2, 4, 8]
+
+
+@pytest.mark.asyncio
+async def test_run_daemon_stop(
+    processor: DynaFlowProcessor,
+    monkeypatch
+):
+    """
+    Test that a stop requested during a pass ends the daemon
+    without waiting, and that the listener is stopped.
+    """
+    stop_listener_list = []
+
+    async def stop_dyna_flow_listener():
+        stop_listener_list.append(True)
+
+    monkeypatch.setattr(
+        processor, "stop_dyna_flow_listener", stop_dyna_flow_listener)
+    wait_seconds_list = _script_passes(processor, monkeypatch, [3], [])
+
+    await asyncio.wait_for(processor.run_daemon(), timeout=5)
+
+    assert wait_seconds_list == []
+    assert stop_listener_list == [True]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_wake(processor: DynaFlowProcessor):
+    """
+    Test that a notification and a stop end the wait, and
+    that the wait times out without them.
+    """
+    processor._wake_event = asyncio.Event()
+
+    assert await processor.wait_for_wake(0.01) is False
+
+    asyncio.get_running_loop().call_later(
+        0.01,
+        processor.on_dyna_flow_notification,
+        None, 1, "dyna_flow_requested", "")
+
+    assert await processor.wait_for_wake(5) is True
+
+    processor._wake_event.clear()
+    asyncio.get_running_loop().call_later(0.01, processor.request_stop)
+
+    assert await processor.wait_for_wake(5) is True
+    assert processor._is_stop_requested is True
+
+
+class _FakeDriverConnection:
+    """
+    An asyncpg connection that can be dropped.
+    """
+    def __init__(self):
+        self.is_dropped = False
+        self.termination_listener_list = []
+
+    def add_termination_listener(self, callback):
+        """
+        Adds a callback called when the connection drops.
+        """
+        self.termination_listener_list.append(callback)
+
+    async def add_listener(self, channel, callback):  # pylint: disable=unused-argument # noqa: E501
+        """
+        Listens on a channel.
+        """
+
+    def is_closed(self) -> bool:
+        """
+        Returns True if the connection dropped.
+        """
+        return self.is_dropped
+
+    def drop(self):
+        """
+        Drops the connection.
+        """
+        self.is_dropped = True
+        for callback in self.termination_listener_list:
+            callback(self)
+
+
+class _FakeConnection:
+    """
+    An engine connection of a fake asyncpg connection.
+    """
+    def __init__(self, fake_engine):
+        self.fake_engine = fake_engine
+        self.driver_connection = _FakeDriverConnection()
+        self.is_invalidated = False
+
+    async def get_raw_connection(self):
+        """
+        Returns the pool connection.
+        """
+        return SimpleNamespace(driver_connection=self.driver_connection)
+
+    async def invalidate(self):
+        """
+        Discards the connection.
+        """
+        self.is_invalidated = True
+
+    async def close(self):
+        """
+        Returns the connection to the pool.
+        """
+
+
+class _FakeEngine:
+    """
+    An asyncpg engine that can fail to connect.
+    """
+    def __init__(self):
+        self.dialect = SimpleNamespace(driver="asyncpg")
+        self.connection_list = []
+        self.is_down = False
+
+    async def connect(self) -> _FakeConnection:
+        """
+        Opens a connection, unless the database is down.
+        """
+        if self.is_down:
+            raise ConnectionError("database is down")
+        connection = _FakeConnection(self)
+        self.connection_list.append(connection)
+        return connection
+
+
+@pytest.mark.asyncio
+async def test_reconnect_dyna_flow_listener(
+    processor: DynaFlowProcessor,
+    monkeypatch
+):
+    """
+    Test that a dropped listen connection wakes the daemon
+    and is replaced, retrying while the database is down.
+    """
+    fake_engine = _FakeEngine()
+    monkeypatch.setattr(dyna_flow_processor, "dyna_flow_engine", fake_engine)
+    processor._wake_event = asyncio.Event()
+
+    await processor.start_dyna_flow_listener()
+    await processor.reconnect_dyna_flow_listener()
+
+    assert len(fake_engine.connection_list) == 1
+    assert processor.is_dyna_flow_listener_connected() is True
+
+    first_connection = fake_engine.connection_list[0]
+    fake_engine.is_down = True
+    first_connection.driver_connection.drop()
+
+    assert processor._wake_event.is_set() is True
+    assert processor.is_dyna_flow_listener_connected() is False
+
+    await processor.reconnect_dyna_flow_listener()
+
+    assert first_connection.is_invalidated is True
+    assert processor.is_dyna_flow_listener_connected() is False
+
+    fake_engine.is_down = False
+    await processor.reconnect_dyna_flow_listener()
+
+    assert len(fake_engine.connection_list) == 2
+    assert processor.is_dyna_flow_listener_connected() is True
+
+    await processor.stop_dyna_flow_listener()
+
+    assert fake_engine.connection_list[1].is_invalidated is False
@@ -0,0 +1,290 @@
+# df_processor/tests/dyna_flow_processor_queue_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the queue mode of the
+`DynaFlowProcessor` class: the batch save of the task
+messages, the skipped and dead messages, the message
+completion and the message lock renewal.
+"""
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import pytest
+from df_processor import dyna_flow_processor
+from df_processor.dyna_flow_processor import DynaFlowProcessor
+from helpers.session_context import SessionContext
+from managers import DynaFlowTaskManager
+from models.factory import DynaFlowTaskFactory
+from services.azure_service_bus_queue_backend import \
+    AzureServiceBusQueueBackend
+from services.local_queue_backend import InMemoryQueueBackend
+from services.queue_backend import QueueMessage
+from services.queue_manager import QueueManager
+
+
+@pytest_asyncio.fixture(scope="function")
+async def processor(session: AsyncSession, monkeypatch):
+    """
+    Fixture that returns a `DynaFlowProcessor` whose sessions
+    run in savepoints of the test session, with an in-memory
+    queue backend.
+    """
+    async def get_dyna_flow_db():
+        async with AsyncSession(
+                bind=session.bind,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint") as db:
+            yield db
+
+    monkeypatch.setattr(
+        dyna_flow_processor, "get_dyna_flow_db", get_dyna_flow_db)
+
+    dyna_flow_processor_obj = DynaFlowProcessor()
+    dyna_flow_processor_obj._queue_manager = QueueManager(
+        InMemoryQueueBackend())
+    yield dyna_flow_processor_obj
+    dyna_flow_processor_obj._process_pool.shutdown()
+
+
+async def _get_task_message(
+    session: AsyncSession,
+    message_id: str = "1"
+) -> QueueMessage:
+    """
+    Creates a DynaFlowTask and returns a queue message
+    that completes it.
+    """
+    dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+    dyna_flow_task.is_completed = False
+    dyna_flow_task.is_canceled = False
+    await session.commit()
+
+    manager = DynaFlowTaskManager(SessionContext({}, session))
+    data = json.loads(manager.to_json(dyna_flow_task))
+    data["is_completed"] = True
+    return QueueMessage(json.dumps(data), message_id=message_id)
+
+
+@pytest.mark.asyncio
+async def test_save_dyna_flow_task_message_batch(
+    processor: DynaFlowProcessor,
+    session: AsyncSession
+):
+    """
+    Test that a batch of task messages is saved, claimed
+    and stamped with the last update user and time.
+    """
+    message_list = [
+        await _get_task_message(session, "1"),
+        await _get_task_message(session, "2"),
+    ]
+    before_utc_date_time = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    saved_code_dict = await processor.save_dyna_flow_task_message_batch(
+        message_list,
+        is_claimed=True)
+
+    assert saved_code_dict is not None
+    assert set(saved_code_dict) == {"1", "2"}
+
+    manager = DynaFlowTaskManager(SessionContext({}, session))
+    for code in saved_code_dict.values():
+        dyna_flow_task = await manager.get_by_code(code)
+        await session.refresh(dyna_flow_task)
+        assert dyna_flow_task.is_completed is True
+        assert dyna_flow_task.processor_identifier == \
+            processor.get_instance_id()
+        assert dyna_flow_task.last_update_user_id == uuid.UUID(int=0)
+        assert dyna_flow_task.last_update_utc_date_time.replace(
+            tzinfo=None) >= before_utc_date_time - timedelta(seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_save_dyna_flow_task_message_list_dead_message(
+    processor: DynaFlowProcessor,
+    session: AsyncSession
+):
+    """
+    Test that a message that cannot be saved fails only
+    itself, and is sent to the dead queue.
+    """
+    good_message = await _get_task_message(session, "good")
+    bad_message = QueueMessage("not json", message_id="bad")
+    message_list = [good_message, bad_message]
+
+    saved_code_dict = await processor.save_dyna_flow_task_message_list(
+        message_list)
+
+    assert list(saved_code_dict) == ["good"]
+
+    await processor.send_dead_messages(message_list, saved_code_dict)
+
+    dead_message_list = await processor._queue_manager.read_messages(
+        processor._task_dead_queue_name, 10, 0)
+
+    assert [x.body for x in dead_message_list] == ["not json"]
+
+
+@pytest.mark.asyncio
+async def test_save_dyna_flow_task_message_batch_skipped(
+    processor: DynaFlowProcessor,
+    session: AsyncSession
+):
+    """
+    Test that a stale message, and a claim of a completed
+    task, are skipped without saving their task.
+    """
+    stale_message = await _get_task_message(session, "stale")
+    data = json.loads(stale_message.body)
+    data["last_change_code"] -= 1
+    stale_message = QueueMessage(json.dumps(data), message_id="stale")
+
+    completed_message = await _get_task_message(session, "completed")
+    manager = DynaFlowTaskManager(SessionContext({}, session))
+    completed_task = await manager.get_by_code(
+        uuid.UUID(json.loads(completed_message.body)["code"]))
+    completed_task.is_completed = True
+    await session.commit()
+
+    last_change_code_dict = {}
+    for message in [stale_message, completed_message]:
+        dyna_flow_task = await manager.get_by_code(
+            uuid.UUID(json.loads(message.body)["code"]))
+        last_change_code_dict[message.message_id] = \
+            dyna_flow_task.last_change_code
+
+    saved_code_dict = await processor.save_dyna_flow_task_message_batch(
+        [stale_message, completed_message],
+        is_claimed=True)
+
+    assert saved_code_dict == {"stale": None, "completed": None}
+
+    for message in [stale_message, completed_message]:
+        dyna_flow_task = await manager.get_by_code(
+            uuid.UUID(json.loads(message.body)["code"]))
+        await session.refresh(dyna_flow_task)
+        assert dyna_flow_task.last_change_code == \
+            last_change_code_dict[message.message_id]
+        assert dyna_flow_task.processor_identifier != \
+            processor.get_instance_id()
+
+    await processor.send_dead_messages(
+        [stale_message, completed_message], saved_code_dict)
+
+    assert await processor._queue_manager.read_messages(
+        processor._task_dead_queue_name, 10, 0) == []
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_queue_tasks_completes_each_message(
+    processor: DynaFlowProcessor,
+    session: AsyncSession,
+    monkeypatch
+):
+    """
+    Test that a skipped message is completed before the
+    task runs, and that each message is completed once
+    its task has run.
+    """
+    message_list = [
+        await _get_task_message(session, "1"),
+        await _get_task_message(session, "2"),
+        await _get_task_message(session, "stale"),
+    ]
+    data = json.loads(message_list[2].body)
+    data["last_change_code"] -= 1
+    body_list = [x.body for x in message_list[:2]] + [json.dumps(data)]
+
+    queue_name = processor._task_processor_queue_name
+    await processor._queue_manager.send_messages_async(queue_name, body_list)
+
+    run_list = []
+
+    async def run_dyna_flow_task(dyna_flow_task_code, **kwargs):  # pylint: disable=unused-argument # noqa: E501
+        run_list.append((
+            str(dyna_flow_task_code),
+            await processor.get_message_count_async(queue_name)))
+
+    monkeypatch.setattr(
+        processor, "run_dyna_flow_task", run_dyna_flow_task)
+    processor._queue_max_wait_seconds = 0
+
+    await processor.run_dyna_flow_queue_tasks()
+
+    assert run_list == [
+        (json.loads(body_list[0])["code"], 2),
+        (json.loads(body_list[1])["code"], 1),
+    ]
+    assert await processor.get_message_count_async(queue_name) == 0
+
+
+class _RenewQueueManager:
+    """
+    A queue manager whose messages are locked for
+    lock_seconds, that counts the lock renewals.
+    """
+    def __init__(self, lock_seconds: float):
+        self.lock_seconds = lock_seconds
+        self.renew_count = 0
+
+    def get_lock_seconds(self, messages) -> float:  # pylint: disable=unused-argument # noqa: E501
+        """
+        Returns the lock seconds of the messages.
+        """
+        return self.lock_seconds
+
+    async def renew_message_locks(self, queue_name, messages) -> int:  # pylint: disable=unused-argument # noqa: E501
+        """
+        Counts a renewal of the message locks.
+        """
+        self.renew_count += 1
+        return len(messages)
+
+
+@pytest.mark.asyncio
+async def test_renew_message_locks_uses_backend_lock_seconds(
+    processor: DynaFlowProcessor
+):
+    """
+    Test that the locks are renewed at half of the lock
+    time the backend reports, not of the visibility timeout.
+    """
+    queue_manager = _RenewQueueManager(lock_seconds=2)
+    processor._queue_manager = queue_manager
+
+    lock_renewer = asyncio.create_task(
+        processor.renew_message_locks(
+            "test-queue",
+            [QueueMessage("a", message_id="1")]))
+    await asyncio.sleep(1.5)
+    lock_renewer.cancel()
+
+    assert queue_manager.renew_count == 1
+
+
+def test_azure_get_lock_seconds():
+    """
+    Test that the Azure Service Bus backend reports the time
+    left on the earliest lock of the messages.
+    """
+    backend = AzureServiceBusQueueBackend.__new__(
+        AzureServiceBusQueueBackend)
+    now = datetime.now(timezone.utc)
+    message_list = [
+        QueueMessage("a", native_message=SimpleNamespace(
+            locked_until_utc=now + timedelta(seconds=60))),
+        QueueMessage("b", native_message=SimpleNamespace(
+            locked_until_utc=(now + timedelta(seconds=30))
+            .replace(tzinfo=None))),
+    ]
+
+    lock_seconds = backend.get_lock_seconds(message_list, 300)
+
+    assert 28 < lock_seconds <= 30
+    assert backend.get_lock_seconds([QueueMessage("c")], 300) == 300
@@ -0,0 +1,338 @@
+# df_processor/tests/dyna_flow_task_process_pool_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the
+`DynaFlowTaskProcessPool` class, the flow run of its worker
+processes and the handoff of a CPU-bound task between the
+`DynaFlowProcessor` and the pool.
+"""
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import pytest
+from business import DynaFlowTaskBusObj
+from df_processor import dyna_flow_processor, dyna_flow_task_process_pool
+from df_processor.dyna_flow_processor import DynaFlowProcessor
+from df_processor.dyna_flow_task_process_pool import (DynaFlowTaskProcessError,
+                                                      DynaFlowTaskProcessPool)
+from helpers.session_context import SessionContext
+from models import DynaFlow, DynaFlowTaskType
+from models.factory import DynaFlowTaskFactory
+
+BROKEN_FLOW_NAME = "FlowBroken"
+ERROR_FLOW_NAME = "FlowError"
+
+
+class _WorkerPoolExecutor(ThreadPoolExecutor):
+    """
+    A process pool executor that runs its
+    workers in threads of the test process.
+    """
+    created_list: list = []
+
+    def __init__(self, max_workers, mp_context=None, initializer=None,  # pylint: disable=unused-argument # noqa: E501
+                 initargs=()):
+        super().__init__(max_workers=max_workers)
+        self.is_shut_down = False
+        _WorkerPoolExecutor.created_list.append(self)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.is_shut_down = True
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def _run_flow_in_worker(dyna_flow_task_code: str, flow_name: str):
+    """
+    Replaces the flow run of a worker process.
+    """
+    if flow_name == BROKEN_FLOW_NAME:
+        raise BrokenProcessPool("A worker process died")
+    if flow_name == ERROR_FLOW_NAME:
+        return f"ValueError: {dyna_flow_task_code}"
+    return None
+
+
+@pytest.fixture(scope="function")
+def process_pool(monkeypatch):
+    """
+    Fixture that returns a `DynaFlowTaskProcessPool`
+    whose workers run in threads.
+    """
+    _WorkerPoolExecutor.created_list = []
+    monkeypatch.setattr(
+        dyna_flow_task_process_pool, "ProcessPoolExecutor",
+        _WorkerPoolExecutor)
+    monkeypatch.setattr(
+        dyna_flow_task_process_pool, "run_flow_in_worker",
+        _run_flow_in_worker)
+
+    pool = DynaFlowTaskProcessPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_is_enabled():
+    """
+    Test that the pool is disabled by 0 or fewer workers.
+    """
+    assert DynaFlowTaskProcessPool(max_workers=2).is_enabled() is True
+    assert DynaFlowTaskProcessPool(max_workers=0).is_enabled() is False
+    assert DynaFlowTaskProcessPool(max_workers=-1).max_workers == 0
+
+
+@pytest.mark.asyncio
+async def test_run_flow_success(process_pool: DynaFlowTaskProcessPool):
+    """
+    Test that a flow that completes in the worker returns,
+    and that the executor is started once and reused.
+    """
+    await process_pool.run_flow(uuid.uuid4(), "FlowSuccess")
+    await process_pool.run_flow(uuid.uuid4(), "FlowSuccess")
+
+    assert len(_WorkerPoolExecutor.created_list) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_flow_error(process_pool: DynaFlowTaskProcessPool):
+    """
+    Test that the error of a flow in the worker is
+    raised in the processor.
+    """
+    dyna_flow_task_code = uuid.uuid4()
+
+    with pytest.raises(DynaFlowTaskProcessError) as exc_info:
+        await process_pool.run_flow(dyna_flow_task_code, ERROR_FLOW_NAME)
+
+    assert str(exc_info.value) == f"ValueError: {dyna_flow_task_code}"
+    assert _WorkerPoolExecutor.created_list[0].is_shut_down is False
+
+
+@pytest.mark.asyncio
+async def test_run_flow_broken_process_pool(
+    process_pool: DynaFlowTaskProcessPool
+):
+    """
+    Test that a broken pool is shut down and raised, and
+    that the next flow runs in a new pool.
+    """
+    with pytest.raises(BrokenProcessPool):
+        await process_pool.run_flow(uuid.uuid4(), BROKEN_FLOW_NAME)
+
+    assert process_pool._executor is None
+    assert _WorkerPoolExecutor.created_list[0].is_shut_down is True
+
+    await process_pool.run_flow(uuid.uuid4(), "FlowSuccess")
+
+    assert len(_WorkerPoolExecutor.created_list) == 2
+    assert process_pool._executor is _WorkerPoolExecutor.created_list[1]
+
+
+class _ResultFlow:
+    """
+    A flow that sets the result value of its task,
+    or raises an error.
+    """
+    def __init__(self, flow_name: str):
+        self.flow_name = flow_name
+
+    async def process(self, dyna_flow_task: DynaFlowTaskBusObj):
+        """
+        Runs the flow.
+        """
+        if self.flow_name == ERROR_FLOW_NAME:
+            dyna_flow_task.result_value = "partial"
+            await dyna_flow_task.save()
+            raise ValueError("bad input")
+        dyna_flow_task.result_value = "done"
+        await dyna_flow_task.save()
+
+
+def _get_savepoint_session_local(session: AsyncSession):
+    """
+    Returns a sessionmaker whose sessions run in
+    savepoints of the test session.
+    """
+    def session_local() -> AsyncSession:
+        return AsyncSession(
+            bind=session.bind,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint")
+
+    return session_local
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("flow_name, expected_error, expected_result", [
+    ("FlowResult", None, "done"),
+    (ERROR_FLOW_NAME, "ValueError: bad input", "before"),
+])
+async def test_worker_run_flow(
+    session: AsyncSession,
+    monkeypatch,
+    flow_name,
+    expected_error,
+    expected_result
+):
+    """
+    Test that the worker commits the changes of a flow that
+    completes, and rolls back those of a flow that raises
+    an error and returns the error.
+    """
+    dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+    dyna_flow_task.result_value = "before"
+    await session.commit()
+
+    monkeypatch.setattr(
+        dyna_flow_task_process_pool, "_worker_session_local",
+        _get_savepoint_session_local(session))
+    monkeypatch.setattr(
+        dyna_flow_task_process_pool.FlowFactory, "create_instance",
+        lambda name, session_context: _ResultFlow(name))
+
+    error = await dyna_flow_task_process_pool._run_flow(
+        dyna_flow_task.code, flow_name)
+
+    assert error == expected_error
+
+    await session.refresh(dyna_flow_task)
+
+    assert dyna_flow_task.result_value == expected_result
+
+
+@pytest_asyncio.fixture(scope="function")
+async def cpu_bound_task_processor(session: AsyncSession, monkeypatch):
+    """
+    Fixture that returns a `DynaFlowProcessor` with the process
+    pool enabled, whose sessions run in savepoints of the test
+    session and record their commits, and the code of a
+    CPU-bound DynaFlowTask that is ready to run.
+    """
+    event_list = []
+
+    class _RecordingSession(AsyncSession):
+        """
+        A session that records its commits.
+        """
+        async def commit(self):
+            event_list.append("commit")
+            await super().commit()
+
+    async def get_dyna_flow_db():
+        async with _RecordingSession(
+                bind=session.bind,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint") as db:
+            yield db
+
+    async def refresh_task_scheduler(dyna_flow_task_code_list):  # pylint: disable=unused-argument # noqa: E501
+        pass
+
+    monkeypatch.setattr(
+        dyna_flow_processor, "get_dyna_flow_db", get_dyna_flow_db)
+
+    dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+    dyna_flow_task.is_started = False
+    dyna_flow_task.is_completed = False
+    dyna_flow_task.is_successful = False
+    dyna_flow_task.is_canceled = False
+    dyna_flow_task.retry_count = 0
+    dyna_flow_task.max_retry_count = 0
+    dyna_flow_task.result_value = "before"
+
+    dyna_flow = await session.get(DynaFlow, dyna_flow_task.dyna_flow_id)
+    dyna_flow.is_completed = False
+    dyna_flow.is_cancel_requested = False
+
+    dyna_flow_task_type = await session.get(
+        DynaFlowTaskType, dyna_flow_task.dyna_flow_task_type_id)
+    dyna_flow_task_type.is_cpu_bound = True
+    await session.commit()
+
+    processor = DynaFlowProcessor()
+    processor._process_pool = DynaFlowTaskProcessPool(max_workers=1)
+    monkeypatch.setattr(
+        processor, "refresh_task_scheduler", refresh_task_scheduler)
+
+    yield processor, dyna_flow_task.code, event_list
+
+
+async def _load_dyna_flow_task(
+    session: AsyncSession,
+    dyna_flow_task_code: uuid.UUID
+) -> DynaFlowTaskBusObj:
+    """
+    Loads a DynaFlowTask in a new savepoint session.
+    """
+    dyna_flow_task = DynaFlowTaskBusObj(SessionContext({}, session))
+    await dyna_flow_task.load_from_code(dyna_flow_task_code)
+    return dyna_flow_task
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_task_process_pool_handoff(
+    session: AsyncSession,
+    cpu_bound_task_processor,
+    monkeypatch
+):
+    """
+    Test that a CPU-bound task is committed as started before
+    its flow is sent to the pool, and that the changes the
+    worker commits are kept when the task is completed.
+    """
+    processor, dyna_flow_task_code, event_list = cpu_bound_task_processor
+
+    async def run_flow(code, flow_name):  # pylint: disable=unused-argument # noqa: E501
+        event_list.append("run_flow")
+        async with _get_savepoint_session_local(session)() as worker_session:  # noqa: E501
+            dyna_flow_task = await _load_dyna_flow_task(
+                worker_session, code)
+            assert dyna_flow_task.is_started is True
+            dyna_flow_task.result_value = "from worker"
+            await dyna_flow_task.save()
+            await worker_session.commit()
+
+    monkeypatch.setattr(processor._process_pool, "run_flow", run_flow)
+
+    await processor.run_dyna_flow_task(
+        dyna_flow_task_code, clear_temp_folder=False)
+
+    assert event_list == ["commit", "run_flow", "commit"]
+
+    dyna_flow_task = await _load_dyna_flow_task(session, dyna_flow_task_code)
+    await dyna_flow_task.refresh()
+
+    assert dyna_flow_task.result_value == "from worker"
+    assert dyna_flow_task.is_completed is True
+    assert dyna_flow_task.is_successful is True
+
+
+@pytest.mark.asyncio
+async def test_run_dyna_flow_task_process_pool_error(
+    session: AsyncSession,
+    cpu_bound_task_processor,
+    monkeypatch
+):
+    """
+    Test that a task whose flow failed in the worker is
+    completed as not successful.
+    """
+    processor, dyna_flow_task_code, _ = cpu_bound_task_processor
+
+    async def run_flow(code, flow_name):  # pylint: disable=unused-argument # noqa: E501
+        raise DynaFlowTaskProcessError("ValueError: bad input")
+
+    monkeypatch.setattr(processor._process_pool, "run_flow", run_flow)
+
+    await processor.run_dyna_flow_task(
+        dyna_flow_task_code, clear_temp_folder=False)
+
+    dyna_flow_task = await _load_dyna_flow_task(session, dyna_flow_task_code)
+    await dyna_flow_task.refresh()
+
+    assert dyna_flow_task.result_value == "before"
+    assert dyna_flow_task.is_completed is True
+    assert dyna_flow_task.is_successful is False
@@ -0,0 +1,293 @@
+# df_processor/tests/dyna_flow_task_scheduler_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access
+"""
+This module contains unit tests for the `DynaFlowTaskScheduler` class.
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import pytest
+from df_processor.dyna_flow_task_scheduler import (DFT_DEPENDENCY_EDGE,
+                                                   DYNA_FLOW_EDGE, TASK_EDGE,
+                                                   DynaFlowTaskNode,
+                                                   DynaFlowTaskScheduler)
+from helpers.session_context import SessionContext
+from models.factory import DynaFlowFactory, DynaFlowTaskFactory
+
+
+def _node(
+    dyna_flow_task_id: int,
+    priority_level: int = 0,
+    **kwargs
+) -> DynaFlowTaskNode:
+    """
+    Returns a pending task node of DynaFlow 1.
+    """
+    return DynaFlowTaskNode(
+        dyna_flow_task_id=dyna_flow_task_id,
+        code=uuid.uuid4(),
+        dyna_flow_id=1,
+        priority_level=priority_level,
+        **kwargs)
+
+
+def _ready_ids(scheduler: DynaFlowTaskScheduler) -> list:
+    """
+    Returns the ids of the tasks get_ready_list returns.
+    """
+    code_ids = {
+        node.code: node.dyna_flow_task_id
+        for node in scheduler._nodes.values()
+    }
+    return [code_ids[x.dyna_flow_task_code]
+            for x in scheduler.get_ready_list()]
+
+
+def test_add_node():
+    """
+    Test that a task is ready only without blocking edges,
+    and that adding it again replaces its edges.
+    """
+    scheduler = DynaFlowTaskScheduler()
+
+    scheduler.add_node(_node(1), [])
+    scheduler.add_node(_node(2), [(TASK_EDGE, 1)])
+
+    assert scheduler.pending_count == 2
+    assert _ready_ids(scheduler) == [1]
+    assert scheduler._dependents == {(TASK_EDGE, 1): {2}}
+
+    scheduler.add_node(_node(2), [(DYNA_FLOW_EDGE, 7)])
+
+    assert scheduler.pending_count == 2
+    assert scheduler._dependents == {(DYNA_FLOW_EDGE, 7): {2}}
+
+    scheduler.add_node(_node(2), [])
+
+    assert scheduler._dependents == {}
+    assert _ready_ids(scheduler) == [1, 2]
+
+
+def test_satisfy_edge():
+    """
+    Test that a task is unblocked only when
+    its last blocking edge is satisfied.
+    """
+    scheduler = DynaFlowTaskScheduler()
+    scheduler.add_node(
+        _node(3),
+        [(TASK_EDGE, 1), (DFT_DEPENDENCY_EDGE, 2), (DYNA_FLOW_EDGE, 9)])
+
+    scheduler._satisfy_edge((TASK_EDGE, 1))
+    scheduler._satisfy_edge((DFT_DEPENDENCY_EDGE, 2))
+
+    assert _ready_ids(scheduler) == []
+
+    scheduler._satisfy_edge((DYNA_FLOW_EDGE, 9))
+
+    assert _ready_ids(scheduler) == [3]
+    assert scheduler._dependents == {}
+
+    # an edge nobody waits on is ignored
+    scheduler._satisfy_edge((TASK_EDGE, 42))
+
+    assert _ready_ids(scheduler) == [3]
+
+
+@pytest.mark.parametrize(
+    "is_completed, is_successful, is_canceled, is_ready",
+    [
+        (True, True, False, True),
+        (True, False, False, False),
+        (False, False, True, True),
+        (False, True, False, False),
+    ])
+def test_on_dyna_flow_task_changed_dependency_task(
+    is_completed, is_successful, is_canceled, is_ready
+):
+    """
+    Test that a dependency task unblocks its dependent
+    when it is completed and successful, or canceled.
+    """
+    scheduler = DynaFlowTaskScheduler()
+    scheduler.add_node(_node(1), [])
+    scheduler.add_node(_node(2), [(TASK_EDGE, 1)])
+
+    scheduler.on_dyna_flow_task_changed(
+        1,
+        is_started=True,
+        is_completed=is_completed,
+        is_successful=is_successful,
+        is_canceled=is_canceled)
+
+    assert (2 in _ready_ids(scheduler)) is is_ready
+
+
+@pytest.mark.parametrize(
+    "is_completed, is_successful, is_canceled, is_ready",
+    [
+        (True, True, False, True),
+        (True, False, False, False),
+        (False, False, True, True),
+        (False, True, False, True),
+    ])
+def test_on_dyna_flow_task_changed_dft_dependency(
+    is_completed, is_successful, is_canceled, is_ready
+):
+    """
+    Test that a DFTDependency unblocks its task when the
+    dependency task is successful, or canceled.
+    """
+    scheduler = DynaFlowTaskScheduler()
+    scheduler.add_node(_node(1), [])
+    scheduler.add_node(_node(2), [(DFT_DEPENDENCY_EDGE, 1)])
+
+    scheduler.on_dyna_flow_task_changed(
+        1,
+        is_started=True,
+        is_completed=is_completed,
+        is_successful=is_successful,
+        is_canceled=is_canceled)
+
+    assert (2 in _ready_ids(scheduler)) is is_ready
+
+
+@pytest.mark.parametrize(
+    "is_completed, is_successful, is_canceled, is_ready",
+    [
+        (True, True, False, True),
+        (True, False, False, False),
+        (False, False, True, True),
+        (False, False, False, False),
+    ])
+def test_on_dyna_flow_changed_dependency_dyna_flow(
+    is_completed, is_successful, is_canceled, is_ready
+):
+    """
+    Test that a dependency DynaFlow unblocks the tasks of its
+    dependent DynaFlow when it is completed and successful,
+    or canceled.
+    """
+    scheduler = DynaFlowTaskScheduler()
+    scheduler.add_node(_node(2), [(DYNA_FLOW_EDGE, 5)])
+
+    scheduler.on_dyna_flow_changed(
+        5,
+        is_completed=is_completed,
+        is_successful=is_successful,
+        is_canceled=is_canceled)
+
+    assert (2 in _ready_ids(scheduler)) is is_ready
+
+
+def test_on_dyna_flow_task_changed_state():
+    """
+    Test that a started task is not ready until it is reset,
+    and that a completed or canceled task leaves the graph.
+    """
+    scheduler = DynaFlowTaskScheduler()
+    scheduler.add_node(_node(1), [])
+    scheduler.add_node(_node(2), [])
+
+    scheduler.on_dyna_flow_task_changed(
+        1, is_started=True, is_completed=False,
+        is_successful=False, is_canceled=False)
+
+    assert _ready_ids(scheduler) == [2]
+
+    scheduler.on_dyna_flow_task_changed(
+        1, is_started=False, is_completed=False,
+        is_successful=False, is_canceled=False)
+
+    assert _ready_ids(scheduler) == [1, 2]
+
+    scheduler.on_dyna_flow_task_changed(
+        1, is_started=True, is_completed=True,
+        is_successful=False, is_canceled=False)
+    scheduler.on_dyna_flow_task_changed(
+        2, is_started=False, is_completed=False,
+        is_successful=False, is_canceled=True)
+
+    assert scheduler.pending_count == 0
+    assert _ready_ids(scheduler) == []
+
+
+def test_get_ready_list():
+    """
+    Test that get_ready_list skips the started, debug and not
+    yet startable tasks, and returns the rest by priority level.
+    """
+    now = datetime.now(timezone.utc)
+    scheduler = DynaFlowTaskScheduler()
+
+    scheduler.add_node(_node(1, priority_level=1), [])
+    scheduler.add_node(_node(2, priority_level=5), [])
+    scheduler.add_node(_node(3, priority_level=5), [])
+    scheduler.add_node(_node(4, priority_level=9, is_started=True), [])
+    scheduler.add_node(
+        _node(5, priority_level=9, is_run_task_debug_required=True), [])
+    scheduler.add_node(
+        _node(6, priority_level=9,
+              min_start_utc_date_time=now + timedelta(hours=1)), [])
+    scheduler.add_node(
+        _node(7, priority_level=9,
+              min_start_utc_date_time=(now - timedelta(hours=1))
+              .replace(tzinfo=None)), [])
+    scheduler.add_node(_node(8, priority_level=9), [(TASK_EDGE, 1)])
+
+    ready_list = scheduler.get_ready_list(now=now)
+
+    assert _ready_ids(scheduler) == [7, 2, 3, 1]
+    assert ready_list[0].dyna_flow_priority_level == 9
+    assert len(scheduler.get_ready_list(item_count=2, now=now)) == 2
+
+
+@pytest.mark.asyncio
+async def test_seed_and_refresh_blocking_edges(session: AsyncSession):
+    """
+    Test that seed loads the blocking edges from the database,
+    and that refresh_blocking_edges unblocks a task whose
+    dependency another processor completed.
+    """
+    dyna_flow = await DynaFlowFactory.create_async(session)
+    dyna_flow.dependency_dyna_flow_id = 0
+    dyna_flow.priority_level = 0
+
+    task_list = []
+    for _ in range(2):
+        dyna_flow_task = await DynaFlowTaskFactory.create_async(session)
+        dyna_flow_task.dyna_flow_id = dyna_flow.dyna_flow_id
+        dyna_flow_task.dependency_dyna_flow_task_id = 0
+        dyna_flow_task.is_started = False
+        dyna_flow_task.is_completed = False
+        dyna_flow_task.is_successful = False
+        dyna_flow_task.is_canceled = False
+        dyna_flow_task.is_run_task_debug_required = False
+        dyna_flow_task.min_start_utc_date_time = \
+            datetime.now(timezone.utc) - timedelta(hours=1)
+        task_list.append(dyna_flow_task)
+    dependency_task, dependent_task = task_list
+    dependent_task.dependency_dyna_flow_task_id = \
+        dependency_task.dyna_flow_task_id
+    await session.flush()
+
+    session_context = SessionContext({}, session)
+    scheduler = DynaFlowTaskScheduler()
+
+    await scheduler.seed(session_context, dyna_flow.pac_id)
+
+    assert scheduler.pending_count == 2
+    assert [x.dyna_flow_task_code for x in scheduler.get_ready_list()] == [
+        dependency_task.code]
+
+    # completed by another processor
+    dependency_task.is_completed = True
+    dependency_task.is_successful = True
+    await session.flush()
+
+    await scheduler.refresh_blocking_edges(session_context)
+
+    assert dependent_task.code in [
+        x.dyna_flow_task_code for x in scheduler.get_ready_list()]
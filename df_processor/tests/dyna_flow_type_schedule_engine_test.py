@@ -0,0 +1,220 @@
+# df_processor/tests/dyna_flow_type_schedule_engine_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access
+"""
+This module contains unit tests for the
+`DynaFlowTypeScheduleEngine` class and the fire time
+functions of its module.
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+import pytest
+from df_processor.dyna_flow_type_schedule_engine import (
+    CATCH_UP_ALL, CATCH_UP_ONCE, CATCH_UP_SKIP, DynaFlowTypeScheduleEngine,
+    get_fire_utc_date_time_list, get_next_fire_utc_date_time)
+from helpers.session_context import SessionContext
+from models import DynaFlow
+from models.factory import DynaFlowTypeScheduleFactory
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _schedule(
+    next_utc_date_time,
+    last_utc_date_time=NOW - timedelta(days=1),
+    frequency_in_hours: int = 1,
+    cron_expression: str = ""
+) -> SimpleNamespace:
+    """
+    Returns a schedule with the fields the
+    fire time functions read.
+    """
+    return SimpleNamespace(
+        cron_expression=cron_expression,
+        frequency_in_hours=frequency_in_hours,
+        next_utc_date_time=next_utc_date_time,
+        last_utc_date_time=last_utc_date_time)
+
+
+def test_get_next_fire_utc_date_time_frequency():
+    """
+    Test that a frequency schedule fires on the grid of
+    its anchor, so a late run does not shift the next ones.
+    """
+    anchor = NOW - timedelta(hours=3, minutes=10)
+
+    assert get_next_fire_utc_date_time("", 1, anchor, NOW) == \
+        anchor + timedelta(hours=4)
+    assert get_next_fire_utc_date_time(
+        "", 1, NOW + timedelta(hours=2), NOW) == NOW + timedelta(hours=2)
+    assert get_next_fire_utc_date_time("", 0, anchor, NOW) is None
+    assert get_next_fire_utc_date_time("", None, anchor, NOW) is None
+
+
+def test_get_next_fire_utc_date_time_cron():
+    """
+    Test that a cron expression wins over the frequency,
+    and that an invalid one gives no fire time.
+    """
+    assert get_next_fire_utc_date_time(
+        "30 * * * *", 5, NOW, NOW) == NOW + timedelta(minutes=30)
+    assert get_next_fire_utc_date_time(
+        "not a cron", 5, NOW, NOW) is None
+
+
+def test_get_fire_utc_date_time_list_once():
+    """
+    Test that the once policy requests one DynaFlow
+    for all the missed runs.
+    """
+    due = NOW - timedelta(hours=3, minutes=10)
+
+    fire_list, next_utc_date_time = get_fire_utc_date_time_list(
+        _schedule(due), NOW, CATCH_UP_ONCE)
+
+    assert fire_list == [due]
+    assert next_utc_date_time == due + timedelta(hours=4)
+
+
+def test_get_fire_utc_date_time_list_all():
+    """
+    Test that the all policy requests one DynaFlow per
+    missed run, up to the max catch up count.
+    """
+    due = NOW - timedelta(hours=3, minutes=10)
+
+    fire_list, next_utc_date_time = get_fire_utc_date_time_list(
+        _schedule(due), NOW, CATCH_UP_ALL, max_catch_up_count=10)
+
+    assert fire_list == [due + timedelta(hours=x) for x in range(4)]
+    assert next_utc_date_time == due + timedelta(hours=4)
+
+    fire_list, _ = get_fire_utc_date_time_list(
+        _schedule(due), NOW, CATCH_UP_ALL, max_catch_up_count=2)
+
+    assert fire_list == [due, due + timedelta(hours=1)]
+
+
+@pytest.mark.parametrize(
+    "late_seconds, is_fired",
+    [
+        (60, True),
+        (300, True),
+        (301, False),
+        (3 * 3600, False),
+    ])
+def test_get_fire_utc_date_time_list_skip(late_seconds, is_fired):
+    """
+    Test that the skip policy requests a run only within
+    the misfire grace, and reschedules it either way.
+    """
+    due = NOW - timedelta(seconds=late_seconds)
+
+    fire_list, next_utc_date_time = get_fire_utc_date_time_list(
+        _schedule(due), NOW, CATCH_UP_SKIP, misfire_grace_seconds=300)
+
+    assert fire_list == ([due] if is_fired else [])
+    assert next_utc_date_time > NOW
+
+
+@pytest.mark.parametrize("catch_up_policy", [
+    CATCH_UP_ONCE, CATCH_UP_ALL, CATCH_UP_SKIP])
+def test_get_fire_utc_date_time_list_never_run(catch_up_policy):
+    """
+    Test that a schedule that never ran fires once, now,
+    whatever the catch up policy.
+    """
+    for schedule in [
+            _schedule(NOW - timedelta(days=3), last_utc_date_time=None),
+            _schedule(None)]:
+        fire_list, next_utc_date_time = get_fire_utc_date_time_list(
+            schedule, NOW, catch_up_policy)
+
+        assert fire_list == [NOW]
+        assert next_utc_date_time > NOW
+
+
+def test_get_fire_utc_date_time_list_invalid():
+    """
+    Test that a schedule with an invalid cron expression
+    or no frequency neither fires nor gets a next time.
+    """
+    due = NOW - timedelta(hours=1)
+
+    assert get_fire_utc_date_time_list(
+        _schedule(due, cron_expression="every day"), NOW) == ([], None)
+    assert get_fire_utc_date_time_list(
+        _schedule(due, frequency_in_hours=0), NOW) == ([], None)
+
+
+def test_get_fire_utc_date_time_list_naive_date_times():
+    """
+    Test that the naive UTC datetimes of the
+    database are read as UTC.
+    """
+    due = NOW - timedelta(minutes=10)
+
+    fire_list, _ = get_fire_utc_date_time_list(
+        _schedule(due.replace(tzinfo=None),
+                  last_utc_date_time=NOW.replace(tzinfo=None)),
+        NOW)
+
+    assert fire_list == [due]
+
+
+def test_unknown_catch_up_policy():
+    """
+    Test that an unknown catch up policy is rejected.
+    """
+    with pytest.raises(ValueError):
+        DynaFlowTypeScheduleEngine(catch_up_policy="twice")
+
+
+@pytest.mark.asyncio
+async def test_fire_due_schedules(session: AsyncSession):
+    """
+    Test that a due schedule requests its DynaFlow once,
+    is rescheduled after now, and is not due again.
+    """
+    now = datetime.now(timezone.utc)
+    due = now - timedelta(minutes=10)
+
+    dyna_flow_type_schedule = \
+        await DynaFlowTypeScheduleFactory.create_async(session)
+    dyna_flow_type_schedule.is_active = True
+    dyna_flow_type_schedule.cron_expression = ""
+    dyna_flow_type_schedule.frequency_in_hours = 1
+    dyna_flow_type_schedule.last_utc_date_time = now - timedelta(hours=1)
+    dyna_flow_type_schedule.next_utc_date_time = due
+    await session.flush()
+
+    session_context = SessionContext({}, session)
+    engine = DynaFlowTypeScheduleEngine(catch_up_policy=CATCH_UP_ONCE)
+
+    assert await engine.fire_due_schedules(session_context, now) == 1
+
+    result = await session.execute(
+        select(DynaFlow).where(
+            DynaFlow._subject_code == dyna_flow_type_schedule.code))
+    dyna_flow_list = result.scalars().all()
+
+    assert len(dyna_flow_list) == 1
+    assert dyna_flow_list[0].dyna_flow_type_id == \
+        dyna_flow_type_schedule.dyna_flow_type_id
+    assert dyna_flow_list[0].param_1 == due.isoformat()
+    assert dyna_flow_list[0].root_dyna_flow_id == \
+        dyna_flow_list[0].dyna_flow_id
+
+    await session.refresh(dyna_flow_type_schedule)
+
+    next_utc_date_time = dyna_flow_type_schedule.next_utc_date_time
+    if next_utc_date_time.tzinfo is None:
+        next_utc_date_time = next_utc_date_time.replace(tzinfo=timezone.utc)
+    assert next_utc_date_time == due + timedelta(hours=1)
+    assert engine.get_next_fire_utc_date_time() == next_utc_date_time
+
+    assert await engine.fire_due_schedules(session_context, now) == 0
+    assert await engine.tick(session_context, now) == 0
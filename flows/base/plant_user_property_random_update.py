@@ -76,7 +76,7 @@ class BaseFlowPlantUserPropertyRandomUpdate(BaseFlow):  # pylint: disable=too-fe
         role_required = "User"
 
         if len(role_required) > 0:
-            if role_required not in self._session_context.role_name_csv:
+            if self._session_context.has_role(role_required) is not True:
                 self._add_validation_error(
                     f"Unauthorized access. {role_required} role not found."
                 )
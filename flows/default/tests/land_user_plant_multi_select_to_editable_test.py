@@ -24,6 +24,8 @@ from helpers.session_context import SessionContext
 from helpers.type_conversion import TypeConversion  # noqa: F401
 from models.factory.land import (
     LandFactory)
+from models.factory.plant import (
+    PlantFactory)
 
 
 class TestLandUserPlantMultiSelectToEditablePostModelResponse:
@@ -104,3 +106,47 @@ class TestLandUserPlantMultiSelectToEditablePostModelResponse:
                 )
 
         session_context.role_name_csv = role_required
+
+    @pytest.mark.asyncio
+    async def test_flow_process_plant_code_list(self, session):
+        """
+        Test that the `process` method of the
+        `FlowLandUserPlantMultiSelectToEditable` class
+        updates every plant in the code list.
+        """
+
+        session_context = SessionContext({}, session)
+        session_context.role_name_csv = "User"
+        flow = FlowLandUserPlantMultiSelectToEditable(
+            session_context)
+
+        land = await \
+            LandFactory.create_async(
+                session)
+
+        land_bus_obj = LandBusObj(session_context)
+        land_bus_obj.load_from_obj_instance(land)
+
+        plants = []
+        for _ in range(3):
+            plant = await PlantFactory.create_async(
+                session=session)
+            plant.land_id = land.land_id
+            plant.is_edit_allowed = False
+            plants.append(plant)
+        await session.flush()
+
+        plant_code_list_csv = ",".join(
+            str(plant.code) for plant in plants[:2])
+
+        await flow.process(
+            land_bus_obj,
+            plant_code_list_csv,
+# endset  # noqa: E122
+        )
+
+        for plant in plants:
+            await session.refresh(plant)
+        assert plants[0].is_edit_allowed is True
+        assert plants[1].is_edit_allowed is True
+        assert plants[2].is_edit_allowed is False
@@ -3,11 +3,25 @@
 This module contains the FlowFactory class, which
 is responsible for dynamically creating instances
 of flow classes based on the provided class name.
+
+The process method of each created flow is timed into the
+`flow_process_seconds` histogram, labelled with the flow class
+name and whether the process raised an error.
 """
 
+import functools
 import importlib
+import inspect
+import time
+
 from helpers.formatting import pascal_to_snake_case
 from helpers.session_context import SessionContext
+from services.metrics import metrics_registry
+
+FLOW_PROCESS_SECONDS = metrics_registry.histogram(
+    "flow_process_seconds",
+    "Time to run the process method of a flow.",
+    ["flow", "outcome"])
 
 
 class FlowFactory:  # pylint: disable=too-few-public-methods
@@ -48,7 +62,41 @@ class FlowFactory:  # pylint: disable=too-few-public-methods
             # Dynamically get the class from the module
             class_ = getattr(module, working_class_name)
             # Create an instance of the class
-            return class_(session_context)
+            instance = class_(session_context)
         except (ModuleNotFoundError, AttributeError) as e:
             raise ValueError(
                 f"Flow Class {class_name} not found: {e}")
+
+        FlowFactory.add_process_timer(instance, working_class_name)
+        return instance
+
+    @staticmethod
+    def add_process_timer(instance, flow_name: str):
+        """
+        Time the async process method of a flow instance.
+
+        Args:
+            instance (object): The flow instance.
+            flow_name (str): The flow label of the timings.
+        """
+        process = getattr(instance, "process", None)
+
+        if process is None or not inspect.iscoroutinefunction(process):
+            return
+
+        @functools.wraps(process)
+        async def timed_process(*args, **kwargs):
+            outcome = "successful"
+            start = time.monotonic()
+            try:
+                return await process(*args, **kwargs)
+            except Exception:
+                outcome = "failed"
+                raise
+            finally:
+                FLOW_PROCESS_SECONDS.observe(
+                    time.monotonic() - start,
+                    flow=flow_name,
+                    outcome=outcome)
+
+        instance.process = timed_process
@@ -10,12 +10,14 @@ that handle the addition of a
 land in the flow process.
 """
 
+import csv
 import json
 import uuid  # noqa: F401
 from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
 
 from business.land import LandBusObj
+from business.plant import PlantBusObj
 from flows.base import LogSeverity
 from flows.base.land_user_plant_multi_select_to_not_editable import \
     BaseFlowLandUserPlantMultiSelectToNotEditable
@@ -101,12 +103,16 @@ class FlowLandUserPlantMultiSelectToNotEditable(
 
         code_list = self._parse_csv_string_to_guids(plant_code_list_csv)
 
-        for code in code_list:
-            plant_bus_obj = PlantBusObj(land_bus_obj.get_session_context())
-            await plant_bus_obj.load_from_code(code)
+        plant_bus_obj_list = await PlantBusObj.load_from_code_list(
+            land_bus_obj.get_session_context(),
+            [uuid.UUID(code) for code in code_list])
+
+        for plant_bus_obj in plant_bus_obj_list:
             plant_bus_obj.is_edit_allowed = False
-            await plant_bus_obj.save()
 
+        await PlantBusObj.save_bulk(
+            land_bus_obj.get_session_context(),
+            plant_bus_obj_list)
 
         super()._log_message_and_severity(
             LogSeverity.INFORMATION_HIGH_DETAIL,
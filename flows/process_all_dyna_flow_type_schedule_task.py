@@ -16,6 +16,8 @@ from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
 
 from business.dyna_flow_task import DynaFlowTaskBusObj
+from df_processor.dyna_flow_type_schedule_engine import \
+    DynaFlowTypeScheduleEngine
 from flows.base import LogSeverity
 from flows.base.process_all_dyna_flow_type_schedule_task import \
     BaseFlowProcessAllDynaFlowTypeScheduleTask
@@ -99,8 +101,14 @@ class FlowProcessAllDynaFlowTypeScheduleTask(
         )
         super()._throw_queued_validation_errors()
 
-        # TODO: add flow logic
+        schedule_engine = DynaFlowTypeScheduleEngine()
 
+        dyna_flow_count = await schedule_engine.fire_due_schedules(
+            self._session_context)
+
+        super()._log_message_and_severity(
+            LogSeverity.INFORMATION_HIGH_DETAIL,
+            f"Scheduled DynaFlows requested: {dyna_flow_count}")
 
         super()._log_message_and_severity(
             LogSeverity.INFORMATION_HIGH_DETAIL,
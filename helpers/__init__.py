@@ -6,5 +6,10 @@ This module contains helper functions and classes for the application.
 
 from .session_context import SessionContext  # noqa: F401
 from .api_token import ApiToken, api_key_header, get_api_key  # noqa: F401
+from .api_token import get_auth_principal  # noqa: F401
+from .auth_principal import AuthPrincipal, VerifiedTokenCache  # noqa: F401
 from .type_conversion import TypeConversion, UUIDField  # noqa: F401
 from .formatting import snake_to_camel  # noqa: F401
+from .keyset_cursor import KeysetCursor  # noqa: F401
+from .lookup_cache import LookupCache  # noqa: F401
+from .response_cache import ResponseCache, ResponseCacheEntry  # noqa: F401
@@ -6,10 +6,12 @@ This module contains functions and classes related to API token handling.
 
 from datetime import datetime, timezone, timedelta
 import logging
+from typing import Optional
 import jwt
 from fastapi.security import APIKeyHeader
 from fastapi import Depends
 from config import API_KEY_SECRET
+from .auth_principal import AuthPrincipal, VerifiedTokenCache
 
 api_key_header = APIKeyHeader(name='API_KEY', auto_error=False)
 
@@ -30,6 +32,22 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
     return api_key
 
 
+async def get_auth_principal(
+    api_key: str = Depends(api_key_header)
+) -> Optional[AuthPrincipal]:
+    """
+    Get the principal of the API key in the request header.
+
+    Args:
+        api_key (str): The API key extracted from the request header.
+
+    Returns:
+        AuthPrincipal: The principal of the API key, or None
+            if the API key is missing, expired or invalid.
+    """
+    return ApiToken.get_auth_principal(api_key)
+
+
 class ApiToken:
     """
     This class provides methods for creating and validating API tokens.
@@ -94,3 +112,38 @@ class ApiToken:
         except jwt.InvalidTokenError:
             logging.info("Auth token invalid")
             return {}  # The token is invalid
+
+    @staticmethod
+    def get_auth_principal(token: str) -> Optional[AuthPrincipal]:
+        """
+        Validate the given authentication token, using the
+        VerifiedTokenCache so a token is only decoded once
+        until it expires.
+
+        Args:
+            token (str): The authentication token to be validated.
+
+        Returns:
+            AuthPrincipal: The principal of the token if it is valid,
+            otherwise None.
+        """
+        if token:
+            principal = VerifiedTokenCache.get(token)
+            if principal is not None:
+                return principal
+
+        principal = ApiToken._principal_or_none(
+            ApiToken.validate_token(token))
+        if principal is not None:
+            VerifiedTokenCache.set(token, principal)
+        return principal
+
+    @staticmethod
+    def _principal_or_none(payload: dict) -> Optional[AuthPrincipal]:
+        """
+        Returns the principal of a token payload,
+        or None if the payload is empty.
+        """
+        if payload is None or len(payload) == 0:
+            return None
+        return AuthPrincipal(payload)
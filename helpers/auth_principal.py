@@ -0,0 +1,218 @@
+# helpers/auth_principal.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the AuthPrincipal class, the parsed claims of
+a verified API key, and the VerifiedTokenCache class which keeps the
+principals of verified API keys so that a key is only decoded once
+until it expires.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterator, Optional
+
+from config import AUTH_TOKEN_CACHE_MAX_SIZE, AUTH_TOKEN_CACHE_TTL_SECONDS
+
+
+def parse_role_name_csv(role_name_csv: str) -> FrozenSet[str]:
+    """
+    Returns the role names of a comma-separated string
+    of role names.
+    """
+    if not role_name_csv:
+        return frozenset()
+    return frozenset(
+        role_name.strip()
+        for role_name in str(role_name_csv).split(",")
+        if role_name.strip()
+    )
+
+
+class AuthPrincipal(Mapping):
+    """
+    The AuthPrincipal class holds the claims of a verified API key
+    and the values parsed from them. It can not be changed once it
+    is built, so one instance is shared by every request that sends
+    the same API key.
+
+    It is a read-only mapping of the claims, so it can be passed
+    where the claims dict of ApiToken.validate_token is expected.
+
+    Attributes:
+        customer_code (uuid.UUID): The CustomerCode claim.
+        tac_code (uuid.UUID): The TacCode claim.
+        pac_code (uuid.UUID): The PacCode claim.
+        user_name (str): The UserName claim.
+        role_name_csv (str): The role_name_csv claim.
+        role_name_set (FrozenSet[str]): The role names of role_name_csv.
+        code_dict (Mapping[str, uuid.UUID]): The claims whose name ends
+            with Code, parsed to UUIDs.
+        expires_at (Optional[float]): The exp claim as a Unix time.
+    """
+
+    __slots__ = (
+        "_claims",
+        "customer_code",
+        "tac_code",
+        "pac_code",
+        "user_name",
+        "role_name_csv",
+        "role_name_set",
+        "code_dict",
+        "expires_at",
+    )
+
+    def __init__(self, claims: Dict[str, Any]) -> None:
+        """
+        Initializes a new instance of the AuthPrincipal class.
+
+        Args:
+            claims (dict): The claims of the verified API key.
+        """
+        code_dict: Dict[str, uuid.UUID] = {}
+        for name, value in claims.items():
+            if not name.endswith("Code"):
+                continue
+            try:
+                code_dict[name] = uuid.UUID(str(value))
+            except ValueError:
+                continue
+
+        expires_at = claims.get("exp", None)
+        role_name_csv = claims.get("role_name_csv", "") or ""
+
+        set_slot = object.__setattr__
+        set_slot(self, "_claims", MappingProxyType(dict(claims)))
+        set_slot(self, "code_dict", MappingProxyType(code_dict))
+        set_slot(self, "customer_code",
+                 code_dict.get("CustomerCode", uuid.UUID(int=0)))
+        set_slot(self, "tac_code",
+                 code_dict.get("TacCode", uuid.UUID(int=0)))
+        set_slot(self, "pac_code",
+                 code_dict.get("PacCode", uuid.UUID(int=0)))
+        set_slot(self, "user_name", claims.get("UserName", "") or "")
+        set_slot(self, "role_name_csv", role_name_csv)
+        set_slot(self, "role_name_set",
+                 parse_role_name_csv(role_name_csv))
+        set_slot(self, "expires_at",
+                 float(expires_at) if expires_at is not None else None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("AuthPrincipal can not be changed")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("AuthPrincipal can not be changed")
+
+    def __getitem__(self, key: str) -> Any:
+        return self._claims[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._claims)
+
+    def __len__(self) -> int:
+        return len(self._claims)
+
+    def __repr__(self) -> str:
+        return (f"AuthPrincipal(user_name={self.user_name!r}, "
+                f"role_name_csv={self.role_name_csv!r})")
+
+    def has_role(self, role_name: str) -> bool:
+        """
+        Returns True if the API key has the role.
+        """
+        return role_name in self.role_name_set
+
+
+class VerifiedTokenCache:
+    """
+    The VerifiedTokenCache class keeps the principals of verified
+    API keys, keyed by the SHA-256 hash of the key, so the keys
+    themselves are not kept in memory.
+
+    An entry expires at the exp claim of its key or after
+    ttl_seconds, whichever is first. When max_size entries are
+    kept, the least recently used entry is dropped.
+
+    Attributes:
+        ttl_seconds (float): How long an entry is kept.
+            0 disables the cache.
+        max_size (int): The number of entries kept.
+    """
+
+    ttl_seconds: float = AUTH_TOKEN_CACHE_TTL_SECONDS
+    max_size: int = AUTH_TOKEN_CACHE_MAX_SIZE
+
+    # token hash -> (expires at, principal)
+    _entries: "OrderedDict[bytes, tuple]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(token: str) -> bytes:
+        """
+        Returns the cache key of an API key.
+        """
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    @classmethod
+    def get(cls, token: str) -> Optional[AuthPrincipal]:
+        """
+        Returns the cached principal of the API key.
+
+        Args:
+            token (str): The API key.
+
+        Returns:
+            The principal, or None if it is not cached or expired.
+        """
+        if cls.ttl_seconds <= 0:
+            return None
+
+        key = cls._get_key(token)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, principal = entry
+            if expires_at <= time.time():
+                del cls._entries[key]
+                return None
+
+            cls._entries.move_to_end(key)
+            return principal
+
+    @classmethod
+    def set(cls, token: str, principal: AuthPrincipal) -> None:
+        """
+        Stores the principal of a verified API key.
+
+        Args:
+            token (str): The API key.
+            principal (AuthPrincipal): The principal of the key.
+        """
+        if cls.ttl_seconds <= 0 or cls.max_size <= 0:
+            return
+
+        expires_at = time.time() + cls.ttl_seconds
+        if principal.expires_at is not None:
+            expires_at = min(expires_at, principal.expires_at)
+
+        key = cls._get_key(token)
+        with cls._lock:
+            cls._entries[key] = (expires_at, principal)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.max_size:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Removes every cached principal.
+        """
+        with cls._lock:
+            cls._entries.clear()
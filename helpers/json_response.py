@@ -0,0 +1,40 @@
+# helpers/json_response.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the JSONBytesResponse class and the
+dump_model_json function, which let an endpoint serialize its
+response model once with orjson and return the bytes as they are.
+
+FastAPI does not validate or serialize a returned Response again,
+so the bytes that are logged are the bytes that are sent.
+"""
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+class JSONBytesResponse(Response):
+    """
+    A JSON response whose content is
+    already serialized to bytes.
+    """
+
+    media_type = "application/json"
+
+
+def dump_model_json(model: BaseModel) -> bytes:
+    """
+    Serializes a response model to JSON bytes.
+
+    The model is dumped in JSON mode by alias, as FastAPI
+    does for a response_model, so the JSON is the same as
+    when FastAPI serializes the returned model.
+
+    Args:
+        model (BaseModel): The response model.
+
+    Returns:
+        bytes: The JSON of the model.
+    """
+    return orjson.dumps(model.model_dump(mode="json", by_alias=True))
@@ -0,0 +1,145 @@
+# helpers/keyset_cursor.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the KeysetCursor class which is used to
+encode and decode the opaque paging tokens of keyset (seek)
+paginated reports.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+
+
+class KeysetCursor:
+    """
+    The KeysetCursor class represents the position of the last row
+    returned by a keyset paginated report.
+
+    Attributes:
+        order_by_column_name (str): The column name the report is
+            ordered by.
+        order_by_descending (bool): Indicates whether the report is
+            ordered in descending order.
+        sort_value: The value of the sort column in the last row.
+        row_id (int): The id of the last row, used as the tie breaker.
+    """
+
+    order_by_column_name: str = ""
+    order_by_descending: bool = False
+    sort_value = None
+    row_id: int = 0
+
+    def __init__(
+        self,
+        order_by_column_name: str = "",
+        order_by_descending: bool = False,
+        sort_value=None,
+        row_id: int = 0
+    ) -> None:
+        """
+        Initializes a new instance of the KeysetCursor class.
+        """
+        self.order_by_column_name = order_by_column_name
+        self.order_by_descending = order_by_descending
+        self.sort_value = sort_value
+        self.row_id = row_id
+
+    def encode(self) -> str:
+        """
+        Encodes the cursor into a url safe token.
+
+        Returns:
+            str: The encoded token.
+        """
+        value_type, value = KeysetCursor._serialize_value(self.sort_value)
+        data = {
+            "c": self.order_by_column_name,
+            "d": self.order_by_descending,
+            "t": value_type,
+            "v": value,
+            "i": self.row_id,
+        }
+        json_str = json.dumps(data, separators=(',', ':'))
+        return base64.urlsafe_b64encode(
+            json_str.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def decode(token: str) -> "KeysetCursor":
+        """
+        Decodes a token created by the encode method.
+
+        Args:
+            token (str): The encoded token.
+
+        Returns:
+            KeysetCursor: The decoded cursor.
+
+        Raises:
+            ValueError: If the token is not a valid cursor.
+        """
+        try:
+            json_str = base64.urlsafe_b64decode(
+                token.encode('ascii')).decode('utf-8')
+            data = json.loads(json_str)
+            return KeysetCursor(
+                order_by_column_name=str(data["c"]),
+                order_by_descending=bool(data["d"]),
+                sort_value=KeysetCursor._deserialize_value(
+                    data["t"], data["v"]),
+                row_id=int(data["i"]),
+            )
+        except (binascii.Error, UnicodeError, KeyError,
+                TypeError, ValueError) as e:
+            raise ValueError("Invalid cursor") from e
+
+    @staticmethod
+    def _serialize_value(value):
+        """
+        Converts a sort value into a json compatible type tag and value.
+        """
+        if value is None:
+            return "none", None
+        if isinstance(value, bool):
+            return "bool", value
+        if isinstance(value, int):
+            return "int", value
+        if isinstance(value, float):
+            return "float", value
+        if isinstance(value, Decimal):
+            return "decimal", str(value)
+        if isinstance(value, datetime):
+            return "datetime", value.isoformat()
+        if isinstance(value, date):
+            return "date", value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return "uuid", str(value)
+        return "str", str(value)
+
+    @staticmethod
+    def _deserialize_value(value_type: str, value):
+        """
+        Converts a type tag and json value back into a sort value.
+        """
+        if value_type == "none":
+            return None
+        if value_type == "bool":
+            return bool(value)
+        if value_type == "int":
+            return int(value)
+        if value_type == "float":
+            return float(value)
+        if value_type == "decimal":
+            return Decimal(value)
+        if value_type == "datetime":
+            return datetime.fromisoformat(value)
+        if value_type == "date":
+            return date.fromisoformat(value)
+        if value_type == "uuid":
+            return uuid.UUID(value)
+        if value_type == "str":
+            return str(value)
+        raise ValueError(f"Unknown cursor value type: {value_type}")
@@ -0,0 +1,251 @@
+# helpers/lookup_cache.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the LookupCache class which is used to
+cache the rows of the lookup tables (Pac, TriStateFilter, Role,
+etc.) across sessions, so that the managers' from_enum methods
+do not query the database on every call.
+"""
+
+import time
+import weakref
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config import LOOKUP_CACHE_TTL_SECONDS
+
+
+class LookupCache:
+    """
+    The LookupCache class holds detached snapshots of lookup
+    rows keyed by the database url, the model class and the
+    lookup enum name. Engines of the same database, such as the
+    DynaFlow engine and the read-only engine of GET requests,
+    share the entries. In-memory SQLite databases are private
+    to their engine, so their entries are keyed by the engine.
+
+    The snapshots are never handed out directly. Each get call
+    merges the snapshot into the caller's session without a
+    query, so the cached object is never modified or attached
+    to a session.
+
+    Attributes:
+        ttl_seconds (float): How long an entry is kept.
+            0 disables the cache.
+    """
+
+    ttl_seconds: float = LOOKUP_CACHE_TTL_SECONDS
+
+    # database url -> {(model class, lookup enum name):
+    #     (expires at, snapshot, code peek values)}
+    _entries: Dict[str, dict] = {}
+
+    # in-memory SQLite engine -> entries
+    _memory_entries: weakref.WeakKeyDictionary = \
+        weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _get_engine_entries(
+        cls,
+        session: AsyncSession,
+        is_created: bool = False
+    ) -> Optional[dict]:
+        """
+        Returns the entries of the database the session is
+        bound to, so that entries of different databases are
+        kept apart.
+
+        Args:
+            session (AsyncSession): The session.
+            is_created (bool): Create the entries if missing.
+        """
+        engine = session.get_bind().engine
+        url = engine.url
+        if url.get_backend_name() == "sqlite" and \
+                url.database in (None, "", ":memory:"):
+            entries, key = cls._memory_entries, engine
+        else:
+            entries = cls._entries
+            key = url.render_as_string(hide_password=True)
+        if is_created:
+            return entries.setdefault(key, {})
+        return entries.get(key)
+
+    @classmethod
+    async def get(
+        cls,
+        session: AsyncSession,
+        model_class: type,
+        lookup_enum_name: str
+    ) -> Optional[Any]:
+        """
+        Returns the cached row for the lookup enum name,
+        merged into the given session.
+
+        Args:
+            session (AsyncSession): The caller's session.
+            model_class (type): The lookup model class.
+            lookup_enum_name (str): The lookup enum name.
+
+        Returns:
+            The row, or None if it is not cached or expired.
+        """
+        if cls.ttl_seconds <= 0:
+            return None
+
+        engine_entries = cls._get_engine_entries(session)
+        if engine_entries is None:
+            return None
+
+        key = (model_class, lookup_enum_name)
+        entry = engine_entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, snapshot, peek_values = entry
+        if expires_at < time.monotonic():
+            engine_entries.pop(key, None)
+            return None
+
+        obj = await session.merge(snapshot, load=False)
+        for name, value in peek_values.items():
+            setattr(obj, name, value)
+
+        return obj
+
+    @classmethod
+    def set(
+        cls,
+        session: AsyncSession,
+        obj: Any
+    ) -> None:
+        """
+        Stores a detached snapshot of the given lookup row.
+
+        Args:
+            session (AsyncSession): The session the row
+                was loaded with.
+            obj: The lookup row.
+        """
+        if cls.ttl_seconds <= 0 or obj is None:
+            return
+
+        model_class = type(obj)
+        snapshot = model_class()
+        for column_attr in inspect(model_class).column_attrs:
+            setattr(snapshot, column_attr.key,
+                    getattr(obj, column_attr.key))
+        make_transient_to_detached(snapshot)
+
+        peek_values = {
+            name: value for name, value in vars(obj).items()
+            if name.endswith("_code_peek")
+        }
+
+        engine_entries = cls._get_engine_entries(
+            session, is_created=True)
+        engine_entries[(model_class, obj.lookup_enum_name)] = (
+            time.monotonic() + cls.ttl_seconds,
+            snapshot,
+            peek_values,
+        )
+
+    @classmethod
+    def invalidate(
+        cls,
+        model_class: Optional[type] = None
+    ) -> None:
+        """
+        Removes the cached rows of a lookup model,
+        or of every lookup model if none is given.
+
+        Args:
+            model_class (type): The lookup model class.
+        """
+        for engine_entries in [*cls._entries.values(),
+                               *cls._memory_entries.values()]:
+            if model_class is None:
+                engine_entries.clear()
+                continue
+            for key in [key for key in engine_entries
+                        if key[0] is model_class]:
+                engine_entries.pop(key, None)
+
+
+def _record_write(session, model_class: type) -> None:
+    """
+    Records a write to a lookup model class in the
+    current transaction of the session.
+    """
+    if hasattr(model_class, "lookup_enum_name"):
+        session.info.setdefault(
+            "lookup_cache_written", set()).add(model_class)
+
+
+@event.listens_for(Session, 'after_flush')
+def record_flushed_lookup_rows(
+    session,
+    flush_context
+):  # pylint: disable=unused-argument
+    """
+    Records the lookup model classes of the rows
+    added, changed or deleted by a flush.
+
+    :param session: The SQLAlchemy session.
+    :param flush_context: The flush context.
+    """
+    for obj in [*session.new, *session.dirty, *session.deleted]:
+        _record_write(session, type(obj))
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def record_executed_lookup_writes(orm_execute_state) -> None:
+    """
+    Records the lookup model classes written by an
+    INSERT, UPDATE or DELETE statement, such as the bulk
+    statements of the managers and the lookup seeding.
+
+    :param orm_execute_state: The statement execution state.
+    """
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or (
+            orm_execute_state.is_delete)):
+        return
+    for mapper in orm_execute_state.all_mappers:
+        _record_write(orm_execute_state.session, mapper.class_)
+
+
+@event.listens_for(Session, 'after_commit')
+def clear_written_lookup_rows(session) -> None:
+    """
+    Forgets the lookup model classes written in the
+    committed transaction.
+
+    :param session: The SQLAlchemy session.
+    """
+    session.info.pop("lookup_cache_written", None)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def invalidate_on_rollback(
+    session,
+    previous_transaction
+):  # pylint: disable=unused-argument
+    """
+    Removes the cached rows of the lookup models written in
+    the rolled back transaction, because they may have been
+    cached from its uncommitted rows. A rollback without
+    lookup writes leaves the cache as is.
+
+    :param session: The SQLAlchemy session.
+    :param previous_transaction: The rolled back transaction.
+    """
+    model_classes = session.info.get("lookup_cache_written")
+    if not model_classes:
+        return
+    for model_class in model_classes:
+        LookupCache.invalidate(model_class)
+    if previous_transaction.parent is None:
+        session.info.pop("lookup_cache_written", None)
@@ -0,0 +1,62 @@
+# helpers/lookup_seed.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the insert_lookup_items function which is
+used by the lookup managers' initialize methods to seed the
+missing rows of a lookup table with one INSERT statement.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, List
+
+from sqlalchemy import insert, inspect
+
+from helpers.lookup_cache import LookupCache
+from helpers.session_context import SessionContext
+
+
+async def insert_lookup_items(
+    session_context: SessionContext,
+    item_list: List[Any]
+) -> int:
+    """
+    Inserts new lookup items of one model with one INSERT
+    statement, run as an executemany.
+
+    The flush of a session inserts items with an autoincrement
+    ID one at a time on SQLite, to read back each ID. The items
+    are not added to the session, so they get the values the
+    ORM insert would set: the insert and last update user and
+    time and the first last_change_code.
+
+    Args:
+        session_context (SessionContext): The session context object.
+        item_list (List[Any]): The new items, of one model.
+
+    Returns:
+        int: The number of inserted rows.
+    """
+    if len(item_list) == 0:
+        return 0
+
+    model_class = type(item_list[0])
+    mapper = inspect(model_class)
+    now_utc_date_time = datetime.now(timezone.utc)
+
+    row_list = []
+    for item in item_list:
+        item.insert_user_id = session_context.customer_code
+        item.last_update_user_id = session_context.customer_code
+        item.insert_utc_date_time = now_utc_date_time
+        item.last_update_utc_date_time = now_utc_date_time
+        item.last_change_code = 1
+        row_list.append({
+            prop.key: getattr(item, prop.key)
+            for prop in mapper.column_attrs
+            if not any(column.primary_key for column in prop.columns)
+        })
+
+    await session_context.session.execute(insert(model_class), row_list)
+    LookupCache.invalidate(model_class)
+
+    return len(row_list)
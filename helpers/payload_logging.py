@@ -0,0 +1,33 @@
+# helpers/payload_logging.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module decides when the payloads of the API responses and
+the report result sets are written to the log.
+
+Serializing a payload only to log it doubles the work of large
+list responses, so payloads are only logged when the root logger
+is at DEBUG level, or for a random sample of
+PAYLOAD_LOG_SAMPLE_RATE of the calls.
+"""
+
+import logging
+import random
+
+from config import PAYLOAD_LOG_SAMPLE_RATE
+
+
+def is_payload_logged() -> bool:
+    """
+    Returns True if the payload of this call is logged.
+
+    Returns:
+        bool: True at DEBUG level, otherwise True for a
+            PAYLOAD_LOG_SAMPLE_RATE fraction of the calls.
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        return True
+
+    if PAYLOAD_LOG_SAMPLE_RATE <= 0:
+        return False
+
+    return random.random() < PAYLOAD_LOG_SAMPLE_RATE
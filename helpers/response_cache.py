@@ -0,0 +1,239 @@
+# helpers/response_cache.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module contains the ResponseCache class, which keeps the
+serialized responses of the cached GET endpoints, the
+ResponseCacheEntry class, and the functions that compute the
+change version and ETag of a cached response.
+
+The change version of a response is read from the tables it is
+built from, so a request whose ETag still matches is answered
+without running the report or flow:
+- the row version of the context object: its last_change_code and
+    last_update_utc_date_time.
+- the table version of a table: its row count, the sum of its
+    last_change_code values and its max last_update_utc_date_time.
+    An insert, delete or update of a row changes it.
+"""
+
+import hashlib
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+from fastapi.responses import Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import RESPONSE_CACHE_MAX_SIZE
+
+
+async def get_change_version(
+    session: AsyncSession,
+    context_model: Optional[type] = None,
+    context_code: uuid.UUID = uuid.UUID(int=0),
+    table_model_list: Iterable[type] = ()
+) -> str:
+    """
+    Returns the change version of the context object
+    and the tables, read with one query.
+
+    Args:
+        session (AsyncSession): The session to read with.
+        context_model (type): The model of the context
+            object, or None.
+        context_code (uuid.UUID): The code of the context object.
+        table_model_list (Iterable[type]): The models of the tables.
+
+    Returns:
+        str: The change version.
+    """
+    # pylint: disable=protected-access
+    column_list = []
+
+    if context_model is not None:
+        row_filter = context_model._code == context_code
+        column_list.append(
+            select(context_model._last_change_code)
+            .where(row_filter)
+            .scalar_subquery())
+        column_list.append(
+            select(context_model._last_update_utc_date_time)
+            .where(row_filter)
+            .scalar_subquery())
+
+    for table_model in table_model_list:
+        column_list.append(
+            select(func.count())
+            .select_from(table_model)
+            .scalar_subquery())
+        column_list.append(
+            select(func.sum(table_model._last_change_code))
+            .scalar_subquery())
+        column_list.append(
+            select(func.max(table_model._last_update_utc_date_time))
+            .scalar_subquery())
+
+    if len(column_list) == 0:
+        return ""
+
+    result = await session.execute(select(*column_list))
+    return json.dumps(list(result.one()), default=str)
+
+
+def get_etag(key: str, change_version: str) -> str:
+    """
+    Returns the weak ETag of a cached response.
+
+    Args:
+        key (str): The cache key of the response.
+        change_version (str): The change version of the response.
+
+    Returns:
+        str: The ETag.
+    """
+    digest = hashlib.sha256(
+        f"{key}\n{change_version}".encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_etag_matched(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Returns True if the If-None-Match header lists the ETag.
+
+    Args:
+        if_none_match (str): The If-None-Match request header.
+        etag (str): The ETag of the response.
+
+    Returns:
+        bool: True if the ETag is listed, or the header is *.
+    """
+    if not if_none_match:
+        return False
+
+    # weak comparison, so W/"x" and "x" match
+    opaque_tag = etag.removeprefix("W/")
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """
+    The ResponseCache class keeps the serialized responses of the
+    cached GET endpoints, keyed by the cache key of the request.
+
+    An entry is only served while its ETag matches the change
+    version of the tables, so entries are never stale. When
+    max_size entries are kept, the least recently used entry
+    is dropped.
+
+    Attributes:
+        max_size (int): The number of entries kept.
+            0 disables the cache, ETags are still sent.
+    """
+
+    max_size: int = RESPONSE_CACHE_MAX_SIZE
+
+    # key -> (etag, response content)
+    _entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_key(*key_part_list: Any) -> str:
+        """
+        Returns the cache key of a request.
+
+        Args:
+            key_part_list: The route, the caller and the
+                normalized request values.
+
+        Returns:
+            str: The cache key.
+        """
+        return json.dumps(key_part_list, sort_keys=True, default=str)
+
+    @classmethod
+    def get(cls, key: str, etag: str) -> Optional[bytes]:
+        """
+        Returns the cached response content for the key.
+
+        Args:
+            key (str): The cache key.
+            etag (str): The current ETag of the response.
+
+        Returns:
+            The response content, or None if it is not
+            cached or its ETag has changed.
+        """
+        if cls.max_size <= 0:
+            return None
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+
+            if entry[0] != etag:
+                del cls._entries[key]
+                return None
+
+            cls._entries.move_to_end(key)
+            return entry[1]
+
+    @classmethod
+    def set(cls, key: str, etag: str, content: bytes) -> None:
+        """
+        Stores the response content for the key.
+
+        Args:
+            key (str): The cache key.
+            etag (str): The ETag of the response.
+            content (bytes): The response content.
+        """
+        if cls.max_size <= 0:
+            return
+
+        with cls._lock:
+            cls._entries[key] = (etag, content)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.max_size:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Removes every cached response.
+        """
+        with cls._lock:
+            cls._entries.clear()
+
+
+class ResponseCacheEntry:  # pylint: disable=too-few-public-methods
+    """
+    The ResponseCacheEntry class holds the cache key and ETag of a
+    request to a cached endpoint, and the response to send without
+    running the endpoint when the ETag still matches.
+
+    Attributes:
+        key (str): The cache key, or "" if the request is not cached.
+        etag (str): The ETag, or "" if the request is not cached.
+        response (Response): The 304 Not Modified or cached
+            response, or None if the endpoint has to run.
+    """
+
+    __slots__ = ("key", "etag", "response")
+
+    def __init__(
+        self,
+        key: str = "",
+        etag: str = "",
+        response: Optional[Response] = None
+    ) -> None:
+        self.key = key
+        self.etag = etag
+        self.response = response
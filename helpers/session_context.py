@@ -6,7 +6,9 @@ manage the session context for API requests.
 """
 
 import uuid
+from typing import FrozenSet, Mapping, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from .auth_principal import AuthPrincipal, parse_role_name_csv
 
 
 class SessionContext:
@@ -20,15 +22,25 @@ class SessionContext:
         tac_code (uuid.UUID): The tac code associated with the session.
         pac_code (uuid.UUID): The pac code associated with the session.
         api_key_dict (dict): A dictionary containing API key values.
+        auth_principal (AuthPrincipal): The principal of the API key,
+            when api_key_dict is one.
         session_code (uuid.UUID): The session code associated with the session.
         role_name_csv (str):
             A comma-separated string of role
             names associated with the session.
         session (AsyncSession): The SQLAlchemy AsyncSession object.
+        read_session (AsyncSession): The optional read replica
+            AsyncSession object, used for the report queries and
+            the counts that do not need to see the writes of the
+            request. ORM entities are never loaded with it.
+        read_your_writes (bool): When True, reads are sent to
+            the primary session even if a read session is set.
 
     Methods:
         __init__: Initializes a new instance of the SessionContext class.
         check_context_code: Checks and returns the context code value.
+        get_read_session: Returns the session to use for reads.
+        has_role: Checks if role_name_csv has a role.
 
     """
 
@@ -36,21 +48,26 @@ class SessionContext:
     customer_code: uuid.UUID = uuid.UUID(int=0)
     tac_code: uuid.UUID = uuid.UUID(int=0)
     pac_code: uuid.UUID = uuid.UUID(int=0)
-    api_key_dict: dict = {}
+    api_key_dict: Mapping = {}
+    auth_principal: Optional[AuthPrincipal] = None
     session_code: uuid.UUID = uuid.UUID(int=0)
     role_name_csv: str = ""
     session: AsyncSession = None  # type: ignore
+    read_session: AsyncSession = None  # type: ignore
+    read_your_writes: bool = False
 
     def __init__(
         self,
-        api_key_dict: dict,
+        api_key_dict: Mapping,
         session: AsyncSession = None  # type: ignore
     ) -> None:
         """
         Initializes a new instance of the SessionContext class.
 
         Args:
-            api_key_dict (dict): A dictionary containing API key values.
+            api_key_dict (Mapping): A dictionary containing API key
+                values, or the AuthPrincipal of the API key, whose
+                parsed codes and roles are used as they are.
             session (AsyncSession, optional): The SQLAlchemy
                 AsyncSession object. Defaults to None.
 
@@ -58,6 +75,43 @@ class SessionContext:
         self.api_key_dict = api_key_dict
         self.session_code = uuid.uuid4()
         self.session = session
+        self._role_name_set_csv: Optional[str] = None
+        self._role_name_set: FrozenSet[str] = frozenset()
+
+        if isinstance(api_key_dict, AuthPrincipal):
+            self.auth_principal = api_key_dict
+            self.customer_code = api_key_dict.customer_code
+            self.tac_code = api_key_dict.tac_code
+            self.pac_code = api_key_dict.pac_code
+            self.user_name = api_key_dict.user_name
+            self.role_name_csv = api_key_dict.role_name_csv
+            self._role_name_set_csv = api_key_dict.role_name_csv
+            self._role_name_set = api_key_dict.role_name_set
+
+        # database.get_db puts the read replica session
+        # and the read your writes override in the session info
+        session_info = getattr(session, "info", None)
+        if isinstance(session_info, dict):
+            self.read_session = session_info.get(
+                "read_session", None)
+            self.read_your_writes = session_info.get(
+                "read_your_writes", False)
+
+    def get_read_session(self) -> AsyncSession:
+        """
+        Returns the session to use for reads that return values,
+        such as report rows and counts. Entities are loaded with
+        the primary session, so they can be refreshed, updated
+        and deleted with it.
+
+        Returns:
+            AsyncSession: The read replica session, or the primary
+                session when there is no read session or
+                read_your_writes is set.
+        """
+        if self.read_session is None or self.read_your_writes:
+            return self.session
+        return self.read_session
 
     def check_context_code(
         self,
@@ -77,6 +131,14 @@ class SessionContext:
             uuid.UUID: The context code value.
 
         """
+        # the principal has the codes parsed already
+        if self.auth_principal is not None:
+            if context_code_value == uuid.UUID(int=0) \
+                    and context_code_name in self.auth_principal.code_dict:
+                return self.auth_principal.code_dict[context_code_name]
+            if context_code_value != uuid.UUID(int=0):
+                return context_code_value
+
         # if code dne or unknown then use the one in the api token
         if context_code_value == uuid.UUID(int=0) \
                 and self.api_key_dict[context_code_name] is not None:
@@ -98,3 +160,21 @@ class SessionContext:
             self.role_name_csv = self.api_key_dict['role_name_csv']
 
         return context_code_value
+
+    def has_role(self, role_name: str) -> bool:
+        """
+        Checks if role_name_csv has the role.
+
+        The role names are parsed again only
+        when role_name_csv has changed.
+
+        Args:
+            role_name (str): The role name.
+
+        Returns:
+            bool: True if the role is in role_name_csv.
+        """
+        if self._role_name_set_csv != self.role_name_csv:
+            self._role_name_set = parse_role_name_csv(self.role_name_csv)
+            self._role_name_set_csv = self.role_name_csv
+        return role_name in self._role_name_set
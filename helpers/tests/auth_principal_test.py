@@ -0,0 +1,200 @@
+# helpers/tests/auth_principal_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the `AuthPrincipal`
+and `VerifiedTokenCache` classes.
+"""
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from helpers import auth_principal
+from helpers.api_token import ApiToken
+from helpers.auth_principal import (AuthPrincipal, VerifiedTokenCache,
+                                    parse_role_name_csv)
+
+NOW = 1_700_000_000.0
+
+
+@pytest.fixture(scope="function")
+def clock(monkeypatch):
+    """
+    Fixture that returns a settable clock used by the
+    `VerifiedTokenCache`, with an empty cache of 3 entries
+    kept for 60 seconds.
+    """
+    now = [NOW]
+    monkeypatch.setattr(
+        auth_principal, "time", SimpleNamespace(time=lambda: now[0]))
+    monkeypatch.setattr(VerifiedTokenCache, "ttl_seconds", 60)
+    monkeypatch.setattr(VerifiedTokenCache, "max_size", 3)
+    VerifiedTokenCache.invalidate()
+    yield now
+    VerifiedTokenCache.invalidate()
+
+
+def test_auth_principal_claims():
+    """
+    Test that the codes, user name and roles
+    are parsed from the claims.
+    """
+    customer_code = uuid.uuid4()
+    principal = AuthPrincipal({
+        "CustomerCode": str(customer_code),
+        "TacCode": "not a uuid",
+        "UserName": "user@example.com",
+        "role_name_csv": "Admin, User",
+        "exp": NOW,
+    })
+
+    assert principal.customer_code == customer_code
+    assert principal.tac_code == uuid.UUID(int=0)
+    assert principal.pac_code == uuid.UUID(int=0)
+    assert dict(principal.code_dict) == {"CustomerCode": customer_code}
+    assert principal.user_name == "user@example.com"
+    assert principal.role_name_set == frozenset({"Admin", "User"})
+    assert principal.expires_at == NOW
+    assert principal["UserName"] == "user@example.com"
+    assert len(principal) == 5
+
+
+def test_auth_principal_immutable():
+    """
+    Test that a principal, its claims and
+    its parsed codes can not be changed.
+    """
+    claims = {"CustomerCode": str(uuid.uuid4()), "UserName": "a"}
+    principal = AuthPrincipal(claims)
+
+    with pytest.raises(AttributeError):
+        principal.user_name = "b"  # type: ignore
+    with pytest.raises(AttributeError):
+        principal.new_attribute = "b"  # type: ignore
+    with pytest.raises(AttributeError):
+        del principal.user_name
+    with pytest.raises(TypeError):
+        principal["UserName"] = "b"  # type: ignore
+    with pytest.raises(TypeError):
+        principal.code_dict["CustomerCode"] = uuid.uuid4()  # type: ignore
+
+    claims["UserName"] = "b"
+
+    assert principal["UserName"] == "a"
+    assert principal.user_name == "a"
+
+
+def test_has_role_exact_match():
+    """
+    Test that a role matches only a whole role name.
+    """
+    principal = AuthPrincipal({"role_name_csv": "PowerUser, Admin"})
+
+    assert principal.has_role("PowerUser") is True
+    assert principal.has_role("Admin") is True
+    assert principal.has_role("User") is False
+    assert principal.has_role("Power") is False
+    assert principal.has_role("") is False
+    assert parse_role_name_csv("") == frozenset()
+    assert parse_role_name_csv(" A ,,B ") == frozenset({"A", "B"})
+
+
+def test_cache_ttl(clock):
+    """
+    Test that an entry expires after ttl_seconds.
+    """
+    principal = AuthPrincipal({"UserName": "a"})
+    VerifiedTokenCache.set("token", principal)
+
+    clock[0] = NOW + 59
+
+    assert VerifiedTokenCache.get("token") is principal
+
+    clock[0] = NOW + 60
+
+    assert VerifiedTokenCache.get("token") is None
+    assert len(VerifiedTokenCache._entries) == 0
+
+
+def test_cache_exp(clock):
+    """
+    Test that an entry expires at the exp claim
+    of its key when it is before the ttl.
+    """
+    principal = AuthPrincipal({"UserName": "a", "exp": NOW + 10})
+    VerifiedTokenCache.set("token", principal)
+
+    clock[0] = NOW + 9
+
+    assert VerifiedTokenCache.get("token") is principal
+
+    clock[0] = NOW + 10
+
+    assert VerifiedTokenCache.get("token") is None
+
+
+def test_cache_lru_eviction(clock):  # pylint: disable=unused-argument
+    """
+    Test that the least recently used entry is
+    dropped when max_size entries are kept.
+    """
+    principal_dict = {
+        token: AuthPrincipal({"UserName": token})
+        for token in ["a", "b", "c", "d"]
+    }
+    for token in ["a", "b", "c"]:
+        VerifiedTokenCache.set(token, principal_dict[token])
+
+    assert VerifiedTokenCache.get("a") is principal_dict["a"]
+
+    VerifiedTokenCache.set("d", principal_dict["d"])
+
+    assert VerifiedTokenCache.get("b") is None
+    for token in ["a", "c", "d"]:
+        assert VerifiedTokenCache.get(token) is principal_dict[token]
+
+
+def test_cache_disabled(clock, monkeypatch):  # pylint: disable=unused-argument # noqa: E501
+    """
+    Test that a ttl of 0 disables the cache.
+    """
+    monkeypatch.setattr(VerifiedTokenCache, "ttl_seconds", 0)
+
+    VerifiedTokenCache.set("token", AuthPrincipal({"UserName": "a"}))
+
+    assert VerifiedTokenCache.get("token") is None
+    assert len(VerifiedTokenCache._entries) == 0
+
+
+def test_cache_keeps_no_token(clock):  # pylint: disable=unused-argument
+    """
+    Test that the cache is keyed by a hash of the API key.
+    """
+    VerifiedTokenCache.set("secret token", AuthPrincipal({}))
+
+    assert "secret token".encode("utf-8") not in \
+        VerifiedTokenCache._entries
+    assert len(next(iter(VerifiedTokenCache._entries))) == 32
+
+
+def test_get_auth_principal_decodes_once(clock, monkeypatch):  # pylint: disable=unused-argument # noqa: E501
+    """
+    Test that an API key is decoded once and its principal
+    is shared until the entry expires.
+    """
+    decode_list = []
+
+    def validate_token(token):
+        decode_list.append(token)
+        return {"UserName": "a"}
+
+    monkeypatch.setattr(ApiToken, "validate_token", validate_token)
+
+    principal = ApiToken.get_auth_principal("token")
+
+    assert ApiToken.get_auth_principal("token") is principal
+    assert decode_list == ["token"]
+
+    clock[0] = NOW + 60
+
+    assert ApiToken.get_auth_principal("token") is not principal
+    assert decode_list == ["token", "token"]
@@ -0,0 +1,91 @@
+# helpers/tests/json_response_test.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains unit tests for the `JSONBytesResponse`
+class and the `dump_model_json` function.
+"""
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+import pytest
+from apis.models.land_plant_list import (LandPlantListGetModelResponse,
+                                         LandPlantListGetModelResponseItem)
+from apis.models.validation_error import ValidationErrorItem
+from helpers.json_response import JSONBytesResponse, dump_model_json
+
+
+def _get_response() -> LandPlantListGetModelResponse:
+    """
+    Returns a list response model with values of
+    each type that FastAPI serializes.
+    """
+    response = LandPlantListGetModelResponse()
+    response.success = True
+    response.records_total = 2
+    response.message = "Café ☕ \"quoted\" \n line"
+    response.validation_errors.append(ValidationErrorItem(
+        property="someIntVal", message="Invalid"))
+
+    for index in range(2):
+        item = LandPlantListGetModelResponseItem()
+        item.plant_code = uuid.uuid4()
+        item.some_int_val = index
+        item.some_big_int_val = 2 ** 53 + index
+        item.some_bit_val = index == 0
+        item.some_float_val = 0.1 + index
+        item.some_decimal_val = Decimal("12.30")
+        item.some_money_val = Decimal("-0.0100")
+        item.some_utc_date_time_val = datetime(
+            2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        item.some_date_val = date(2024, 5, 1)
+        item.some_n_var_char_val = "Ünïcödé"
+        response.items.append(item)
+
+    response.items[1].some_utc_date_time_val = datetime(2024, 5, 1)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_dump_model_json_matches_response_model():
+    """
+    Test that an endpoint returning a JSONBytesResponse of
+    dump_model_json sends the same JSON as an endpoint
+    whose response model FastAPI serializes.
+    """
+    response = _get_response()
+    app = FastAPI()
+
+    @app.get("/model", response_model=LandPlantListGetModelResponse)
+    async def get_model():
+        return response
+
+    @app.get("/bytes", response_model=LandPlantListGetModelResponse)
+    async def get_bytes():
+        return JSONBytesResponse(dump_model_json(response))
+
+    async with AsyncClient(app=app, base_url="https://test.com") as ac:
+        model_response = await ac.get("/model")
+        bytes_response = await ac.get("/bytes")
+
+    assert bytes_response.status_code == model_response.status_code == 200
+    assert bytes_response.headers["content-type"] == \
+        model_response.headers["content-type"]
+    assert json.loads(bytes_response.content) == \
+        json.loads(model_response.content)
+    assert bytes_response.content == model_response.content
+
+
+def test_json_bytes_response_sends_bytes():
+    """
+    Test that the content is sent as it is.
+    """
+    content = dump_model_json(_get_response())
+
+    response = JSONBytesResponse(content)
+
+    assert response.body == content
+    assert response.media_type == "application/json"
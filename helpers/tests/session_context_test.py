@@ -0,0 +1,85 @@
+# helpers/tests/session_context_test.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains unit tests for the `SessionContext` class.
+"""
+import uuid
+
+from helpers.auth_principal import AuthPrincipal
+from helpers.session_context import SessionContext
+
+
+def test_auth_principal_values():
+    """
+    Test that the values of the principal
+    are used as they are.
+    """
+    customer_code = uuid.uuid4()
+    principal = AuthPrincipal({
+        "CustomerCode": str(customer_code),
+        "UserName": "user@example.com",
+        "role_name_csv": "Admin",
+    })
+
+    session_context = SessionContext(principal)
+
+    assert session_context.auth_principal is principal
+    assert session_context.customer_code == customer_code
+    assert session_context.user_name == "user@example.com"
+    assert session_context.role_name_csv == "Admin"
+
+
+def test_check_context_code_auth_principal():
+    """
+    Test that a missing context code is taken from the
+    principal, and a given one is returned as it is.
+    """
+    tac_code = uuid.uuid4()
+    other_code = uuid.uuid4()
+    session_context = SessionContext(
+        AuthPrincipal({"TacCode": str(tac_code)}))
+
+    assert session_context.check_context_code("TacCode") == tac_code
+    assert session_context.check_context_code(
+        "TacCode", other_code) == other_code
+
+
+def test_check_context_code_api_key_dict():
+    """
+    Test that a claims dict sets the values of the
+    session context when the context code is checked.
+    """
+    pac_code = uuid.uuid4()
+    tac_code = uuid.uuid4()
+    session_context = SessionContext({
+        "PacCode": pac_code,
+        "TacCode": None,
+        "UserName": "user@example.com",
+        "role_name_csv": "User",
+    })
+
+    assert session_context.check_context_code("PacCode") == pac_code
+    assert session_context.check_context_code(
+        "TacCode", tac_code) == tac_code
+    assert session_context.pac_code == pac_code
+    assert session_context.user_name == "user@example.com"
+    assert session_context.role_name_csv == "User"
+
+
+def test_has_role_exact_match():
+    """
+    Test that a role matches only a whole role name, and
+    that a changed role_name_csv is parsed again.
+    """
+    session_context = SessionContext(
+        AuthPrincipal({"role_name_csv": "PowerUser"}))
+
+    assert session_context.has_role("PowerUser") is True
+    assert session_context.has_role("User") is False
+
+    session_context.role_name_csv = "Config, User"
+
+    assert session_context.has_role("User") is True
+    assert session_context.has_role("PowerUser") is False
+    assert session_context.has_role("Config") is True
+
+    assert SessionContext({}).has_role("User") is False
@@ -7,15 +7,17 @@ exception handlers, and startup event.
 """
 
 import logging
-from fastapi import FastAPI, Request
+from typing import Optional
+from fastapi import Depends, FastAPI, Request
 from fastapi.responses import JSONResponse, RedirectResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import current_runtime
-from database import get_db, engine
-from helpers.session_context import SessionContext
-from models import Base
+from database import async_session_local, engine, get_api_pool_stats
+from apis.fs_farm_api.v1_0.endpoints.base_router import BaseRouter
 from apis.fs_farm_api.v1_0.routers import fs_farm_api_v1_0_router
+from helpers import AuthPrincipal
+from helpers.api_token import get_auth_principal
 
 # Define a proper date format string
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -104,20 +106,38 @@ async def read_root():
     return RedirectResponse(url="/redoc")
 
 
+@app.get("/health/database-pools")
+async def read_database_pools(
+    auth_principal: Optional[AuthPrincipal] = Depends(get_auth_principal)
+):
+    """
+    Monitoring endpoint with the connection pool statistics
+    of the engines the API uses. It requires a valid API key.
+
+    Args:
+        auth_principal (AuthPrincipal): The principal of the API key.
+
+    Raises:
+        HTTPException: If the API key is invalid or missing
+            (HTTP status code 401).
+
+    Returns:
+        dict: The pool statistics by engine role.
+    """
+    BaseRouter.authorization_check(False, auth_principal)
+    return get_api_pool_stats()
+
+
 @app.on_event("startup")
 async def startup_event():
     """
     Startup event of the application.
-    Performs necessary initialization tasks.
+    Creates the missing tables and seeds the lookup rows,
+    or with DATABASE_FAST_START only checks that the
+    database version is current.
 
     Returns:
         None
     """
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async for session in get_db():
-        session_context = SessionContext({}, session)
-        await current_runtime.initialize(session_context)
-        await session.commit()
-        break
+    await current_runtime.initialize_database(
+        engine, async_session_local)
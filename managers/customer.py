@@ -11,10 +11,12 @@ customers in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.tac import Tac  # TacID
 from models.customer import Customer
@@ -47,6 +49,8 @@ class CustomerManager:
     and retrieving customers.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -163,6 +167,8 @@ class CustomerManager:
         else:
             query = customer_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -506,6 +512,18 @@ class CustomerManager:
         Update multiple customers
         with the provided updates.
 
+        Every customer is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        customer still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             customer_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -517,16 +535,24 @@ class CustomerManager:
 
         Raises:
             TypeError: If the customer_id is not an integer.
+            ValueError: If an invalid property is provided.
             CustomerNotFoundError: If a
                 customer with the
                 provided customer_id is not found.
+            StaleDataError: If a customer does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "CustomerManager.update_bulk start")
-        updated_customers = []
-        for update in customer_updates:
-            customer_id = update.get(
+        property_list = Customer.property_list()
+        customer_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for customer_update in customer_updates:
+            customer_id = customer_update.get(
                 "customer_id")
             if not isinstance(customer_id, int):
                 raise TypeError(
@@ -541,24 +567,99 @@ class CustomerManager:
                 "customer_id:%s",
                 customer_id)
 
-            customer = await self.get_by_id(
+            expected_change_code = customer_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in customer_update.items():
+                if key in ("customer_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[customer_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 customer_id)
-
-            if not customer:
-                raise CustomerNotFoundError(
-                    f"Customer with ID "
-                    f"{customer_id} not found!")
-
-            for key, value in update.items():
-                if key != "customer_id":
-                    setattr(customer, key, value)
-
-            customer.last_update_user_id =\
+            customer_ids.append(customer_id)
+
+        unique_ids = list(dict.fromkeys(customer_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Customer._customer_id, Customer._last_change_code)
+                .where(Customer._customer_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for customer_id in chunk:
+                if customer_id not in change_codes:
+                    raise CustomerNotFoundError(
+                        f"Customer with ID "
+                        f"{customer_id} not found!")
+                change_code = change_codes[customer_id]
+                expected_change_code = expected_change_codes.get(
+                    customer_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Customer with ID "
+                        f"{customer_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Customer, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Customer._last_change_code] = \
+                Customer._last_change_code + 1
+            values[Customer._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Customer._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Customer)
+                    .where(Customer._customer_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Customer._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Customer rows changed during the update!")
+
+        # reload the rows so customers already in the
+        # session pick up the new values and last_change_code
+        customers_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Customer)
+                .where(Customer._customer_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for customer in result.scalars().all():
+                customers_by_id[customer.customer_id] = customer
 
-            updated_customers.append(customer)
-
-        await self._session_context.session.flush()
+        updated_customers = [
+            customers_by_id[customer_id]
+            for customer_id in customer_ids
+        ]
 
         logging.info(
             "CustomerManager.update_bulk end")
@@ -570,6 +671,9 @@ class CustomerManager:
         """
         Delete multiple customers
         by their IDs.
+
+        The customers are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "CustomerManager.delete_bulk")
@@ -581,19 +685,25 @@ class CustomerManager:
                     f"got {type(customer_id)} instead."
                 )
 
-            customer = await self.get_by_id(
-                customer_id)
-            if not customer:
-                raise CustomerNotFoundError(
-                    f"Customer with ID "
-                    f"{customer_id} not found!"
-                )
-
-            if customer:
-                await self._session_context.session.delete(
-                    customer)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(customer_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Customer._customer_id)
+                .where(Customer._customer_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for customer_id in chunk:
+                if customer_id not in found_ids:
+                    raise CustomerNotFoundError(
+                        f"Customer with ID "
+                        f"{customer_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Customer)
+                .where(Customer._customer_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -604,9 +714,35 @@ class CustomerManager:
         """
         logging.info(
             "CustomerManager.count")
-        result = await self._session_context.session.execute(
-            select(Customer))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Customer))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of customers
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "CustomerManager.count_by")
+        property_list = Customer.property_list()
+        query = select(func.count()).select_from(Customer)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Customer, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -638,9 +774,14 @@ class CustomerManager:
                 f"The customer_id must be an integer, "
                 f"got {type(customer_id)} instead."
             )
-        customer = await self.get_by_id(
-            customer_id)
-        return bool(customer)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Customer)
+            .where(Customer._customer_id == customer_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ customer_roles in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.customer import Customer  # CustomerID
 from models.role import Role  # RoleID
@@ -48,6 +50,8 @@ class CustomerRoleManager:
     and retrieving customer_roles.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class CustomerRoleManager:
         else:
             query = customer_role_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -517,6 +523,18 @@ class CustomerRoleManager:
         Update multiple customer_roles
         with the provided updates.
 
+        Every customer_role is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        customer_role still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             customer_role_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +546,24 @@ class CustomerRoleManager:
 
         Raises:
             TypeError: If the customer_role_id is not an integer.
+            ValueError: If an invalid property is provided.
             CustomerRoleNotFoundError: If a
                 customer_role with the
                 provided customer_role_id is not found.
+            StaleDataError: If a customer_role does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "CustomerRoleManager.update_bulk start")
-        updated_customer_roles = []
-        for update in customer_role_updates:
-            customer_role_id = update.get(
+        property_list = CustomerRole.property_list()
+        customer_role_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for customer_role_update in customer_role_updates:
+            customer_role_id = customer_role_update.get(
                 "customer_role_id")
             if not isinstance(customer_role_id, int):
                 raise TypeError(
@@ -552,24 +578,99 @@ class CustomerRoleManager:
                 "customer_role_id:%s",
                 customer_role_id)
 
-            customer_role = await self.get_by_id(
+            expected_change_code = customer_role_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in customer_role_update.items():
+                if key in ("customer_role_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[customer_role_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 customer_role_id)
-
-            if not customer_role:
-                raise CustomerRoleNotFoundError(
-                    f"CustomerRole with ID "
-                    f"{customer_role_id} not found!")
-
-            for key, value in update.items():
-                if key != "customer_role_id":
-                    setattr(customer_role, key, value)
-
-            customer_role.last_update_user_id =\
+            customer_role_ids.append(customer_role_id)
+
+        unique_ids = list(dict.fromkeys(customer_role_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(CustomerRole._customer_role_id, CustomerRole._last_change_code)  # noqa: E501
+                .where(CustomerRole._customer_role_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for customer_role_id in chunk:
+                if customer_role_id not in change_codes:
+                    raise CustomerRoleNotFoundError(
+                        f"CustomerRole with ID "
+                        f"{customer_role_id} not found!")
+                change_code = change_codes[customer_role_id]
+                expected_change_code = expected_change_codes.get(
+                    customer_role_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"CustomerRole with ID "
+                        f"{customer_role_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(CustomerRole, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[CustomerRole._last_change_code] = \
+                CustomerRole._last_change_code + 1
+            values[CustomerRole._last_update_user_id] = \
                 self._session_context.customer_code
+            values[CustomerRole._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(CustomerRole)
+                    .where(CustomerRole._customer_role_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        CustomerRole._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"CustomerRole rows changed during the update!")
+
+        # reload the rows so customer_roles already in the
+        # session pick up the new values and last_change_code
+        customer_roles_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(CustomerRole)
+                .where(CustomerRole._customer_role_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for customer_role in result.scalars().all():
+                customer_roles_by_id[customer_role.customer_role_id] = customer_role  # noqa: E501
 
-            updated_customer_roles.append(customer_role)
-
-        await self._session_context.session.flush()
+        updated_customer_roles = [
+            customer_roles_by_id[customer_role_id]
+            for customer_role_id in customer_role_ids
+        ]
 
         logging.info(
             "CustomerRoleManager.update_bulk end")
@@ -581,6 +682,9 @@ class CustomerRoleManager:
         """
         Delete multiple customer_roles
         by their IDs.
+
+        The customer_roles are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "CustomerRoleManager.delete_bulk")
@@ -592,19 +696,25 @@ class CustomerRoleManager:
                     f"got {type(customer_role_id)} instead."
                 )
 
-            customer_role = await self.get_by_id(
-                customer_role_id)
-            if not customer_role:
-                raise CustomerRoleNotFoundError(
-                    f"CustomerRole with ID "
-                    f"{customer_role_id} not found!"
-                )
-
-            if customer_role:
-                await self._session_context.session.delete(
-                    customer_role)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(customer_role_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(CustomerRole._customer_role_id)
+                .where(CustomerRole._customer_role_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for customer_role_id in chunk:
+                if customer_role_id not in found_ids:
+                    raise CustomerRoleNotFoundError(
+                        f"CustomerRole with ID "
+                        f"{customer_role_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(CustomerRole)
+                .where(CustomerRole._customer_role_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -615,9 +725,35 @@ class CustomerRoleManager:
         """
         logging.info(
             "CustomerRoleManager.count")
-        result = await self._session_context.session.execute(
-            select(CustomerRole))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(CustomerRole))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of customer_roles
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "CustomerRoleManager.count_by")
+        property_list = CustomerRole.property_list()
+        query = select(func.count()).select_from(CustomerRole)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(CustomerRole, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +785,14 @@ class CustomerRoleManager:
                 f"The customer_role_id must be an integer, "
                 f"got {type(customer_role_id)} instead."
             )
-        customer_role = await self.get_by_id(
-            customer_role_id)
-        return bool(customer_role)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(CustomerRole)
+            .where(CustomerRole._customer_role_id == customer_role_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
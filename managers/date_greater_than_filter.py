@@ -11,10 +11,14 @@ date_greater_than_filters in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.date_greater_than_filter import DateGreaterThanFilter
@@ -65,6 +69,8 @@ class DateGreaterThanFilterManager:
     and retrieving date_greater_than_filters.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -105,62 +111,75 @@ class DateGreaterThanFilterManager:
         logging.info("DateGreaterThanFilterManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(DateGreaterThanFilter._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
 # endset
-        if await self.from_enum(DateGreaterThanFilterEnum.UNKNOWN) \
-                is None:
+        if DateGreaterThanFilterEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DateGreaterThanFilterEnum.LAST_24_HOURS) \
-                is None:
+            item_list.append(item)
+        if DateGreaterThanFilterEnum.LAST_24_HOURS.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Last 24 Hours"
             item.lookup_enum_name = "Last_24_Hours"
             item.description = "Last 24 Hours"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DateGreaterThanFilterEnum.LAST_7_DAYS) \
-                is None:
+            item_list.append(item)
+        if DateGreaterThanFilterEnum.LAST_7_DAYS.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Last 7 Days"
             item.lookup_enum_name = "Last_7_Days"
             item.description = "Last 7 Days"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DateGreaterThanFilterEnum.LAST_30_DAYS) \
-                is None:
+            item_list.append(item)
+        if DateGreaterThanFilterEnum.LAST_30_DAYS.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Last 30 Days"
             item.lookup_enum_name = "Last_30_Days"
             item.description = "Last 30 Days"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DateGreaterThanFilterEnum.LAST_90_DAYS) \
-                is None:
+            item_list.append(item)
+        if DateGreaterThanFilterEnum.LAST_90_DAYS.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Last 90 Days"
             item.lookup_enum_name = "Last_90_Days"
             item.description = "Last 90 Days"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DateGreaterThanFilterEnum.LAST_365_DAYS) \
-                is None:
+            item_list.append(item)
+        if DateGreaterThanFilterEnum.LAST_365_DAYS.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Last 365 Days"
             item.lookup_enum_name = "Last_365_Days"
             item.description = "Last 365 Days"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
 # endset
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("DateGreaterThanFilterManager.Initialize end")
 
     async def from_enum(
@@ -178,10 +197,31 @@ class DateGreaterThanFilterManager:
                 The DateGreaterThanFilter object
                 matching the enum value.
         """
+        date_greater_than_filter = await LookupCache.get(
+            self._session_context.session,
+            DateGreaterThanFilter,
+            enum_val.value)
+        if date_greater_than_filter is not None:
+            return date_greater_than_filter
         query_filter = (
             DateGreaterThanFilter._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        date_greater_than_filter = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            date_greater_than_filter)
+        return date_greater_than_filter
+
+    async def load_lookup_cache(self):
+        """
+        Loads every DateGreaterThanFilter row
+        into the process wide lookup cache.
+        """
+        logging.info("DateGreaterThanFilterManager.load_lookup_cache")
+        for date_greater_than_filter in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                date_greater_than_filter)
 ##GENLearn[isLookup=true]End
 ##GENTrainingBlock[caseIsLookupObject]End
 
@@ -227,6 +267,7 @@ class DateGreaterThanFilterManager:
         self._session_context.session.add(
             date_greater_than_filter)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DateGreaterThanFilter)
         return date_greater_than_filter
 
     def _build_query(self):
@@ -277,6 +318,8 @@ class DateGreaterThanFilterManager:
         else:
             query = date_greater_than_filter_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -403,6 +446,7 @@ class DateGreaterThanFilterManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(date_greater_than_filter, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(DateGreaterThanFilter)
         return date_greater_than_filter
 
     async def delete(self, date_greater_than_filter_id: int):
@@ -439,6 +483,7 @@ class DateGreaterThanFilterManager:
             date_greater_than_filter)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(DateGreaterThanFilter)
 
     async def get_list(
         self
@@ -610,6 +655,7 @@ class DateGreaterThanFilterManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(date_greater_than_filters)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DateGreaterThanFilter)
         return date_greater_than_filters
 
     async def update_bulk(
@@ -620,6 +666,18 @@ class DateGreaterThanFilterManager:
         Update multiple date_greater_than_filters
         with the provided updates.
 
+        Every date_greater_than_filter is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        date_greater_than_filter still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             date_greater_than_filter_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -631,16 +689,24 @@ class DateGreaterThanFilterManager:
 
         Raises:
             TypeError: If the date_greater_than_filter_id is not an integer.
+            ValueError: If an invalid property is provided.
             DateGreaterThanFilterNotFoundError: If a
                 date_greater_than_filter with the
                 provided date_greater_than_filter_id is not found.
+            StaleDataError: If a date_greater_than_filter does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DateGreaterThanFilterManager.update_bulk start")
-        updated_date_greater_than_filters = []
-        for update in date_greater_than_filter_updates:
-            date_greater_than_filter_id = update.get(
+        property_list = DateGreaterThanFilter.property_list()
+        date_greater_than_filter_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for date_greater_than_filter_update in date_greater_than_filter_updates:  # noqa: E501
+            date_greater_than_filter_id = date_greater_than_filter_update.get(
                 "date_greater_than_filter_id")
             if not isinstance(date_greater_than_filter_id, int):
                 raise TypeError(
@@ -655,24 +721,101 @@ class DateGreaterThanFilterManager:
                 "date_greater_than_filter_id:%s",
                 date_greater_than_filter_id)
 
-            date_greater_than_filter = await self.get_by_id(
+            expected_change_code = date_greater_than_filter_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in date_greater_than_filter_update.items():
+                if key in ("date_greater_than_filter_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[date_greater_than_filter_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 date_greater_than_filter_id)
-
-            if not date_greater_than_filter:
-                raise DateGreaterThanFilterNotFoundError(
-                    f"DateGreaterThanFilter with ID "
-                    f"{date_greater_than_filter_id} not found!")
-
-            for key, value in update.items():
-                if key != "date_greater_than_filter_id":
-                    setattr(date_greater_than_filter, key, value)
-
-            date_greater_than_filter.last_update_user_id =\
+            date_greater_than_filter_ids.append(date_greater_than_filter_id)
+
+        unique_ids = list(dict.fromkeys(date_greater_than_filter_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DateGreaterThanFilter._date_greater_than_filter_id, DateGreaterThanFilter._last_change_code)  # noqa: E501
+                .where(DateGreaterThanFilter._date_greater_than_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for date_greater_than_filter_id in chunk:
+                if date_greater_than_filter_id not in change_codes:
+                    raise DateGreaterThanFilterNotFoundError(
+                        f"DateGreaterThanFilter with ID "
+                        f"{date_greater_than_filter_id} not found!")
+                change_code = change_codes[date_greater_than_filter_id]
+                expected_change_code = expected_change_codes.get(
+                    date_greater_than_filter_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DateGreaterThanFilter with ID "
+                        f"{date_greater_than_filter_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DateGreaterThanFilter, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DateGreaterThanFilter._last_change_code] = \
+                DateGreaterThanFilter._last_change_code + 1
+            values[DateGreaterThanFilter._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DateGreaterThanFilter._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DateGreaterThanFilter)
+                    .where(DateGreaterThanFilter._date_greater_than_filter_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DateGreaterThanFilter._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DateGreaterThanFilter rows changed during the update!")  # noqa: E501
+
+        # reload the rows so date_greater_than_filters already in the
+        # session pick up the new values and last_change_code
+        date_greater_than_filters_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DateGreaterThanFilter)
+                .where(DateGreaterThanFilter._date_greater_than_filter_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for date_greater_than_filter in result.scalars().all():
+                date_greater_than_filters_by_id[date_greater_than_filter.date_greater_than_filter_id] = date_greater_than_filter  # noqa: E501
 
-            updated_date_greater_than_filters.append(date_greater_than_filter)
+        updated_date_greater_than_filters = [
+            date_greater_than_filters_by_id[date_greater_than_filter_id]
+            for date_greater_than_filter_id in date_greater_than_filter_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DateGreaterThanFilter)
 
         logging.info(
             "DateGreaterThanFilterManager.update_bulk end")
@@ -684,6 +827,9 @@ class DateGreaterThanFilterManager:
         """
         Delete multiple date_greater_than_filters
         by their IDs.
+
+        The date_greater_than_filters are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DateGreaterThanFilterManager.delete_bulk")
@@ -695,19 +841,27 @@ class DateGreaterThanFilterManager:
                     f"got {type(date_greater_than_filter_id)} instead."
                 )
 
-            date_greater_than_filter = await self.get_by_id(
-                date_greater_than_filter_id)
-            if not date_greater_than_filter:
-                raise DateGreaterThanFilterNotFoundError(
-                    f"DateGreaterThanFilter with ID "
-                    f"{date_greater_than_filter_id} not found!"
-                )
-
-            if date_greater_than_filter:
-                await self._session_context.session.delete(
-                    date_greater_than_filter)
+        unique_ids = list(dict.fromkeys(date_greater_than_filter_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DateGreaterThanFilter._date_greater_than_filter_id)
+                .where(DateGreaterThanFilter._date_greater_than_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for date_greater_than_filter_id in chunk:
+                if date_greater_than_filter_id not in found_ids:
+                    raise DateGreaterThanFilterNotFoundError(
+                        f"DateGreaterThanFilter with ID "
+                        f"{date_greater_than_filter_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DateGreaterThanFilter)
+                .where(DateGreaterThanFilter._date_greater_than_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DateGreaterThanFilter)
 
         return True
 
@@ -718,9 +872,35 @@ class DateGreaterThanFilterManager:
         """
         logging.info(
             "DateGreaterThanFilterManager.count")
-        result = await self._session_context.session.execute(
-            select(DateGreaterThanFilter))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DateGreaterThanFilter))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of date_greater_than_filters
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DateGreaterThanFilterManager.count_by")
+        property_list = DateGreaterThanFilter.property_list()
+        query = select(func.count()).select_from(DateGreaterThanFilter)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DateGreaterThanFilter, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -752,9 +932,14 @@ class DateGreaterThanFilterManager:
                 f"The date_greater_than_filter_id must be an integer, "
                 f"got {type(date_greater_than_filter_id)} instead."
             )
-        date_greater_than_filter = await self.get_by_id(
-            date_greater_than_filter_id)
-        return bool(date_greater_than_filter)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DateGreaterThanFilter)
+            .where(DateGreaterThanFilter._date_greater_than_filter_id == date_greater_than_filter_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ df_maintenances in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.df_maintenance import DFMaintenance
@@ -47,6 +49,8 @@ class DFMaintenanceManager:
     and retrieving df_maintenances.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -163,6 +167,8 @@ class DFMaintenanceManager:
         else:
             query = df_maintenance_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -506,6 +512,18 @@ class DFMaintenanceManager:
         Update multiple df_maintenances
         with the provided updates.
 
+        Every df_maintenance is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        df_maintenance still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             df_maintenance_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -517,16 +535,24 @@ class DFMaintenanceManager:
 
         Raises:
             TypeError: If the df_maintenance_id is not an integer.
+            ValueError: If an invalid property is provided.
             DFMaintenanceNotFoundError: If a
                 df_maintenance with the
                 provided df_maintenance_id is not found.
+            StaleDataError: If a df_maintenance does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DFMaintenanceManager.update_bulk start")
-        updated_df_maintenances = []
-        for update in df_maintenance_updates:
-            df_maintenance_id = update.get(
+        property_list = DFMaintenance.property_list()
+        df_maintenance_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for df_maintenance_update in df_maintenance_updates:
+            df_maintenance_id = df_maintenance_update.get(
                 "df_maintenance_id")
             if not isinstance(df_maintenance_id, int):
                 raise TypeError(
@@ -541,24 +567,99 @@ class DFMaintenanceManager:
                 "df_maintenance_id:%s",
                 df_maintenance_id)
 
-            df_maintenance = await self.get_by_id(
+            expected_change_code = df_maintenance_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in df_maintenance_update.items():
+                if key in ("df_maintenance_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[df_maintenance_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 df_maintenance_id)
-
-            if not df_maintenance:
-                raise DFMaintenanceNotFoundError(
-                    f"DFMaintenance with ID "
-                    f"{df_maintenance_id} not found!")
-
-            for key, value in update.items():
-                if key != "df_maintenance_id":
-                    setattr(df_maintenance, key, value)
-
-            df_maintenance.last_update_user_id =\
+            df_maintenance_ids.append(df_maintenance_id)
+
+        unique_ids = list(dict.fromkeys(df_maintenance_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFMaintenance._df_maintenance_id, DFMaintenance._last_change_code)  # noqa: E501
+                .where(DFMaintenance._df_maintenance_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for df_maintenance_id in chunk:
+                if df_maintenance_id not in change_codes:
+                    raise DFMaintenanceNotFoundError(
+                        f"DFMaintenance with ID "
+                        f"{df_maintenance_id} not found!")
+                change_code = change_codes[df_maintenance_id]
+                expected_change_code = expected_change_codes.get(
+                    df_maintenance_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DFMaintenance with ID "
+                        f"{df_maintenance_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DFMaintenance, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DFMaintenance._last_change_code] = \
+                DFMaintenance._last_change_code + 1
+            values[DFMaintenance._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DFMaintenance._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DFMaintenance)
+                    .where(DFMaintenance._df_maintenance_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DFMaintenance._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DFMaintenance rows changed during the update!")
+
+        # reload the rows so df_maintenances already in the
+        # session pick up the new values and last_change_code
+        df_maintenances_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFMaintenance)
+                .where(DFMaintenance._df_maintenance_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for df_maintenance in result.scalars().all():
+                df_maintenances_by_id[df_maintenance.df_maintenance_id] = df_maintenance  # noqa: E501
 
-            updated_df_maintenances.append(df_maintenance)
-
-        await self._session_context.session.flush()
+        updated_df_maintenances = [
+            df_maintenances_by_id[df_maintenance_id]
+            for df_maintenance_id in df_maintenance_ids
+        ]
 
         logging.info(
             "DFMaintenanceManager.update_bulk end")
@@ -570,6 +671,9 @@ class DFMaintenanceManager:
         """
         Delete multiple df_maintenances
         by their IDs.
+
+        The df_maintenances are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DFMaintenanceManager.delete_bulk")
@@ -581,19 +685,25 @@ class DFMaintenanceManager:
                     f"got {type(df_maintenance_id)} instead."
                 )
 
-            df_maintenance = await self.get_by_id(
-                df_maintenance_id)
-            if not df_maintenance:
-                raise DFMaintenanceNotFoundError(
-                    f"DFMaintenance with ID "
-                    f"{df_maintenance_id} not found!"
-                )
-
-            if df_maintenance:
-                await self._session_context.session.delete(
-                    df_maintenance)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(df_maintenance_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFMaintenance._df_maintenance_id)
+                .where(DFMaintenance._df_maintenance_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for df_maintenance_id in chunk:
+                if df_maintenance_id not in found_ids:
+                    raise DFMaintenanceNotFoundError(
+                        f"DFMaintenance with ID "
+                        f"{df_maintenance_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DFMaintenance)
+                .where(DFMaintenance._df_maintenance_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -604,9 +714,35 @@ class DFMaintenanceManager:
         """
         logging.info(
             "DFMaintenanceManager.count")
-        result = await self._session_context.session.execute(
-            select(DFMaintenance))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DFMaintenance))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of df_maintenances
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DFMaintenanceManager.count_by")
+        property_list = DFMaintenance.property_list()
+        query = select(func.count()).select_from(DFMaintenance)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DFMaintenance, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -638,9 +774,14 @@ class DFMaintenanceManager:
                 f"The df_maintenance_id must be an integer, "
                 f"got {type(df_maintenance_id)} instead."
             )
-        df_maintenance = await self.get_by_id(
-            df_maintenance_id)
-        return bool(df_maintenance)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DFMaintenance)
+            .where(DFMaintenance._df_maintenance_id == df_maintenance_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
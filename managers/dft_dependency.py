@@ -11,10 +11,12 @@ dft_dependencys in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.dyna_flow_task import DynaFlowTask  # DynaFlowTaskID
 from models.dft_dependency import DFTDependency
@@ -47,6 +49,8 @@ class DFTDependencyManager:
     and retrieving dft_dependencys.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -163,6 +167,8 @@ class DFTDependencyManager:
         else:
             query = dft_dependency_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -506,6 +512,18 @@ class DFTDependencyManager:
         Update multiple dft_dependencys
         with the provided updates.
 
+        Every dft_dependency is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dft_dependency still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dft_dependency_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -517,16 +535,24 @@ class DFTDependencyManager:
 
         Raises:
             TypeError: If the dft_dependency_id is not an integer.
+            ValueError: If an invalid property is provided.
             DFTDependencyNotFoundError: If a
                 dft_dependency with the
                 provided dft_dependency_id is not found.
+            StaleDataError: If a dft_dependency does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DFTDependencyManager.update_bulk start")
-        updated_dft_dependencys = []
-        for update in dft_dependency_updates:
-            dft_dependency_id = update.get(
+        property_list = DFTDependency.property_list()
+        dft_dependency_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dft_dependency_update in dft_dependency_updates:
+            dft_dependency_id = dft_dependency_update.get(
                 "dft_dependency_id")
             if not isinstance(dft_dependency_id, int):
                 raise TypeError(
@@ -541,24 +567,99 @@ class DFTDependencyManager:
                 "dft_dependency_id:%s",
                 dft_dependency_id)
 
-            dft_dependency = await self.get_by_id(
+            expected_change_code = dft_dependency_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dft_dependency_update.items():
+                if key in ("dft_dependency_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dft_dependency_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dft_dependency_id)
-
-            if not dft_dependency:
-                raise DFTDependencyNotFoundError(
-                    f"DFTDependency with ID "
-                    f"{dft_dependency_id} not found!")
-
-            for key, value in update.items():
-                if key != "dft_dependency_id":
-                    setattr(dft_dependency, key, value)
-
-            dft_dependency.last_update_user_id =\
+            dft_dependency_ids.append(dft_dependency_id)
+
+        unique_ids = list(dict.fromkeys(dft_dependency_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFTDependency._dft_dependency_id, DFTDependency._last_change_code)  # noqa: E501
+                .where(DFTDependency._dft_dependency_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for dft_dependency_id in chunk:
+                if dft_dependency_id not in change_codes:
+                    raise DFTDependencyNotFoundError(
+                        f"DFTDependency with ID "
+                        f"{dft_dependency_id} not found!")
+                change_code = change_codes[dft_dependency_id]
+                expected_change_code = expected_change_codes.get(
+                    dft_dependency_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DFTDependency with ID "
+                        f"{dft_dependency_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DFTDependency, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DFTDependency._last_change_code] = \
+                DFTDependency._last_change_code + 1
+            values[DFTDependency._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DFTDependency._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DFTDependency)
+                    .where(DFTDependency._dft_dependency_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DFTDependency._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DFTDependency rows changed during the update!")
+
+        # reload the rows so dft_dependencys already in the
+        # session pick up the new values and last_change_code
+        dft_dependencys_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFTDependency)
+                .where(DFTDependency._dft_dependency_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for dft_dependency in result.scalars().all():
+                dft_dependencys_by_id[dft_dependency.dft_dependency_id] = dft_dependency  # noqa: E501
 
-            updated_dft_dependencys.append(dft_dependency)
-
-        await self._session_context.session.flush()
+        updated_dft_dependencys = [
+            dft_dependencys_by_id[dft_dependency_id]
+            for dft_dependency_id in dft_dependency_ids
+        ]
 
         logging.info(
             "DFTDependencyManager.update_bulk end")
@@ -570,6 +671,9 @@ class DFTDependencyManager:
         """
         Delete multiple dft_dependencys
         by their IDs.
+
+        The dft_dependencys are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DFTDependencyManager.delete_bulk")
@@ -581,19 +685,25 @@ class DFTDependencyManager:
                     f"got {type(dft_dependency_id)} instead."
                 )
 
-            dft_dependency = await self.get_by_id(
-                dft_dependency_id)
-            if not dft_dependency:
-                raise DFTDependencyNotFoundError(
-                    f"DFTDependency with ID "
-                    f"{dft_dependency_id} not found!"
-                )
-
-            if dft_dependency:
-                await self._session_context.session.delete(
-                    dft_dependency)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(dft_dependency_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DFTDependency._dft_dependency_id)
+                .where(DFTDependency._dft_dependency_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for dft_dependency_id in chunk:
+                if dft_dependency_id not in found_ids:
+                    raise DFTDependencyNotFoundError(
+                        f"DFTDependency with ID "
+                        f"{dft_dependency_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DFTDependency)
+                .where(DFTDependency._dft_dependency_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -604,9 +714,35 @@ class DFTDependencyManager:
         """
         logging.info(
             "DFTDependencyManager.count")
-        result = await self._session_context.session.execute(
-            select(DFTDependency))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DFTDependency))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dft_dependencys
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DFTDependencyManager.count_by")
+        property_list = DFTDependency.property_list()
+        query = select(func.count()).select_from(DFTDependency)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DFTDependency, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -638,9 +774,14 @@ class DFTDependencyManager:
                 f"The dft_dependency_id must be an integer, "
                 f"got {type(dft_dependency_id)} instead."
             )
-        dft_dependency = await self.get_by_id(
-            dft_dependency_id)
-        return bool(dft_dependency)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DFTDependency)
+            .where(DFTDependency._dft_dependency_id == dft_dependency_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ dyna_flows in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.dyna_flow_type import DynaFlowType  # DynaFlowTypeID
 from models.pac import Pac  # PacID
@@ -48,6 +50,8 @@ class DynaFlowManager:
     and retrieving dyna_flows.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class DynaFlowManager:
         else:
             query = dyna_flow_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -270,6 +276,191 @@ class DynaFlowManager:
 
         return self._first_or_none(query_results)
 
+    async def claim_for_task_build(
+        self,
+        code_list: List[uuid.UUID],
+        processor_identifier: str,
+        item_count: Optional[int] = None
+    ) -> List[DynaFlow]:
+        """
+        Claims the dyna_flows
+        with the given codes for a task build,
+        with one UPDATE statement per chunk of codes.
+
+        Only dyna_flows whose task creation is not
+        started are claimed. The claimed dyna_flows are
+        marked as task creation started by the processor
+        and get the priority_level of their dyna_flow_type.
+
+        On PostgreSQL, rows locked by another processor
+        are skipped (FOR UPDATE SKIP LOCKED). On other
+        databases the is_task_creation_started condition
+        of the UPDATE makes sure only one processor claims
+        a row.
+
+        Args:
+            code_list (List[uuid.UUID]): The codes of the
+                dyna_flows to claim.
+            processor_identifier (str): The identifier of
+                the claiming processor.
+            item_count (Optional[int]): The most
+                dyna_flows to claim, in the order of the
+                codes. A chunk then takes only as many codes
+                as are left to claim, so a code another
+                processor claimed first is made up by the
+                next codes. None claims them all.
+
+        Returns:
+            List[DynaFlow]: The claimed
+                dyna_flows. Codes that are not found
+                or already claimed are skipped.
+        """
+        logging.info("DynaFlowManager.claim_for_task_build %s",
+                     len(code_list))
+
+        session = self._session_context.session
+        dialect = session.get_bind().dialect
+        claim_utc_date_time = datetime.now(timezone.utc)
+
+        values = {
+            DynaFlow._is_task_creation_started: True,
+            DynaFlow._task_creation_processor_identifier:
+                processor_identifier,
+            DynaFlow._priority_level: func.coalesce(
+                select(DynaFlowType._priority_level)
+                .where(
+                    DynaFlowType._dyna_flow_type_id == DynaFlow._dyna_flow_type_id)  # noqa: E501
+                .scalar_subquery(),
+                DynaFlow._priority_level),
+            DynaFlow._last_change_code:
+                DynaFlow._last_change_code + 1,
+            DynaFlow._last_update_user_id:
+                self._session_context.customer_code,
+            DynaFlow._last_update_utc_date_time: claim_utc_date_time,
+        }
+
+        unique_codes = list(dict.fromkeys(
+            str(code) for code in code_list))
+
+        claimed_ids = []
+        index = 0
+        while index < len(unique_codes):
+            chunk_size = self._bulk_chunk_size
+            if item_count is not None:
+                chunk_size = min(chunk_size, item_count - len(claimed_ids))
+                if chunk_size <= 0:
+                    break
+            chunk = unique_codes[index:index + chunk_size]
+            index += chunk_size
+            ready_filter = and_(
+                DynaFlow._code.in_(chunk),  # type: ignore
+                DynaFlow._is_task_creation_started == False,  # noqa: E712
+            )
+            if dialect.name == "postgresql":
+                ready_filter = and_(
+                    ready_filter,
+                    DynaFlow._dyna_flow_id.in_(  # type: ignore
+                        select(DynaFlow._dyna_flow_id)
+                        .where(ready_filter)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+            query = (
+                update(DynaFlow)
+                .where(ready_filter)
+                .values(values)
+                .execution_options(synchronize_session=False)
+            )
+            if dialect.update_returning:
+                result = await session.execute(
+                    query.returning(DynaFlow._dyna_flow_id))
+                claimed_ids.extend(result.scalars().all())
+            else:
+                await session.execute(query)
+                result = await session.execute(
+                    select(DynaFlow._dyna_flow_id)
+                    .where(
+                        DynaFlow._code.in_(chunk),  # type: ignore
+                        DynaFlow._task_creation_processor_identifier == processor_identifier,  # noqa: E501
+                        DynaFlow._last_update_utc_date_time == claim_utc_date_time)  # noqa: E501
+                )
+                claimed_ids.extend(result.scalars().all())
+
+        if len(claimed_ids) == 0:
+            return []
+
+        # reload the rows so dyna_flows already in the
+        # session pick up the claim and last_change_code
+        result = await session.execute(
+            select(DynaFlow)
+            .where(DynaFlow._dyna_flow_id.in_(claimed_ids))  # type: ignore
+            .execution_options(populate_existing=True)
+        )
+        dyna_flows_by_code = {
+            str(dyna_flow.code): dyna_flow
+            for dyna_flow in result.scalars().all()
+        }
+
+        return [
+            dyna_flows_by_code[code]
+            for code in unique_codes
+            if code in dyna_flows_by_code
+        ]
+
+    async def mark_started(
+        self,
+        dyna_flow_id: int,
+        started_utc_date_time: datetime
+    ) -> bool:
+        """
+        Marks the dyna_flow with the given ID
+        as started, with one conditional UPDATE
+        statement instead of a versioned save.
+
+        Only a dyna_flow that is not started is
+        updated, so tasks of the same dyna_flow that
+        start in parallel do not conflict on its
+        last_change_code.
+
+        Args:
+            dyna_flow_id (int): The ID of the
+                dyna_flow to mark as started.
+            started_utc_date_time (datetime): The
+                started date time to set.
+
+        Returns:
+            bool: True if this call marked the
+                dyna_flow as started, False if it was
+                already started or is not found.
+        """
+        logging.info("DynaFlowManager.mark_started %s",
+                     dyna_flow_id)
+        if not isinstance(dyna_flow_id, int):
+            raise TypeError(
+                "The dyna_flow_id must be an integer, "
+                f"got {type(dyna_flow_id)} instead.")
+
+        query = (
+            update(DynaFlow)
+            .where(
+                DynaFlow._dyna_flow_id == dyna_flow_id,
+                DynaFlow._is_started == False)  # noqa: E712
+            .values({
+                DynaFlow._is_started: True,
+                DynaFlow._started_utc_date_time: started_utc_date_time,
+                DynaFlow._last_change_code:
+                    DynaFlow._last_change_code + 1,
+                DynaFlow._last_update_user_id:
+                    self._session_context.customer_code,
+                DynaFlow._last_update_utc_date_time:
+                    datetime.now(timezone.utc),
+            })
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session_context.session.execute(query)
+
+        return result.rowcount > 0
+
     async def update(
         self,
         dyna_flow: DynaFlow, **kwargs
@@ -517,6 +708,18 @@ class DynaFlowManager:
         Update multiple dyna_flows
         with the provided updates.
 
+        Every dyna_flow is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dyna_flow still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dyna_flow_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +731,24 @@ class DynaFlowManager:
 
         Raises:
             TypeError: If the dyna_flow_id is not an integer.
+            ValueError: If an invalid property is provided.
             DynaFlowNotFoundError: If a
                 dyna_flow with the
                 provided dyna_flow_id is not found.
+            StaleDataError: If a dyna_flow does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DynaFlowManager.update_bulk start")
-        updated_dyna_flows = []
-        for update in dyna_flow_updates:
-            dyna_flow_id = update.get(
+        property_list = DynaFlow.property_list()
+        dyna_flow_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dyna_flow_update in dyna_flow_updates:
+            dyna_flow_id = dyna_flow_update.get(
                 "dyna_flow_id")
             if not isinstance(dyna_flow_id, int):
                 raise TypeError(
@@ -552,24 +763,99 @@ class DynaFlowManager:
                 "dyna_flow_id:%s",
                 dyna_flow_id)
 
-            dyna_flow = await self.get_by_id(
+            expected_change_code = dyna_flow_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dyna_flow_update.items():
+                if key in ("dyna_flow_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dyna_flow_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dyna_flow_id)
-
-            if not dyna_flow:
-                raise DynaFlowNotFoundError(
-                    f"DynaFlow with ID "
-                    f"{dyna_flow_id} not found!")
-
-            for key, value in update.items():
-                if key != "dyna_flow_id":
-                    setattr(dyna_flow, key, value)
-
-            dyna_flow.last_update_user_id =\
+            dyna_flow_ids.append(dyna_flow_id)
+
+        unique_ids = list(dict.fromkeys(dyna_flow_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlow._dyna_flow_id, DynaFlow._last_change_code)
+                .where(DynaFlow._dyna_flow_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for dyna_flow_id in chunk:
+                if dyna_flow_id not in change_codes:
+                    raise DynaFlowNotFoundError(
+                        f"DynaFlow with ID "
+                        f"{dyna_flow_id} not found!")
+                change_code = change_codes[dyna_flow_id]
+                expected_change_code = expected_change_codes.get(
+                    dyna_flow_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DynaFlow with ID "
+                        f"{dyna_flow_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DynaFlow, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DynaFlow._last_change_code] = \
+                DynaFlow._last_change_code + 1
+            values[DynaFlow._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DynaFlow._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DynaFlow)
+                    .where(DynaFlow._dyna_flow_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DynaFlow._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DynaFlow rows changed during the update!")
+
+        # reload the rows so dyna_flows already in the
+        # session pick up the new values and last_change_code
+        dyna_flows_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlow)
+                .where(DynaFlow._dyna_flow_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for dyna_flow in result.scalars().all():
+                dyna_flows_by_id[dyna_flow.dyna_flow_id] = dyna_flow
 
-            updated_dyna_flows.append(dyna_flow)
-
-        await self._session_context.session.flush()
+        updated_dyna_flows = [
+            dyna_flows_by_id[dyna_flow_id]
+            for dyna_flow_id in dyna_flow_ids
+        ]
 
         logging.info(
             "DynaFlowManager.update_bulk end")
@@ -581,6 +867,9 @@ class DynaFlowManager:
         """
         Delete multiple dyna_flows
         by their IDs.
+
+        The dyna_flows are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DynaFlowManager.delete_bulk")
@@ -592,19 +881,25 @@ class DynaFlowManager:
                     f"got {type(dyna_flow_id)} instead."
                 )
 
-            dyna_flow = await self.get_by_id(
-                dyna_flow_id)
-            if not dyna_flow:
-                raise DynaFlowNotFoundError(
-                    f"DynaFlow with ID "
-                    f"{dyna_flow_id} not found!"
-                )
-
-            if dyna_flow:
-                await self._session_context.session.delete(
-                    dyna_flow)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(dyna_flow_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlow._dyna_flow_id)
+                .where(DynaFlow._dyna_flow_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for dyna_flow_id in chunk:
+                if dyna_flow_id not in found_ids:
+                    raise DynaFlowNotFoundError(
+                        f"DynaFlow with ID "
+                        f"{dyna_flow_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DynaFlow)
+                .where(DynaFlow._dyna_flow_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -615,9 +910,35 @@ class DynaFlowManager:
         """
         logging.info(
             "DynaFlowManager.count")
-        result = await self._session_context.session.execute(
-            select(DynaFlow))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DynaFlow))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dyna_flows
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DynaFlowManager.count_by")
+        property_list = DynaFlow.property_list()
+        query = select(func.count()).select_from(DynaFlow)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DynaFlow, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +970,14 @@ class DynaFlowManager:
                 f"The dyna_flow_id must be an integer, "
                 f"got {type(dyna_flow_id)} instead."
             )
-        dyna_flow = await self.get_by_id(
-            dyna_flow_id)
-        return bool(dyna_flow)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DynaFlow)
+            .where(DynaFlow._dyna_flow_id == dyna_flow_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ dyna_flow_tasks in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.dyna_flow import DynaFlow  # DynaFlowID
 from models.dyna_flow_task_type import DynaFlowTaskType  # DynaFlowTaskTypeID
@@ -48,6 +50,8 @@ class DynaFlowTaskManager:
     and retrieving dyna_flow_tasks.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class DynaFlowTaskManager:
         else:
             query = dyna_flow_task_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -270,6 +276,183 @@ class DynaFlowTaskManager:
 
         return self._first_or_none(query_results)
 
+    async def claim_for_task_run(
+        self,
+        code_list: List[uuid.UUID],
+        processor_identifier: str,
+        item_count: Optional[int] = None
+    ) -> List[DynaFlowTask]:
+        """
+        Claims the dyna_flow_tasks
+        with the given codes for a task run,
+        with one UPDATE statement per chunk of codes.
+
+        Only dyna_flow_tasks that are not started,
+        completed or canceled are claimed. The claimed
+        dyna_flow_tasks are marked as started by the
+        processor and get the max_retry_count of their
+        dyna_flow_task_type.
+
+        On PostgreSQL, rows locked by another processor
+        are skipped (FOR UPDATE SKIP LOCKED). On other
+        databases the is_started condition of the UPDATE
+        makes sure only one processor claims a row.
+
+        Args:
+            code_list (List[uuid.UUID]): The codes of the
+                dyna_flow_tasks to claim.
+            processor_identifier (str): The identifier of
+                the claiming processor.
+            item_count (Optional[int]): The most
+                dyna_flow_tasks to claim, in the order of the
+                codes. A chunk then takes only as many codes
+                as are left to claim, so a code another
+                processor claimed first is made up by the
+                next codes. None claims them all.
+
+        Returns:
+            List[DynaFlowTask]: The claimed
+                dyna_flow_tasks. Codes that are not found
+                or already claimed are skipped.
+        """
+        logging.info("DynaFlowTaskManager.claim_for_task_run %s",
+                     len(code_list))
+
+        session = self._session_context.session
+        dialect = session.get_bind().dialect
+        claim_utc_date_time = datetime.now(timezone.utc)
+
+        values = {
+            DynaFlowTask._is_started: True,
+            DynaFlowTask._started_utc_date_time: claim_utc_date_time,
+            DynaFlowTask._processor_identifier: processor_identifier,
+            DynaFlowTask._max_retry_count: func.coalesce(
+                select(DynaFlowTaskType._max_retry_count)
+                .where(
+                    DynaFlowTaskType._dyna_flow_task_type_id == DynaFlowTask._dyna_flow_task_type_id)  # noqa: E501
+                .scalar_subquery(),
+                DynaFlowTask._max_retry_count),
+            DynaFlowTask._last_change_code:
+                DynaFlowTask._last_change_code + 1,
+            DynaFlowTask._last_update_user_id:
+                self._session_context.customer_code,
+            DynaFlowTask._last_update_utc_date_time: claim_utc_date_time,
+        }
+
+        unique_codes = list(dict.fromkeys(
+            str(code) for code in code_list))
+
+        claimed_ids = []
+        index = 0
+        while index < len(unique_codes):
+            chunk_size = self._bulk_chunk_size
+            if item_count is not None:
+                chunk_size = min(chunk_size, item_count - len(claimed_ids))
+                if chunk_size <= 0:
+                    break
+            chunk = unique_codes[index:index + chunk_size]
+            index += chunk_size
+            ready_filter = and_(
+                DynaFlowTask._code.in_(chunk),  # type: ignore
+                DynaFlowTask._is_started == False,  # noqa: E712
+                DynaFlowTask._is_completed == False,  # noqa: E712
+                DynaFlowTask._is_canceled == False,  # noqa: E712
+            )
+            if dialect.name == "postgresql":
+                ready_filter = and_(
+                    ready_filter,
+                    DynaFlowTask._dyna_flow_task_id.in_(  # type: ignore
+                        select(DynaFlowTask._dyna_flow_task_id)
+                        .where(ready_filter)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+            query = (
+                update(DynaFlowTask)
+                .where(ready_filter)
+                .values(values)
+                .execution_options(synchronize_session=False)
+            )
+            if dialect.update_returning:
+                result = await session.execute(
+                    query.returning(DynaFlowTask._dyna_flow_task_id))
+                claimed_ids.extend(result.scalars().all())
+            else:
+                await session.execute(query)
+                result = await session.execute(
+                    select(DynaFlowTask._dyna_flow_task_id)
+                    .where(
+                        DynaFlowTask._code.in_(chunk),  # type: ignore
+                        DynaFlowTask._processor_identifier == processor_identifier,  # noqa: E501
+                        DynaFlowTask._started_utc_date_time == claim_utc_date_time)  # noqa: E501
+                )
+                claimed_ids.extend(result.scalars().all())
+
+        if len(claimed_ids) == 0:
+            return []
+
+        # reload the rows so dyna_flow_tasks already in the
+        # session pick up the claim and last_change_code
+        result = await session.execute(
+            select(DynaFlowTask)
+            .where(DynaFlowTask._dyna_flow_task_id.in_(claimed_ids))  # type: ignore # noqa: E501
+            .execution_options(populate_existing=True)
+        )
+        dyna_flow_tasks_by_code = {
+            str(dyna_flow_task.code): dyna_flow_task
+            for dyna_flow_task in result.scalars().all()
+        }
+
+        return [
+            dyna_flow_tasks_by_code[code]
+            for code in unique_codes
+            if code in dyna_flow_tasks_by_code
+        ]
+
+    async def get_parallel_run_allowed_dict(
+        self,
+        code_list: List[uuid.UUID]
+    ) -> Dict[uuid.UUID, bool]:
+        """
+        Returns the is_parallel_run_allowed value of the
+        dyna_flow_tasks with the given codes, with one
+        SELECT statement per chunk of codes, without
+        loading the dyna_flow_tasks.
+
+        Args:
+            code_list (List[uuid.UUID]): The codes of the
+                dyna_flow_tasks.
+
+        Returns:
+            Dict[uuid.UUID, bool]: The is_parallel_run_allowed
+                value by code. Codes that are not found
+                are skipped.
+        """
+        logging.info(
+            "DynaFlowTaskManager.get_parallel_run_allowed_dict %s",
+            len(code_list))
+
+        unique_codes = list(dict.fromkeys(
+            str(code) for code in code_list))
+
+        is_allowed_by_code = {}
+        for index in range(0, len(unique_codes), self._bulk_chunk_size):
+            chunk = unique_codes[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(
+                    DynaFlowTask._code,
+                    DynaFlowTask._is_parallel_run_allowed)
+                .where(DynaFlowTask._code.in_(chunk))  # type: ignore
+            )
+            for code, is_allowed in result.tuples().all():
+                is_allowed_by_code[str(code)] = is_allowed is True
+
+        return {
+            code: is_allowed_by_code[str(code)]
+            for code in code_list
+            if str(code) in is_allowed_by_code
+        }
+
     async def update(
         self,
         dyna_flow_task: DynaFlowTask, **kwargs
@@ -517,6 +700,18 @@ class DynaFlowTaskManager:
         Update multiple dyna_flow_tasks
         with the provided updates.
 
+        Every dyna_flow_task is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dyna_flow_task still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dyna_flow_task_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +723,24 @@ class DynaFlowTaskManager:
 
         Raises:
             TypeError: If the dyna_flow_task_id is not an integer.
+            ValueError: If an invalid property is provided.
             DynaFlowTaskNotFoundError: If a
                 dyna_flow_task with the
                 provided dyna_flow_task_id is not found.
+            StaleDataError: If a dyna_flow_task does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DynaFlowTaskManager.update_bulk start")
-        updated_dyna_flow_tasks = []
-        for update in dyna_flow_task_updates:
-            dyna_flow_task_id = update.get(
+        property_list = DynaFlowTask.property_list()
+        dyna_flow_task_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dyna_flow_task_update in dyna_flow_task_updates:
+            dyna_flow_task_id = dyna_flow_task_update.get(
                 "dyna_flow_task_id")
             if not isinstance(dyna_flow_task_id, int):
                 raise TypeError(
@@ -552,24 +755,99 @@ class DynaFlowTaskManager:
                 "dyna_flow_task_id:%s",
                 dyna_flow_task_id)
 
-            dyna_flow_task = await self.get_by_id(
+            expected_change_code = dyna_flow_task_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dyna_flow_task_update.items():
+                if key in ("dyna_flow_task_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dyna_flow_task_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dyna_flow_task_id)
-
-            if not dyna_flow_task:
-                raise DynaFlowTaskNotFoundError(
-                    f"DynaFlowTask with ID "
-                    f"{dyna_flow_task_id} not found!")
-
-            for key, value in update.items():
-                if key != "dyna_flow_task_id":
-                    setattr(dyna_flow_task, key, value)
-
-            dyna_flow_task.last_update_user_id =\
+            dyna_flow_task_ids.append(dyna_flow_task_id)
+
+        unique_ids = list(dict.fromkeys(dyna_flow_task_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTask._dyna_flow_task_id, DynaFlowTask._last_change_code)  # noqa: E501
+                .where(DynaFlowTask._dyna_flow_task_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for dyna_flow_task_id in chunk:
+                if dyna_flow_task_id not in change_codes:
+                    raise DynaFlowTaskNotFoundError(
+                        f"DynaFlowTask with ID "
+                        f"{dyna_flow_task_id} not found!")
+                change_code = change_codes[dyna_flow_task_id]
+                expected_change_code = expected_change_codes.get(
+                    dyna_flow_task_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DynaFlowTask with ID "
+                        f"{dyna_flow_task_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DynaFlowTask, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DynaFlowTask._last_change_code] = \
+                DynaFlowTask._last_change_code + 1
+            values[DynaFlowTask._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DynaFlowTask._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DynaFlowTask)
+                    .where(DynaFlowTask._dyna_flow_task_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DynaFlowTask._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DynaFlowTask rows changed during the update!")
+
+        # reload the rows so dyna_flow_tasks already in the
+        # session pick up the new values and last_change_code
+        dyna_flow_tasks_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTask)
+                .where(DynaFlowTask._dyna_flow_task_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for dyna_flow_task in result.scalars().all():
+                dyna_flow_tasks_by_id[dyna_flow_task.dyna_flow_task_id] = dyna_flow_task  # noqa: E501
 
-            updated_dyna_flow_tasks.append(dyna_flow_task)
-
-        await self._session_context.session.flush()
+        updated_dyna_flow_tasks = [
+            dyna_flow_tasks_by_id[dyna_flow_task_id]
+            for dyna_flow_task_id in dyna_flow_task_ids
+        ]
 
         logging.info(
             "DynaFlowTaskManager.update_bulk end")
@@ -581,6 +859,9 @@ class DynaFlowTaskManager:
         """
         Delete multiple dyna_flow_tasks
         by their IDs.
+
+        The dyna_flow_tasks are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DynaFlowTaskManager.delete_bulk")
@@ -592,19 +873,25 @@ class DynaFlowTaskManager:
                     f"got {type(dyna_flow_task_id)} instead."
                 )
 
-            dyna_flow_task = await self.get_by_id(
-                dyna_flow_task_id)
-            if not dyna_flow_task:
-                raise DynaFlowTaskNotFoundError(
-                    f"DynaFlowTask with ID "
-                    f"{dyna_flow_task_id} not found!"
-                )
-
-            if dyna_flow_task:
-                await self._session_context.session.delete(
-                    dyna_flow_task)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(dyna_flow_task_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTask._dyna_flow_task_id)
+                .where(DynaFlowTask._dyna_flow_task_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for dyna_flow_task_id in chunk:
+                if dyna_flow_task_id not in found_ids:
+                    raise DynaFlowTaskNotFoundError(
+                        f"DynaFlowTask with ID "
+                        f"{dyna_flow_task_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DynaFlowTask)
+                .where(DynaFlowTask._dyna_flow_task_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -615,9 +902,35 @@ class DynaFlowTaskManager:
         """
         logging.info(
             "DynaFlowTaskManager.count")
-        result = await self._session_context.session.execute(
-            select(DynaFlowTask))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DynaFlowTask))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dyna_flow_tasks
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DynaFlowTaskManager.count_by")
+        property_list = DynaFlowTask.property_list()
+        query = select(func.count()).select_from(DynaFlowTask)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DynaFlowTask, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +962,14 @@ class DynaFlowTaskManager:
                 f"The dyna_flow_task_id must be an integer, "
                 f"got {type(dyna_flow_task_id)} instead."
             )
-        dyna_flow_task = await self.get_by_id(
-            dyna_flow_task_id)
-        return bool(dyna_flow_task)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DynaFlowTask)
+            .where(DynaFlowTask._dyna_flow_task_id == dyna_flow_task_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
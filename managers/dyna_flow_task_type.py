@@ -11,10 +11,14 @@ dyna_flow_task_types in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.dyna_flow_task_type import DynaFlowTaskType
@@ -59,6 +63,8 @@ class DynaFlowTaskTypeManager:
     and retrieving dyna_flow_task_types.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -96,51 +102,63 @@ class DynaFlowTaskTypeManager:
         logging.info("DynaFlowTaskTypeManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(DynaFlowTaskTypeEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(DynaFlowTaskType._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if DynaFlowTaskTypeEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTaskTypeEnum.DYNAFLOWTASKDYNAFLOWCLEANUP) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTaskTypeEnum.DYNAFLOWTASKDYNAFLOWCLEANUP.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Dyna Flow Task Dyna Flow Cleanup"
             item.lookup_enum_name = "DynaFlowTaskDynaFlowCleanup"
             item.description = "Dyna Flow Task Dyna Flow Cleanup"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTaskTypeEnum.PROCESSALLDYNAFLOWTYPESCHEDULETASK) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTaskTypeEnum.PROCESSALLDYNAFLOWTYPESCHEDULETASK.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Process All Scheduled DynaFlowTypes"
             item.lookup_enum_name = "ProcessAllDynaFlowTypeScheduleTask"
             item.description = "Process All Scheduled DynaFlowTypes"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTaskTypeEnum.DYNAFLOWTASKPLANTTASKONE) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTaskTypeEnum.DYNAFLOWTASKPLANTTASKONE.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Dyna Flow Task Plant Task One"
             item.lookup_enum_name = "DynaFlowTaskPlantTaskOne"
             item.description = "Dyna Flow Task Plant Task One"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTaskTypeEnum.DYNAFLOWTASKPLANTTASKTWO) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTaskTypeEnum.DYNAFLOWTASKPLANTTASKTWO.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Dyna Flow Task Plant Task Two"
             item.lookup_enum_name = "DynaFlowTaskPlantTaskTwo"
             item.description = "Dyna Flow Task Plant Task Two"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("DynaFlowTaskTypeManager.Initialize end")
 
     async def from_enum(
@@ -158,10 +176,31 @@ class DynaFlowTaskTypeManager:
                 The DynaFlowTaskType object
                 matching the enum value.
         """
+        dyna_flow_task_type = await LookupCache.get(
+            self._session_context.session,
+            DynaFlowTaskType,
+            enum_val.value)
+        if dyna_flow_task_type is not None:
+            return dyna_flow_task_type
         query_filter = (
             DynaFlowTaskType._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        dyna_flow_task_type = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            dyna_flow_task_type)
+        return dyna_flow_task_type
+
+    async def load_lookup_cache(self):
+        """
+        Loads every DynaFlowTaskType row
+        into the process wide lookup cache.
+        """
+        logging.info("DynaFlowTaskTypeManager.load_lookup_cache")
+        for dyna_flow_task_type in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                dyna_flow_task_type)
 
 
     async def build(self, **kwargs) -> DynaFlowTaskType:
@@ -205,6 +244,7 @@ class DynaFlowTaskTypeManager:
         self._session_context.session.add(
             dyna_flow_task_type)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowTaskType)
         return dyna_flow_task_type
 
     def _build_query(self):
@@ -255,6 +295,8 @@ class DynaFlowTaskTypeManager:
         else:
             query = dyna_flow_task_type_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -381,6 +423,7 @@ class DynaFlowTaskTypeManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(dyna_flow_task_type, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(DynaFlowTaskType)
         return dyna_flow_task_type
 
     async def delete(self, dyna_flow_task_type_id: int):
@@ -417,6 +460,7 @@ class DynaFlowTaskTypeManager:
             dyna_flow_task_type)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowTaskType)
 
     async def get_list(
         self
@@ -588,6 +632,7 @@ class DynaFlowTaskTypeManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(dyna_flow_task_types)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowTaskType)
         return dyna_flow_task_types
 
     async def update_bulk(
@@ -598,6 +643,18 @@ class DynaFlowTaskTypeManager:
         Update multiple dyna_flow_task_types
         with the provided updates.
 
+        Every dyna_flow_task_type is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dyna_flow_task_type still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dyna_flow_task_type_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -609,16 +666,24 @@ class DynaFlowTaskTypeManager:
 
         Raises:
             TypeError: If the dyna_flow_task_type_id is not an integer.
+            ValueError: If an invalid property is provided.
             DynaFlowTaskTypeNotFoundError: If a
                 dyna_flow_task_type with the
                 provided dyna_flow_task_type_id is not found.
+            StaleDataError: If a dyna_flow_task_type does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DynaFlowTaskTypeManager.update_bulk start")
-        updated_dyna_flow_task_types = []
-        for update in dyna_flow_task_type_updates:
-            dyna_flow_task_type_id = update.get(
+        property_list = DynaFlowTaskType.property_list()
+        dyna_flow_task_type_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dyna_flow_task_type_update in dyna_flow_task_type_updates:
+            dyna_flow_task_type_id = dyna_flow_task_type_update.get(
                 "dyna_flow_task_type_id")
             if not isinstance(dyna_flow_task_type_id, int):
                 raise TypeError(
@@ -633,24 +698,101 @@ class DynaFlowTaskTypeManager:
                 "dyna_flow_task_type_id:%s",
                 dyna_flow_task_type_id)
 
-            dyna_flow_task_type = await self.get_by_id(
+            expected_change_code = dyna_flow_task_type_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dyna_flow_task_type_update.items():
+                if key in ("dyna_flow_task_type_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dyna_flow_task_type_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dyna_flow_task_type_id)
-
-            if not dyna_flow_task_type:
-                raise DynaFlowTaskTypeNotFoundError(
-                    f"DynaFlowTaskType with ID "
-                    f"{dyna_flow_task_type_id} not found!")
-
-            for key, value in update.items():
-                if key != "dyna_flow_task_type_id":
-                    setattr(dyna_flow_task_type, key, value)
-
-            dyna_flow_task_type.last_update_user_id =\
+            dyna_flow_task_type_ids.append(dyna_flow_task_type_id)
+
+        unique_ids = list(dict.fromkeys(dyna_flow_task_type_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTaskType._dyna_flow_task_type_id, DynaFlowTaskType._last_change_code)  # noqa: E501
+                .where(DynaFlowTaskType._dyna_flow_task_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for dyna_flow_task_type_id in chunk:
+                if dyna_flow_task_type_id not in change_codes:
+                    raise DynaFlowTaskTypeNotFoundError(
+                        f"DynaFlowTaskType with ID "
+                        f"{dyna_flow_task_type_id} not found!")
+                change_code = change_codes[dyna_flow_task_type_id]
+                expected_change_code = expected_change_codes.get(
+                    dyna_flow_task_type_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DynaFlowTaskType with ID "
+                        f"{dyna_flow_task_type_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DynaFlowTaskType, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DynaFlowTaskType._last_change_code] = \
+                DynaFlowTaskType._last_change_code + 1
+            values[DynaFlowTaskType._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DynaFlowTaskType._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DynaFlowTaskType)
+                    .where(DynaFlowTaskType._dyna_flow_task_type_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DynaFlowTaskType._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DynaFlowTaskType rows changed during the update!")
+
+        # reload the rows so dyna_flow_task_types already in the
+        # session pick up the new values and last_change_code
+        dyna_flow_task_types_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTaskType)
+                .where(DynaFlowTaskType._dyna_flow_task_type_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for dyna_flow_task_type in result.scalars().all():
+                dyna_flow_task_types_by_id[dyna_flow_task_type.dyna_flow_task_type_id] = dyna_flow_task_type  # noqa: E501
 
-            updated_dyna_flow_task_types.append(dyna_flow_task_type)
+        updated_dyna_flow_task_types = [
+            dyna_flow_task_types_by_id[dyna_flow_task_type_id]
+            for dyna_flow_task_type_id in dyna_flow_task_type_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowTaskType)
 
         logging.info(
             "DynaFlowTaskTypeManager.update_bulk end")
@@ -662,6 +804,9 @@ class DynaFlowTaskTypeManager:
         """
         Delete multiple dyna_flow_task_types
         by their IDs.
+
+        The dyna_flow_task_types are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DynaFlowTaskTypeManager.delete_bulk")
@@ -673,19 +818,27 @@ class DynaFlowTaskTypeManager:
                     f"got {type(dyna_flow_task_type_id)} instead."
                 )
 
-            dyna_flow_task_type = await self.get_by_id(
-                dyna_flow_task_type_id)
-            if not dyna_flow_task_type:
-                raise DynaFlowTaskTypeNotFoundError(
-                    f"DynaFlowTaskType with ID "
-                    f"{dyna_flow_task_type_id} not found!"
-                )
-
-            if dyna_flow_task_type:
-                await self._session_context.session.delete(
-                    dyna_flow_task_type)
+        unique_ids = list(dict.fromkeys(dyna_flow_task_type_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTaskType._dyna_flow_task_type_id)
+                .where(DynaFlowTaskType._dyna_flow_task_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for dyna_flow_task_type_id in chunk:
+                if dyna_flow_task_type_id not in found_ids:
+                    raise DynaFlowTaskTypeNotFoundError(
+                        f"DynaFlowTaskType with ID "
+                        f"{dyna_flow_task_type_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DynaFlowTaskType)
+                .where(DynaFlowTaskType._dyna_flow_task_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowTaskType)
 
         return True
 
@@ -696,9 +849,35 @@ class DynaFlowTaskTypeManager:
         """
         logging.info(
             "DynaFlowTaskTypeManager.count")
-        result = await self._session_context.session.execute(
-            select(DynaFlowTaskType))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DynaFlowTaskType))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dyna_flow_task_types
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DynaFlowTaskTypeManager.count_by")
+        property_list = DynaFlowTaskType.property_list()
+        query = select(func.count()).select_from(DynaFlowTaskType)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DynaFlowTaskType, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -730,9 +909,14 @@ class DynaFlowTaskTypeManager:
                 f"The dyna_flow_task_type_id must be an integer, "
                 f"got {type(dyna_flow_task_type_id)} instead."
             )
-        dyna_flow_task_type = await self.get_by_id(
-            dyna_flow_task_type_id)
-        return bool(dyna_flow_task_type)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DynaFlowTaskType)
+            .where(DynaFlowTaskType._dyna_flow_task_type_id == dyna_flow_task_type_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,14 @@ dyna_flow_types in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.dyna_flow_type import DynaFlowType
@@ -57,6 +61,8 @@ class DynaFlowTypeManager:
     and retrieving dyna_flow_types.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -94,33 +100,43 @@ class DynaFlowTypeManager:
         logging.info("DynaFlowTypeManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(DynaFlowTypeEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(DynaFlowType._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if DynaFlowTypeEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTypeEnum.PACPROCESSALLDYNAFLOWTYPESCHEDULEFLOW) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTypeEnum.PACPROCESSALLDYNAFLOWTYPESCHEDULEFLOW.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Pac Process All Dyna Flow Type Schedule Flow"
             item.lookup_enum_name = "PacProcessAllDynaFlowTypeScheduleFlow"
             item.description = "Pac Process All Dyna Flow Type Schedule Flow"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(DynaFlowTypeEnum.PLANTSAMPLEWORKFLOW) \
-                is None:
+            item_list.append(item)
+        if DynaFlowTypeEnum.PLANTSAMPLEWORKFLOW.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Plant Sample Workflow"
             item.lookup_enum_name = "PlantSampleWorkflow"
             item.description = "Plant Sample Workflow"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("DynaFlowTypeManager.Initialize end")
 
     async def from_enum(
@@ -138,10 +154,31 @@ class DynaFlowTypeManager:
                 The DynaFlowType object
                 matching the enum value.
         """
+        dyna_flow_type = await LookupCache.get(
+            self._session_context.session,
+            DynaFlowType,
+            enum_val.value)
+        if dyna_flow_type is not None:
+            return dyna_flow_type
         query_filter = (
             DynaFlowType._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        dyna_flow_type = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            dyna_flow_type)
+        return dyna_flow_type
+
+    async def load_lookup_cache(self):
+        """
+        Loads every DynaFlowType row
+        into the process wide lookup cache.
+        """
+        logging.info("DynaFlowTypeManager.load_lookup_cache")
+        for dyna_flow_type in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                dyna_flow_type)
 
 
     async def build(self, **kwargs) -> DynaFlowType:
@@ -185,6 +222,7 @@ class DynaFlowTypeManager:
         self._session_context.session.add(
             dyna_flow_type)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowType)
         return dyna_flow_type
 
     def _build_query(self):
@@ -235,6 +273,8 @@ class DynaFlowTypeManager:
         else:
             query = dyna_flow_type_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -361,6 +401,7 @@ class DynaFlowTypeManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(dyna_flow_type, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(DynaFlowType)
         return dyna_flow_type
 
     async def delete(self, dyna_flow_type_id: int):
@@ -397,6 +438,7 @@ class DynaFlowTypeManager:
             dyna_flow_type)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowType)
 
     async def get_list(
         self
@@ -568,6 +610,7 @@ class DynaFlowTypeManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(dyna_flow_types)
         await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowType)
         return dyna_flow_types
 
     async def update_bulk(
@@ -578,6 +621,18 @@ class DynaFlowTypeManager:
         Update multiple dyna_flow_types
         with the provided updates.
 
+        Every dyna_flow_type is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dyna_flow_type still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dyna_flow_type_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -589,16 +644,24 @@ class DynaFlowTypeManager:
 
         Raises:
             TypeError: If the dyna_flow_type_id is not an integer.
+            ValueError: If an invalid property is provided.
             DynaFlowTypeNotFoundError: If a
                 dyna_flow_type with the
                 provided dyna_flow_type_id is not found.
+            StaleDataError: If a dyna_flow_type does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DynaFlowTypeManager.update_bulk start")
-        updated_dyna_flow_types = []
-        for update in dyna_flow_type_updates:
-            dyna_flow_type_id = update.get(
+        property_list = DynaFlowType.property_list()
+        dyna_flow_type_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dyna_flow_type_update in dyna_flow_type_updates:
+            dyna_flow_type_id = dyna_flow_type_update.get(
                 "dyna_flow_type_id")
             if not isinstance(dyna_flow_type_id, int):
                 raise TypeError(
@@ -613,24 +676,101 @@ class DynaFlowTypeManager:
                 "dyna_flow_type_id:%s",
                 dyna_flow_type_id)
 
-            dyna_flow_type = await self.get_by_id(
+            expected_change_code = dyna_flow_type_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dyna_flow_type_update.items():
+                if key in ("dyna_flow_type_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dyna_flow_type_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dyna_flow_type_id)
-
-            if not dyna_flow_type:
-                raise DynaFlowTypeNotFoundError(
-                    f"DynaFlowType with ID "
-                    f"{dyna_flow_type_id} not found!")
-
-            for key, value in update.items():
-                if key != "dyna_flow_type_id":
-                    setattr(dyna_flow_type, key, value)
-
-            dyna_flow_type.last_update_user_id =\
+            dyna_flow_type_ids.append(dyna_flow_type_id)
+
+        unique_ids = list(dict.fromkeys(dyna_flow_type_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowType._dyna_flow_type_id, DynaFlowType._last_change_code)  # noqa: E501
+                .where(DynaFlowType._dyna_flow_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for dyna_flow_type_id in chunk:
+                if dyna_flow_type_id not in change_codes:
+                    raise DynaFlowTypeNotFoundError(
+                        f"DynaFlowType with ID "
+                        f"{dyna_flow_type_id} not found!")
+                change_code = change_codes[dyna_flow_type_id]
+                expected_change_code = expected_change_codes.get(
+                    dyna_flow_type_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DynaFlowType with ID "
+                        f"{dyna_flow_type_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DynaFlowType, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DynaFlowType._last_change_code] = \
+                DynaFlowType._last_change_code + 1
+            values[DynaFlowType._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DynaFlowType._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DynaFlowType)
+                    .where(DynaFlowType._dyna_flow_type_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DynaFlowType._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DynaFlowType rows changed during the update!")
+
+        # reload the rows so dyna_flow_types already in the
+        # session pick up the new values and last_change_code
+        dyna_flow_types_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowType)
+                .where(DynaFlowType._dyna_flow_type_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for dyna_flow_type in result.scalars().all():
+                dyna_flow_types_by_id[dyna_flow_type.dyna_flow_type_id] = dyna_flow_type  # noqa: E501
 
-            updated_dyna_flow_types.append(dyna_flow_type)
+        updated_dyna_flow_types = [
+            dyna_flow_types_by_id[dyna_flow_type_id]
+            for dyna_flow_type_id in dyna_flow_type_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowType)
 
         logging.info(
             "DynaFlowTypeManager.update_bulk end")
@@ -642,6 +782,9 @@ class DynaFlowTypeManager:
         """
         Delete multiple dyna_flow_types
         by their IDs.
+
+        The dyna_flow_types are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DynaFlowTypeManager.delete_bulk")
@@ -653,19 +796,27 @@ class DynaFlowTypeManager:
                     f"got {type(dyna_flow_type_id)} instead."
                 )
 
-            dyna_flow_type = await self.get_by_id(
-                dyna_flow_type_id)
-            if not dyna_flow_type:
-                raise DynaFlowTypeNotFoundError(
-                    f"DynaFlowType with ID "
-                    f"{dyna_flow_type_id} not found!"
-                )
-
-            if dyna_flow_type:
-                await self._session_context.session.delete(
-                    dyna_flow_type)
+        unique_ids = list(dict.fromkeys(dyna_flow_type_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowType._dyna_flow_type_id)
+                .where(DynaFlowType._dyna_flow_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for dyna_flow_type_id in chunk:
+                if dyna_flow_type_id not in found_ids:
+                    raise DynaFlowTypeNotFoundError(
+                        f"DynaFlowType with ID "
+                        f"{dyna_flow_type_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DynaFlowType)
+                .where(DynaFlowType._dyna_flow_type_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(DynaFlowType)
 
         return True
 
@@ -676,9 +827,35 @@ class DynaFlowTypeManager:
         """
         logging.info(
             "DynaFlowTypeManager.count")
-        result = await self._session_context.session.execute(
-            select(DynaFlowType))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DynaFlowType))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dyna_flow_types
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DynaFlowTypeManager.count_by")
+        property_list = DynaFlowType.property_list()
+        query = select(func.count()).select_from(DynaFlowType)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DynaFlowType, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -710,9 +887,14 @@ class DynaFlowTypeManager:
                 f"The dyna_flow_type_id must be an integer, "
                 f"got {type(dyna_flow_type_id)} instead."
             )
-        dyna_flow_type = await self.get_by_id(
-            dyna_flow_type_id)
-        return bool(dyna_flow_type)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DynaFlowType)
+            .where(DynaFlowType._dyna_flow_type_id == dyna_flow_type_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
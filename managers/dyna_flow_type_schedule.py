@@ -11,10 +11,12 @@ dyna_flow_type_schedules in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
-from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from typing import Any, List, Optional, Dict, Tuple
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.dyna_flow_type import DynaFlowType  # DynaFlowTypeID
 from models.pac import Pac  # PacID
@@ -48,6 +50,8 @@ class DynaFlowTypeScheduleManager:
     and retrieving dyna_flow_type_schedules.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class DynaFlowTypeScheduleManager:
         else:
             query = dyna_flow_type_schedule_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -270,6 +276,125 @@ class DynaFlowTypeScheduleManager:
 
         return self._first_or_none(query_results)
 
+    async def claim_due(
+        self,
+        due_utc_date_time: datetime,
+        item_count: int = 500
+    ) -> List[DynaFlowTypeSchedule]:
+        """
+        Claims the active dyna_flow_type_schedules
+        whose next_utc_date_time is due, with one
+        UPDATE statement that increments their
+        last_change_code.
+
+        The caller sets the new next_utc_date_time of
+        the claimed schedules in the same transaction.
+        A processor claiming at the same time waits for
+        that transaction and then no longer finds the
+        schedules due. On PostgreSQL, rows locked by
+        another processor are skipped
+        (FOR UPDATE SKIP LOCKED).
+
+        Args:
+            due_utc_date_time (datetime): Schedules with a
+                next_utc_date_time up to this time are due.
+            item_count (int): The maximum number of
+                schedules to claim.
+
+        Returns:
+            List[DynaFlowTypeSchedule]: The claimed
+                dyna_flow_type_schedules, by next_utc_date_time.
+        """
+        logging.info("DynaFlowTypeScheduleManager.claim_due %s",
+                     due_utc_date_time)
+
+        session = self._session_context.session
+        dialect = session.get_bind().dialect
+        claim_utc_date_time = datetime.now(timezone.utc)
+
+        due_filter = and_(
+            DynaFlowTypeSchedule._is_active == True,  # noqa: E712
+            DynaFlowTypeSchedule._next_utc_date_time <= due_utc_date_time,
+        )
+
+        due_id_query = (
+            select(DynaFlowTypeSchedule._dyna_flow_type_schedule_id)
+            .where(due_filter)
+            .order_by(DynaFlowTypeSchedule._next_utc_date_time)
+            .limit(item_count)
+        )
+        if dialect.name == "postgresql":
+            due_id_query = due_id_query.with_for_update(skip_locked=True)
+
+        query = (
+            update(DynaFlowTypeSchedule)
+            .where(
+                due_filter,
+                DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(  # type: ignore # noqa: E501
+                    due_id_query.scalar_subquery()))
+            .values({
+                DynaFlowTypeSchedule._last_change_code:
+                    DynaFlowTypeSchedule._last_change_code + 1,
+                DynaFlowTypeSchedule._last_update_user_id:
+                    self._session_context.customer_code,
+                DynaFlowTypeSchedule._last_update_utc_date_time:
+                    claim_utc_date_time,
+            })
+            .execution_options(synchronize_session=False)
+        )
+
+        if dialect.update_returning:
+            result = await session.execute(
+                query.returning(
+                    DynaFlowTypeSchedule._dyna_flow_type_schedule_id))
+            claimed_ids = result.scalars().all()
+        else:
+            await session.execute(query)
+            result = await session.execute(
+                select(DynaFlowTypeSchedule._dyna_flow_type_schedule_id)
+                .where(
+                    due_filter,
+                    DynaFlowTypeSchedule._last_update_utc_date_time == claim_utc_date_time)  # noqa: E501
+            )
+            claimed_ids = result.scalars().all()
+
+        if len(claimed_ids) == 0:
+            return []
+
+        # reload the rows so schedules already in the
+        # session pick up the new last_change_code
+        result = await session.execute(
+            select(DynaFlowTypeSchedule)
+            .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(  # type: ignore # noqa: E501
+                claimed_ids))
+            .order_by(DynaFlowTypeSchedule._next_utc_date_time)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def get_next_utc_date_time_list(
+        self
+    ) -> List[Tuple[int, datetime]]:
+        """
+        Retrieves the id and next_utc_date_time
+        of the active dyna_flow_type_schedules.
+
+        Returns:
+            List[Tuple[int, datetime]]: The
+                dyna_flow_type_schedule_id and
+                next_utc_date_time of each active schedule.
+        """
+        logging.info(
+            "DynaFlowTypeScheduleManager.get_next_utc_date_time_list")
+
+        result = await self._session_context.session.execute(
+            select(
+                DynaFlowTypeSchedule._dyna_flow_type_schedule_id,
+                DynaFlowTypeSchedule._next_utc_date_time)
+            .where(DynaFlowTypeSchedule._is_active == True)  # noqa: E712
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
     async def update(
         self,
         dyna_flow_type_schedule: DynaFlowTypeSchedule, **kwargs
@@ -517,6 +642,18 @@ class DynaFlowTypeScheduleManager:
         Update multiple dyna_flow_type_schedules
         with the provided updates.
 
+        Every dyna_flow_type_schedule is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        dyna_flow_type_schedule still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             dyna_flow_type_schedule_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +665,24 @@ class DynaFlowTypeScheduleManager:
 
         Raises:
             TypeError: If the dyna_flow_type_schedule_id is not an integer.
+            ValueError: If an invalid property is provided.
             DynaFlowTypeScheduleNotFoundError: If a
                 dyna_flow_type_schedule with the
                 provided dyna_flow_type_schedule_id is not found.
+            StaleDataError: If a dyna_flow_type_schedule does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "DynaFlowTypeScheduleManager.update_bulk start")
-        updated_dyna_flow_type_schedules = []
-        for update in dyna_flow_type_schedule_updates:
-            dyna_flow_type_schedule_id = update.get(
+        property_list = DynaFlowTypeSchedule.property_list()
+        dyna_flow_type_schedule_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for dyna_flow_type_schedule_update in dyna_flow_type_schedule_updates:
+            dyna_flow_type_schedule_id = dyna_flow_type_schedule_update.get(
                 "dyna_flow_type_schedule_id")
             if not isinstance(dyna_flow_type_schedule_id, int):
                 raise TypeError(
@@ -552,24 +697,99 @@ class DynaFlowTypeScheduleManager:
                 "dyna_flow_type_schedule_id:%s",
                 dyna_flow_type_schedule_id)
 
-            dyna_flow_type_schedule = await self.get_by_id(
+            expected_change_code = dyna_flow_type_schedule_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in dyna_flow_type_schedule_update.items():
+                if key in ("dyna_flow_type_schedule_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[dyna_flow_type_schedule_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 dyna_flow_type_schedule_id)
-
-            if not dyna_flow_type_schedule:
-                raise DynaFlowTypeScheduleNotFoundError(
-                    f"DynaFlowTypeSchedule with ID "
-                    f"{dyna_flow_type_schedule_id} not found!")
-
-            for key, value in update.items():
-                if key != "dyna_flow_type_schedule_id":
-                    setattr(dyna_flow_type_schedule, key, value)
-
-            dyna_flow_type_schedule.last_update_user_id =\
+            dyna_flow_type_schedule_ids.append(dyna_flow_type_schedule_id)
+
+        unique_ids = list(dict.fromkeys(dyna_flow_type_schedule_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTypeSchedule._dyna_flow_type_schedule_id, DynaFlowTypeSchedule._last_change_code)  # noqa: E501
+                .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for dyna_flow_type_schedule_id in chunk:
+                if dyna_flow_type_schedule_id not in change_codes:
+                    raise DynaFlowTypeScheduleNotFoundError(
+                        f"DynaFlowTypeSchedule with ID "
+                        f"{dyna_flow_type_schedule_id} not found!")
+                change_code = change_codes[dyna_flow_type_schedule_id]
+                expected_change_code = expected_change_codes.get(
+                    dyna_flow_type_schedule_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"DynaFlowTypeSchedule with ID "
+                        f"{dyna_flow_type_schedule_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(DynaFlowTypeSchedule, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[DynaFlowTypeSchedule._last_change_code] = \
+                DynaFlowTypeSchedule._last_change_code + 1
+            values[DynaFlowTypeSchedule._last_update_user_id] = \
                 self._session_context.customer_code
+            values[DynaFlowTypeSchedule._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(DynaFlowTypeSchedule)
+                    .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        DynaFlowTypeSchedule._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"DynaFlowTypeSchedule rows changed during the update!")  # noqa: E501
+
+        # reload the rows so dyna_flow_type_schedules already in the
+        # session pick up the new values and last_change_code
+        dyna_flow_type_schedules_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTypeSchedule)
+                .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for dyna_flow_type_schedule in result.scalars().all():
+                dyna_flow_type_schedules_by_id[dyna_flow_type_schedule.dyna_flow_type_schedule_id] = dyna_flow_type_schedule  # noqa: E501
 
-            updated_dyna_flow_type_schedules.append(dyna_flow_type_schedule)
-
-        await self._session_context.session.flush()
+        updated_dyna_flow_type_schedules = [
+            dyna_flow_type_schedules_by_id[dyna_flow_type_schedule_id]
+            for dyna_flow_type_schedule_id in dyna_flow_type_schedule_ids
+        ]
 
         logging.info(
             "DynaFlowTypeScheduleManager.update_bulk end")
@@ -581,6 +801,9 @@ class DynaFlowTypeScheduleManager:
         """
         Delete multiple dyna_flow_type_schedules
         by their IDs.
+
+        The dyna_flow_type_schedules are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "DynaFlowTypeScheduleManager.delete_bulk")
@@ -592,19 +815,25 @@ class DynaFlowTypeScheduleManager:
                     f"got {type(dyna_flow_type_schedule_id)} instead."
                 )
 
-            dyna_flow_type_schedule = await self.get_by_id(
-                dyna_flow_type_schedule_id)
-            if not dyna_flow_type_schedule:
-                raise DynaFlowTypeScheduleNotFoundError(
-                    f"DynaFlowTypeSchedule with ID "
-                    f"{dyna_flow_type_schedule_id} not found!"
-                )
-
-            if dyna_flow_type_schedule:
-                await self._session_context.session.delete(
-                    dyna_flow_type_schedule)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(dyna_flow_type_schedule_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(DynaFlowTypeSchedule._dyna_flow_type_schedule_id)
+                .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for dyna_flow_type_schedule_id in chunk:
+                if dyna_flow_type_schedule_id not in found_ids:
+                    raise DynaFlowTypeScheduleNotFoundError(
+                        f"DynaFlowTypeSchedule with ID "
+                        f"{dyna_flow_type_schedule_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(DynaFlowTypeSchedule)
+                .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -615,9 +844,35 @@ class DynaFlowTypeScheduleManager:
         """
         logging.info(
             "DynaFlowTypeScheduleManager.count")
-        result = await self._session_context.session.execute(
-            select(DynaFlowTypeSchedule))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(DynaFlowTypeSchedule))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of dyna_flow_type_schedules
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "DynaFlowTypeScheduleManager.count_by")
+        property_list = DynaFlowTypeSchedule.property_list()
+        query = select(func.count()).select_from(DynaFlowTypeSchedule)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(DynaFlowTypeSchedule, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +904,14 @@ class DynaFlowTypeScheduleManager:
                 f"The dyna_flow_type_schedule_id must be an integer, "
                 f"got {type(dyna_flow_type_schedule_id)} instead."
             )
-        dyna_flow_type_schedule = await self.get_by_id(
-            dyna_flow_type_schedule_id)
-        return bool(dyna_flow_type_schedule)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(DynaFlowTypeSchedule)
+            .where(DynaFlowTypeSchedule._dyna_flow_type_schedule_id == dyna_flow_type_schedule_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ error_logs in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.error_log import ErrorLog
@@ -47,6 +49,8 @@ class ErrorLogManager:
     and retrieving error_logs.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -163,6 +167,8 @@ class ErrorLogManager:
         else:
             query = error_log_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -506,6 +512,18 @@ class ErrorLogManager:
         Update multiple error_logs
         with the provided updates.
 
+        Every error_log is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        error_log still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             error_log_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -517,16 +535,24 @@ class ErrorLogManager:
 
         Raises:
             TypeError: If the error_log_id is not an integer.
+            ValueError: If an invalid property is provided.
             ErrorLogNotFoundError: If a
                 error_log with the
                 provided error_log_id is not found.
+            StaleDataError: If a error_log does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "ErrorLogManager.update_bulk start")
-        updated_error_logs = []
-        for update in error_log_updates:
-            error_log_id = update.get(
+        property_list = ErrorLog.property_list()
+        error_log_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for error_log_update in error_log_updates:
+            error_log_id = error_log_update.get(
                 "error_log_id")
             if not isinstance(error_log_id, int):
                 raise TypeError(
@@ -541,24 +567,99 @@ class ErrorLogManager:
                 "error_log_id:%s",
                 error_log_id)
 
-            error_log = await self.get_by_id(
+            expected_change_code = error_log_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in error_log_update.items():
+                if key in ("error_log_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[error_log_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 error_log_id)
-
-            if not error_log:
-                raise ErrorLogNotFoundError(
-                    f"ErrorLog with ID "
-                    f"{error_log_id} not found!")
-
-            for key, value in update.items():
-                if key != "error_log_id":
-                    setattr(error_log, key, value)
-
-            error_log.last_update_user_id =\
+            error_log_ids.append(error_log_id)
+
+        unique_ids = list(dict.fromkeys(error_log_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(ErrorLog._error_log_id, ErrorLog._last_change_code)
+                .where(ErrorLog._error_log_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for error_log_id in chunk:
+                if error_log_id not in change_codes:
+                    raise ErrorLogNotFoundError(
+                        f"ErrorLog with ID "
+                        f"{error_log_id} not found!")
+                change_code = change_codes[error_log_id]
+                expected_change_code = expected_change_codes.get(
+                    error_log_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"ErrorLog with ID "
+                        f"{error_log_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(ErrorLog, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[ErrorLog._last_change_code] = \
+                ErrorLog._last_change_code + 1
+            values[ErrorLog._last_update_user_id] = \
                 self._session_context.customer_code
+            values[ErrorLog._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(ErrorLog)
+                    .where(ErrorLog._error_log_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        ErrorLog._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"ErrorLog rows changed during the update!")
+
+        # reload the rows so error_logs already in the
+        # session pick up the new values and last_change_code
+        error_logs_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(ErrorLog)
+                .where(ErrorLog._error_log_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for error_log in result.scalars().all():
+                error_logs_by_id[error_log.error_log_id] = error_log
 
-            updated_error_logs.append(error_log)
-
-        await self._session_context.session.flush()
+        updated_error_logs = [
+            error_logs_by_id[error_log_id]
+            for error_log_id in error_log_ids
+        ]
 
         logging.info(
             "ErrorLogManager.update_bulk end")
@@ -570,6 +671,9 @@ class ErrorLogManager:
         """
         Delete multiple error_logs
         by their IDs.
+
+        The error_logs are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "ErrorLogManager.delete_bulk")
@@ -581,19 +685,25 @@ class ErrorLogManager:
                     f"got {type(error_log_id)} instead."
                 )
 
-            error_log = await self.get_by_id(
-                error_log_id)
-            if not error_log:
-                raise ErrorLogNotFoundError(
-                    f"ErrorLog with ID "
-                    f"{error_log_id} not found!"
-                )
-
-            if error_log:
-                await self._session_context.session.delete(
-                    error_log)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(error_log_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(ErrorLog._error_log_id)
+                .where(ErrorLog._error_log_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for error_log_id in chunk:
+                if error_log_id not in found_ids:
+                    raise ErrorLogNotFoundError(
+                        f"ErrorLog with ID "
+                        f"{error_log_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(ErrorLog)
+                .where(ErrorLog._error_log_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -604,9 +714,35 @@ class ErrorLogManager:
         """
         logging.info(
             "ErrorLogManager.count")
-        result = await self._session_context.session.execute(
-            select(ErrorLog))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(ErrorLog))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of error_logs
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "ErrorLogManager.count_by")
+        property_list = ErrorLog.property_list()
+        query = select(func.count()).select_from(ErrorLog)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(ErrorLog, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -638,9 +774,14 @@ class ErrorLogManager:
                 f"The error_log_id must be an integer, "
                 f"got {type(error_log_id)} instead."
             )
-        error_log = await self.get_by_id(
-            error_log_id)
-        return bool(error_log)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(ErrorLog)
+            .where(ErrorLog._error_log_id == error_log_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,14 @@ flavors in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.flavor import Flavor
@@ -57,6 +61,8 @@ class FlavorManager:
     and retrieving flavors.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -94,33 +100,43 @@ class FlavorManager:
         logging.info("FlavorManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(FlavorEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(Flavor._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if FlavorEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Unknown"
             item.lookup_enum_name = "Unknown"
             item.description = "Unknown"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(FlavorEnum.SWEET) \
-                is None:
+            item_list.append(item)
+        if FlavorEnum.SWEET.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Sweet"
             item.lookup_enum_name = "Sweet"
             item.description = "Sweet"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(FlavorEnum.SOUR) \
-                is None:
+            item_list.append(item)
+        if FlavorEnum.SOUR.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Sour"
             item.lookup_enum_name = "Sour"
             item.description = "Sour"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("FlavorManager.Initialize end")
 
     async def from_enum(
@@ -138,10 +154,31 @@ class FlavorManager:
                 The Flavor object
                 matching the enum value.
         """
+        flavor = await LookupCache.get(
+            self._session_context.session,
+            Flavor,
+            enum_val.value)
+        if flavor is not None:
+            return flavor
         query_filter = (
             Flavor._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        flavor = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            flavor)
+        return flavor
+
+    async def load_lookup_cache(self):
+        """
+        Loads every Flavor row
+        into the process wide lookup cache.
+        """
+        logging.info("FlavorManager.load_lookup_cache")
+        for flavor in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                flavor)
 
 
     async def build(self, **kwargs) -> Flavor:
@@ -185,6 +222,7 @@ class FlavorManager:
         self._session_context.session.add(
             flavor)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Flavor)
         return flavor
 
     def _build_query(self):
@@ -235,6 +273,8 @@ class FlavorManager:
         else:
             query = flavor_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -361,6 +401,7 @@ class FlavorManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(flavor, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(Flavor)
         return flavor
 
     async def delete(self, flavor_id: int):
@@ -397,6 +438,7 @@ class FlavorManager:
             flavor)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(Flavor)
 
     async def get_list(
         self
@@ -568,6 +610,7 @@ class FlavorManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(flavors)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Flavor)
         return flavors
 
     async def update_bulk(
@@ -578,6 +621,18 @@ class FlavorManager:
         Update multiple flavors
         with the provided updates.
 
+        Every flavor is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        flavor still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             flavor_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -589,16 +644,24 @@ class FlavorManager:
 
         Raises:
             TypeError: If the flavor_id is not an integer.
+            ValueError: If an invalid property is provided.
             FlavorNotFoundError: If a
                 flavor with the
                 provided flavor_id is not found.
+            StaleDataError: If a flavor does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "FlavorManager.update_bulk start")
-        updated_flavors = []
-        for update in flavor_updates:
-            flavor_id = update.get(
+        property_list = Flavor.property_list()
+        flavor_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for flavor_update in flavor_updates:
+            flavor_id = flavor_update.get(
                 "flavor_id")
             if not isinstance(flavor_id, int):
                 raise TypeError(
@@ -613,24 +676,101 @@ class FlavorManager:
                 "flavor_id:%s",
                 flavor_id)
 
-            flavor = await self.get_by_id(
+            expected_change_code = flavor_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in flavor_update.items():
+                if key in ("flavor_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[flavor_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 flavor_id)
-
-            if not flavor:
-                raise FlavorNotFoundError(
-                    f"Flavor with ID "
-                    f"{flavor_id} not found!")
-
-            for key, value in update.items():
-                if key != "flavor_id":
-                    setattr(flavor, key, value)
-
-            flavor.last_update_user_id =\
+            flavor_ids.append(flavor_id)
+
+        unique_ids = list(dict.fromkeys(flavor_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Flavor._flavor_id, Flavor._last_change_code)
+                .where(Flavor._flavor_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for flavor_id in chunk:
+                if flavor_id not in change_codes:
+                    raise FlavorNotFoundError(
+                        f"Flavor with ID "
+                        f"{flavor_id} not found!")
+                change_code = change_codes[flavor_id]
+                expected_change_code = expected_change_codes.get(
+                    flavor_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Flavor with ID "
+                        f"{flavor_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Flavor, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Flavor._last_change_code] = \
+                Flavor._last_change_code + 1
+            values[Flavor._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Flavor._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Flavor)
+                    .where(Flavor._flavor_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Flavor._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Flavor rows changed during the update!")
+
+        # reload the rows so flavors already in the
+        # session pick up the new values and last_change_code
+        flavors_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Flavor)
+                .where(Flavor._flavor_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for flavor in result.scalars().all():
+                flavors_by_id[flavor.flavor_id] = flavor
 
-            updated_flavors.append(flavor)
+        updated_flavors = [
+            flavors_by_id[flavor_id]
+            for flavor_id in flavor_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Flavor)
 
         logging.info(
             "FlavorManager.update_bulk end")
@@ -642,6 +782,9 @@ class FlavorManager:
         """
         Delete multiple flavors
         by their IDs.
+
+        The flavors are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "FlavorManager.delete_bulk")
@@ -653,19 +796,27 @@ class FlavorManager:
                     f"got {type(flavor_id)} instead."
                 )
 
-            flavor = await self.get_by_id(
-                flavor_id)
-            if not flavor:
-                raise FlavorNotFoundError(
-                    f"Flavor with ID "
-                    f"{flavor_id} not found!"
-                )
-
-            if flavor:
-                await self._session_context.session.delete(
-                    flavor)
+        unique_ids = list(dict.fromkeys(flavor_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Flavor._flavor_id)
+                .where(Flavor._flavor_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for flavor_id in chunk:
+                if flavor_id not in found_ids:
+                    raise FlavorNotFoundError(
+                        f"Flavor with ID "
+                        f"{flavor_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Flavor)
+                .where(Flavor._flavor_id.in_(chunk))  # type: ignore
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Flavor)
 
         return True
 
@@ -676,9 +827,35 @@ class FlavorManager:
         """
         logging.info(
             "FlavorManager.count")
-        result = await self._session_context.session.execute(
-            select(Flavor))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Flavor))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of flavors
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "FlavorManager.count_by")
+        property_list = Flavor.property_list()
+        query = select(func.count()).select_from(Flavor)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Flavor, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -710,9 +887,14 @@ class FlavorManager:
                 f"The flavor_id must be an integer, "
                 f"got {type(flavor_id)} instead."
             )
-        flavor = await self.get_by_id(
-            flavor_id)
-        return bool(flavor)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Flavor)
+            .where(Flavor._flavor_id == flavor_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
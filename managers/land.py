@@ -11,10 +11,13 @@ lands in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.land import Land
@@ -56,6 +59,8 @@ class LandManager:
     and retrieving lands.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -93,24 +98,33 @@ class LandManager:
         logging.info("LandManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(LandEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(Land._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if LandEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Unknown"
             item.lookup_enum_name = "Unknown"
             item.description = "Unknown"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(LandEnum.FIELD_ONE) \
-                is None:
+            item_list.append(item)
+        if LandEnum.FIELD_ONE.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Field One"
             item.lookup_enum_name = "Field_One"
             item.description = "Field One"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("LandManager.Initialize end")
 
     async def from_enum(
@@ -225,6 +239,8 @@ class LandManager:
         else:
             query = land_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -568,6 +584,18 @@ class LandManager:
         Update multiple lands
         with the provided updates.
 
+        Every land is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        land still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             land_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -579,16 +607,24 @@ class LandManager:
 
         Raises:
             TypeError: If the land_id is not an integer.
+            ValueError: If an invalid property is provided.
             LandNotFoundError: If a
                 land with the
                 provided land_id is not found.
+            StaleDataError: If a land does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "LandManager.update_bulk start")
-        updated_lands = []
-        for update in land_updates:
-            land_id = update.get(
+        property_list = Land.property_list()
+        land_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for land_update in land_updates:
+            land_id = land_update.get(
                 "land_id")
             if not isinstance(land_id, int):
                 raise TypeError(
@@ -603,24 +639,99 @@ class LandManager:
                 "land_id:%s",
                 land_id)
 
-            land = await self.get_by_id(
+            expected_change_code = land_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in land_update.items():
+                if key in ("land_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[land_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 land_id)
-
-            if not land:
-                raise LandNotFoundError(
-                    f"Land with ID "
-                    f"{land_id} not found!")
-
-            for key, value in update.items():
-                if key != "land_id":
-                    setattr(land, key, value)
-
-            land.last_update_user_id =\
+            land_ids.append(land_id)
+
+        unique_ids = list(dict.fromkeys(land_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Land._land_id, Land._last_change_code)
+                .where(Land._land_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for land_id in chunk:
+                if land_id not in change_codes:
+                    raise LandNotFoundError(
+                        f"Land with ID "
+                        f"{land_id} not found!")
+                change_code = change_codes[land_id]
+                expected_change_code = expected_change_codes.get(
+                    land_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Land with ID "
+                        f"{land_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Land, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Land._last_change_code] = \
+                Land._last_change_code + 1
+            values[Land._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Land._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Land)
+                    .where(Land._land_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Land._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Land rows changed during the update!")
+
+        # reload the rows so lands already in the
+        # session pick up the new values and last_change_code
+        lands_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Land)
+                .where(Land._land_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for land in result.scalars().all():
+                lands_by_id[land.land_id] = land
 
-            updated_lands.append(land)
-
-        await self._session_context.session.flush()
+        updated_lands = [
+            lands_by_id[land_id]
+            for land_id in land_ids
+        ]
 
         logging.info(
             "LandManager.update_bulk end")
@@ -632,6 +743,9 @@ class LandManager:
         """
         Delete multiple lands
         by their IDs.
+
+        The lands are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "LandManager.delete_bulk")
@@ -643,19 +757,25 @@ class LandManager:
                     f"got {type(land_id)} instead."
                 )
 
-            land = await self.get_by_id(
-                land_id)
-            if not land:
-                raise LandNotFoundError(
-                    f"Land with ID "
-                    f"{land_id} not found!"
-                )
-
-            if land:
-                await self._session_context.session.delete(
-                    land)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(land_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Land._land_id)
+                .where(Land._land_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for land_id in chunk:
+                if land_id not in found_ids:
+                    raise LandNotFoundError(
+                        f"Land with ID "
+                        f"{land_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Land)
+                .where(Land._land_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -666,9 +786,35 @@ class LandManager:
         """
         logging.info(
             "LandManager.count")
-        result = await self._session_context.session.execute(
-            select(Land))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Land))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of lands
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "LandManager.count_by")
+        property_list = Land.property_list()
+        query = select(func.count()).select_from(Land)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Land, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -700,9 +846,14 @@ class LandManager:
                 f"The land_id must be an integer, "
                 f"got {type(land_id)} instead."
             )
-        land = await self.get_by_id(
-            land_id)
-        return bool(land)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Land)
+            .where(Land._land_id == land_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
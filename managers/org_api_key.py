@@ -11,10 +11,12 @@ org_api_keys in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.organization import Organization  # OrganizationID
 from models.org_customer import OrgCustomer  # OrgCustomerID
@@ -48,6 +50,8 @@ class OrgApiKeyManager:
     and retrieving org_api_keys.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class OrgApiKeyManager:
         else:
             query = org_api_key_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -517,6 +523,18 @@ class OrgApiKeyManager:
         Update multiple org_api_keys
         with the provided updates.
 
+        Every org_api_key is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        org_api_key still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             org_api_key_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +546,24 @@ class OrgApiKeyManager:
 
         Raises:
             TypeError: If the org_api_key_id is not an integer.
+            ValueError: If an invalid property is provided.
             OrgApiKeyNotFoundError: If a
                 org_api_key with the
                 provided org_api_key_id is not found.
+            StaleDataError: If a org_api_key does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "OrgApiKeyManager.update_bulk start")
-        updated_org_api_keys = []
-        for update in org_api_key_updates:
-            org_api_key_id = update.get(
+        property_list = OrgApiKey.property_list()
+        org_api_key_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for org_api_key_update in org_api_key_updates:
+            org_api_key_id = org_api_key_update.get(
                 "org_api_key_id")
             if not isinstance(org_api_key_id, int):
                 raise TypeError(
@@ -552,24 +578,99 @@ class OrgApiKeyManager:
                 "org_api_key_id:%s",
                 org_api_key_id)
 
-            org_api_key = await self.get_by_id(
+            expected_change_code = org_api_key_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in org_api_key_update.items():
+                if key in ("org_api_key_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[org_api_key_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 org_api_key_id)
-
-            if not org_api_key:
-                raise OrgApiKeyNotFoundError(
-                    f"OrgApiKey with ID "
-                    f"{org_api_key_id} not found!")
-
-            for key, value in update.items():
-                if key != "org_api_key_id":
-                    setattr(org_api_key, key, value)
-
-            org_api_key.last_update_user_id =\
+            org_api_key_ids.append(org_api_key_id)
+
+        unique_ids = list(dict.fromkeys(org_api_key_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgApiKey._org_api_key_id, OrgApiKey._last_change_code)
+                .where(OrgApiKey._org_api_key_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for org_api_key_id in chunk:
+                if org_api_key_id not in change_codes:
+                    raise OrgApiKeyNotFoundError(
+                        f"OrgApiKey with ID "
+                        f"{org_api_key_id} not found!")
+                change_code = change_codes[org_api_key_id]
+                expected_change_code = expected_change_codes.get(
+                    org_api_key_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"OrgApiKey with ID "
+                        f"{org_api_key_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(OrgApiKey, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[OrgApiKey._last_change_code] = \
+                OrgApiKey._last_change_code + 1
+            values[OrgApiKey._last_update_user_id] = \
                 self._session_context.customer_code
+            values[OrgApiKey._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(OrgApiKey)
+                    .where(OrgApiKey._org_api_key_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        OrgApiKey._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"OrgApiKey rows changed during the update!")
+
+        # reload the rows so org_api_keys already in the
+        # session pick up the new values and last_change_code
+        org_api_keys_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgApiKey)
+                .where(OrgApiKey._org_api_key_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for org_api_key in result.scalars().all():
+                org_api_keys_by_id[org_api_key.org_api_key_id] = org_api_key
 
-            updated_org_api_keys.append(org_api_key)
-
-        await self._session_context.session.flush()
+        updated_org_api_keys = [
+            org_api_keys_by_id[org_api_key_id]
+            for org_api_key_id in org_api_key_ids
+        ]
 
         logging.info(
             "OrgApiKeyManager.update_bulk end")
@@ -581,6 +682,9 @@ class OrgApiKeyManager:
         """
         Delete multiple org_api_keys
         by their IDs.
+
+        The org_api_keys are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "OrgApiKeyManager.delete_bulk")
@@ -592,19 +696,25 @@ class OrgApiKeyManager:
                     f"got {type(org_api_key_id)} instead."
                 )
 
-            org_api_key = await self.get_by_id(
-                org_api_key_id)
-            if not org_api_key:
-                raise OrgApiKeyNotFoundError(
-                    f"OrgApiKey with ID "
-                    f"{org_api_key_id} not found!"
-                )
-
-            if org_api_key:
-                await self._session_context.session.delete(
-                    org_api_key)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(org_api_key_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgApiKey._org_api_key_id)
+                .where(OrgApiKey._org_api_key_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for org_api_key_id in chunk:
+                if org_api_key_id not in found_ids:
+                    raise OrgApiKeyNotFoundError(
+                        f"OrgApiKey with ID "
+                        f"{org_api_key_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(OrgApiKey)
+                .where(OrgApiKey._org_api_key_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -615,9 +725,35 @@ class OrgApiKeyManager:
         """
         logging.info(
             "OrgApiKeyManager.count")
-        result = await self._session_context.session.execute(
-            select(OrgApiKey))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(OrgApiKey))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of org_api_keys
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "OrgApiKeyManager.count_by")
+        property_list = OrgApiKey.property_list()
+        query = select(func.count()).select_from(OrgApiKey)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(OrgApiKey, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +785,14 @@ class OrgApiKeyManager:
                 f"The org_api_key_id must be an integer, "
                 f"got {type(org_api_key_id)} instead."
             )
-        org_api_key = await self.get_by_id(
-            org_api_key_id)
-        return bool(org_api_key)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(OrgApiKey)
+            .where(OrgApiKey._org_api_key_id == org_api_key_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
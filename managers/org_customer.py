@@ -11,10 +11,12 @@ org_customers in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.customer import Customer  # CustomerID
 from models.organization import Organization  # OrganizationID
@@ -48,6 +50,8 @@ class OrgCustomerManager:
     and retrieving org_customers.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -170,6 +174,8 @@ class OrgCustomerManager:
         else:
             query = org_customer_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -517,6 +523,18 @@ class OrgCustomerManager:
         Update multiple org_customers
         with the provided updates.
 
+        Every org_customer is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        org_customer still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             org_customer_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -528,16 +546,24 @@ class OrgCustomerManager:
 
         Raises:
             TypeError: If the org_customer_id is not an integer.
+            ValueError: If an invalid property is provided.
             OrgCustomerNotFoundError: If a
                 org_customer with the
                 provided org_customer_id is not found.
+            StaleDataError: If a org_customer does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "OrgCustomerManager.update_bulk start")
-        updated_org_customers = []
-        for update in org_customer_updates:
-            org_customer_id = update.get(
+        property_list = OrgCustomer.property_list()
+        org_customer_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for org_customer_update in org_customer_updates:
+            org_customer_id = org_customer_update.get(
                 "org_customer_id")
             if not isinstance(org_customer_id, int):
                 raise TypeError(
@@ -552,24 +578,99 @@ class OrgCustomerManager:
                 "org_customer_id:%s",
                 org_customer_id)
 
-            org_customer = await self.get_by_id(
+            expected_change_code = org_customer_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in org_customer_update.items():
+                if key in ("org_customer_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[org_customer_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 org_customer_id)
-
-            if not org_customer:
-                raise OrgCustomerNotFoundError(
-                    f"OrgCustomer with ID "
-                    f"{org_customer_id} not found!")
-
-            for key, value in update.items():
-                if key != "org_customer_id":
-                    setattr(org_customer, key, value)
-
-            org_customer.last_update_user_id =\
+            org_customer_ids.append(org_customer_id)
+
+        unique_ids = list(dict.fromkeys(org_customer_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgCustomer._org_customer_id, OrgCustomer._last_change_code)  # noqa: E501
+                .where(OrgCustomer._org_customer_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for org_customer_id in chunk:
+                if org_customer_id not in change_codes:
+                    raise OrgCustomerNotFoundError(
+                        f"OrgCustomer with ID "
+                        f"{org_customer_id} not found!")
+                change_code = change_codes[org_customer_id]
+                expected_change_code = expected_change_codes.get(
+                    org_customer_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"OrgCustomer with ID "
+                        f"{org_customer_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(OrgCustomer, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[OrgCustomer._last_change_code] = \
+                OrgCustomer._last_change_code + 1
+            values[OrgCustomer._last_update_user_id] = \
                 self._session_context.customer_code
+            values[OrgCustomer._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(OrgCustomer)
+                    .where(OrgCustomer._org_customer_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        OrgCustomer._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"OrgCustomer rows changed during the update!")
+
+        # reload the rows so org_customers already in the
+        # session pick up the new values and last_change_code
+        org_customers_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgCustomer)
+                .where(OrgCustomer._org_customer_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for org_customer in result.scalars().all():
+                org_customers_by_id[org_customer.org_customer_id] = org_customer  # noqa: E501
 
-            updated_org_customers.append(org_customer)
-
-        await self._session_context.session.flush()
+        updated_org_customers = [
+            org_customers_by_id[org_customer_id]
+            for org_customer_id in org_customer_ids
+        ]
 
         logging.info(
             "OrgCustomerManager.update_bulk end")
@@ -581,6 +682,9 @@ class OrgCustomerManager:
         """
         Delete multiple org_customers
         by their IDs.
+
+        The org_customers are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "OrgCustomerManager.delete_bulk")
@@ -592,19 +696,25 @@ class OrgCustomerManager:
                     f"got {type(org_customer_id)} instead."
                 )
 
-            org_customer = await self.get_by_id(
-                org_customer_id)
-            if not org_customer:
-                raise OrgCustomerNotFoundError(
-                    f"OrgCustomer with ID "
-                    f"{org_customer_id} not found!"
-                )
-
-            if org_customer:
-                await self._session_context.session.delete(
-                    org_customer)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(org_customer_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(OrgCustomer._org_customer_id)
+                .where(OrgCustomer._org_customer_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for org_customer_id in chunk:
+                if org_customer_id not in found_ids:
+                    raise OrgCustomerNotFoundError(
+                        f"OrgCustomer with ID "
+                        f"{org_customer_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(OrgCustomer)
+                .where(OrgCustomer._org_customer_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -615,9 +725,35 @@ class OrgCustomerManager:
         """
         logging.info(
             "OrgCustomerManager.count")
-        result = await self._session_context.session.execute(
-            select(OrgCustomer))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(OrgCustomer))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of org_customers
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "OrgCustomerManager.count_by")
+        property_list = OrgCustomer.property_list()
+        query = select(func.count()).select_from(OrgCustomer)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(OrgCustomer, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -649,9 +785,14 @@ class OrgCustomerManager:
                 f"The org_customer_id must be an integer, "
                 f"got {type(org_customer_id)} instead."
             )
-        org_customer = await self.get_by_id(
-            org_customer_id)
-        return bool(org_customer)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(OrgCustomer)
+            .where(OrgCustomer._org_customer_id == org_customer_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,12 @@ organizations in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.tac import Tac  # TacID
 from models.organization import Organization
@@ -47,6 +49,8 @@ class OrganizationManager:
     and retrieving organizations.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -163,6 +167,8 @@ class OrganizationManager:
         else:
             query = organization_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -506,6 +512,18 @@ class OrganizationManager:
         Update multiple organizations
         with the provided updates.
 
+        Every organization is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        organization still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             organization_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -517,16 +535,24 @@ class OrganizationManager:
 
         Raises:
             TypeError: If the organization_id is not an integer.
+            ValueError: If an invalid property is provided.
             OrganizationNotFoundError: If a
                 organization with the
                 provided organization_id is not found.
+            StaleDataError: If a organization does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "OrganizationManager.update_bulk start")
-        updated_organizations = []
-        for update in organization_updates:
-            organization_id = update.get(
+        property_list = Organization.property_list()
+        organization_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for organization_update in organization_updates:
+            organization_id = organization_update.get(
                 "organization_id")
             if not isinstance(organization_id, int):
                 raise TypeError(
@@ -541,24 +567,99 @@ class OrganizationManager:
                 "organization_id:%s",
                 organization_id)
 
-            organization = await self.get_by_id(
+            expected_change_code = organization_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in organization_update.items():
+                if key in ("organization_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[organization_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 organization_id)
-
-            if not organization:
-                raise OrganizationNotFoundError(
-                    f"Organization with ID "
-                    f"{organization_id} not found!")
-
-            for key, value in update.items():
-                if key != "organization_id":
-                    setattr(organization, key, value)
-
-            organization.last_update_user_id =\
+            organization_ids.append(organization_id)
+
+        unique_ids = list(dict.fromkeys(organization_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Organization._organization_id, Organization._last_change_code)  # noqa: E501
+                .where(Organization._organization_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for organization_id in chunk:
+                if organization_id not in change_codes:
+                    raise OrganizationNotFoundError(
+                        f"Organization with ID "
+                        f"{organization_id} not found!")
+                change_code = change_codes[organization_id]
+                expected_change_code = expected_change_codes.get(
+                    organization_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Organization with ID "
+                        f"{organization_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Organization, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Organization._last_change_code] = \
+                Organization._last_change_code + 1
+            values[Organization._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Organization._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Organization)
+                    .where(Organization._organization_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Organization._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Organization rows changed during the update!")
+
+        # reload the rows so organizations already in the
+        # session pick up the new values and last_change_code
+        organizations_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Organization)
+                .where(Organization._organization_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for organization in result.scalars().all():
+                organizations_by_id[organization.organization_id] = organization  # noqa: E501
 
-            updated_organizations.append(organization)
-
-        await self._session_context.session.flush()
+        updated_organizations = [
+            organizations_by_id[organization_id]
+            for organization_id in organization_ids
+        ]
 
         logging.info(
             "OrganizationManager.update_bulk end")
@@ -570,6 +671,9 @@ class OrganizationManager:
         """
         Delete multiple organizations
         by their IDs.
+
+        The organizations are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "OrganizationManager.delete_bulk")
@@ -581,19 +685,25 @@ class OrganizationManager:
                     f"got {type(organization_id)} instead."
                 )
 
-            organization = await self.get_by_id(
-                organization_id)
-            if not organization:
-                raise OrganizationNotFoundError(
-                    f"Organization with ID "
-                    f"{organization_id} not found!"
-                )
-
-            if organization:
-                await self._session_context.session.delete(
-                    organization)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(organization_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Organization._organization_id)
+                .where(Organization._organization_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for organization_id in chunk:
+                if organization_id not in found_ids:
+                    raise OrganizationNotFoundError(
+                        f"Organization with ID "
+                        f"{organization_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Organization)
+                .where(Organization._organization_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
         return True
 
@@ -604,9 +714,35 @@ class OrganizationManager:
         """
         logging.info(
             "OrganizationManager.count")
-        result = await self._session_context.session.execute(
-            select(Organization))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Organization))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of organizations
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "OrganizationManager.count_by")
+        property_list = Organization.property_list()
+        query = select(func.count()).select_from(Organization)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Organization, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -638,9 +774,14 @@ class OrganizationManager:
                 f"The organization_id must be an integer, "
                 f"got {type(organization_id)} instead."
             )
-        organization = await self.get_by_id(
-            organization_id)
-        return bool(organization)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Organization)
+            .where(Organization._organization_id == organization_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,14 @@ pacs in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 
 from models.pac import Pac
@@ -55,6 +59,8 @@ class PacManager:
     and retrieving pacs.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -92,15 +98,23 @@ class PacManager:
         logging.info("PacManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(PacEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(Pac._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if PacEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("PacManager.Initialize end")
 
     async def from_enum(
@@ -118,10 +132,31 @@ class PacManager:
                 The Pac object
                 matching the enum value.
         """
+        pac = await LookupCache.get(
+            self._session_context.session,
+            Pac,
+            enum_val.value)
+        if pac is not None:
+            return pac
         query_filter = (
             Pac._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        pac = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            pac)
+        return pac
+
+    async def load_lookup_cache(self):
+        """
+        Loads every Pac row
+        into the process wide lookup cache.
+        """
+        logging.info("PacManager.load_lookup_cache")
+        for pac in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                pac)
 
 
     async def build(self, **kwargs) -> Pac:
@@ -165,6 +200,7 @@ class PacManager:
         self._session_context.session.add(
             pac)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Pac)
         return pac
 
     def _build_query(self):
@@ -211,6 +247,8 @@ class PacManager:
         else:
             query = pac_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -335,6 +373,7 @@ class PacManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(pac, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(Pac)
         return pac
 
     async def delete(self, pac_id: int):
@@ -371,6 +410,7 @@ class PacManager:
             pac)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(Pac)
 
     async def get_list(
         self
@@ -542,6 +582,7 @@ class PacManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(pacs)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Pac)
         return pacs
 
     async def update_bulk(
@@ -552,6 +593,18 @@ class PacManager:
         Update multiple pacs
         with the provided updates.
 
+        Every pac is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        pac still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             pac_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -563,16 +616,24 @@ class PacManager:
 
         Raises:
             TypeError: If the pac_id is not an integer.
+            ValueError: If an invalid property is provided.
             PacNotFoundError: If a
                 pac with the
                 provided pac_id is not found.
+            StaleDataError: If a pac does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "PacManager.update_bulk start")
-        updated_pacs = []
-        for update in pac_updates:
-            pac_id = update.get(
+        property_list = Pac.property_list()
+        pac_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for pac_update in pac_updates:
+            pac_id = pac_update.get(
                 "pac_id")
             if not isinstance(pac_id, int):
                 raise TypeError(
@@ -587,24 +648,101 @@ class PacManager:
                 "pac_id:%s",
                 pac_id)
 
-            pac = await self.get_by_id(
+            expected_change_code = pac_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in pac_update.items():
+                if key in ("pac_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[pac_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 pac_id)
-
-            if not pac:
-                raise PacNotFoundError(
-                    f"Pac with ID "
-                    f"{pac_id} not found!")
-
-            for key, value in update.items():
-                if key != "pac_id":
-                    setattr(pac, key, value)
-
-            pac.last_update_user_id =\
+            pac_ids.append(pac_id)
+
+        unique_ids = list(dict.fromkeys(pac_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Pac._pac_id, Pac._last_change_code)
+                .where(Pac._pac_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for pac_id in chunk:
+                if pac_id not in change_codes:
+                    raise PacNotFoundError(
+                        f"Pac with ID "
+                        f"{pac_id} not found!")
+                change_code = change_codes[pac_id]
+                expected_change_code = expected_change_codes.get(
+                    pac_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Pac with ID "
+                        f"{pac_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Pac, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Pac._last_change_code] = \
+                Pac._last_change_code + 1
+            values[Pac._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Pac._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Pac)
+                    .where(Pac._pac_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Pac._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Pac rows changed during the update!")
+
+        # reload the rows so pacs already in the
+        # session pick up the new values and last_change_code
+        pacs_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Pac)
+                .where(Pac._pac_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for pac in result.scalars().all():
+                pacs_by_id[pac.pac_id] = pac
 
-            updated_pacs.append(pac)
+        updated_pacs = [
+            pacs_by_id[pac_id]
+            for pac_id in pac_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Pac)
 
         logging.info(
             "PacManager.update_bulk end")
@@ -616,6 +754,9 @@ class PacManager:
         """
         Delete multiple pacs
         by their IDs.
+
+        The pacs are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "PacManager.delete_bulk")
@@ -627,19 +768,27 @@ class PacManager:
                     f"got {type(pac_id)} instead."
                 )
 
-            pac = await self.get_by_id(
-                pac_id)
-            if not pac:
-                raise PacNotFoundError(
-                    f"Pac with ID "
-                    f"{pac_id} not found!"
-                )
-
-            if pac:
-                await self._session_context.session.delete(
-                    pac)
+        unique_ids = list(dict.fromkeys(pac_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Pac._pac_id)
+                .where(Pac._pac_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for pac_id in chunk:
+                if pac_id not in found_ids:
+                    raise PacNotFoundError(
+                        f"Pac with ID "
+                        f"{pac_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Pac)
+                .where(Pac._pac_id.in_(chunk))  # type: ignore
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Pac)
 
         return True
 
@@ -650,9 +799,35 @@ class PacManager:
         """
         logging.info(
             "PacManager.count")
-        result = await self._session_context.session.execute(
-            select(Pac))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Pac))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of pacs
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "PacManager.count_by")
+        property_list = Pac.property_list()
+        query = select(func.count()).select_from(Pac)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Pac, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -684,9 +859,14 @@ class PacManager:
                 f"The pac_id must be an integer, "
                 f"got {type(pac_id)} instead."
             )
-        pac = await self.get_by_id(
-            pac_id)
-        return bool(pac)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Pac)
+            .where(Pac._pac_id == pac_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
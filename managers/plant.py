@@ -11,10 +11,12 @@ plants in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 from helpers.session_context import SessionContext
 from models.flavor import Flavor  # FlvrForeignKeyID
 from models.land import Land  # LandID
@@ -53,6 +55,8 @@ class PlantManager:
     and retrieving plants.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -179,6 +183,8 @@ class PlantManager:
         else:
             query = plant_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -282,6 +288,37 @@ class PlantManager:
 
         return self._first_or_none(query_results)
 
+    async def get_by_code_list(
+        self, code_list: List[uuid.UUID]
+    ) -> List[Plant]:
+        """
+        Retrieves the plants
+        with the given codes, using one query
+        per chunk of codes.
+
+        Args:
+            code_list (List[uuid.UUID]): The codes of the
+                plants to retrieve.
+
+        Returns:
+            List[Plant]: The retrieved
+                plants. Codes that are not
+                found are skipped.
+        """
+        logging.info("PlantManager.get_by_code_list %s",
+                     len(code_list))
+
+        unique_codes = list(dict.fromkeys(
+            str(code) for code in code_list))
+
+        result = []
+        for index in range(0, len(unique_codes), self._bulk_chunk_size):
+            chunk = unique_codes[index:index + self._bulk_chunk_size]
+            query_filter = Plant._code.in_(chunk)  # pylint: disable=protected-access  # noqa: E501
+            result.extend(await self._run_query(query_filter))
+
+        return result
+
     async def update(
         self,
         plant: Plant, **kwargs
@@ -529,6 +566,18 @@ class PlantManager:
         Update multiple plants
         with the provided updates.
 
+        Every plant is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        plant still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             plant_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -540,16 +589,24 @@ class PlantManager:
 
         Raises:
             TypeError: If the plant_id is not an integer.
+            ValueError: If an invalid property is provided.
             PlantNotFoundError: If a
                 plant with the
                 provided plant_id is not found.
+            StaleDataError: If a plant does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "PlantManager.update_bulk start")
-        updated_plants = []
-        for update in plant_updates:
-            plant_id = update.get(
+        property_list = Plant.property_list()
+        plant_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for plant_update in plant_updates:
+            plant_id = plant_update.get(
                 "plant_id")
             if not isinstance(plant_id, int):
                 raise TypeError(
@@ -564,24 +621,99 @@ class PlantManager:
                 "plant_id:%s",
                 plant_id)
 
-            plant = await self.get_by_id(
+            expected_change_code = plant_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in plant_update.items():
+                if key in ("plant_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[plant_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 plant_id)
-
-            if not plant:
-                raise PlantNotFoundError(
-                    f"Plant with ID "
-                    f"{plant_id} not found!")
-
-            for key, value in update.items():
-                if key != "plant_id":
-                    setattr(plant, key, value)
-
-            plant.last_update_user_id =\
+            plant_ids.append(plant_id)
+
+        unique_ids = list(dict.fromkeys(plant_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Plant._plant_id, Plant._last_change_code)
+                .where(Plant._plant_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for plant_id in chunk:
+                if plant_id not in change_codes:
+                    raise PlantNotFoundError(
+                        f"Plant with ID "
+                        f"{plant_id} not found!")
+                change_code = change_codes[plant_id]
+                expected_change_code = expected_change_codes.get(
+                    plant_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Plant with ID "
+                        f"{plant_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Plant, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Plant._last_change_code] = \
+                Plant._last_change_code + 1
+            values[Plant._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Plant._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Plant)
+                    .where(Plant._plant_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Plant._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Plant rows changed during the update!")
+
+        # reload the rows so plants already in the
+        # session pick up the new values and last_change_code
+        plants_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Plant)
+                .where(Plant._plant_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for plant in result.scalars().all():
+                plants_by_id[plant.plant_id] = plant
 
-            updated_plants.append(plant)
-
-        await self._session_context.session.flush()
+        updated_plants = [
+            plants_by_id[plant_id]
+            for plant_id in plant_ids
+        ]
 
         logging.info(
             "PlantManager.update_bulk end")
@@ -593,6 +725,9 @@ class PlantManager:
         """
         Delete multiple plants
         by their IDs.
+
+        The plants are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "PlantManager.delete_bulk")
@@ -604,19 +739,25 @@ class PlantManager:
                     f"got {type(plant_id)} instead."
                 )
 
-            plant = await self.get_by_id(
-                plant_id)
-            if not plant:
-                raise PlantNotFoundError(
-                    f"Plant with ID "
-                    f"{plant_id} not found!"
-                )
-
-            if plant:
-                await self._session_context.session.delete(
-                    plant)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(plant_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Plant._plant_id)
+                .where(Plant._plant_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for plant_id in chunk:
+                if plant_id not in found_ids:
+                    raise PlantNotFoundError(
+                        f"Plant with ID "
+                        f"{plant_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Plant)
+                .where(Plant._plant_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -627,9 +768,35 @@ class PlantManager:
         """
         logging.info(
             "PlantManager.count")
-        result = await self._session_context.session.execute(
-            select(Plant))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Plant))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of plants
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "PlantManager.count_by")
+        property_list = Plant.property_list()
+        query = select(func.count()).select_from(Plant)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Plant, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -661,9 +828,14 @@ class PlantManager:
                 f"The plant_id must be an integer, "
                 f"got {type(plant_id)} instead."
             )
-        plant = await self.get_by_id(
-            plant_id)
-        return bool(plant)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Plant)
+            .where(Plant._plant_id == plant_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -11,10 +11,14 @@ roles in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.role import Role
@@ -58,6 +62,8 @@ class RoleManager:
     and retrieving roles.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -95,42 +101,53 @@ class RoleManager:
         logging.info("RoleManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(RoleEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(Role._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if RoleEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(RoleEnum.ADMIN) \
-                is None:
+            item_list.append(item)
+        if RoleEnum.ADMIN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Admin"
             item.lookup_enum_name = "Admin"
             item.description = "Admin"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(RoleEnum.CONFIG) \
-                is None:
+            item_list.append(item)
+        if RoleEnum.CONFIG.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Config"
             item.lookup_enum_name = "Config"
             item.description = "Config"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(RoleEnum.USER) \
-                is None:
+            item_list.append(item)
+        if RoleEnum.USER.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "User"
             item.lookup_enum_name = "User"
             item.description = "User"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("RoleManager.Initialize end")
 
     async def from_enum(
@@ -148,10 +165,31 @@ class RoleManager:
                 The Role object
                 matching the enum value.
         """
+        role = await LookupCache.get(
+            self._session_context.session,
+            Role,
+            enum_val.value)
+        if role is not None:
+            return role
         query_filter = (
             Role._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        role = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            role)
+        return role
+
+    async def load_lookup_cache(self):
+        """
+        Loads every Role row
+        into the process wide lookup cache.
+        """
+        logging.info("RoleManager.load_lookup_cache")
+        for role in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                role)
 
 
     async def build(self, **kwargs) -> Role:
@@ -195,6 +233,7 @@ class RoleManager:
         self._session_context.session.add(
             role)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Role)
         return role
 
     def _build_query(self):
@@ -245,6 +284,8 @@ class RoleManager:
         else:
             query = role_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -371,6 +412,7 @@ class RoleManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(role, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(Role)
         return role
 
     async def delete(self, role_id: int):
@@ -407,6 +449,7 @@ class RoleManager:
             role)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(Role)
 
     async def get_list(
         self
@@ -578,6 +621,7 @@ class RoleManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(roles)
         await self._session_context.session.flush()
+        LookupCache.invalidate(Role)
         return roles
 
     async def update_bulk(
@@ -588,6 +632,18 @@ class RoleManager:
         Update multiple roles
         with the provided updates.
 
+        Every role is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        role still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             role_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -599,16 +655,24 @@ class RoleManager:
 
         Raises:
             TypeError: If the role_id is not an integer.
+            ValueError: If an invalid property is provided.
             RoleNotFoundError: If a
                 role with the
                 provided role_id is not found.
+            StaleDataError: If a role does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "RoleManager.update_bulk start")
-        updated_roles = []
-        for update in role_updates:
-            role_id = update.get(
+        property_list = Role.property_list()
+        role_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for role_update in role_updates:
+            role_id = role_update.get(
                 "role_id")
             if not isinstance(role_id, int):
                 raise TypeError(
@@ -623,24 +687,101 @@ class RoleManager:
                 "role_id:%s",
                 role_id)
 
-            role = await self.get_by_id(
+            expected_change_code = role_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in role_update.items():
+                if key in ("role_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[role_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 role_id)
-
-            if not role:
-                raise RoleNotFoundError(
-                    f"Role with ID "
-                    f"{role_id} not found!")
-
-            for key, value in update.items():
-                if key != "role_id":
-                    setattr(role, key, value)
-
-            role.last_update_user_id =\
+            role_ids.append(role_id)
+
+        unique_ids = list(dict.fromkeys(role_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Role._role_id, Role._last_change_code)
+                .where(Role._role_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for role_id in chunk:
+                if role_id not in change_codes:
+                    raise RoleNotFoundError(
+                        f"Role with ID "
+                        f"{role_id} not found!")
+                change_code = change_codes[role_id]
+                expected_change_code = expected_change_codes.get(
+                    role_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Role with ID "
+                        f"{role_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Role, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Role._last_change_code] = \
+                Role._last_change_code + 1
+            values[Role._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Role._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Role)
+                    .where(Role._role_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Role._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Role rows changed during the update!")
+
+        # reload the rows so roles already in the
+        # session pick up the new values and last_change_code
+        roles_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Role)
+                .where(Role._role_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for role in result.scalars().all():
+                roles_by_id[role.role_id] = role
 
-            updated_roles.append(role)
+        updated_roles = [
+            roles_by_id[role_id]
+            for role_id in role_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Role)
 
         logging.info(
             "RoleManager.update_bulk end")
@@ -652,6 +793,9 @@ class RoleManager:
         """
         Delete multiple roles
         by their IDs.
+
+        The roles are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "RoleManager.delete_bulk")
@@ -663,19 +807,27 @@ class RoleManager:
                     f"got {type(role_id)} instead."
                 )
 
-            role = await self.get_by_id(
-                role_id)
-            if not role:
-                raise RoleNotFoundError(
-                    f"Role with ID "
-                    f"{role_id} not found!"
-                )
-
-            if role:
-                await self._session_context.session.delete(
-                    role)
+        unique_ids = list(dict.fromkeys(role_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Role._role_id)
+                .where(Role._role_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for role_id in chunk:
+                if role_id not in found_ids:
+                    raise RoleNotFoundError(
+                        f"Role with ID "
+                        f"{role_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Role)
+                .where(Role._role_id.in_(chunk))  # type: ignore
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(Role)
 
         return True
 
@@ -686,9 +838,35 @@ class RoleManager:
         """
         logging.info(
             "RoleManager.count")
-        result = await self._session_context.session.execute(
-            select(Role))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Role))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of roles
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "RoleManager.count_by")
+        property_list = Role.property_list()
+        query = select(func.count()).select_from(Role)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Role, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -720,9 +898,14 @@ class RoleManager:
                 f"The role_id must be an integer, "
                 f"got {type(role_id)} instead."
             )
-        role = await self.get_by_id(
-            role_id)
-        return bool(role)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Role)
+            .where(Role._role_id == role_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
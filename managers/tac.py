@@ -11,10 +11,13 @@ tacs in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.tac import Tac
@@ -56,6 +59,8 @@ class TacManager:
     and retrieving tacs.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -93,24 +98,33 @@ class TacManager:
         logging.info("TacManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(TacEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(Tac._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if TacEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(TacEnum.PRIMARY) \
-                is None:
+            item_list.append(item)
+        if TacEnum.PRIMARY.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Primary"
             item.lookup_enum_name = "Primary"
             item.description = "Primary"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("TacManager.Initialize end")
 
     async def from_enum(
@@ -225,6 +239,8 @@ class TacManager:
         else:
             query = tac_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -568,6 +584,18 @@ class TacManager:
         Update multiple tacs
         with the provided updates.
 
+        Every tac is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        tac still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             tac_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -579,16 +607,24 @@ class TacManager:
 
         Raises:
             TypeError: If the tac_id is not an integer.
+            ValueError: If an invalid property is provided.
             TacNotFoundError: If a
                 tac with the
                 provided tac_id is not found.
+            StaleDataError: If a tac does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "TacManager.update_bulk start")
-        updated_tacs = []
-        for update in tac_updates:
-            tac_id = update.get(
+        property_list = Tac.property_list()
+        tac_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for tac_update in tac_updates:
+            tac_id = tac_update.get(
                 "tac_id")
             if not isinstance(tac_id, int):
                 raise TypeError(
@@ -603,24 +639,99 @@ class TacManager:
                 "tac_id:%s",
                 tac_id)
 
-            tac = await self.get_by_id(
+            expected_change_code = tac_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in tac_update.items():
+                if key in ("tac_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[tac_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 tac_id)
-
-            if not tac:
-                raise TacNotFoundError(
-                    f"Tac with ID "
-                    f"{tac_id} not found!")
-
-            for key, value in update.items():
-                if key != "tac_id":
-                    setattr(tac, key, value)
-
-            tac.last_update_user_id =\
+            tac_ids.append(tac_id)
+
+        unique_ids = list(dict.fromkeys(tac_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Tac._tac_id, Tac._last_change_code)
+                .where(Tac._tac_id.in_(chunk))  # type: ignore
+            )
+            change_codes = dict(result.tuples().all())
+            for tac_id in chunk:
+                if tac_id not in change_codes:
+                    raise TacNotFoundError(
+                        f"Tac with ID "
+                        f"{tac_id} not found!")
+                change_code = change_codes[tac_id]
+                expected_change_code = expected_change_codes.get(
+                    tac_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"Tac with ID "
+                        f"{tac_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(Tac, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[Tac._last_change_code] = \
+                Tac._last_change_code + 1
+            values[Tac._last_update_user_id] = \
                 self._session_context.customer_code
+            values[Tac._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(Tac)
+                    .where(Tac._tac_id.in_(chunk))  # type: ignore
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        Tac._last_change_code == expected_change_code)
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"Tac rows changed during the update!")
+
+        # reload the rows so tacs already in the
+        # session pick up the new values and last_change_code
+        tacs_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Tac)
+                .where(Tac._tac_id.in_(chunk))  # type: ignore
+                .execution_options(populate_existing=True)
+            )
+            for tac in result.scalars().all():
+                tacs_by_id[tac.tac_id] = tac
 
-            updated_tacs.append(tac)
-
-        await self._session_context.session.flush()
+        updated_tacs = [
+            tacs_by_id[tac_id]
+            for tac_id in tac_ids
+        ]
 
         logging.info(
             "TacManager.update_bulk end")
@@ -632,6 +743,9 @@ class TacManager:
         """
         Delete multiple tacs
         by their IDs.
+
+        The tacs are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "TacManager.delete_bulk")
@@ -643,19 +757,25 @@ class TacManager:
                     f"got {type(tac_id)} instead."
                 )
 
-            tac = await self.get_by_id(
-                tac_id)
-            if not tac:
-                raise TacNotFoundError(
-                    f"Tac with ID "
-                    f"{tac_id} not found!"
-                )
-
-            if tac:
-                await self._session_context.session.delete(
-                    tac)
-
-        await self._session_context.session.flush()
+        unique_ids = list(dict.fromkeys(tac_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(Tac._tac_id)
+                .where(Tac._tac_id.in_(chunk))  # type: ignore
+            )
+            found_ids = set(result.scalars().all())
+            for tac_id in chunk:
+                if tac_id not in found_ids:
+                    raise TacNotFoundError(
+                        f"Tac with ID "
+                        f"{tac_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(Tac)
+                .where(Tac._tac_id.in_(chunk))  # type: ignore
+            )
 
         return True
 
@@ -666,9 +786,35 @@ class TacManager:
         """
         logging.info(
             "TacManager.count")
-        result = await self._session_context.session.execute(
-            select(Tac))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(Tac))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of tacs
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "TacManager.count_by")
+        property_list = Tac.property_list()
+        query = select(func.count()).select_from(Tac)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(Tac, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -700,9 +846,14 @@ class TacManager:
                 f"The tac_id must be an integer, "
                 f"got {type(tac_id)} instead."
             )
-        tac = await self.get_by_id(
-            tac_id)
-        return bool(tac)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(Tac)
+            .where(Tac._tac_id == tac_id)  # type: ignore
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
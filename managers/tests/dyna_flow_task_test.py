@@ -17,7 +17,7 @@ from sqlalchemy.future import select
 import pytest
 from helpers.session_context import SessionContext
 from managers.dyna_flow_task import DynaFlowTaskManager
-from models import DynaFlowTask
+from models import DynaFlowTask, DynaFlowTaskType
 from models.factory import DynaFlowTaskFactory
 from models.serialization_schema.dyna_flow_task import DynaFlowTaskSchema
 
@@ -922,3 +922,128 @@ class TestDynaFlowTaskManager:
             await obj_manager.exists(invalid_id)  # type: ignore  # noqa: E501
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_claim_for_task_run(
+        self,
+        obj_manager: DynaFlowTaskManager,
+        session: AsyncSession
+    ):
+        """
+        Test that claim_for_task_run claims only the
+        ready dyna_flow_tasks, stamps them for the
+        processor and does not claim them twice.
+        """
+        ready_list = [
+            await DynaFlowTaskFactory.create_async(session)
+            for _ in range(2)
+        ]
+        started = await DynaFlowTaskFactory.create_async(session)
+
+        for dyna_flow_task in ready_list:
+            dyna_flow_task.is_started = False
+            dyna_flow_task.is_completed = False
+            dyna_flow_task.is_canceled = False
+        started.is_started = True
+        await session.flush()
+
+        last_change_code_list = [
+            dyna_flow_task.last_change_code
+            for dyna_flow_task in ready_list
+        ]
+
+        code_list = [dyna_flow_task.code for dyna_flow_task in ready_list]
+        code_list.append(started.code)
+
+        claimed_list = await obj_manager.claim_for_task_run(
+            code_list,
+            "processor-1")
+
+        assert [x.code for x in claimed_list] == \
+            [x.code for x in ready_list]
+
+        for claimed, last_change_code in zip(
+                claimed_list, last_change_code_list):
+            result = await session.execute(
+                select(DynaFlowTaskType).filter(
+                    DynaFlowTaskType._dyna_flow_task_type_id == claimed.dyna_flow_task_type_id))  # noqa: E501
+            dyna_flow_task_type = result.scalars().one()
+
+            assert claimed.is_started is True
+            assert claimed.processor_identifier == "processor-1"
+            assert claimed.max_retry_count == \
+                dyna_flow_task_type.max_retry_count
+            assert claimed.last_change_code == last_change_code + 1
+            assert claimed.last_update_user_id == \
+                obj_manager._session_context.customer_code
+
+        assert started.processor_identifier != "processor-1"
+
+        assert await obj_manager.claim_for_task_run(
+            [dyna_flow_task.code for dyna_flow_task in ready_list],
+            "processor-2") == []
+
+    @pytest.mark.asyncio
+    async def test_claim_for_task_run_item_count(
+        self,
+        obj_manager: DynaFlowTaskManager,
+        session: AsyncSession
+    ):
+        """
+        Test that claim_for_task_run with an item_count claims
+        at most that many dyna_flow_tasks in the order of the
+        codes, and makes up a started one with the next code.
+        """
+        dyna_flow_task_list = [
+            await DynaFlowTaskFactory.create_async(session)
+            for _ in range(4)
+        ]
+        for dyna_flow_task in dyna_flow_task_list:
+            dyna_flow_task.is_started = False
+            dyna_flow_task.is_completed = False
+            dyna_flow_task.is_canceled = False
+        dyna_flow_task_list[1].is_started = True
+        await session.flush()
+
+        code_list = [x.code for x in dyna_flow_task_list]
+
+        claimed_list = await obj_manager.claim_for_task_run(
+            code_list,
+            "processor-1",
+            item_count=2)
+
+        assert [x.code for x in claimed_list] == \
+            [code_list[0], code_list[2]]
+
+        claimed_list = await obj_manager.claim_for_task_run(
+            code_list,
+            "processor-1",
+            item_count=2)
+
+        assert [x.code for x in claimed_list] == [code_list[3]]
+
+    @pytest.mark.asyncio
+    async def test_get_parallel_run_allowed_dict(
+        self,
+        obj_manager: DynaFlowTaskManager,
+        session: AsyncSession
+    ):
+        """
+        Test that get_parallel_run_allowed_dict returns the
+        is_parallel_run_allowed value by code, skips the codes
+        that are not found and claims nothing.
+        """
+        parallel = await DynaFlowTaskFactory.create_async(session)
+        serial = await DynaFlowTaskFactory.create_async(session)
+        parallel.is_parallel_run_allowed = True
+        serial.is_parallel_run_allowed = False
+        serial.is_started = False
+        await session.flush()
+
+        missing_code = uuid.uuid4()
+
+        result = await obj_manager.get_parallel_run_allowed_dict(
+            [serial.code, parallel.code, missing_code])
+
+        assert result == {serial.code: False, parallel.code: True}
+        assert serial.is_started is False
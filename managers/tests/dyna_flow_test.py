@@ -8,6 +8,7 @@
 """
 
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from typing import List
 
 import pytest_asyncio
@@ -17,7 +18,7 @@ from sqlalchemy.future import select
 import pytest
 from helpers.session_context import SessionContext
 from managers.dyna_flow import DynaFlowManager
-from models import DynaFlow
+from models import DynaFlow, DynaFlowType
 from models.factory import DynaFlowFactory
 from models.serialization_schema.dyna_flow import DynaFlowSchema
 
@@ -922,3 +923,112 @@ class TestDynaFlowManager:
             await obj_manager.exists(invalid_id)  # type: ignore  # noqa: E501
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_claim_for_task_build(
+        self,
+        obj_manager: DynaFlowManager,
+        session: AsyncSession
+    ):
+        """
+        Test that claim_for_task_build claims only the
+        dyna_flows whose task creation is not started,
+        stamps them for the processor and does not
+        claim them twice.
+        """
+        ready = await DynaFlowFactory.create_async(session)
+        started = await DynaFlowFactory.create_async(session)
+
+        ready.is_task_creation_started = False
+        started.is_task_creation_started = True
+        await session.flush()
+
+        last_change_code = ready.last_change_code
+
+        claimed_list = await obj_manager.claim_for_task_build(
+            [ready.code, started.code],
+            "processor-1")
+
+        assert [x.code for x in claimed_list] == [ready.code]
+
+        result = await session.execute(
+            select(DynaFlowType).filter(
+                DynaFlowType._dyna_flow_type_id == ready.dyna_flow_type_id))
+        dyna_flow_type = result.scalars().one()
+
+        claimed = claimed_list[0]
+        assert claimed.is_task_creation_started is True
+        assert claimed.task_creation_processor_identifier == "processor-1"
+        assert claimed.priority_level == dyna_flow_type.priority_level
+        assert claimed.last_change_code == last_change_code + 1
+
+        assert started.task_creation_processor_identifier != "processor-1"
+
+        assert await obj_manager.claim_for_task_build(
+            [ready.code],
+            "processor-2") == []
+
+    @pytest.mark.asyncio
+    async def test_claim_for_task_build_item_count(
+        self,
+        obj_manager: DynaFlowManager,
+        session: AsyncSession
+    ):
+        """
+        Test that claim_for_task_build with an item_count
+        claims at most that many dyna_flows in the order of
+        the codes, and makes up a started one with the
+        next code.
+        """
+        dyna_flow_list = [
+            await DynaFlowFactory.create_async(session)
+            for _ in range(3)
+        ]
+        for dyna_flow in dyna_flow_list:
+            dyna_flow.is_task_creation_started = False
+        dyna_flow_list[0].is_task_creation_started = True
+        await session.flush()
+
+        code_list = [x.code for x in dyna_flow_list]
+
+        claimed_list = await obj_manager.claim_for_task_build(
+            code_list,
+            "processor-1",
+            item_count=1)
+
+        assert [x.code for x in claimed_list] == [code_list[1]]
+
+    @pytest.mark.asyncio
+    async def test_mark_started(
+        self,
+        obj_manager: DynaFlowManager,
+        session: AsyncSession
+    ):
+        """
+        Test that mark_started marks a dyna_flow that is
+        not started once, and that a second mark, as by a
+        parallel task of the same dyna_flow, neither
+        updates it nor raises.
+        """
+        dyna_flow = await DynaFlowFactory.create_async(session)
+        dyna_flow.is_started = False
+        await session.flush()
+
+        last_change_code = dyna_flow.last_change_code
+        started_utc_date_time = datetime.now(timezone.utc)
+
+        assert await obj_manager.mark_started(
+            dyna_flow.dyna_flow_id, started_utc_date_time) is True
+        assert await obj_manager.mark_started(
+            dyna_flow.dyna_flow_id, datetime.now(timezone.utc)) is False
+
+        await session.refresh(dyna_flow)
+
+        assert dyna_flow.is_started is True
+        assert dyna_flow.started_utc_date_time.replace(tzinfo=None) == \
+            started_utc_date_time.replace(tzinfo=None)
+        assert dyna_flow.last_change_code == last_change_code + 1
+
+        with pytest.raises(TypeError):
+            await obj_manager.mark_started(
+                "1", datetime.now(timezone.utc))  # type: ignore
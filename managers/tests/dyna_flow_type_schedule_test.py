@@ -8,6 +8,7 @@
 """
 
 import uuid  # noqa: F401
+from datetime import datetime, timedelta, timezone
 from typing import List
 
 import pytest_asyncio
@@ -922,3 +923,48 @@ class TestDynaFlowTypeScheduleManager:
             await obj_manager.exists(invalid_id)  # type: ignore  # noqa: E501
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_claim_due(
+        self,
+        obj_manager: DynaFlowTypeScheduleManager,
+        session: AsyncSession
+    ):
+        """
+        Test that claim_due claims only the active
+        dyna_flow_type_schedules whose next_utc_date_time
+        is due, ordered by next_utc_date_time.
+        """
+        now = datetime.now(timezone.utc)
+
+        due_late = await DynaFlowTypeScheduleFactory.create_async(session)
+        due_early = await DynaFlowTypeScheduleFactory.create_async(session)
+        not_due = await DynaFlowTypeScheduleFactory.create_async(session)
+        inactive = await DynaFlowTypeScheduleFactory.create_async(session)
+
+        due_late.is_active = True
+        due_late.next_utc_date_time = now - timedelta(minutes=1)
+        due_early.is_active = True
+        due_early.next_utc_date_time = now - timedelta(hours=1)
+        not_due.is_active = True
+        not_due.next_utc_date_time = now + timedelta(hours=1)
+        inactive.is_active = False
+        inactive.next_utc_date_time = now - timedelta(hours=1)
+        await session.flush()
+
+        last_change_code = due_late.last_change_code
+
+        claimed_list = await obj_manager.claim_due(now)
+
+        assert [x.code for x in claimed_list] == [
+            due_early.code, due_late.code]
+        assert due_late.last_change_code == last_change_code + 1
+
+        assert [x.code for x in await obj_manager.claim_due(now, 1)] == [
+            due_early.code]
+
+        next_list = await obj_manager.get_next_utc_date_time_list()
+
+        next_ids = [x[0] for x in next_list]
+        assert not_due.dyna_flow_type_schedule_id in next_ids
+        assert inactive.dyna_flow_type_schedule_id not in next_ids
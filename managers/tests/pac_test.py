@@ -8,15 +8,17 @@
 """
 
 import uuid  # noqa: F401
+from unittest.mock import AsyncMock, patch
 from typing import List
 
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.future import select
 
 import pytest
+from helpers.lookup_cache import LookupCache
 from helpers.session_context import SessionContext
-from managers.pac import PacManager
+from managers.pac import PacEnum, PacManager
 from models import Pac
 from models.factory import PacFactory
 from models.serialization_schema.pac import PacSchema
@@ -922,3 +924,131 @@ class TestPacManager:
             await obj_manager.exists(invalid_id)  # type: ignore  # noqa: E501
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_from_enum_uses_lookup_cache(
+        self,
+        obj_manager: PacManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to check that from_enum returns the
+        cached row without querying the database and
+        that writes invalidate the cache.
+        """
+        await obj_manager.initialize()
+        await obj_manager.load_lookup_cache()
+
+        pac = await obj_manager.from_enum(PacEnum.UNKNOWN)
+        assert pac is not None
+
+        with patch.object(
+                obj_manager, "_run_query",
+                new_callable=AsyncMock) as mock_run_query:
+            cached_pac = await obj_manager.from_enum(
+                PacEnum.UNKNOWN)
+            mock_run_query.assert_not_called()
+
+        assert cached_pac is pac
+        assert cached_pac.pac_id == pac.pac_id
+
+        await obj_manager.update(pac, description="Updated")
+
+        with patch.object(
+                obj_manager, "_run_query",
+                wraps=obj_manager._run_query) as mock_run_query:
+            reloaded_pac = await obj_manager.from_enum(
+                PacEnum.UNKNOWN)
+            mock_run_query.assert_called_once()
+
+        assert reloaded_pac.description == "Updated"
+
+    @pytest.mark.asyncio
+    async def test_from_enum_cache_in_new_session(
+        self,
+        obj_manager: PacManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to check that a cached row is merged into
+        another session as a separate instance.
+        """
+        await obj_manager.initialize()
+        pac = await obj_manager.from_enum(PacEnum.UNKNOWN)
+
+        other_session = AsyncSession(bind=session.bind)
+        try:
+            other_manager = PacManager(
+                SessionContext({}, other_session))
+            with patch.object(
+                    other_manager, "_run_query",
+                    new_callable=AsyncMock) as mock_run_query:
+                other_pac = await other_manager.from_enum(
+                    PacEnum.UNKNOWN)
+                mock_run_query.assert_not_called()
+        finally:
+            await other_session.close()
+
+        assert other_pac is not pac
+        assert other_pac.pac_id == pac.pac_id
+        assert other_pac.code == pac.code
+
+    @pytest.mark.asyncio
+    async def test_lookup_cache_rollback(
+        self,
+        obj_manager: PacManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to check that a rollback keeps the cached
+        rows, unless the rolled back transaction wrote
+        to the lookup table.
+        """
+        await obj_manager.initialize()
+        await session.commit()
+        await obj_manager.load_lookup_cache()
+
+        await session.rollback()
+
+        assert await LookupCache.get(
+            session, Pac, PacEnum.UNKNOWN.value) is not None
+
+        pac = await obj_manager.from_enum(PacEnum.UNKNOWN)
+        await obj_manager.update(pac, description="Rolled Back")
+        await obj_manager.load_lookup_cache()
+
+        await session.rollback()
+
+        assert await LookupCache.get(
+            session, Pac, PacEnum.UNKNOWN.value) is None
+
+    @pytest.mark.asyncio
+    async def test_lookup_cache_shared_by_database_url(
+        self,
+        obj_manager: PacManager,
+        tmp_path
+    ):
+        """
+        Test case to check that engines of the same database
+        share the cached rows, and that in-memory SQLite
+        engines do not.
+        """
+        pac = await PacFactory.build_async(None)
+        pac.lookup_enum_name = "SharedByUrl"
+
+        for database_url, is_shared in [
+                (f"sqlite+aiosqlite:///{tmp_path / 'lookup.db'}", True),
+                ("sqlite+aiosqlite:///:memory:", False)]:
+            engine_list = [create_async_engine(database_url)
+                           for _ in range(2)]
+            try:
+                LookupCache.set(AsyncSession(bind=engine_list[0]), pac)
+                cached_pac = await LookupCache.get(
+                    AsyncSession(bind=engine_list[1]),
+                    Pac,
+                    "SharedByUrl")
+                assert (cached_pac is not None) is is_shared
+            finally:
+                LookupCache.invalidate(Pac)
+                for engine in engine_list:
+                    await engine.dispose()
@@ -13,10 +13,11 @@ import uuid  # noqa: F401
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
 
 import pytest
 from helpers.session_context import SessionContext
-from managers.plant import PlantManager
+from managers.plant import PlantManager, PlantNotFoundError
 from models import Plant
 from models.factory import PlantFactory
 
@@ -476,3 +477,202 @@ class TestPlantBulkManager:
                 plant_ids)
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_update_bulk_chunked_versioning(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to verify that the `update_bulk` method
+        updates plants spread over several chunks,
+        increments their last_change_code and keeps the
+        plants already in the session in sync.
+        """
+        obj_manager._bulk_chunk_size = 2
+
+        plants = [
+            await PlantFactory.create_async(
+                session=session)
+            for _ in range(5)
+        ]
+        last_change_codes = [
+            plant.last_change_code for plant in plants
+        ]
+
+        updates = [
+            {
+                "plant_id": plant.plant_id,
+                "is_edit_allowed": True
+            }
+            for plant in plants
+        ]
+        updates[0]["other_flavor"] = "Updated"
+
+        updated_plants = await obj_manager.update_bulk(
+            updates)
+
+        assert len(updated_plants) == 5
+        for index, plant in enumerate(plants):
+            assert updated_plants[index] is plant
+            assert plant.is_edit_allowed is True
+            assert plant.last_change_code == \
+                last_change_codes[index] + 1
+            assert plant.last_update_user_id == \
+                obj_manager._session_context.customer_code
+        assert plants[0].other_flavor == "Updated"
+
+        # the refreshed version must allow a normal update
+        await obj_manager.update(plants[1], some_int_val=7)
+        assert plants[1].last_change_code == \
+            last_change_codes[1] + 2
+
+    @pytest.mark.asyncio
+    async def test_update_bulk_not_found_updates_nothing(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to verify that the `update_bulk` method
+        checks every plant before any update, so no plant
+        is changed when one of them is not found.
+        """
+        obj_manager._bulk_chunk_size = 2
+
+        plants = [
+            await PlantFactory.create_async(
+                session=session)
+            for _ in range(3)
+        ]
+        last_change_codes = [
+            plant.last_change_code for plant in plants
+        ]
+
+        updates = [
+            {
+                "plant_id": plant.plant_id,
+                "other_flavor": "Updated"
+            }
+            for plant in plants
+        ]
+        updates.append({"plant_id": 999999, "other_flavor": "Updated"})
+
+        with pytest.raises(PlantNotFoundError):
+            await obj_manager.update_bulk(updates)
+
+        result = await session.execute(
+            select(Plant._other_flavor, Plant._last_change_code)
+            .where(Plant._plant_id.in_(  # type: ignore
+                [plant.plant_id for plant in plants]))
+            .order_by(Plant._plant_id)
+        )
+        rows = result.all()
+
+        assert [row[0] for row in rows] == \
+            [plant.other_flavor for plant in plants]
+        assert [row[1] for row in rows] == last_change_codes
+
+    @pytest.mark.asyncio
+    async def test_update_bulk_last_change_code(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to verify that the `update_bulk` method
+        applies an update with the current last_change_code,
+        and raises a StaleDataError without updating
+        anything when it is not current.
+        """
+        plant_1 = await PlantFactory.create_async(
+            session=session)
+        plant_2 = await PlantFactory.create_async(
+            session=session)
+        last_change_code = plant_1.last_change_code
+
+        updated_plants = await obj_manager.update_bulk([
+            {
+                "plant_id": plant_1.plant_id,
+                "last_change_code": last_change_code,
+                "other_flavor": "Current"
+            }
+        ])
+
+        assert updated_plants[0].other_flavor == "Current"
+        assert updated_plants[0].last_change_code == \
+            last_change_code + 1
+
+        with pytest.raises(StaleDataError):
+            await obj_manager.update_bulk([
+                {
+                    "plant_id": plant_2.plant_id,
+                    "other_flavor": "Stale"
+                },
+                {
+                    "plant_id": plant_1.plant_id,
+                    "last_change_code": last_change_code,
+                    "other_flavor": "Stale"
+                }
+            ])
+
+        await session.refresh(plant_1)
+        await session.refresh(plant_2)
+
+        assert plant_1.other_flavor == "Current"
+        assert plant_1.last_change_code == last_change_code + 1
+        assert plant_2.other_flavor != "Stale"
+
+    @pytest.mark.asyncio
+    async def test_update_bulk_invalid_property(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to verify that the `update_bulk` method
+        raises a ValueError when an invalid property
+        is provided.
+        """
+        plant = await PlantFactory.create_async(
+            session=session)
+
+        updates = [
+            {
+                "plant_id": plant.plant_id,
+                "not_a_property": 1
+            }
+        ]
+
+        with pytest.raises(ValueError):
+            await obj_manager.update_bulk(updates)
+
+        await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_delete_bulk_chunked(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case to verify that the `delete_bulk` method
+        deletes plants spread over several chunks.
+        """
+        obj_manager._bulk_chunk_size = 2
+
+        plants = [
+            await PlantFactory.create_async(
+                session=session)
+            for _ in range(5)
+        ]
+        plant_ids = [
+            plant.plant_id for plant in plants
+        ]
+
+        result = await obj_manager.delete_bulk(
+            plant_ids)
+
+        assert result is True
+        assert await obj_manager.count() == 0
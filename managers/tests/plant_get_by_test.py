@@ -161,6 +161,41 @@ class TestPlantGetByManager:
 
         assert plant is None
 
+    @pytest.mark.asyncio
+    async def test_get_by_code_list(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test case for the `get_by_code_list` method of
+        `PlantManager` that checks if
+        the plants are returned by their codes,
+        across several chunks, skipping unknown codes.
+        """
+        obj_manager._bulk_chunk_size = 2
+
+        new_objs = [
+            await PlantFactory.create_async(
+                session)
+            for _ in range(3)
+        ]
+        code_list = [
+            new_obj.code for new_obj in new_objs
+        ]
+        code_list.append(uuid.uuid4())
+
+        plants = await \
+            obj_manager.get_by_code_list(
+                code_list)
+
+        assert len(plants) == 3
+        assert {plant.plant_id for plant in plants} == {
+            new_obj.plant_id for new_obj in new_objs}
+        assert all(
+            plant.land_code_peek != uuid.UUID(int=0)
+            for plant in plants)
+
 # endset
 
     # isDeleteAllowed
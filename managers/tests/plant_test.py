@@ -9,6 +9,7 @@
 
 import uuid  # noqa: F401
 from typing import List
+from unittest.mock import patch
 
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -699,6 +700,46 @@ class TestPlantManager:
 
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_count_by(
+        self,
+        obj_manager: PlantManager,
+        session: AsyncSession
+    ):
+        """
+        Test the count_by method of the
+        PlantManager class with a property filter.
+        """
+        plants_data = (
+            [await PlantFactory.create_async(session)
+             for _ in range(3)])
+        plants_data[0].is_edit_allowed = True
+        plants_data[1].is_edit_allowed = False
+        plants_data[2].is_edit_allowed = False
+        await session.flush()
+
+        assert await obj_manager.count_by(
+            is_edit_allowed=True) == 1
+        assert await obj_manager.count_by(
+            is_edit_allowed=False) == 2
+        assert await obj_manager.count_by(
+            is_edit_allowed=False,
+            land_id=plants_data[1].land_id) == 1
+        assert await obj_manager.count_by() == 3
+
+    @pytest.mark.asyncio
+    async def test_count_by_invalid_property(
+        self,
+        obj_manager: PlantManager
+    ):
+        """
+        Test that the count_by method raises a
+        ValueError for an invalid property.
+        """
+        with pytest.raises(ValueError):
+            await obj_manager.count_by(
+                not_a_property=1)
+
     @pytest.mark.asyncio
     async def test_refresh_basic(
         self,
@@ -922,4 +963,39 @@ class TestPlantManager:
             await obj_manager.exists(invalid_id)  # type: ignore  # noqa: E501
 
         await session.rollback()
+
+    @pytest.mark.asyncio
+    async def test_read_session_routing(
+        self,
+        session: AsyncSession
+    ):
+        """
+        Test that with a read session, count and exists run on it,
+        while the get methods load the plants with the primary
+        session, so they can be updated and deleted.
+        """
+        plant = await PlantFactory.create_async(session)
+
+        session.info["read_session"] = AsyncSession(bind=session.bind)
+        session_context = SessionContext({}, session)
+        read_session = session_context.read_session
+        obj_manager = PlantManager(session_context)
+
+        try:
+            with patch.object(
+                    read_session, "execute",
+                    wraps=read_session.execute) as read_execute:
+                assert await obj_manager.exists(plant.plant_id)
+                assert read_execute.call_count == 1
+
+                fetched_plant = await obj_manager.get_by_id(plant.plant_id)
+                assert read_execute.call_count == 1
+
+            assert fetched_plant in session
+            await obj_manager.delete(plant.plant_id)
+            await session.flush()
+            assert not await obj_manager.exists(plant.plant_id)
+        finally:
+            del session.info["read_session"]
+            await read_session.close()
 # endset
@@ -11,10 +11,14 @@ tri_state_filters in the system.
 import json
 import logging
 import uuid  # noqa: F401
+from datetime import datetime, timezone
 from enum import Enum  # noqa: F401
 from typing import Any, List, Optional, Dict
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, func, literal_column, update
 from sqlalchemy.future import select
+from sqlalchemy.orm.exc import StaleDataError
+from helpers.lookup_cache import LookupCache
+from helpers.lookup_seed import insert_lookup_items
 from helpers.session_context import SessionContext
 from models.pac import Pac  # PacID
 from models.tri_state_filter import TriStateFilter
@@ -57,6 +61,8 @@ class TriStateFilterManager:
     and retrieving tri_state_filters.
     """
 
+    _bulk_chunk_size: int = 500
+
     def __init__(self, session_context: SessionContext):
         """
         Initializes a new instance of the
@@ -94,33 +100,43 @@ class TriStateFilterManager:
         logging.info("TriStateFilterManager.Initialize start")
         pac_result = await self._session_context.session.execute(select(Pac))
         pac = pac_result.scalars().first()
-        if await self.from_enum(TriStateFilterEnum.UNKNOWN) \
-                is None:
+        # one SELECT of the seeded names and one INSERT
+        # of the missing rows, instead of a query per row
+        lookup_enum_name_result = await self._session_context.session.execute(
+            select(TriStateFilter._lookup_enum_name))
+        lookup_enum_name_list = list(lookup_enum_name_result.scalars().all())
+        item_list = []
+        if TriStateFilterEnum.UNKNOWN.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = ""
             item.lookup_enum_name = "Unknown"
             item.description = ""
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(TriStateFilterEnum.YES) \
-                is None:
+            item_list.append(item)
+        if TriStateFilterEnum.YES.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "Yes"
             item.lookup_enum_name = "Yes"
             item.description = "Yes"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
-        if await self.from_enum(TriStateFilterEnum.NO) \
-                is None:
+            item_list.append(item)
+        if TriStateFilterEnum.NO.value \
+                not in lookup_enum_name_list:
             item = await self._build_lookup_item(pac)
             item.name = "No"
             item.lookup_enum_name = "No"
             item.description = "No"
-            item.display_order = await self.count()
+            item.display_order = \
+                len(lookup_enum_name_list) + len(item_list)
             item.is_active = True
-            await self.add(item)
+            item_list.append(item)
+        await insert_lookup_items(self._session_context, item_list)
         logging.info("TriStateFilterManager.Initialize end")
 
     async def from_enum(
@@ -138,10 +154,31 @@ class TriStateFilterManager:
                 The TriStateFilter object
                 matching the enum value.
         """
+        tri_state_filter = await LookupCache.get(
+            self._session_context.session,
+            TriStateFilter,
+            enum_val.value)
+        if tri_state_filter is not None:
+            return tri_state_filter
         query_filter = (
             TriStateFilter._lookup_enum_name == enum_val.value)  # pylint: disable=protected-access  # noqa: E501
         query_results = await self._run_query(query_filter)
-        return self._first_or_none(query_results)
+        tri_state_filter = self._first_or_none(query_results)
+        LookupCache.set(
+            self._session_context.session,
+            tri_state_filter)
+        return tri_state_filter
+
+    async def load_lookup_cache(self):
+        """
+        Loads every TriStateFilter row
+        into the process wide lookup cache.
+        """
+        logging.info("TriStateFilterManager.load_lookup_cache")
+        for tri_state_filter in await self._run_query(None):
+            LookupCache.set(
+                self._session_context.session,
+                tri_state_filter)
 
 
     async def build(self, **kwargs) -> TriStateFilter:
@@ -185,6 +222,7 @@ class TriStateFilterManager:
         self._session_context.session.add(
             tri_state_filter)
         await self._session_context.session.flush()
+        LookupCache.invalidate(TriStateFilter)
         return tri_state_filter
 
     def _build_query(self):
@@ -235,6 +273,8 @@ class TriStateFilterManager:
         else:
             query = tri_state_filter_query_all
 
+        # the entities stay attached to the primary session,
+        # so they can be refreshed, updated and deleted
         result_proxy = await self._session_context.session.execute(query)
 
         query_results = result_proxy.all()
@@ -361,6 +401,7 @@ class TriStateFilterManager:
                     raise ValueError(f"Invalid property: {key}")
                 setattr(tri_state_filter, key, value)
             await self._session_context.session.flush()
+            LookupCache.invalidate(TriStateFilter)
         return tri_state_filter
 
     async def delete(self, tri_state_filter_id: int):
@@ -397,6 +438,7 @@ class TriStateFilterManager:
             tri_state_filter)
 
         await self._session_context.session.flush()
+        LookupCache.invalidate(TriStateFilter)
 
     async def get_list(
         self
@@ -568,6 +610,7 @@ class TriStateFilterManager:
                 self._session_context.customer_code)
         self._session_context.session.add_all(tri_state_filters)
         await self._session_context.session.flush()
+        LookupCache.invalidate(TriStateFilter)
         return tri_state_filters
 
     async def update_bulk(
@@ -578,6 +621,18 @@ class TriStateFilterManager:
         Update multiple tri_state_filters
         with the provided updates.
 
+        Every tri_state_filter is checked first, with one SELECT
+        statement per chunk of ids, so nothing is updated
+        when one of them is missing or has changed. An update
+        with a last_change_code is applied only if the
+        tri_state_filter still has that last_change_code.
+
+        Updates with the same changes are applied together
+        with one UPDATE statement per chunk of ids. Each
+        updated row gets its last_change_code incremented and
+        its last_update_user_id and last_update_utc_date_time
+        stamped.
+
         Args:
             tri_state_filter_updates (List[Dict[str, Any]]): A list of
             dictionaries containing the updates for each
@@ -589,16 +644,24 @@ class TriStateFilterManager:
 
         Raises:
             TypeError: If the tri_state_filter_id is not an integer.
+            ValueError: If an invalid property is provided.
             TriStateFilterNotFoundError: If a
                 tri_state_filter with the
                 provided tri_state_filter_id is not found.
+            StaleDataError: If a tri_state_filter does not have
+                the last_change_code of its update.
         """
 
         logging.info(
             "TriStateFilterManager.update_bulk start")
-        updated_tri_state_filters = []
-        for update in tri_state_filter_updates:
-            tri_state_filter_id = update.get(
+        property_list = TriStateFilter.property_list()
+        tri_state_filter_ids = []
+        expected_change_codes: Dict[int, int] = {}
+        grouped_ids: Dict[str, List[int]] = {}
+        grouped_changes: Dict[str, Dict[str, Any]] = {}
+        grouped_change_codes: Dict[str, Optional[int]] = {}
+        for tri_state_filter_update in tri_state_filter_updates:
+            tri_state_filter_id = tri_state_filter_update.get(
                 "tri_state_filter_id")
             if not isinstance(tri_state_filter_id, int):
                 raise TypeError(
@@ -613,24 +676,101 @@ class TriStateFilterManager:
                 "tri_state_filter_id:%s",
                 tri_state_filter_id)
 
-            tri_state_filter = await self.get_by_id(
+            expected_change_code = tri_state_filter_update.get(
+                "last_change_code")
+            changes = {}
+            for key, value in tri_state_filter_update.items():
+                if key in ("tri_state_filter_id", "last_change_code"):
+                    continue
+                if key not in property_list:
+                    raise ValueError(f"Invalid property: {key}")
+                changes[key] = value
+
+            if expected_change_code is not None:
+                expected_change_codes[tri_state_filter_id] = \
+                    expected_change_code
+            group_key = repr(
+                (expected_change_code, sorted(changes.items())))
+            grouped_changes[group_key] = changes
+            grouped_change_codes[group_key] = expected_change_code
+            grouped_ids.setdefault(group_key, []).append(
                 tri_state_filter_id)
-
-            if not tri_state_filter:
-                raise TriStateFilterNotFoundError(
-                    f"TriStateFilter with ID "
-                    f"{tri_state_filter_id} not found!")
-
-            for key, value in update.items():
-                if key != "tri_state_filter_id":
-                    setattr(tri_state_filter, key, value)
-
-            tri_state_filter.last_update_user_id =\
+            tri_state_filter_ids.append(tri_state_filter_id)
+
+        unique_ids = list(dict.fromkeys(tri_state_filter_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(TriStateFilter._tri_state_filter_id, TriStateFilter._last_change_code)  # noqa: E501
+                .where(TriStateFilter._tri_state_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            change_codes = dict(result.tuples().all())
+            for tri_state_filter_id in chunk:
+                if tri_state_filter_id not in change_codes:
+                    raise TriStateFilterNotFoundError(
+                        f"TriStateFilter with ID "
+                        f"{tri_state_filter_id} not found!")
+                change_code = change_codes[tri_state_filter_id]
+                expected_change_code = expected_change_codes.get(
+                    tri_state_filter_id, change_code)
+                if expected_change_code != change_code:
+                    raise StaleDataError(
+                        f"TriStateFilter with ID "
+                        f"{tri_state_filter_id} has last_change_code "
+                        f"{change_code}, not {expected_change_code}!")
+
+        update_utc_date_time = datetime.now(timezone.utc)
+        for group_key, group_ids in grouped_ids.items():
+            expected_change_code = grouped_change_codes[group_key]
+            values = {
+                getattr(TriStateFilter, "_" + key): value
+                for key, value in grouped_changes[group_key].items()
+            }
+            values[TriStateFilter._last_change_code] = \
+                TriStateFilter._last_change_code + 1
+            values[TriStateFilter._last_update_user_id] = \
                 self._session_context.customer_code
+            values[TriStateFilter._last_update_utc_date_time] = \
+                update_utc_date_time
+            group_ids = list(dict.fromkeys(group_ids))
+            for index in range(0, len(group_ids), self._bulk_chunk_size):
+                chunk = group_ids[index:index + self._bulk_chunk_size]
+                query = (
+                    update(TriStateFilter)
+                    .where(TriStateFilter._tri_state_filter_id.in_(chunk))  # type: ignore # noqa: E501
+                    .values(values)
+                    .execution_options(synchronize_session=False)
+                )
+                if expected_change_code is not None:
+                    query = query.where(
+                        TriStateFilter._last_change_code == expected_change_code)  # noqa: E501
+                result = await self._session_context.session.execute(
+                    query)
+                # changed or deleted since the check
+                if result.rowcount != len(chunk):
+                    raise StaleDataError(
+                        f"{len(chunk) - result.rowcount} of the "
+                        f"TriStateFilter rows changed during the update!")
+
+        # reload the rows so tri_state_filters already in the
+        # session pick up the new values and last_change_code
+        tri_state_filters_by_id = {}
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(TriStateFilter)
+                .where(TriStateFilter._tri_state_filter_id.in_(chunk))  # type: ignore # noqa: E501
+                .execution_options(populate_existing=True)
+            )
+            for tri_state_filter in result.scalars().all():
+                tri_state_filters_by_id[tri_state_filter.tri_state_filter_id] = tri_state_filter  # noqa: E501
 
-            updated_tri_state_filters.append(tri_state_filter)
+        updated_tri_state_filters = [
+            tri_state_filters_by_id[tri_state_filter_id]
+            for tri_state_filter_id in tri_state_filter_ids
+        ]
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(TriStateFilter)
 
         logging.info(
             "TriStateFilterManager.update_bulk end")
@@ -642,6 +782,9 @@ class TriStateFilterManager:
         """
         Delete multiple tri_state_filters
         by their IDs.
+
+        The tri_state_filters are deleted with one DELETE
+        statement per chunk of ids.
         """
         logging.info(
             "TriStateFilterManager.delete_bulk")
@@ -653,19 +796,27 @@ class TriStateFilterManager:
                     f"got {type(tri_state_filter_id)} instead."
                 )
 
-            tri_state_filter = await self.get_by_id(
-                tri_state_filter_id)
-            if not tri_state_filter:
-                raise TriStateFilterNotFoundError(
-                    f"TriStateFilter with ID "
-                    f"{tri_state_filter_id} not found!"
-                )
-
-            if tri_state_filter:
-                await self._session_context.session.delete(
-                    tri_state_filter)
+        unique_ids = list(dict.fromkeys(tri_state_filter_ids))
+        for index in range(0, len(unique_ids), self._bulk_chunk_size):
+            chunk = unique_ids[index:index + self._bulk_chunk_size]
+            result = await self._session_context.session.execute(
+                select(TriStateFilter._tri_state_filter_id)
+                .where(TriStateFilter._tri_state_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
+            found_ids = set(result.scalars().all())
+            for tri_state_filter_id in chunk:
+                if tri_state_filter_id not in found_ids:
+                    raise TriStateFilterNotFoundError(
+                        f"TriStateFilter with ID "
+                        f"{tri_state_filter_id} not found!"
+                    )
+
+            await self._session_context.session.execute(
+                delete(TriStateFilter)
+                .where(TriStateFilter._tri_state_filter_id.in_(chunk))  # type: ignore # noqa: E501
+            )
 
-        await self._session_context.session.flush()
+        LookupCache.invalidate(TriStateFilter)
 
         return True
 
@@ -676,9 +827,35 @@ class TriStateFilterManager:
         """
         logging.info(
             "TriStateFilterManager.count")
-        result = await self._session_context.session.execute(
-            select(TriStateFilter))
-        return len(list(result.scalars().all()))
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(func.count()).select_from(TriStateFilter))
+        return result.scalar_one()
+
+    async def count_by(self, **kwargs) -> int:
+        """
+        return the number of tri_state_filters
+        matching the given property values.
+
+        Args:
+            **kwargs: The property values to filter on.
+
+        Raises:
+            ValueError: If an invalid property is provided.
+        """
+        logging.info(
+            "TriStateFilterManager.count_by")
+        property_list = TriStateFilter.property_list()
+        query = select(func.count()).select_from(TriStateFilter)
+        for key, value in kwargs.items():
+            if key not in property_list:
+                raise ValueError(f"Invalid property: {key}")
+            query = query.where(
+                getattr(TriStateFilter, "_" + key) == value)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            query)
+        return result.scalar_one()
 
     async def refresh(
         self,
@@ -710,9 +887,14 @@ class TriStateFilterManager:
                 f"The tri_state_filter_id must be an integer, "
                 f"got {type(tri_state_filter_id)} instead."
             )
-        tri_state_filter = await self.get_by_id(
-            tri_state_filter_id)
-        return bool(tri_state_filter)
+        read_session = self._session_context.get_read_session()
+        result = await read_session.execute(
+            select(literal_column("1"))
+            .select_from(TriStateFilter)
+            .where(TriStateFilter._tri_state_filter_id == tri_state_filter_id)  # type: ignore # noqa: E501
+            .limit(1)
+        )
+        return result.scalar_one_or_none() is not None
 
     def is_equal(
         self,
@@ -24,5 +24,6 @@ from .org_customer import OrgCustomer  # noqa: F401
 from .pac import Pac  # noqa: F401
 from .plant import Plant  # noqa: F401
 from .role import Role  # noqa: F401
+from .schema_version import SchemaVersion  # noqa: F401
 from .tac import Tac  # noqa: F401
 from .tri_state_filter import TriStateFilter  # noqa: F401
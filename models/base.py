@@ -4,12 +4,53 @@
 This module contains the base classes and types for the SQLAlchemy models.
 """
 
+from sqlalchemy import Index
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.types import TypeDecorator, LargeBinary
 from services.encryption import encrypt_message, decrypt_message
 
 Base = declarative_base()
 
+# the dialects that support an index with a WHERE clause
+PARTIAL_INDEX_DIALECT_LIST = ["postgresql", "sqlite", "mssql"]
+
+
+def partial_index(name: str, *columns, where=None, **kwargs) -> Index:
+    """
+    Returns a composite index, limited to the rows that
+    match the where clause on the dialects that support it
+    (PostgreSQL partial index, SQLite partial index, SQL
+    Server filtered index). Other dialects index every row.
+
+    Args:
+        name: The name of the index.
+        *columns: The columns of the index, in order.
+        where: The condition of the indexed rows.
+        **kwargs: The other Index arguments.
+
+    Returns:
+        The index, to add to the __table_args__ of a model.
+    """
+    if where is not None:
+        for dialect_name in PARTIAL_INDEX_DIALECT_LIST:
+            kwargs[f"{dialect_name}_where"] = where
+    return Index(name, *columns, **kwargs)
+
+
+def create_missing_indexes(connection) -> None:
+    """
+    Creates the indexes of the models that are missing from
+    tables that already exist. Base.metadata.create_all only
+    creates the indexes of the tables it creates.
+
+    Args:
+        connection: A synchronous connection, as passed
+            by AsyncConnection.run_sync.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
 
 class EncryptedType(TypeDecorator):
     """
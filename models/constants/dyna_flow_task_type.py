@@ -7,6 +7,7 @@ dyna_flow_task_types.
 description_calculatedIsDBColumnIndexed: bool = False
 display_order_calculatedIsDBColumnIndexed: bool = False
 is_active_calculatedIsDBColumnIndexed: bool = False
+is_cpu_bound_calculatedIsDBColumnIndexed: bool = False
 lookup_enum_name_calculatedIsDBColumnIndexed: bool = False
 max_retry_count_calculatedIsDBColumnIndexed: bool = False
 name_calculatedIsDBColumnIndexed: bool = False
@@ -14,6 +15,7 @@ pac_id_calculatedIsDBColumnIndexed: bool = True
 description_isEncrypted: bool = False
 display_order_isEncrypted: bool = False
 is_active_isEncrypted: bool = False
+is_cpu_bound_isEncrypted: bool = False
 lookup_enum_name_isEncrypted: bool = False
 max_retry_count_isEncrypted: bool = False
 name_isEncrypted: bool = False
@@ -4,12 +4,14 @@
 This module contains boolean constants related to
 dyna_flow_type_schedules.
 """
+cron_expression_calculatedIsDBColumnIndexed: bool = False
 dyna_flow_type_id_calculatedIsDBColumnIndexed: bool = True
 frequency_in_hours_calculatedIsDBColumnIndexed: bool = False
 is_active_calculatedIsDBColumnIndexed: bool = False
 last_utc_date_time_calculatedIsDBColumnIndexed: bool = False
-next_utc_date_time_calculatedIsDBColumnIndexed: bool = False
+next_utc_date_time_calculatedIsDBColumnIndexed: bool = True
 pac_id_calculatedIsDBColumnIndexed: bool = True
+cron_expression_isEncrypted: bool = False
 dyna_flow_type_id_isEncrypted: bool = False
 frequency_in_hours_isEncrypted: bool = False
 is_active_isEncrypted: bool = False
@@ -92,6 +92,14 @@ class DFTDependency(Base):
         DateTime,
         nullable=True)
 
+    __table_args__ = (
+        # the tasks locked by a dependency task
+        Index(
+            'ix_farm_dft_dependency_dependency_df_task',
+            _dependency_df_task_id,
+            _dyna_flow_task_id),
+    )
+
     __mapper_args__ = {
         'version_id_col': _last_change_code
     }
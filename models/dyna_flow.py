@@ -13,11 +13,12 @@ from sqlalchemy_utils import UUIDType
 from sqlalchemy import (BigInteger, Boolean,   # noqa: F401
                         Column, Date, DateTime, Float,
                         ForeignKey, Index, Integer, Numeric, String,
-                        event, func)
+                        and_, event, func, text)
 import models.constants.dyna_flow as \
     dyna_flow_constants
+from config import DYNAFLOW_NOTIFY_CHANNEL
 from utils.common_functions import snake_case
-from .base import Base, EncryptedType  # noqa: F401
+from .base import Base, EncryptedType, partial_index  # noqa: F401
 
 
 class DynaFlow(Base):
@@ -308,6 +309,39 @@ class DynaFlow(Base):
         DateTime,
         nullable=True)
 
+    # the work-queue indexes, limited to the pending
+    # rows where the database supports it
+    __table_args__ = (
+        # the task build to-do list
+        partial_index(
+            'ix_farm_dyna_flow_build_to_do',
+            _pac_id,
+            _requested_utc_date_time,
+            where=and_(
+                _is_canceled == False,  # noqa: E712
+                _is_started == False,  # noqa: E712
+                _is_completed == False,  # noqa: E712
+                _is_task_creation_started == False)),  # noqa: E712
+        # the pending DynaFlows that depend on a DynaFlow
+        partial_index(
+            'ix_farm_dyna_flow_pending_dependency',
+            _dependency_dyna_flow_id,
+            where=and_(
+                _is_completed == False,  # noqa: E712
+                _is_canceled == False)),  # noqa: E712
+        # the finished DynaFlows, oldest first, for the archive.
+        # SQL Server filtered indexes do not support OR, so
+        # completed and canceled DynaFlows have an index each
+        partial_index(
+            'ix_farm_dyna_flow_completed',
+            _last_update_utc_date_time,
+            where=_is_completed == True),  # noqa: E712
+        partial_index(
+            'ix_farm_dyna_flow_canceled',
+            _last_update_utc_date_time,
+            where=_is_canceled == True),  # noqa: E712
+    )
+
     __mapper_args__ = {
         'version_id_col': _last_change_code
     }
@@ -1227,3 +1261,29 @@ def set_updated_on(
     :param target: The target object to update.
     """
     target.last_update_utc_date_time = datetime.now(timezone.utc)
+
+
+@event.listens_for(DynaFlow, 'after_insert')
+def notify_dyna_flow_requested(
+    mapper,
+    connection,
+    target
+):  # pylint: disable=unused-argument
+    """
+    Notifies the DynaFlow processors listening on
+    DYNAFLOW_NOTIFY_CHANNEL that a DynaFlow was requested.
+
+    Only PostgreSQL supports notifications. They are
+    delivered when the transaction commits.
+
+    :param mapper: The SQLAlchemy mapper object.
+    :param connection: The SQLAlchemy connection object.
+    :param target: The inserted DynaFlow object.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    connection.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": DYNAFLOW_NOTIFY_CHANNEL, "payload": str(target.code)}
+    )
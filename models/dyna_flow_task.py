@@ -13,11 +13,11 @@ from sqlalchemy_utils import UUIDType
 from sqlalchemy import (BigInteger, Boolean,   # noqa: F401
                         Column, Date, DateTime, Float,
                         ForeignKey, Index, Integer, Numeric, String,
-                        event, func)
+                        and_, event, func)
 import models.constants.dyna_flow_task as \
     dyna_flow_task_constants
 from utils.common_functions import snake_case
-from .base import Base, EncryptedType  # noqa: F401
+from .base import Base, EncryptedType, partial_index  # noqa: F401
 
 
 class DynaFlowTask(Base):
@@ -274,6 +274,43 @@ class DynaFlowTask(Base):
         DateTime,
         nullable=True)
 
+    # the work-queue indexes, limited to the pending
+    # rows where the database supports it
+    __table_args__ = (
+        # the task run to-do list
+        partial_index(
+            'ix_farm_dyna_flow_task_run_to_do',
+            _min_start_utc_date_time,
+            _dyna_flow_id,
+            where=and_(
+                _is_canceled == False,  # noqa: E712
+                _is_started == False,  # noqa: E712
+                _is_completed == False)),  # noqa: E712
+        # the task scheduler seed and its new task loads
+        partial_index(
+            'ix_farm_dyna_flow_task_pending',
+            _dyna_flow_task_id,
+            _dyna_flow_id,
+            where=and_(
+                _is_completed == False,  # noqa: E712
+                _is_canceled == False)),  # noqa: E712
+        # the pending tasks that depend on a task
+        partial_index(
+            'ix_farm_dyna_flow_task_pending_dependency',
+            _dependency_dyna_flow_task_id,
+            where=and_(
+                _is_completed == False,  # noqa: E712
+                _is_canceled == False)),  # noqa: E712
+        # the started tasks of a processor, for the cleanup
+        partial_index(
+            'ix_farm_dyna_flow_task_started_processor',
+            _processor_identifier,
+            _started_utc_date_time,
+            where=and_(
+                _is_started == True,  # noqa: E712
+                _is_completed == False)),  # noqa: E712
+    )
+
     __mapper_args__ = {
         'version_id_col': _last_change_code
     }
@@ -84,6 +84,15 @@ class DynaFlowTaskType(Base):
             is_active_calculatedIsDBColumnIndexed
         ),
         nullable=True)
+    _is_cpu_bound = Column(
+        'is_cpu_bound',
+        Boolean,
+        default=False,
+        index=(
+            dyna_flow_task_type_constants.
+            is_cpu_bound_calculatedIsDBColumnIndexed
+        ),
+        nullable=True)
     _lookup_enum_name = Column(
         'lookup_enum_name',
 
@@ -154,6 +163,8 @@ class DynaFlowTaskType(Base):
             'display_order', 0)
         self.is_active = kwargs.get(
             'is_active', False)
+        self.is_cpu_bound = kwargs.get(
+            'is_cpu_bound', False)
         self.lookup_enum_name = kwargs.get(
             'lookup_enum_name', "")
         self.max_retry_count = kwargs.get(
@@ -400,6 +411,26 @@ class DynaFlowTaskType(Base):
         """
 
         self._is_active = value
+    # isCPUBound
+
+    @property
+    def is_cpu_bound(self) -> bool:
+        """
+        Check if the tasks of the dyna_flow_task_type
+        are run in the CPU-bound process pool.
+
+        Returns:
+            bool: True if the tasks are CPU-bound, False otherwise.
+        """
+        return getattr(self, '_is_cpu_bound', False) or False
+
+    @is_cpu_bound.setter
+    def is_cpu_bound(self, value: bool) -> None:
+        """
+        Set the is_cpu_bound.
+        """
+
+        self._is_cpu_bound = value
     # lookupEnumName
 
     @property
@@ -498,6 +529,7 @@ class DynaFlowTaskType(Base):
             "description",
             "display_order",
             "is_active",
+            "is_cpu_bound",
             "lookup_enum_name",
             "max_retry_count",
             "name",
@@ -55,6 +55,17 @@ class DynaFlowTypeSchedule(Base):
         UUIDType(binary=False),
         default=uuid.uuid4,
         nullable=True)
+    _cron_expression = Column(
+        'cron_expression',
+
+        String,
+
+        default="",
+        index=(
+            dyna_flow_type_schedule_constants.
+            cron_expression_calculatedIsDBColumnIndexed
+        ),
+        nullable=True)
     _dyna_flow_type_id = Column(
         'dyna_flow_type_id',
         Integer,
@@ -134,6 +145,8 @@ class DynaFlowTypeSchedule(Base):
             'insert_user_id', uuid.UUID(int=0))
         self.last_update_user_id = kwargs.get(
             'last_update_user_id', uuid.UUID(int=0))
+        self.cron_expression = kwargs.get(
+            'cron_expression', "")
         self.dyna_flow_type_id = kwargs.get(
             'dyna_flow_type_id', 0)
         self.frequency_in_hours = kwargs.get(
@@ -325,6 +338,27 @@ class DynaFlowTypeSchedule(Base):
             value = value.replace(tzinfo=timezone.utc)
 
         self._last_update_utc_date_time = value
+    # cronExpression
+
+    @property
+    def cron_expression(self) -> str:
+        """
+        Returns the Cron Expression of the
+        dyna_flow_type_schedule.
+
+        :return: The Cron Expression of the
+            dyna_flow_type_schedule.
+        :rtype: str
+        """
+        return getattr(self, '_cron_expression', "") or ""
+
+    @cron_expression.setter
+    def cron_expression(self, value: str) -> None:
+        """
+        Set the cron_expression.
+        """
+
+        self._cron_expression = value
     # dynaFlowTypeID
     # frequencyInHours
 
@@ -478,6 +512,7 @@ class DynaFlowTypeSchedule(Base):
         """
 
         result = [
+            "cron_expression",
             "dyna_flow_type_id",
             "frequency_in_hours",
             "is_active",
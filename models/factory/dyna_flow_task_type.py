@@ -39,6 +39,7 @@ class DynaFlowTaskTypeFactory(factory.Factory):
     description = Faker('sentence', nb_words=4)
     display_order = Faker('random_int')
     is_active = Faker('boolean')
+    is_cpu_bound = Faker('boolean')
     lookup_enum_name = Faker('sentence', nb_words=4)
     max_retry_count = Faker('random_int')
     name = Faker('sentence', nb_words=4)
@@ -37,6 +37,7 @@ class DynaFlowTypeScheduleFactory(factory.Factory):
     last_change_code = 0
     insert_user_id = factory.LazyFunction(uuid.uuid4)
     last_update_user_id = factory.LazyFunction(uuid.uuid4)
+    cron_expression = Faker('sentence', nb_words=4)
     # dyna_flow_type_id
     frequency_in_hours = Faker('random_int')
     is_active = Faker('boolean')
@@ -223,6 +223,7 @@ class TestDynaFlowTaskTypeFactory:
             obj.description, str)
         assert isinstance(obj.display_order, int)
         assert isinstance(obj.is_active, bool)
+        assert isinstance(obj.is_cpu_bound, bool)
         assert obj.lookup_enum_name == "" or isinstance(
             obj.lookup_enum_name, str)
         assert isinstance(obj.max_retry_count, int)
@@ -283,6 +284,7 @@ class TestDynaFlowTaskTypeFactory:
         assert new_obj.description == ""
         assert new_obj.display_order == 0
         assert new_obj.is_active is False
+        assert new_obj.is_cpu_bound is False
         assert new_obj.lookup_enum_name == ""
         assert new_obj.max_retry_count == 0
         assert new_obj.name == ""
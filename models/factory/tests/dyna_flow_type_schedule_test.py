@@ -219,6 +219,8 @@ class TestDynaFlowTypeScheduleFactory:
         assert isinstance(obj.last_change_code, int)
         assert isinstance(obj.insert_user_id, uuid.UUID)
         assert isinstance(obj.last_update_user_id, uuid.UUID)
+        assert obj.cron_expression == "" or isinstance(
+            obj.cron_expression, str)
         assert isinstance(obj.dyna_flow_type_id, int)
         assert isinstance(obj.frequency_in_hours, int)
         assert isinstance(obj.is_active, bool)
@@ -282,6 +284,7 @@ class TestDynaFlowTypeScheduleFactory:
         assert isinstance(
             new_obj.pac_code_peek, uuid.UUID)
         assert new_obj is not None
+        assert new_obj.cron_expression == ""
         assert new_obj.dyna_flow_type_id == 0
         assert new_obj.frequency_in_hours == 0
         assert new_obj.is_active is False
@@ -0,0 +1,39 @@
+# models/schema_version.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+The SchemaVersion model inherits from
+the Base model and is mapped to the
+'farm_schema_version' table in the database.
+"""
+from sqlalchemy import Column, DateTime, Integer, String
+from utils.common_functions import snake_case
+from .base import Base
+
+# the id of the single schema version row
+SCHEMA_VERSION_ID = 1
+
+
+class SchemaVersion(Base):
+    """
+    The SchemaVersion model holds a single row with the version
+    of the schema and lookup seed the database was last
+    initialized with. It is written by
+    current_runtime.initialize_database, so a fast start can
+    skip create_all and the lookup seeding while it is current.
+    """
+
+    __tablename__ = 'farm_' + snake_case('SchemaVersion')
+
+    _schema_version_id = Column(
+        'schema_version_id',
+        Integer,
+        primary_key=True,
+        autoincrement=False)
+    _version = Column(
+        'version',
+        String(64),
+        nullable=True)
+    _last_update_utc_date_time = Column(
+        'last_update_utc_date_time',
+        DateTime,
+        nullable=True)
@@ -38,6 +38,7 @@ class DynaFlowTaskTypeSchema(SQLAlchemyAutoSchema):
             "_description",  # description
             "_display_order",  # displayOrder
             "_is_active",  # isActive
+            "_is_cpu_bound",  # isCPUBound
             "_lookup_enum_name",  # lookupEnumName
             "_max_retry_count",  # maxRetryCount
             "_name",  # name
@@ -53,6 +54,7 @@ class DynaFlowTaskTypeSchema(SQLAlchemyAutoSchema):
     description = fields.Str()
     display_order = fields.Int()
     is_active = fields.Bool()
+    is_cpu_bound = fields.Bool()
     lookup_enum_name = fields.Str()
     max_retry_count = fields.Int()
     name = fields.Str()
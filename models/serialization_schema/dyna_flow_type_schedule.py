@@ -35,6 +35,7 @@ class DynaFlowTypeScheduleSchema(SQLAlchemyAutoSchema):
             "_last_change_code",
             "_insert_utc_date_time",
             "_last_update_utc_date_time",
+            "_cron_expression",  # cronExpression
             "_dyna_flow_type_id",  # dynaFlowTypeID
             "_frequency_in_hours",  # frequencyInHours
             "_is_active",  # isActive
@@ -49,6 +50,7 @@ class DynaFlowTypeScheduleSchema(SQLAlchemyAutoSchema):
     last_change_code = fields.Int()
     insert_user_id = fields.UUID()
     last_update_user_id = fields.UUID()
+    cron_expression = fields.Str()
     dyna_flow_type_id = fields.Int()
     frequency_in_hours = fields.Int()
     is_active = fields.Bool()
@@ -98,6 +98,7 @@ class TestDynaFlowTaskTypeSchema:
         "description": "Vanilla",
         "display_order": 42,
         "is_active": False,
+        "is_cpu_bound": False,
         "lookup_enum_name": "Vanilla",
         "max_retry_count": 42,
         "name": "Vanilla",
@@ -149,6 +150,8 @@ class TestDynaFlowTaskTypeSchema:
             new_obj.display_order)
         assert result['is_active'] == (
             new_obj.is_active)
+        assert result['is_cpu_bound'] == (
+            new_obj.is_cpu_bound)
         assert result['lookup_enum_name'] == (
             new_obj.lookup_enum_name)
         assert result['max_retry_count'] == (
@@ -202,6 +205,8 @@ class TestDynaFlowTaskTypeSchema:
             new_obj.display_order)
         assert deserialized_data['is_active'] == (
             new_obj.is_active)
+        assert deserialized_data['is_cpu_bound'] == (
+            new_obj.is_cpu_bound)
         assert deserialized_data['lookup_enum_name'] == (
             new_obj.lookup_enum_name)
         assert deserialized_data['max_retry_count'] == (
@@ -240,6 +245,8 @@ class TestDynaFlowTaskTypeSchema:
             new_obj.display_order)
         assert obj_from_dict.is_active == (
             new_obj.is_active)
+        assert obj_from_dict.is_cpu_bound == (
+            new_obj.is_cpu_bound)
         assert obj_from_dict.lookup_enum_name == (
             new_obj.lookup_enum_name)
         assert obj_from_dict.max_retry_count == (
@@ -302,6 +309,8 @@ class TestDynaFlowTaskTypeSchema:
             str(self.sample_data['display_order']))
         assert str(deserialized_data['is_active']) == (
             str(self.sample_data['is_active']))
+        assert str(deserialized_data['is_cpu_bound']) == (
+            str(self.sample_data['is_cpu_bound']))
         assert str(deserialized_data['lookup_enum_name']) == (
             str(self.sample_data['lookup_enum_name']))
         assert str(deserialized_data['max_retry_count']) == (
@@ -396,6 +405,10 @@ class TestDynaFlowTaskTypeSchema:
             new_obj.is_active), (
             "failed on is_active"
         )
+        assert dict_from_json['is_cpu_bound'] == (
+            new_obj.is_cpu_bound), (
+            "failed on is_cpu_bound"
+        )
         assert dict_from_json['lookup_enum_name'] == (
             new_obj.lookup_enum_name), (
             "failed on lookup_enum_name"
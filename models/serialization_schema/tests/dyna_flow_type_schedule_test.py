@@ -95,6 +95,7 @@ class TestDynaFlowTypeScheduleSchema:
         "last_update_user_id":
             "a1b2c3d4-e5f6-7a8b-9c0d-123456789012",
 # endset  # noqa: E122
+        "cron_expression": "0 6 * * *",
         "dyna_flow_type_id": 1,
         "frequency_in_hours": 42,
         "is_active": False,
@@ -148,6 +149,8 @@ class TestDynaFlowTypeScheduleSchema:
         assert result['last_update_user_id'] == (
             str(new_obj.last_update_user_id))
 
+        assert result['cron_expression'] == (
+            new_obj.cron_expression)
         assert result['dyna_flow_type_id'] == (
             new_obj.dyna_flow_type_id)
         assert result['frequency_in_hours'] == (
@@ -201,6 +204,8 @@ class TestDynaFlowTypeScheduleSchema:
             new_obj.insert_user_id)
         assert deserialized_data['last_update_user_id'] == (
             new_obj.last_update_user_id)
+        assert deserialized_data['cron_expression'] == (
+            new_obj.cron_expression)
         assert deserialized_data['dyna_flow_type_id'] == (
             new_obj.dyna_flow_type_id)
         assert deserialized_data['frequency_in_hours'] == (
@@ -240,6 +245,8 @@ class TestDynaFlowTypeScheduleSchema:
             new_obj.insert_user_id
         assert obj_from_dict.last_update_user_id == \
             new_obj.last_update_user_id
+        assert obj_from_dict.cron_expression == (
+            new_obj.cron_expression)
         assert obj_from_dict.dyna_flow_type_id == (
             new_obj.dyna_flow_type_id)
         assert obj_from_dict.frequency_in_hours == (
@@ -302,6 +309,8 @@ class TestDynaFlowTypeScheduleSchema:
             str(self.sample_data['insert_user_id']))
         assert str(deserialized_data['last_update_user_id']) == (
             str(self.sample_data['last_update_user_id']))
+        assert str(deserialized_data['cron_expression']) == (
+            str(self.sample_data['cron_expression']))
         assert str(deserialized_data['dyna_flow_type_id']) == (
             str(self.sample_data['dyna_flow_type_id']))
         assert str(deserialized_data['frequency_in_hours']) == (
@@ -391,6 +400,10 @@ class TestDynaFlowTypeScheduleSchema:
             str(new_obj.last_update_user_id)), (
             "failed on last_update_user_id"
         )
+        assert dict_from_json['cron_expression'] == (
+            new_obj.cron_expression), (
+            "failed on cron_expression"
+        )
         assert dict_from_json['dyna_flow_type_id'] == (
             new_obj.dyna_flow_type_id), (
             "failed on dyna_flow_type_id"
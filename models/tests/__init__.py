@@ -0,0 +1,4 @@
+# models/tests/__init__.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This is the __init__ module for the 'models.tests' package.
+"""
@@ -0,0 +1,116 @@
+# models/tests/base_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=redefined-outer-name
+"""
+This module contains unit tests for the partial indexes
+of the models and `create_missing_indexes` on SQLite.
+"""
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import pytest
+from config import TEST_DATABASE_URL
+from models import Base
+from models.base import create_missing_indexes, partial_index
+
+
+def _get_partial_index_name_list() -> list:
+    """
+    Returns the names of the indexes of the
+    models that have a WHERE clause.
+    """
+    return sorted(
+        index.name
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes
+        if index.dialect_options["sqlite"]["where"] is not None)
+
+
+async def _get_index_sql_dict(conn) -> dict:
+    """
+    Returns the CREATE INDEX statement of each index, by name.
+    """
+    result = await conn.execute(text(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index'"))
+    return {row.name: row.sql for row in result}
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_engine():
+    """
+    Fixture that returns the engine of an in-memory
+    SQLite database with the tables of the models.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def test_partial_index_where():
+    """
+    Test that the WHERE clause applies on the dialects
+    that support it and that no clause is left out.
+    """
+    index_dict = {
+        x.name: x
+        for x in Base.metadata.tables["farm_dyna_flow_task"].indexes
+    }
+    run_to_do_index = index_dict["ix_farm_dyna_flow_task_run_to_do"]
+
+    for dialect_name in ["postgresql", "sqlite", "mssql"]:
+        assert run_to_do_index.dialect_options[dialect_name]["where"] \
+            is not None
+
+    assert partial_index(
+        "ix_test", Base.metadata.tables["farm_pac"].c.code
+    ).dialect_options["sqlite"]["where"] is None
+
+
+@pytest.mark.asyncio
+async def test_create_missing_indexes(db_engine):
+    """
+    Test that the partial indexes dropped from existing
+    tables are created again, with their WHERE clause, and
+    that the indexes that exist are left as they are.
+    """
+    partial_index_name_list = _get_partial_index_name_list()
+
+    assert "ix_farm_dyna_flow_task_run_to_do" in partial_index_name_list
+    assert "ix_farm_dyna_flow_build_to_do" in partial_index_name_list
+
+    async with db_engine.begin() as conn:
+        for name in partial_index_name_list:
+            await conn.execute(text(f"DROP INDEX {name}"))
+
+        index_sql_dict = await _get_index_sql_dict(conn)
+
+        for name in partial_index_name_list:
+            assert name not in index_sql_dict
+
+        await conn.run_sync(create_missing_indexes)
+        await conn.run_sync(create_missing_indexes)
+
+        index_sql_dict = await _get_index_sql_dict(conn)
+
+    for name in partial_index_name_list:
+        assert " WHERE " in index_sql_dict[name].upper()
+
+
+@pytest.mark.asyncio
+async def test_run_to_do_index_used(db_engine):
+    """
+    Test that SQLite answers the run to-do predicate
+    with the run to-do partial index.
+    """
+    async with db_engine.begin() as conn:
+        result = await conn.execute(text(
+            "EXPLAIN QUERY PLAN "
+            "SELECT dyna_flow_task_id FROM farm_dyna_flow_task "
+            "WHERE is_canceled = 0 AND is_started = 0 "
+            "AND is_completed = 0 "
+            "AND min_start_utc_date_time <= datetime('now')"))
+        plan = " ".join(str(row[-1]) for row in result)
+
+    assert "ix_farm_dyna_flow_task_run_to_do" in plan
@@ -8,12 +8,14 @@ This module is the manager for report
 
 import json
 import csv
+import io
 import uuid  # noqa: F401
 import logging
 from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
-from typing import List
+from typing import Any, AsyncIterator, List
 from helpers import SessionContext, TypeConversion  # noqa: F401
+from helpers.payload_logging import is_payload_logged
 from reports.providers.land_plant_list import (
     ReportProviderLandPlantList)
 from reports.row_models.land_plant_list import (
@@ -30,6 +32,8 @@ class ReportManagerLandPlantList(ReportManagerBase):
     """
 
     _session_context: SessionContext
+    next_cursor: str = ""
+    total_row_count: int = 0
 
     def __init__(self, session_context: SessionContext):
         self._session_context = session_context
@@ -80,11 +84,19 @@ class ReportManagerLandPlantList(ReportManagerBase):
         item_count_per_page: int = 1,
         order_by_column_name: str = "",
         order_by_descending: bool = False,
+        is_keyset_paging: bool = False,
+        cursor: str = "",
     ) -> List[ReportItemLandPlantList]:
         """
         Generate the
         'Land Plant List' report.
 
+        When is_keyset_paging is True, the page after
+        cursor is returned instead of page_number and
+        next_cursor is set to the cursor of the next page.
+        Otherwise total_row_count is set to the number
+        of rows matching the filters.
+
         Returns:
             List[ReportItemLandPlantList]: The
                 list of report items.
@@ -96,7 +108,7 @@ class ReportManagerLandPlantList(ReportManagerBase):
         role_required = "User"
 
         if len(role_required) > 0:
-            if role_required not in self._session_context.role_name_csv:
+            if self._session_context.has_role(role_required) is not True:
                 raise ReportRequestValidationError(
                     "",
                     f"Unauthorized access. {role_required} role not found."
@@ -108,7 +120,7 @@ class ReportManagerLandPlantList(ReportManagerBase):
                 "Minimum count per page is 1"
             )
 
-        if page_number <= 0:
+        if page_number <= 0 and not is_keyset_paging:
             raise ReportRequestValidationError("page_number",
                                                "Minimum page number is 1")
 
@@ -138,8 +150,13 @@ class ReportManagerLandPlantList(ReportManagerBase):
             item_count_per_page,
             order_by_column_name,
             order_by_descending,
+            is_keyset_paging,
+            cursor,
         )
 
+        self.next_cursor = provider.next_cursor
+        self.total_row_count = provider.total_row_count
+
         result = []
 
         for data_item in data_list:
@@ -148,11 +165,12 @@ class ReportManagerLandPlantList(ReportManagerBase):
             report_item.load_data_provider_dict(data_item)
             result.append(report_item)
 
-        logging.info(
-            "ReportManagerLandPlantList"
-            ".generate Results: %s",
-            json.dumps(data_list)
-        )
+        if is_payload_logged():
+            logging.info(
+                "ReportManagerLandPlantList"
+                ".generate Results: %s",
+                json.dumps(data_list)
+            )
 
         logging.info("ReportManagerLandPlantList"
                      ".generate End")
@@ -183,6 +201,140 @@ class ReportManagerLandPlantList(ReportManagerBase):
             for obj in data_list:
                 writer.writerow(obj.__dict__)
 
+    def stream_csv(
+        self,
+        land_code: uuid.UUID,
+        flavor_code:
+            uuid.UUID = uuid.UUID(int=0),
+        some_int_val:
+            int = 0,
+        some_big_int_val:
+            int = 0,
+        some_float_val:
+            float = 0,
+        some_bit_val:
+            bool = False,
+        is_edit_allowed:
+            bool = False,
+        is_delete_allowed:
+            bool = False,
+        some_decimal_val:
+            Decimal = Decimal(0),
+        some_min_utc_date_time_val:
+            datetime = TypeConversion.get_default_date_time(),
+        some_min_date_val:
+            date = TypeConversion.get_default_date(),
+        some_money_val:
+            Decimal = Decimal(0),
+        some_n_var_char_val:
+            str = "",
+        some_var_char_val:
+            str = "",
+        some_text_val:
+            str = "",
+        some_phone_number:
+            str = "",
+        some_email_address:
+            str = "",
+# endset  # noqa: E122
+        order_by_column_name: str = "",
+        order_by_descending: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the whole
+        'Land Plant List' report (every row
+        matching the filters) as CSV bytes.
+
+        The request is validated before this method returns,
+        rows are read from the database in chunks of
+        chunk_size while the returned iterator is consumed.
+
+        Returns:
+            AsyncIterator[bytes]: The CSV content.
+        """
+        logging.info("ReportManagerLandPlantList"
+                     ".stream_csv")
+
+        role_required = "User"
+
+        if len(role_required) > 0:
+            if self._session_context.has_role(role_required) is not True:
+                raise ReportRequestValidationError(
+                    "",
+                    f"Unauthorized access. {role_required} role not found."
+                )
+
+        if chunk_size <= 0:
+            raise ReportRequestValidationError(
+                "chunk_size",
+                "Minimum chunk size is 1"
+            )
+
+        provider = ReportProviderLandPlantList(
+            self._session_context)
+
+        chunks = provider.stream_list(
+            land_code,
+            flavor_code,
+            some_int_val,
+            some_big_int_val,
+            some_float_val,
+            some_bit_val,
+            is_edit_allowed,
+            is_delete_allowed,
+            some_decimal_val,
+            some_min_utc_date_time_val,
+            some_min_date_val,
+            some_money_val,
+            some_n_var_char_val,
+            some_var_char_val,
+            some_text_val,
+            some_phone_number,
+            some_email_address,
+# endset  # noqa: E122
+            order_by_column_name,
+            order_by_descending,
+            chunk_size,
+        )
+
+        return self._build_csv_chunks(chunks)
+
+    async def _build_csv_chunks(
+        self,
+        chunks: AsyncIterator[list[dict[str, Any]]]
+    ) -> AsyncIterator[bytes]:
+        """
+        Convert chunks of provider rows into CSV bytes,
+        starting with the header row.
+
+        Args:
+            chunks (AsyncIterator[list[dict[str, Any]]]):
+                The chunks of provider rows.
+
+        Yields:
+            bytes: The CSV content of the next chunk.
+        """
+        buffer = io.StringIO()
+        writer = csv.DictWriter(
+            buffer,
+            fieldnames=list(
+                ReportItemLandPlantList.__annotations__.keys()),
+            quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+
+        async for data_list in chunks:
+            for data_item in data_list:
+                report_item = ReportItemLandPlantList()
+                report_item.load_data_provider_dict(data_item)
+                writer.writerow(report_item.__dict__)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+
+        if buffer.tell() > 0:
+            yield buffer.getvalue().encode('utf-8')
+
     async def read_csv(
         self,
         file_name: str
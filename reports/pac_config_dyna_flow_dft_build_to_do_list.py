@@ -14,6 +14,7 @@ from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
 from typing import List
 from helpers import SessionContext, TypeConversion  # noqa: F401
+from helpers.payload_logging import is_payload_logged
 from reports.providers.pac_config_dyna_flow_dft_build_to_do_list import (
     ReportProviderPacConfigDynaFlowDFTBuildToDoList)
 from reports.row_models.pac_config_dyna_flow_dft_build_to_do_list import (
@@ -66,7 +67,7 @@ class ReportManagerPacConfigDynaFlowDFTBuildToDoList(ReportManagerBase):
         role_required = "Config"
 
         if len(role_required) > 0:
-            if role_required not in self._session_context.role_name_csv:
+            if self._session_context.has_role(role_required) is not True:
                 raise ReportRequestValidationError(
                     "",
                     f"Unauthorized access. {role_required} role not found."
@@ -103,11 +104,12 @@ class ReportManagerPacConfigDynaFlowDFTBuildToDoList(ReportManagerBase):
             report_item.load_data_provider_dict(data_item)
             result.append(report_item)
 
-        logging.info(
-            "ReportManagerPacConfigDynaFlowDFTBuildToDoList"
-            ".generate Results: %s",
-            json.dumps(data_list)
-        )
+        if is_payload_logged():
+            logging.info(
+                "ReportManagerPacConfigDynaFlowDFTBuildToDoList"
+                ".generate Results: %s",
+                json.dumps(data_list)
+            )
 
         logging.info("ReportManagerPacConfigDynaFlowDFTBuildToDoList"
                      ".generate End")
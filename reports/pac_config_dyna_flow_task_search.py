@@ -14,6 +14,7 @@ from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
 from typing import List
 from helpers import SessionContext, TypeConversion  # noqa: F401
+from helpers.payload_logging import is_payload_logged
 from reports.providers.pac_config_dyna_flow_task_search import (
     ReportProviderPacConfigDynaFlowTaskSearch)
 from reports.row_models.pac_config_dyna_flow_task_search import (
@@ -74,7 +75,7 @@ class ReportManagerPacConfigDynaFlowTaskSearch(ReportManagerBase):
         role_required = "Config"
 
         if len(role_required) > 0:
-            if role_required not in self._session_context.role_name_csv:
+            if self._session_context.has_role(role_required) is not True:
                 raise ReportRequestValidationError(
                     "",
                     f"Unauthorized access. {role_required} role not found."
@@ -115,11 +116,12 @@ class ReportManagerPacConfigDynaFlowTaskSearch(ReportManagerBase):
             report_item.load_data_provider_dict(data_item)
             result.append(report_item)
 
-        logging.info(
-            "ReportManagerPacConfigDynaFlowTaskSearch"
-            ".generate Results: %s",
-            json.dumps(data_list)
-        )
+        if is_payload_logged():
+            logging.info(
+                "ReportManagerPacConfigDynaFlowTaskSearch"
+                ".generate Results: %s",
+                json.dumps(data_list)
+            )
 
         logging.info("ReportManagerPacConfigDynaFlowTaskSearch"
                      ".generate End")
@@ -14,6 +14,7 @@ from datetime import date, datetime, timezone  # noqa: F401
 from decimal import Decimal  # noqa: F401
 from typing import List
 from helpers import SessionContext, TypeConversion  # noqa: F401
+from helpers.payload_logging import is_payload_logged
 from reports.providers.pac_user_date_greater_than_filter_list import (
     ReportProviderPacUserDateGreaterThanFilterList)
 from reports.row_models.pac_user_date_greater_than_filter_list import (
@@ -65,7 +66,7 @@ class ReportManagerPacUserDateGreaterThanFilterList(ReportManagerBase):
         role_required = ""
 
         if len(role_required) > 0:
-            if role_required not in self._session_context.role_name_csv:
+            if self._session_context.has_role(role_required) is not True:
                 raise ReportRequestValidationError(
                     "",
                     f"Unauthorized access. {role_required} role not found."
@@ -102,11 +103,12 @@ class ReportManagerPacUserDateGreaterThanFilterList(ReportManagerBase):
             report_item.load_data_provider_dict(data_item)
             result.append(report_item)
 
-        logging.info(
-            "ReportManagerPacUserDateGreaterThanFilterList"
-            ".generate Results: %s",
-            json.dumps(data_list)
-        )
+        if is_payload_logged():
+            logging.info(
+                "ReportManagerPacUserDateGreaterThanFilterList"
+                ".generate Results: %s",
+                json.dumps(data_list)
+            )
 
         logging.info("ReportManagerPacUserDateGreaterThanFilterList"
                      ".generate End")
@@ -11,13 +11,16 @@ of land plants based on the provided parameters.
 import json
 from datetime import date, datetime, timezone  # noqa: F401
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 import uuid  # noqa: F401
 from decimal import Decimal  # noqa: F401
 import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
-from helpers import SessionContext
+from helpers import KeysetCursor, SessionContext
+from helpers.payload_logging import is_payload_logged
+from reports.report_request_validation_error import (
+    ReportRequestValidationError)
 
 
 class ReportProviderLandPlantList():
@@ -37,11 +40,45 @@ class ReportProviderLandPlantList():
         _session_context (SessionContext): The session context object.
         _session (AsyncSession): The async session object.
         _cached_sql_query (str): Static variable for caching the SQL query.
+        _cached_keyset_sql_query (str): Static variable for caching
+            the keyset paging SQL query.
+        next_cursor (str): The cursor of the page following the last
+            keyset paginated page, or empty if there are no more rows.
+        total_row_count (int): The number of rows matching the
+            filters of the last page numbered query.
     """
 
     _session_context: SessionContext
     _session: AsyncSession
     _cached_sql_query: str = ""
+    _cached_keyset_sql_query: str = ""
+    next_cursor: str = ""
+    total_row_count: int = 0
+
+    # the keyset query always has a row limit, streaming reads all rows
+    _stream_row_limit: int = 2147483647
+
+    # order_by_column_name -> sql sort expression used for keyset paging
+    _keyset_sort_columns: dict[str, str] = {
+        "": "plant.plant_id",
+        "SomeIntVal": "plant.some_int_val",
+        "SomeBigIntVal": "plant.some_big_int_val",
+        "SomeBitVal": "plant.some_bit_val",
+        "IsEditAllowed": "plant.is_edit_allowed",
+        "IsDeleteAllowed": "plant.is_delete_allowed",
+        "SomeFloatVal": "plant.some_float_val",
+        "SomeDecimalVal": "plant.some_decimal_val",
+        "SomeUTCDateTimeVal": "plant.some_utc_date_time_val",
+        "SomeDateVal": "plant.some_date_val",
+        "SomeMoneyVal": "plant.some_money_val",
+        "SomeNVarCharVal": "plant.some_n_var_char_val",
+        "SomeVarCharVal": "plant.some_var_char_val",
+        "SomePhoneNumber": "plant.some_phone_number",
+        "SomeEmailAddress": "plant.some_email_address",
+        "FlavorName": "COALESCE(plantflavor.name, '')",
+        "SomeIntConditionalOnDeletable": "plant.some_int_val",
+        "NVarCharAsUrl": "plant.some_n_var_char_val",
+    }
 
     def __init__(self, session_context: SessionContext):
         """
@@ -81,11 +118,20 @@ class ReportProviderLandPlantList():
         item_count_per_page: int,
         order_by_column_name: str,
         order_by_descending: bool,
+        is_keyset_paging: bool = False,
+        cursor: str = "",
     ) -> list[dict[str, Any]]:
         """
         Generates a list of land plants based
         on the provided parameters.
 
+        When is_keyset_paging is True the page_number is ignored.
+        The page starts after the row identified by cursor
+        (or at the first row if cursor is empty) and
+        next_cursor is set to the cursor of the following page.
+        Otherwise total_row_count is set to the number of
+        rows matching the filters.
+
         Returns:
             list[dict[str, Any]]: The list of
             land plants as dictionaries.
@@ -97,6 +143,143 @@ class ReportProviderLandPlantList():
 
         logging.info("%s Start", flow_name)
         logging.info("%s context_code: %s", flow_name, str(context_code))
+        query_dict = self._build_query_dict(
+            context_code,
+            flavor_code,
+            some_int_val,
+            some_big_int_val,
+            some_float_val,
+            some_bit_val,
+            is_edit_allowed,
+            is_delete_allowed,
+            some_decimal_val,
+            some_min_utc_date_time_val,
+            some_min_date_val,
+            some_money_val,
+            some_n_var_char_val,
+            some_var_char_val,
+            some_text_val,
+            some_phone_number,
+            some_email_address,
+            page_number,
+            item_count_per_page,
+            order_by_column_name,
+            order_by_descending
+        )
+
+        if is_keyset_paging:
+            results = await self._generate_keyset_page(
+                query_dict,
+                item_count_per_page,
+                order_by_column_name,
+                order_by_descending,
+                cursor
+            )
+            if is_payload_logged():
+                logging.info(
+                    "%s Results: %s", flow_name, json.dumps(results))
+            logging.info("%s End", flow_name)
+            return results
+
+        if ReportProviderLandPlantList \
+                ._cached_sql_query == "":
+
+            sql_folder = "sql_server"
+            db_engine_url = str(self._session_context.session.bind.engine.url)
+            if 'sqlite' in db_engine_url:
+                sql_folder = "sqlite"
+            if 'postgresql' in db_engine_url:
+                sql_folder = "postgres"
+            # Prioritize
+            # 'land_plant_list.inc.sql'
+            # if it exists
+            inc_file_path = (
+                f"reports/providers/sql/{sql_folder}/"
+                "land_plant_list.inc.sql"
+            )
+            gen_file_path = (
+                f"reports/providers/sql/{sql_folder}/"
+                "land_plant_list.gen.sql"
+            )
+            if os.path.exists(inc_file_path):
+                file_to_read = inc_file_path
+            elif os.path.exists(gen_file_path):
+                file_to_read = gen_file_path
+            else:
+                raise FileNotFoundError("SQL file not found")
+
+            with open(file_to_read, 'r', encoding='utf-8') as file:
+                (ReportProviderLandPlantList
+                 ._cached_sql_query) = file.read()
+
+        # Execute the SQL query with the provided parameters
+        read_session = self._session_context.get_read_session()
+        cursor = await read_session.execute(
+            text(ReportProviderLandPlantList
+                 ._cached_sql_query),
+            query_dict
+        )
+
+        results = self.dictfetchall(cursor)
+
+        # every row carries the COUNT(*) OVER() of the filtered set,
+        # only a page past the end needs a second (one row) query
+        if len(results) > 0:
+            self.total_row_count = int(results[0]["total_row_count"])
+        elif page_number > 1:
+            query_dict["page_number"] = 1
+            query_dict["item_count_per_page"] = 1
+            count_cursor = await read_session.execute(
+                text(ReportProviderLandPlantList
+                     ._cached_sql_query),
+                query_dict
+            )
+            count_results = self.dictfetchall(count_cursor)
+            self.total_row_count = (
+                int(count_results[0]["total_row_count"])
+                if len(count_results) > 0
+                else 0
+            )
+        else:
+            self.total_row_count = 0
+
+        if is_payload_logged():
+            logging.info(
+                "%s Results: %s", flow_name, json.dumps(results))
+        logging.info("%s End", flow_name)
+        return results
+
+    def _build_query_dict(
+        self,
+        context_code: uuid.UUID,
+        flavor_code: uuid.UUID,
+        some_int_val: int,
+        some_big_int_val: int,
+        some_float_val: float,
+        some_bit_val: bool,
+        is_edit_allowed: bool,
+        is_delete_allowed: bool,
+        some_decimal_val: Decimal,
+        some_min_utc_date_time_val: datetime,
+        some_min_date_val: date,
+        some_money_val: Decimal,
+        some_n_var_char_val: str,
+        some_var_char_val: str,
+        some_text_val: str,
+        some_phone_number: str,
+        some_email_address: str,
+        page_number: int,
+        item_count_per_page: int,
+        order_by_column_name: str,
+        order_by_descending: bool,
+    ) -> dict[str, Any]:
+        """
+        Builds the dictionary of SQL query parameters
+        from the report filters.
+
+        Returns:
+            dict[str, Any]: The query parameters.
+        """
         query_dict = {}
         query_dict["context_code"] = (
             str(context_code))
@@ -174,50 +357,259 @@ class ReportProviderLandPlantList():
             order_by_descending)
         query_dict["user_id"] = (
             str(self._session_context.customer_code))
+        return query_dict
 
-        if ReportProviderLandPlantList \
-                ._cached_sql_query == "":
+    async def _generate_keyset_page(
+        self,
+        query_dict: dict[str, Any],
+        item_count_per_page: int,
+        order_by_column_name: str,
+        order_by_descending: bool,
+        cursor: str
+    ) -> list[dict[str, Any]]:
+        """
+        Runs the keyset (seek) paging query. Instead of numbering
+        every matching row, it seeks past the last row of the
+        previous page and reads one page, so the cost of a page
+        does not depend on how deep it is.
 
-            sql_folder = "sql_server"
-            db_engine_url = str(self._session_context.session.bind.engine.url)
-            if 'sqlite' in db_engine_url:
-                sql_folder = "sqlite"
-            if 'postgresql' in db_engine_url:
-                sql_folder = "postgres"
-            # Prioritize
-            # 'land_plant_list.inc.sql'
-            # if it exists
-            inc_file_path = (
-                f"reports/providers/sql/{sql_folder}/"
-                "land_plant_list.inc.sql"
-            )
-            gen_file_path = (
-                f"reports/providers/sql/{sql_folder}/"
-                "land_plant_list.gen.sql"
-            )
-            if os.path.exists(inc_file_path):
-                file_to_read = inc_file_path
-            elif os.path.exists(gen_file_path):
-                file_to_read = gen_file_path
-            else:
-                raise FileNotFoundError("SQL file not found")
+        Returns:
+            list[dict[str, Any]]: The list of
+            land plants as dictionaries.
+        """
+        sql_query = self._build_keyset_sql_query(
+            order_by_column_name,
+            order_by_descending
+        )
 
-            with open(file_to_read, 'r', encoding='utf-8') as file:
-                (ReportProviderLandPlantList
-                 ._cached_sql_query) = file.read()
+        after = KeysetCursor(order_by_column_name, order_by_descending)
+        if cursor:
+            try:
+                after = KeysetCursor.decode(cursor)
+            except ValueError as e:
+                raise ReportRequestValidationError(
+                    "cursor", "Invalid cursor") from e
+            if after.order_by_column_name != order_by_column_name or \
+                    after.order_by_descending != order_by_descending:
+                raise ReportRequestValidationError(
+                    "cursor",
+                    "Cursor does not match the requested order"
+                )
 
-        # Execute the SQL query with the provided parameters
-        cursor = await self._session_context.session.execute(
-            text(ReportProviderLandPlantList
-                 ._cached_sql_query),
+        query_dict["after_sort_value"] = after.sort_value
+        query_dict["after_sort_value_is_null"] = (
+            1 if after.sort_value is None else 0)
+        query_dict["after_plant_id"] = after.row_id
+        # read one extra row to find out if there is a next page
+        query_dict["row_limit"] = item_count_per_page + 1
+
+        read_session = self._session_context.get_read_session()
+        cursor_result = await read_session.execute(
+            text(sql_query),
             query_dict
         )
 
-        results = self.dictfetchall(cursor)
-        logging.info(
-            "%s Results: %s", flow_name, json.dumps(results))
-        logging.info("%s End", flow_name)
-        return results
+        rows = self.dictfetchall(cursor_result)
+
+        self.next_cursor = ""
+        if len(rows) > item_count_per_page:
+            rows = rows[:item_count_per_page]
+            last_row = rows[-1]
+            self.next_cursor = KeysetCursor(
+                order_by_column_name,
+                order_by_descending,
+                last_row["keyset_sort_value"],
+                int(last_row["keyset_plant_id"])
+            ).encode()
+
+        for row in rows:
+            del row["keyset_sort_value"]
+            del row["keyset_plant_id"]
+
+        return rows
+
+    def stream_list(
+        self,
+        context_code: uuid.UUID,
+        flavor_code: uuid.UUID,
+        some_int_val: int,
+        some_big_int_val: int,
+        some_float_val: float,
+        some_bit_val: bool,
+        is_edit_allowed: bool,
+        is_delete_allowed: bool,
+        some_decimal_val: Decimal,
+        some_min_utc_date_time_val: datetime,
+        some_min_date_val: date,
+        some_money_val: Decimal,
+        some_n_var_char_val: str,
+        some_var_char_val: str,
+        some_text_val: str,
+        some_phone_number: str,
+        some_email_address: str,
+        order_by_column_name: str,
+        order_by_descending: bool,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Streams every land plant matching the filters
+        (not just one page) through a server side cursor,
+        in lists of at most chunk_size rows so that
+        memory use does not depend on the number of rows.
+
+        The request is validated before this method returns,
+        the query runs when the iterator is first read.
+
+        Returns:
+            AsyncIterator[list[dict[str, Any]]]: The chunks of
+            land plants as dictionaries.
+        """
+        logging.info("ReportProviderLandPlantList.stream_list")
+
+        query_dict = self._build_query_dict(
+            context_code,
+            flavor_code,
+            some_int_val,
+            some_big_int_val,
+            some_float_val,
+            some_bit_val,
+            is_edit_allowed,
+            is_delete_allowed,
+            some_decimal_val,
+            some_min_utc_date_time_val,
+            some_min_date_val,
+            some_money_val,
+            some_n_var_char_val,
+            some_var_char_val,
+            some_text_val,
+            some_phone_number,
+            some_email_address,
+            1,
+            chunk_size,
+            order_by_column_name,
+            order_by_descending
+        )
+        query_dict["after_sort_value"] = None
+        query_dict["after_sort_value_is_null"] = 1
+        query_dict["after_plant_id"] = 0
+        query_dict["row_limit"] = (
+            ReportProviderLandPlantList._stream_row_limit)
+
+        sql_query = self._build_keyset_sql_query(
+            order_by_column_name,
+            order_by_descending
+        )
+
+        return self._stream_rows(sql_query, query_dict, chunk_size)
+
+    async def _stream_rows(
+        self,
+        sql_query: str,
+        query_dict: dict[str, Any],
+        chunk_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Runs the query on a server side cursor and
+        yields the rows in chunks.
+
+        Yields:
+            list[dict[str, Any]]: The next chunk of rows.
+        """
+        read_session = self._session_context.get_read_session()
+        result = await read_session.stream(
+            text(sql_query),
+            query_dict,
+            execution_options={"yield_per": chunk_size}
+        )
+
+        async for partition in result.mappings().partitions(chunk_size):
+            rows = []
+            for row in partition:
+                row_dict = dict(row)
+                del row_dict["keyset_sort_value"]
+                del row_dict["keyset_plant_id"]
+                rows.append(row_dict)
+            yield rows
+
+    def _build_keyset_sql_query(
+        self,
+        order_by_column_name: str,
+        order_by_descending: bool
+    ) -> str:
+        """
+        Returns the keyset paging SQL query ordered
+        by the requested column.
+
+        Raises:
+            ReportRequestValidationError: If the column
+                cannot be used for keyset paging.
+        """
+        if order_by_column_name not in \
+                ReportProviderLandPlantList._keyset_sort_columns:
+            raise ReportRequestValidationError(
+                "order_by_column_name",
+                "Invalid order by column name"
+            )
+
+        # NULL sorts before every value, so NULLS FIRST ascending
+        # and NULLS LAST descending, the default of SQLite and
+        # SQL Server. The seek moves between the NULL and the
+        # not NULL rows with the keyset_null_seek terms.
+        sort_column = ReportProviderLandPlantList \
+            ._keyset_sort_columns[order_by_column_name]
+        return self._get_keyset_sql_query().format(
+            keyset_sort_column=sort_column,
+            keyset_comparison="<" if order_by_descending else ">",
+            keyset_direction="DESC" if order_by_descending else "ASC",
+            keyset_nulls=(
+                "NULLS LAST" if order_by_descending else "NULLS FIRST"),
+            keyset_null_seek_flag=0 if order_by_descending else 1,
+            keyset_null_seek_test=(
+                "is null" if order_by_descending else "is not null")
+        )
+
+    def _get_keyset_sql_query(self) -> str:
+        """
+        Returns the keyset paging SQL query for the
+        current database engine, reading it from disk
+        the first time it is needed.
+
+        Returns:
+            str: The SQL query.
+        """
+        if ReportProviderLandPlantList \
+                ._cached_keyset_sql_query != "":
+            return ReportProviderLandPlantList._cached_keyset_sql_query
+
+        sql_folder = "sql_server"
+        db_engine_url = str(self._session_context.session.bind.engine.url)
+        if 'sqlite' in db_engine_url:
+            sql_folder = "sqlite"
+        if 'postgresql' in db_engine_url:
+            sql_folder = "postgres"
+        # Prioritize
+        # 'land_plant_list.keyset.inc.sql'
+        # if it exists
+        inc_file_path = (
+            f"reports/providers/sql/{sql_folder}/"
+            "land_plant_list.keyset.inc.sql"
+        )
+        gen_file_path = (
+            f"reports/providers/sql/{sql_folder}/"
+            "land_plant_list.keyset.gen.sql"
+        )
+        if os.path.exists(inc_file_path):
+            file_to_read = inc_file_path
+        elif os.path.exists(gen_file_path):
+            file_to_read = gen_file_path
+        else:
+            raise FileNotFoundError("SQL file not found")
+
+        with open(file_to_read, 'r', encoding='utf-8') as file:
+            (ReportProviderLandPlantList
+             ._cached_keyset_sql_query) = file.read()
+
+        return ReportProviderLandPlantList._cached_keyset_sql_query
 
     def dictfetchall(self, cursor) -> list[dict[str, Any]]:
         """
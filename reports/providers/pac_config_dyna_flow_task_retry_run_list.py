@@ -18,6 +18,7 @@ import logging
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from helpers import SessionContext
+from helpers.payload_logging import is_payload_logged
 
 
 class ReportProviderPacConfigDynaFlowTaskRetryRunList():
@@ -130,15 +131,17 @@ class ReportProviderPacConfigDynaFlowTaskRetryRunList():
                  ._cached_sql_query) = file.read()
 
         # Execute the SQL query with the provided parameters
-        cursor = await self._session_context.session.execute(
+        read_session = self._session_context.get_read_session()
+        cursor = await read_session.execute(
             text(ReportProviderPacConfigDynaFlowTaskRetryRunList
                  ._cached_sql_query),
             query_dict
         )
 
         results = self.dictfetchall(cursor)
-        logging.info(
-            "%s Results: %s", flow_name, json.dumps(results))
+        if is_payload_logged():
+            logging.info(
+                "%s Results: %s", flow_name, json.dumps(results))
         logging.info("%s End", flow_name)
         return results
 
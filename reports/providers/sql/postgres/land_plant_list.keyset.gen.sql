@@ -0,0 +1,117 @@
+
+
+	SELECT
+
+		plant.code as plant_code,
+
+		plant.some_int_val as some_int_val,
+
+		plant.some_big_int_val as some_big_int_val,
+
+		plant.some_bit_val as some_bit_val,
+
+		plant.is_edit_allowed as is_edit_allowed,
+
+		plant.is_delete_allowed as is_delete_allowed,
+
+		plant.some_float_val as some_float_val,
+
+		plant.some_decimal_val as some_decimal_val,
+
+		plant.some_utc_date_time_val as some_utc_date_time_val,
+
+		plant.some_date_val as some_date_val,
+
+		plant.some_money_val as some_money_val,
+
+		plant.some_n_var_char_val as some_n_var_char_val,
+
+		plant.some_var_char_val as some_var_char_val,
+
+		plant.some_text_val as some_text_val,
+
+		plant.some_phone_number as some_phone_number,
+
+		plant.some_email_address as some_email_address,
+
+		plantflavor.name as flavor_name,
+
+		plantflavor.code as flavor_code,
+
+		plant.some_int_val as some_int_conditional_on_deletable,
+
+		plant.some_n_var_char_val as n_var_char_as_url,
+
+		plant.code as update_link_plant_code,
+
+		plant.code as delete_async_button_link_plant_code,
+
+		plant.code as details_link_plant_code,
+
+		pac.code as test_file_download_link_pac_code,
+
+		pac.code as test_conditional_file_download_link_pac_code,
+
+		pac.code as test_async_flow_req_link_pac_code,
+
+		pac.code as test_conditional_async_flow_req_link_pac_code,
+
+		plant.code as conditional_btn_example_link_plant_code,
+
+		{keyset_sort_column} as keyset_sort_value,
+
+		plant.plant_id as keyset_plant_id
+
+	from
+	 	farm_land  land  --owner obj
+
+		  join farm_plant plant on land.land_id = plant.land_id		 --child obj
+
+		left join farm_flavor plantflavor on plant.flvr_foreign_key_id = plantflavor.flavor_id --child obj lookup prop
+
+		left join farm_pac pac on pac.pac_id = land.pac_id  -- up obj tree
+
+	where
+		 (land.code = :context_code
+		   )
+
+		and (:flavor_code is null or :flavor_code = '00000000-0000-0000-0000-000000000000' or :flavor_code = plantflavor.code)
+
+		and (:some_int_val is null or :some_int_val = 0 or :some_int_val = plant.some_int_val)
+
+		and (:some_big_int_val is null or :some_big_int_val = 0 or :some_big_int_val = plant.some_big_int_val)
+
+		and (:some_float_val is null or :some_float_val = 0 or :some_float_val = plant.some_float_val)
+
+		and (:some_bit_val is null or :some_bit_val = 0 or :some_bit_val = plant.some_bit_val)
+
+		and (:is_edit_allowed is null or :is_edit_allowed = 0 or :is_edit_allowed = plant.is_edit_allowed)
+
+		and (:is_delete_allowed is null or :is_delete_allowed = 0 or :is_delete_allowed = plant.is_edit_allowed)
+
+		and (:some_decimal_val is null or :some_decimal_val = 0 or :some_decimal_val = plant.some_decimal_val)
+
+		and (:some_min_utc_date_time_val is null or :some_min_utc_date_time_val = Null or :some_min_utc_date_time_val = plant.some_utc_date_time_val)
+
+		and (:some_min_date_val is null or :some_min_date_val = Null or :some_min_date_val = plant.some_date_val)
+
+		and (:some_money_val is null or :some_money_val = 0 or :some_money_val = plant.some_money_val)
+
+		and (:some_n_var_char_val is null or :some_n_var_char_val = '' or  plant.some_n_var_char_val like :like_some_n_var_char_val)
+
+		and (:some_var_char_val is null or :some_var_char_val = '' or  plant.some_var_char_val like :like_some_var_char_val)
+
+		and (:some_text_val is null or :some_text_val = '' or  plant.some_text_val like :like_some_text_val)
+
+		and (:some_phone_number is null or :some_phone_number = '' or  plant.some_phone_number like :like_some_phone_number)
+
+		and (:some_email_address is null or :some_email_address = '' or  plant.some_email_address like :like_some_email_address)
+
+		and (:after_plant_id = 0
+			or {keyset_sort_column} {keyset_comparison} :after_sort_value
+			or ({keyset_sort_column} = :after_sort_value and plant.plant_id {keyset_comparison} :after_plant_id)
+			or (:after_sort_value_is_null = 1 and {keyset_sort_column} is null and plant.plant_id {keyset_comparison} :after_plant_id)
+			or (:after_sort_value_is_null = {keyset_null_seek_flag} and {keyset_sort_column} {keyset_null_seek_test}))
+
+	ORDER BY {keyset_sort_column} {keyset_direction} {keyset_nulls}, plant.plant_id {keyset_direction}
+	LIMIT :row_limit
@@ -133,7 +133,9 @@
 
 					CASE WHEN :order_by_descending = 1 and :order_by_column_name = 'placeholder' THEN ''  END DESC
 
-				) AS ROWNUMBER
+				) AS ROWNUMBER,
+
+			COUNT(*) OVER() AS total_row_count
 		  -- select *
 		from
 		 	farm_land  land  --owner obj
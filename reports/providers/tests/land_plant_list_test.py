@@ -11,12 +11,17 @@ import uuid  # noqa: F401
 import sqlite3
 from decimal import Decimal  # noqa: F401
 from datetime import datetime, date  # noqa: F401
+from unittest.mock import patch
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
 from helpers.session_context import SessionContext
 from helpers.type_conversion import TypeConversion  # noqa: F401
 from models.factory.land import LandFactory
+from models.factory.plant import PlantFactory
 from reports.providers.land_plant_list import (
     ReportProviderLandPlantList)
+from reports.report_request_validation_error import (
+    ReportRequestValidationError)
 import current_runtime
 
 
@@ -140,3 +145,283 @@ class TestReportProviderLandPlantList:
             ]
             for key in expected_keys:
                 assert key in result, f"Key {key} not found in result"
+
+    @pytest.mark.asyncio
+    async def test_report_keyset_paging(self, session):
+        """
+        This test case verifies that keyset paging
+        walks through every row exactly once and
+        ends with an empty next cursor.
+        """
+
+        session_context = SessionContext({}, session)
+        await current_runtime.initialize(session_context)
+        land = await LandFactory.create_async(session=session)
+        plant_codes = set()
+        for _ in range(5):
+            plant = await PlantFactory.create_async(session=session)
+            plant.land_id = land.land_id
+            plant_codes.add(plant.code)
+        await session.flush()
+
+        for order_by_column_name in ["", "SomeIntVal", "FlavorName"]:
+            report_provider = ReportProviderLandPlantList(
+                session_context)
+            result_codes = []
+            cursor = ""
+            page_count = 0
+            while True:
+                results = await report_provider.generate_list(
+                    land.code,
+                    uuid.UUID(int=0),
+                    0,
+                    0,
+                    0,
+                    False,
+                    False,
+                    False,
+                    Decimal(0),
+                    TypeConversion.get_default_date_time(),
+                    TypeConversion.get_default_date(),
+                    Decimal(0),
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",
+# endset  # noqa: E122
+                    1,
+                    2,
+                    order_by_column_name,
+                    True,
+                    is_keyset_paging=True,
+                    cursor=cursor
+                )
+                page_count += 1
+                assert len(results) <= 2
+                for result in results:
+                    assert "keyset_sort_value" not in result
+                    assert "keyset_plant_id" not in result
+                    result_codes.append(
+                        TypeConversion.get_uuid(result["plant_code"]))
+                cursor = report_provider.next_cursor
+                if cursor == "":
+                    break
+
+            assert page_count == 3
+            assert len(result_codes) == len(plant_codes)
+            assert set(result_codes) == plant_codes
+
+    @pytest.mark.asyncio
+    async def test_report_keyset_paging_null_sort_value(self, session):
+        """
+        This test case verifies that keyset paging
+        returns every row exactly once when pages
+        start and end on NULL sort values, with NULL
+        sorted before every value.
+        """
+
+        session_context = SessionContext({}, session)
+        await current_runtime.initialize(session_context)
+        land = await LandFactory.create_async(session=session)
+        some_int_val_by_code = {}
+        for some_int_val in [None, 5, None, 3, None]:
+            plant = await PlantFactory.create_async(session=session)
+            plant.land_id = land.land_id
+            plant._some_int_val = some_int_val  # pylint: disable=protected-access # noqa: E501
+            some_int_val_by_code[plant.code] = some_int_val
+        await session.flush()
+
+        for order_by_descending in [False, True]:
+            report_provider = ReportProviderLandPlantList(
+                session_context)
+            result_codes = []
+            cursor = ""
+            while True:
+                results = await report_provider.generate_list(
+                    land.code,
+                    uuid.UUID(int=0),
+                    0,
+                    0,
+                    0,
+                    False,
+                    False,
+                    False,
+                    Decimal(0),
+                    TypeConversion.get_default_date_time(),
+                    TypeConversion.get_default_date(),
+                    Decimal(0),
+                    "",
+                    "",
+                    "",
+                    "",
+                    "",
+# endset  # noqa: E122
+                    1,
+                    2,
+                    "SomeIntVal",
+                    order_by_descending,
+                    is_keyset_paging=True,
+                    cursor=cursor
+                )
+                result_codes.extend(
+                    TypeConversion.get_uuid(result["plant_code"])
+                    for result in results)
+                cursor = report_provider.next_cursor
+                if cursor == "":
+                    break
+
+            assert len(result_codes) == len(some_int_val_by_code)
+            assert set(result_codes) == set(some_int_val_by_code)
+
+            expected_values = [None, None, None, 3, 5]
+            if order_by_descending:
+                expected_values.reverse()
+            assert [some_int_val_by_code[code]
+                    for code in result_codes] == expected_values
+
+    @pytest.mark.asyncio
+    async def test_report_keyset_paging_invalid_cursor(self, session):
+        """
+        This test case verifies that a cursor that
+        cannot be decoded is reported as a
+        validation error.
+        """
+
+        session_context = SessionContext({}, session)
+        report_provider = ReportProviderLandPlantList(
+            session_context)
+        land = await LandFactory.create_async(session=session)
+
+        with pytest.raises(ReportRequestValidationError):
+            await report_provider.generate_list(
+                land.code,
+                uuid.UUID(int=0),
+                0,
+                0,
+                0,
+                False,
+                False,
+                False,
+                Decimal(0),
+                TypeConversion.get_default_date_time(),
+                TypeConversion.get_default_date(),
+                Decimal(0),
+                "",
+                "",
+                "",
+                "",
+                "",
+# endset  # noqa: E122
+                1,
+                2,
+                "",
+                False,
+                is_keyset_paging=True,
+                cursor="not-a-cursor"
+            )
+
+    @pytest.mark.asyncio
+    async def test_report_total_row_count(self, session):
+        """
+        This test case verifies that the total row
+        count is returned with the page, including
+        for a page past the last row.
+        """
+
+        session_context = SessionContext({}, session)
+        await current_runtime.initialize(session_context)
+        land = await LandFactory.create_async(session=session)
+        for _ in range(3):
+            plant = await PlantFactory.create_async(session=session)
+            plant.land_id = land.land_id
+        await session.flush()
+
+        for page_number, expected_row_count in [(1, 2), (2, 1), (5, 0)]:
+            report_provider = ReportProviderLandPlantList(
+                session_context)
+            results = await report_provider.generate_list(
+                land.code,
+                uuid.UUID(int=0),
+                0,
+                0,
+                0,
+                False,
+                False,
+                False,
+                Decimal(0),
+                TypeConversion.get_default_date_time(),
+                TypeConversion.get_default_date(),
+                Decimal(0),
+                "",
+                "",
+                "",
+                "",
+                "",
+# endset  # noqa: E122
+                page_number,
+                2,
+                "",
+                False
+            )
+            assert len(results) == expected_row_count
+            assert report_provider.total_row_count == 3
+
+    @pytest.mark.asyncio
+    async def test_report_read_session_routing(self, session):
+        """
+        This test case verifies that the report runs on
+        the read session when one is set, and on the
+        primary session when read your writes is set.
+        """
+
+        land = await LandFactory.create_async(session=session)
+        plant = await PlantFactory.create_async(session=session)
+        plant.land_id = land.land_id
+        await session.flush()
+
+        session.info["read_session"] = AsyncSession(bind=session.bind)
+        session_context = SessionContext({}, session)
+        read_session = session_context.read_session
+
+        try:
+            for read_your_writes in [False, True]:
+                session_context.read_your_writes = read_your_writes
+                report_provider = ReportProviderLandPlantList(
+                    session_context)
+                with patch.object(
+                        read_session, "execute",
+                        wraps=read_session.execute) as read_execute, \
+                        patch.object(
+                            session, "execute",
+                            wraps=session.execute) as primary_execute:
+                    results = await report_provider.generate_list(
+                        land.code,
+                        uuid.UUID(int=0),
+                        0,
+                        0,
+                        0,
+                        False,
+                        False,
+                        False,
+                        Decimal(0),
+                        TypeConversion.get_default_date_time(),
+                        TypeConversion.get_default_date(),
+                        Decimal(0),
+                        "",
+                        "",
+                        "",
+                        "",
+                        "",
+# endset  # noqa: E122
+                        1,
+                        10,
+                        "",
+                        False
+                    )
+                assert len(results) == 1
+                assert read_execute.called is not read_your_writes
+                assert primary_execute.called is read_your_writes
+        finally:
+            del session.info["read_session"]
+            await read_session.close()
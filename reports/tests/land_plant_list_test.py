@@ -9,6 +9,8 @@ class in the
 `land_plant_list` module.
 """
 
+import csv
+import io
 import os
 import sqlite3
 import uuid  # noqa: F401
@@ -20,6 +22,7 @@ import pytest
 from helpers.session_context import SessionContext
 from helpers.type_conversion import TypeConversion  # noqa: F401
 from models.factory.land import LandFactory
+from models.factory.plant import PlantFactory
 from reports.land_plant_list import \
     ReportManagerLandPlantList
 from reports.providers.land_plant_list import \
@@ -81,6 +84,8 @@ class TestReportManagerLandPlantList:
             item_count_per_page: int,
             order_by_column_name: str,
             order_by_descending: bool,
+            is_keyset_paging: bool = False,
+            cursor: str = "",
         ):
             result = []
             return result
@@ -192,6 +197,8 @@ class TestReportManagerLandPlantList:
             item_count_per_page: int,
             order_by_column_name: str,
             order_by_descending: bool,
+            is_keyset_paging: bool = False,
+            cursor: str = "",
         ):
             result = []
             return result
@@ -300,6 +307,8 @@ class TestReportManagerLandPlantList:
             item_count_per_page: int,
             order_by_column_name: str,
             order_by_descending: bool,
+            is_keyset_paging: bool = False,
+            cursor: str = "",
         ):
             result = []
             return result
@@ -405,6 +414,61 @@ class TestReportManagerLandPlantList:
 
         os.remove(file_name)
 
+    @pytest.mark.asyncio
+    async def test_stream_csv(self, session):
+        """
+        Test case for the stream_csv method of
+        ReportManagerLandPlantList.
+
+        Streams every plant of a land in small chunks
+        and verifies the header and one row per plant.
+
+        Args:
+            session: The session object used for testing.
+        """
+
+        session_context = SessionContext({}, session)
+        session_context.role_name_csv = "User"
+        land = await LandFactory.create_async(session=session)
+        plant_codes = set()
+        for _ in range(5):
+            plant = await PlantFactory.create_async(session=session)
+            plant.land_id = land.land_id
+            plant_codes.add(str(plant.code))
+        await session.flush()
+
+        report_generator = ReportManagerLandPlantList(
+            session_context)
+        csv_stream = report_generator.stream_csv(
+            land.code,
+            chunk_size=2)
+
+        chunks = [chunk async for chunk in csv_stream]
+        rows = list(csv.reader(
+            io.StringIO(b"".join(chunks).decode('utf-8'))))
+
+        assert len(chunks) == 3
+        assert rows[0][0] == "plant_code"
+        assert len(rows) == len(plant_codes) + 1
+        assert {row[0] for row in rows[1:]} == plant_codes
+
+    @pytest.mark.asyncio
+    async def test_stream_csv_unauthorized(self, session):
+        """
+        Test case to verify that stream_csv checks the
+        required role before any row is read.
+
+        Args:
+            session: The session object used for testing.
+        """
+
+        session_context = SessionContext({}, session)
+        report_generator = ReportManagerLandPlantList(
+            session_context)
+
+        with pytest.raises(ReportRequestValidationError):
+            report_generator.stream_csv(uuid.uuid4())
+
     @pytest.mark.asyncio
     async def test_read_csv(self, session):
         """
@@ -0,0 +1,212 @@
+# services/azure_service_bus_queue_backend.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the AzureServiceBusQueueBackend class,
+the queue backend that uses Azure Service Bus queues.
+"""
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from azure.servicebus import ServiceBusMessage
+from azure.servicebus.aio import (ServiceBusClient, ServiceBusReceiver,
+                                  ServiceBusSender)
+from azure.servicebus.aio.management import ServiceBusAdministrationClient
+from azure.servicebus.exceptions import (MessageAlreadySettled,
+                                         MessageLockLostError)
+
+from services.queue_backend import QueueBackend, QueueMessage
+
+
+class AzureServiceBusQueueBackend(QueueBackend):
+    """
+    A queue backend that uses Azure Service Bus queues
+    with the asyncio client.
+
+    One sender and one peek lock receiver are opened per
+    queue and reused until the backend is closed.
+
+    Service Bus locks a received message for the lock
+    duration of the queue, so the visibility timeout
+    arguments are not used. The lock of a message
+    expires at its locked_until_utc time.
+    """
+    def __init__(self, connection_string: str):
+        if len(connection_string) == 0:
+            raise ValueError("Azure Service Bus connection string is not set.")
+
+        self._connection_string = connection_string
+        self._client = ServiceBusClient.from_connection_string(
+            connection_string)
+        self._administration_client = None
+        self._senders: Dict[str, ServiceBusSender] = {}
+        self._receivers: Dict[str, ServiceBusReceiver] = {}
+
+    def _get_sender(self, queue_name: str) -> ServiceBusSender:
+        if queue_name not in self._senders:
+            self._senders[queue_name] = self._client.get_queue_sender(
+                queue_name)
+        return self._senders[queue_name]
+
+    def _get_receiver(self, queue_name: str) -> ServiceBusReceiver:
+        if queue_name not in self._receivers:
+            self._receivers[queue_name] = self._client.get_queue_receiver(
+                queue_name)
+        return self._receivers[queue_name]
+
+    async def send_messages(
+        self,
+        queue_name: str,
+        body_list: List[str]
+    ) -> None:
+        """
+        Send messages to a queue, in as few
+        message batches as their size allows.
+        """
+        if len(body_list) == 0:
+            return
+
+        sender = self._get_sender(queue_name)
+        batch = await sender.create_message_batch()
+        for body in body_list:
+            message = ServiceBusMessage(body)
+            try:
+                batch.add_message(message)
+            except ValueError:
+                # the batch is full
+                await sender.send_messages(batch)
+                batch = await sender.create_message_batch()
+                batch.add_message(message)
+        await sender.send_messages(batch)
+
+    async def receive_messages(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        max_wait_time: float,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        """
+        Receive up to max_message_count messages from a queue,
+        waiting up to max_wait_time seconds for the first one.
+        """
+        receiver = self._get_receiver(queue_name)
+        received_list = await receiver.receive_messages(
+            max_message_count=max_message_count,
+            max_wait_time=max_wait_time)
+
+        return [
+            QueueMessage(
+                str(received),
+                message_id=str(received.message_id),
+                lock_token=str(received.lock_token),
+                delivery_count=received.delivery_count or 1,
+                native_message=received)
+            for received in received_list
+        ]
+
+    async def complete_messages(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage]
+    ) -> int:
+        """
+        Remove received messages from a queue.
+        Messages whose lock expired are skipped.
+        """
+        receiver = self._get_receiver(queue_name)
+
+        async def complete(message: QueueMessage) -> bool:
+            try:
+                await receiver.complete_message(message.native_message)
+                return True
+            except (MessageLockLostError, MessageAlreadySettled) as e:
+                print(f'Error occurred: {e}')
+                return False
+
+        result_list = await asyncio.gather(
+            *(complete(message) for message in message_list))
+        return sum(1 for result in result_list if result)
+
+    async def renew_message_locks(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> int:
+        """
+        Renew the locks of received messages
+        for another lock duration of the queue.
+        """
+        receiver = self._get_receiver(queue_name)
+
+        async def renew(message: QueueMessage) -> bool:
+            try:
+                await receiver.renew_message_lock(message.native_message)
+                return True
+            except (MessageLockLostError, MessageAlreadySettled) as e:
+                print(f'Error occurred: {e}')
+                return False
+
+        result_list = await asyncio.gather(
+            *(renew(message) for message in message_list))
+        return sum(1 for result in result_list if result)
+
+    def get_lock_seconds(
+        self,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> float:
+        """
+        Get the number of seconds until the first lock of
+        received messages expires, from the locked_until_utc
+        time of the messages. A renew moves it forward.
+        """
+        now = datetime.now(timezone.utc)
+        lock_seconds_list = []
+        for message in message_list:
+            locked_until_utc = getattr(
+                message.native_message, "locked_until_utc", None)
+            if locked_until_utc is None:
+                continue
+            if locked_until_utc.tzinfo is None:
+                locked_until_utc = locked_until_utc.replace(
+                    tzinfo=timezone.utc)
+            lock_seconds_list.append(
+                (locked_until_utc - now).total_seconds())
+
+        if len(lock_seconds_list) == 0:
+            return visibility_timeout
+        return min(lock_seconds_list)
+
+    async def get_message_count(
+        self,
+        queue_name: str
+    ) -> int:
+        """
+        Get the number of active messages in a queue,
+        from the queue runtime properties.
+        """
+        if self._administration_client is None:
+            self._administration_client = \
+                ServiceBusAdministrationClient.from_connection_string(
+                    self._connection_string)
+
+        properties = await self._administration_client \
+            .get_queue_runtime_properties(queue_name)
+        return properties.active_message_count or 0
+
+    async def close(self) -> None:
+        """
+        Close the senders, receivers and clients.
+        """
+        for link in list(self._senders.values()) + \
+                list(self._receivers.values()):
+            await link.close()
+        self._senders = {}
+        self._receivers = {}
+
+        if self._administration_client is not None:
+            await self._administration_client.close()
+            self._administration_client = None
+
+        await self._client.close()
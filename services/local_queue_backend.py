@@ -0,0 +1,379 @@
+# services/local_queue_backend.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the local queue backends, used to run
+and load test the DynaFlow processor queue mode without a
+cloud service:
+
+- InMemoryQueueBackend: the queues live in the process.
+- SqliteQueueBackend: the queues live in a SQLite file, so
+    several processors on the same machine can share them.
+"""
+import asyncio
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import aiosqlite
+
+from services.queue_backend import QueueBackend, QueueMessage
+
+
+class _InMemoryEntry:  # pylint: disable=too-few-public-methods
+    """
+    A message stored by the InMemoryQueueBackend.
+    """
+    def __init__(self, body: str):
+        self.message_id = str(uuid.uuid4())
+        self.body = body
+        self.visible_at = 0.0
+        self.lock_token = ""
+        self.delivery_count = 0
+
+
+class InMemoryQueueBackend(QueueBackend):
+    """
+    A queue backend that keeps the queues in memory.
+    The messages are lost when the process exits.
+    """
+    def __init__(self):
+        self._queues: Dict[str, Dict[str, _InMemoryEntry]] = {}
+        self._conditions: Dict[str, asyncio.Condition] = {}
+
+    def _get_queue(self, queue_name: str) -> Dict[str, _InMemoryEntry]:
+        return self._queues.setdefault(queue_name, {})
+
+    def _get_condition(self, queue_name: str) -> asyncio.Condition:
+        if queue_name not in self._conditions:
+            self._conditions[queue_name] = asyncio.Condition()
+        return self._conditions[queue_name]
+
+    async def send_messages(
+        self,
+        queue_name: str,
+        body_list: List[str]
+    ) -> None:
+        """
+        Send messages to a queue.
+        """
+        queue = self._get_queue(queue_name)
+        for body in body_list:
+            entry = _InMemoryEntry(body)
+            queue[entry.message_id] = entry
+
+        condition = self._get_condition(queue_name)
+        async with condition:
+            condition.notify_all()
+
+    def _lock_visible_entries(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        now = time.monotonic()
+        result = []
+        for entry in self._get_queue(queue_name).values():
+            if len(result) >= max_message_count:
+                break
+            if entry.visible_at > now:
+                continue
+            entry.visible_at = now + visibility_timeout
+            entry.lock_token = str(uuid.uuid4())
+            entry.delivery_count += 1
+            result.append(QueueMessage(
+                entry.body,
+                message_id=entry.message_id,
+                lock_token=entry.lock_token,
+                delivery_count=entry.delivery_count))
+        return result
+
+    def _get_next_visible_delay(self, queue_name: str) -> Optional[float]:
+        now = time.monotonic()
+        delays = [
+            entry.visible_at - now
+            for entry in self._get_queue(queue_name).values()
+        ]
+        if len(delays) == 0:
+            return None
+        return max(0.0, min(delays))
+
+    async def receive_messages(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        max_wait_time: float,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        """
+        Receive up to max_message_count messages from a queue,
+        waiting up to max_wait_time seconds for the first one.
+        """
+        deadline = time.monotonic() + max_wait_time
+        condition = self._get_condition(queue_name)
+
+        async with condition:
+            while True:
+                result = self._lock_visible_entries(
+                    queue_name, max_message_count, visibility_timeout)
+                remaining = deadline - time.monotonic()
+                if len(result) > 0 or remaining <= 0:
+                    return result
+
+                timeout = remaining
+                next_visible_delay = self._get_next_visible_delay(
+                    queue_name)
+                if next_visible_delay is not None:
+                    timeout = min(timeout, next_visible_delay)
+
+                try:
+                    await asyncio.wait_for(condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def complete_messages(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage]
+    ) -> int:
+        """
+        Remove received messages from a queue.
+        Messages whose lock expired are skipped.
+        """
+        now = time.monotonic()
+        queue = self._get_queue(queue_name)
+        count = 0
+        for message in message_list:
+            entry = queue.get(message.message_id)
+            if entry is None or entry.lock_token != message.lock_token or \
+                    entry.visible_at <= now:
+                continue
+            del queue[message.message_id]
+            count += 1
+        return count
+
+    async def renew_message_locks(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> int:
+        """
+        Extend the locks of received messages.
+        """
+        now = time.monotonic()
+        queue = self._get_queue(queue_name)
+        count = 0
+        for message in message_list:
+            entry = queue.get(message.message_id)
+            if entry is None or entry.lock_token != message.lock_token or \
+                    entry.visible_at <= now:
+                continue
+            entry.visible_at = now + visibility_timeout
+            count += 1
+        return count
+
+    async def get_message_count(
+        self,
+        queue_name: str
+    ) -> int:
+        """
+        Get the number of messages in a queue,
+        including the locked ones.
+        """
+        return len(self._get_queue(queue_name))
+
+
+class SqliteQueueBackend(QueueBackend):
+    """
+    A queue backend that keeps the queues in a SQLite file.
+
+    Each receive locks its messages with a single UPDATE
+    statement, so processes sharing the file never receive
+    the same message at the same time.
+    """
+
+    poll_seconds: float = 0.2
+
+    def __init__(self, database_path: str):
+        self._database_path = database_path
+        self._connection: Optional[aiosqlite.Connection] = None
+        self._connection_lock = asyncio.Lock()
+
+    async def _get_connection(self) -> aiosqlite.Connection:
+        async with self._connection_lock:
+            if self._connection is None:
+                connection = await aiosqlite.connect(
+                    self._database_path, timeout=30)
+                await connection.execute("PRAGMA journal_mode=WAL")
+                await connection.execute(
+                    "CREATE TABLE IF NOT EXISTS queue_message ("
+                    "message_id TEXT PRIMARY KEY, "
+                    "queue_name TEXT NOT NULL, "
+                    "body TEXT NOT NULL, "
+                    "sequence_number INTEGER NOT NULL, "
+                    "visible_at REAL NOT NULL, "
+                    "lock_token TEXT NOT NULL DEFAULT '', "
+                    "delivery_count INTEGER NOT NULL DEFAULT 0)")
+                await connection.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_queue_message_ready "
+                    "ON queue_message "
+                    "(queue_name, visible_at, sequence_number)")
+                await connection.commit()
+                self._connection = connection
+            return self._connection
+
+    async def send_messages(
+        self,
+        queue_name: str,
+        body_list: List[str]
+    ) -> None:
+        """
+        Send messages to a queue.
+        """
+        if len(body_list) == 0:
+            return
+
+        connection = await self._get_connection()
+        sequence_number = time.time_ns()
+        await connection.executemany(
+            "INSERT INTO queue_message "
+            "(message_id, queue_name, body, sequence_number, visible_at) "
+            "VALUES (?, ?, ?, ?, 0)",
+            [
+                (str(uuid.uuid4()), queue_name, body, sequence_number + index)
+                for index, body in enumerate(body_list)
+            ])
+        await connection.commit()
+
+    async def _lock_visible_messages(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        connection = await self._get_connection()
+        now = time.time()
+        lock_token = str(uuid.uuid4())
+        cursor = await connection.execute(
+            "UPDATE queue_message "
+            "SET visible_at = ?, lock_token = ?, "
+            "delivery_count = delivery_count + 1 "
+            "WHERE message_id IN ("
+            "SELECT message_id FROM queue_message "
+            "WHERE queue_name = ? AND visible_at <= ? "
+            "ORDER BY sequence_number LIMIT ?) "
+            "RETURNING message_id, body, delivery_count, sequence_number",
+            (now + visibility_timeout, lock_token, queue_name, now,
+             max_message_count))
+        rows = await cursor.fetchall()
+        await cursor.close()
+        await connection.commit()
+
+        return [
+            QueueMessage(
+                body,
+                message_id=message_id,
+                lock_token=lock_token,
+                delivery_count=delivery_count)
+            for message_id, body, delivery_count, _ in sorted(
+                rows, key=lambda row: row[3])
+        ]
+
+    async def receive_messages(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        max_wait_time: float,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        """
+        Receive up to max_message_count messages from a queue,
+        waiting up to max_wait_time seconds for the first one.
+        """
+        deadline = time.monotonic() + max_wait_time
+        while True:
+            result = await self._lock_visible_messages(
+                queue_name, max_message_count, visibility_timeout)
+            remaining = deadline - time.monotonic()
+            if len(result) > 0 or remaining <= 0:
+                return result
+            await asyncio.sleep(min(self.poll_seconds, remaining))
+
+    async def complete_messages(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage]
+    ) -> int:
+        """
+        Remove received messages from a queue.
+        Messages whose lock expired are skipped.
+        """
+        if len(message_list) == 0:
+            return 0
+
+        connection = await self._get_connection()
+        cursor = await connection.executemany(
+            "DELETE FROM queue_message "
+            "WHERE message_id = ? AND queue_name = ? "
+            "AND lock_token = ? AND visible_at > ?",
+            [
+                (message.message_id, queue_name, message.lock_token,
+                 time.time())
+                for message in message_list
+            ])
+        count = cursor.rowcount
+        await cursor.close()
+        await connection.commit()
+        return count
+
+    async def renew_message_locks(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> int:
+        """
+        Extend the locks of received messages.
+        """
+        if len(message_list) == 0:
+            return 0
+
+        connection = await self._get_connection()
+        now = time.time()
+        cursor = await connection.executemany(
+            "UPDATE queue_message SET visible_at = ? "
+            "WHERE message_id = ? AND queue_name = ? "
+            "AND lock_token = ? AND visible_at > ?",
+            [
+                (now + visibility_timeout, message.message_id, queue_name,
+                 message.lock_token, now)
+                for message in message_list
+            ])
+        count = cursor.rowcount
+        await cursor.close()
+        await connection.commit()
+        return count
+
+    async def get_message_count(
+        self,
+        queue_name: str
+    ) -> int:
+        """
+        Get the number of messages in a queue,
+        including the locked ones.
+        """
+        connection = await self._get_connection()
+        cursor = await connection.execute(
+            "SELECT COUNT(*) FROM queue_message WHERE queue_name = ?",
+            (queue_name,))
+        row = await cursor.fetchone()
+        await cursor.close()
+        return row[0] if row else 0
+
+    async def close(self) -> None:
+        """
+        Close the SQLite connection.
+        """
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
@@ -0,0 +1,395 @@
+# services/metrics.py  # pylint: disable=duplicate-code # noqa: E501
+
+"""
+This module provides in-process counters, gauges and histograms
+for the DynaFlowProcessor and the flows it runs.
+
+The metrics are kept in a MetricsRegistry and can be read as a
+dictionary snapshot, for a structured log line, or as Prometheus
+text, which `start_metrics_server` serves at `/metrics`.
+"""
+
+import asyncio
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# seconds, from a fast claim to a long running task
+DEFAULT_BUCKET_LIST = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0)
+
+
+def _format_label_values(
+    label_name_list: Sequence[str],
+    label_value_list: Sequence[str],
+    extra: str = ""
+) -> str:
+    """
+    Returns the Prometheus label set of a metric series.
+    """
+    pair_list = [
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_name_list, label_value_list)
+    ]
+    if extra:
+        pair_list.append(extra)
+    if len(pair_list) == 0:
+        return ""
+    return "{" + ",".join(pair_list) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+    """
+    return value.replace("\\", "\\\\").replace(
+        "\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    """
+    Returns a number in the Prometheus text format.
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """
+    The base class of the metric types. Each metric
+    holds one series per combination of label values.
+    """
+
+    metric_type: str = ""
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_name_list: Sequence[str] = ()
+    ):
+        self.name = name
+        self.description = description
+        self.label_name_list = tuple(label_name_list)
+        self._lock = threading.Lock()
+
+    def _get_key(self, label_dict: Dict[str, str]) -> Tuple[str, ...]:
+        """
+        Returns the series key of the label values.
+        """
+        if set(label_dict) != set(self.label_name_list):
+            raise ValueError(
+                f"Metric {self.name} expects the labels "
+                f"{list(self.label_name_list)}, got {list(label_dict)}")
+        return tuple(str(label_dict[x]) for x in self.label_name_list)
+
+    @abstractmethod
+    def get_snapshot(self) -> List[dict]:
+        """
+        Returns the series of the metric.
+        """
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """
+        Returns the Prometheus text lines of the metric.
+        """
+
+
+class Counter(Metric):
+    """
+    A value that only goes up.
+    """
+
+    metric_type = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._value_by_key: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **label_dict: str):
+        """
+        Adds the amount to the series of the labels.
+        """
+        if amount < 0:
+            raise ValueError("A counter can not be decreased")
+        key = self._get_key(label_dict)
+        with self._lock:
+            self._value_by_key[key] = \
+                self._value_by_key.get(key, 0) + amount
+
+    def get_value(self, **label_dict: str) -> float:
+        """
+        Returns the value of the series of the labels.
+        """
+        return self._value_by_key.get(self._get_key(label_dict), 0)
+
+    def get_snapshot(self) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "labels": dict(zip(self.label_name_list, key)),
+                    "value": value,
+                }
+                for key, value in self._value_by_key.items()
+            ]
+
+    def render(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{self.name}"
+                f"{_format_label_values(self.label_name_list, key)} "
+                f"{_format_number(value)}"
+                for key, value in self._value_by_key.items()
+            ]
+
+
+class Gauge(Counter):
+    """
+    A value that is set, such as a backlog size.
+    """
+
+    metric_type = "gauge"
+
+    def set(self, value: float, **label_dict: str):
+        """
+        Sets the value of the series of the labels.
+        """
+        key = self._get_key(label_dict)
+        with self._lock:
+            self._value_by_key[key] = value
+
+
+class Histogram(Metric):
+    """
+    Counts observed values, such as durations in
+    seconds, into cumulative buckets.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_name_list: Sequence[str] = (),
+        bucket_list: Sequence[float] = DEFAULT_BUCKET_LIST
+    ):
+        super().__init__(name, description, label_name_list)
+        self.bucket_list = tuple(sorted(bucket_list))
+        # key -> [bucket counts..., count of larger values], sum
+        self._series_by_key: Dict[
+            Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **label_dict: str):
+        """
+        Adds a value to the series of the labels.
+        """
+        key = self._get_key(label_dict)
+        index = bisect.bisect_left(self.bucket_list, value)
+        with self._lock:
+            series = self._series_by_key.get(key)
+            if series is None:
+                series = ([0] * (len(self.bucket_list) + 1), [0.0])
+                self._series_by_key[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def get_count(self, **label_dict: str) -> int:
+        """
+        Returns the number of values observed
+        for the series of the labels.
+        """
+        series = self._series_by_key.get(self._get_key(label_dict))
+        if series is None:
+            return 0
+        return sum(series[0])
+
+    def get_snapshot(self) -> List[dict]:
+        with self._lock:
+            snapshot = []
+            for key, (count_list, total) in self._series_by_key.items():
+                cumulative_count = 0
+                bucket_dict = {}
+                for bucket, count in zip(self.bucket_list, count_list):
+                    cumulative_count += count
+                    bucket_dict[_format_number(bucket)] = cumulative_count
+                snapshot.append({
+                    "labels": dict(zip(self.label_name_list, key)),
+                    "count": sum(count_list),
+                    "sum": total[0],
+                    "buckets": bucket_dict,
+                })
+            return snapshot
+
+    def render(self) -> List[str]:
+        line_list = []
+        with self._lock:
+            for key, (count_list, total) in self._series_by_key.items():
+                cumulative_count = 0
+                for bucket, count in zip(
+                        self.bucket_list + (float("inf"),), count_list):
+                    cumulative_count += count
+                    label_text = _format_label_values(
+                        self.label_name_list,
+                        key,
+                        f'le="{_format_number(bucket)}"')
+                    line_list.append(
+                        f"{self.name}_bucket{label_text} {cumulative_count}")
+                label_text = _format_label_values(self.label_name_list, key)
+                line_list.append(
+                    f"{self.name}_sum{label_text} {_format_number(total[0])}")
+                line_list.append(
+                    f"{self.name}_count{label_text} {cumulative_count}")
+        return line_list
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics by name. Asking for a metric
+    that already exists returns the existing one.
+    """
+
+    def __init__(self):
+        self._metric_by_name: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_add(self, metric_class: type, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metric_by_name.get(name)
+            if metric is None:
+                metric = metric_class(name, *args, **kwargs)
+                self._metric_by_name[name] = metric
+            elif type(metric) is not metric_class:  # noqa: E721
+                raise ValueError(
+                    f"Metric {name} is a {metric.metric_type}")
+            return metric
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        label_name_list: Sequence[str] = ()
+    ) -> Counter:
+        """
+        Returns the counter with the name.
+        """
+        return self._get_or_add(Counter, name, description, label_name_list)
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        label_name_list: Sequence[str] = ()
+    ) -> Gauge:
+        """
+        Returns the gauge with the name.
+        """
+        return self._get_or_add(Gauge, name, description, label_name_list)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        label_name_list: Sequence[str] = (),
+        bucket_list: Sequence[float] = DEFAULT_BUCKET_LIST
+    ) -> Histogram:
+        """
+        Returns the histogram with the name.
+        """
+        return self._get_or_add(
+            Histogram, name, description, label_name_list, bucket_list)
+
+    def get_snapshot(self) -> Dict[str, dict]:
+        """
+        Returns every metric as a dictionary,
+        for a structured log line.
+        """
+        with self._lock:
+            metric_list = list(self._metric_by_name.values())
+        return {
+            metric.name: {
+                "type": metric.metric_type,
+                "series": metric.get_snapshot(),
+            }
+            for metric in metric_list
+        }
+
+    def render_prometheus(self) -> str:
+        """
+        Returns every metric in the Prometheus text format.
+        """
+        with self._lock:
+            metric_list = list(self._metric_by_name.values())
+        line_list = []
+        for metric in metric_list:
+            line_list.append(f"# HELP {metric.name} {metric.description}")
+            line_list.append(f"# TYPE {metric.name} {metric.metric_type}")
+            line_list.extend(metric.render())
+        return "\n".join(line_list) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+
+async def _handle_metrics_request(
+    registry: MetricsRegistry,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter
+):
+    """
+    Answers one HTTP request. GET /metrics returns the
+    Prometheus text, any other path returns 404.
+    """
+    try:
+        request_line = await reader.readline()
+        # skip the request headers
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+        part_list = request_line.decode("latin-1").split()
+        path = part_list[1] if len(part_list) > 1 else ""
+
+        if len(part_list) > 0 and part_list[0] == "GET" and \
+                path.split("?")[0] == "/metrics":
+            status = "200 OK"
+            body = registry.render_prometheus().encode("utf-8")
+        else:
+            status = "404 Not Found"
+            body = b"Not Found\n"
+
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1") + body)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(
+    host: str,
+    port: int,
+    registry: Optional[MetricsRegistry] = None
+) -> asyncio.AbstractServer:
+    """
+    Serves the metrics of the registry at
+    http://host:port/metrics until the
+    returned server is closed.
+    """
+    if registry is None:
+        registry = metrics_registry
+
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_metrics_request(
+            registry, reader, writer),
+        host,
+        port)
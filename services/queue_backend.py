@@ -0,0 +1,145 @@
+# services/queue_backend.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains the QueueMessage class and the
+QueueBackend base class that the queue backends
+used by the QueueManager implement.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+
+class QueueMessage:
+    """
+    A message received from a queue.
+
+    The message stays locked by the receiver until it is
+    completed or its visibility timeout expires. After that
+    it is delivered again.
+
+    Attributes:
+        body (str): The message body.
+        message_id (str): The identifier of the message.
+        lock_token (str): The token of the current lock.
+        delivery_count (int): How many times the message
+            was delivered, including this time.
+        native_message: The message object of the backend,
+            if it has one.
+    """
+    def __init__(
+        self,
+        body: str,
+        message_id: str = "",
+        lock_token: str = "",
+        delivery_count: int = 1,
+        native_message: Optional[Any] = None
+    ):
+        self.body = body
+        self.message_id = message_id
+        self.lock_token = lock_token
+        self.delivery_count = delivery_count
+        self.native_message = native_message
+
+    def __str__(self) -> str:
+        return self.body
+
+
+class QueueBackend(ABC):
+    """
+    The base class of the queue backends.
+
+    All the methods are coroutines, and the list
+    methods work on a batch of messages per call.
+    A backend that does not implement every abstract
+    method cannot be created.
+    """
+
+    @abstractmethod
+    async def send_messages(
+        self,
+        queue_name: str,
+        body_list: List[str]
+    ) -> None:
+        """
+        Send messages to a queue.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def receive_messages(
+        self,
+        queue_name: str,
+        max_message_count: int,
+        max_wait_time: float,
+        visibility_timeout: float
+    ) -> List[QueueMessage]:
+        """
+        Receive up to max_message_count messages from a queue,
+        waiting up to max_wait_time seconds for the first one.
+
+        The received messages are hidden from other receivers
+        for visibility_timeout seconds, unless the backend
+        uses the lock duration of the queue instead.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete_messages(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage]
+    ) -> int:
+        """
+        Remove received messages from a queue.
+
+        Messages whose lock expired are skipped, and
+        will be delivered again.
+
+        Returns the number of completed messages.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def renew_message_locks(
+        self,
+        queue_name: str,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> int:
+        """
+        Extend the locks of received messages.
+
+        Returns the number of renewed locks.
+        """
+        raise NotImplementedError
+
+    def get_lock_seconds(
+        self,
+        message_list: List[QueueMessage],
+        visibility_timeout: float
+    ) -> float:
+        """
+        Get the number of seconds until the first lock of
+        received messages expires, so the locks can be
+        renewed before then.
+
+        The messages are locked for visibility_timeout
+        seconds, unless the backend uses the lock duration
+        of the queue instead.
+        """
+        return visibility_timeout
+
+    @abstractmethod
+    async def get_message_count(
+        self,
+        queue_name: str
+    ) -> int:
+        """
+        Get the number of messages in a queue,
+        including the locked ones.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Close the connections of the backend.
+        """
@@ -1,88 +1,163 @@
 # services/queue_manager.py  # pylint: disable=duplicate-code # noqa: E501
 """
 This module contains the QueueManager class which is
-responsible for managing the Azure Service Bus queue.
+responsible for managing the DynaFlow task queues.
+
+The queues are kept by the backend named by the
+DYNAFLOW_QUEUE_BACKEND setting:
+
+- azure: Azure Service Bus queues.
+- sqlite: a local SQLite file, shared by the processors
+    of the machine.
+- memory: in-process queues.
 """
+from typing import List, Optional
+
+from config import (AZURE_SERVICE_BUS_CONNECTION_STRING,
+                    DYNAFLOW_QUEUE_BACKEND, DYNAFLOW_QUEUE_SQLITE_PATH,
+                    DYNAFLOW_QUEUE_VISIBILITY_TIMEOUT_SECONDS)
+from services.queue_backend import QueueBackend, QueueMessage
+
+
+def create_queue_backend(backend_name: str) -> QueueBackend:
+    """
+    Create the queue backend with the given name.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    backend_name = backend_name.strip().lower()
+
+    if backend_name == "azure":
+        # imported here so the local backends do not
+        # require the Azure Service Bus package
+        from services.azure_service_bus_queue_backend import \
+            AzureServiceBusQueueBackend  # pylint: disable=import-outside-toplevel # noqa: E501
+        return AzureServiceBusQueueBackend(
+            AZURE_SERVICE_BUS_CONNECTION_STRING)
 
-from config import (
-    AZURE_SERVICE_BUS_CONNECTION_STRING
-)
-from azure.servicebus import ServiceBusClient, ServiceBusMessage
+    if backend_name == "sqlite":
+        from services.local_queue_backend import \
+            SqliteQueueBackend  # pylint: disable=import-outside-toplevel
+        return SqliteQueueBackend(DYNAFLOW_QUEUE_SQLITE_PATH)
+
+    if backend_name == "memory":
+        from services.local_queue_backend import \
+            InMemoryQueueBackend  # pylint: disable=import-outside-toplevel
+        return InMemoryQueueBackend()
+
+    raise ValueError(f"Unknown queue backend: {backend_name}")
 
 
 class QueueManager:
     """
     The QueueManager class is responsible for managing
-    the Azure Service Bus queue.
+    the DynaFlow task queues.
     """
 
-    def __init__(self):
+    def __init__(self, backend: Optional[QueueBackend] = None):
         """
         Initialize the QueueManager class.
+
+        Args:
+            backend (QueueBackend): The queue backend. Defaults
+                to the backend of the DYNAFLOW_QUEUE_BACKEND setting.
         """
-        self._service_bus_client = None
-        self._service_bus_client = ServiceBusClient.from_connection_string(
-            AZURE_SERVICE_BUS_CONNECTION_STRING)
+        if backend is None:
+            backend = create_queue_backend(DYNAFLOW_QUEUE_BACKEND)
 
-        if len(AZURE_SERVICE_BUS_CONNECTION_STRING) == 0:
-            raise ValueError("Azure Service Bus connection string is not set.")
+        self._backend = backend
+        self._visibility_timeout = DYNAFLOW_QUEUE_VISIBILITY_TIMEOUT_SECONDS
 
     async def get_message_count_async(self, queue_name) -> int:
         """
         Get the count of messages in a queue.
         """
-        assert self._service_bus_client is not None
-
-        receiver = self._service_bus_client.get_queue_receiver(queue_name)
-
-        count = len(receiver.peek_messages(max_message_count=32))
-
-        return count
-
-    async def read_next_message(self, queue_name) -> str:
+        return await self._backend.get_message_count(queue_name)
+
+    async def read_messages(
+        self,
+        queue_name,
+        max_message_count: int,
+        max_wait_time: float = 5
+    ) -> List[QueueMessage]:
+        """
+        Read up to max_message_count messages from the queue.
+        The messages must be completed before their
+        visibility timeout expires, or they are read again.
+        """
+        return await self._backend.receive_messages(
+            queue_name,
+            max_message_count,
+            max_wait_time,
+            self._visibility_timeout)
+
+    async def read_next_message(
+        self,
+        queue_name
+    ) -> Optional[QueueMessage]:
         """
         Read the next message from the queue.
         """
-
-        result = ""
-
-        assert self._service_bus_client is not None
-
-        receiver = self._service_bus_client.get_queue_receiver(
-            queue_name
-        )
-
-        messages = receiver.receive_messages(
-            max_message_count=1,
-            max_wait_time=5
-        )
-        if messages:
-            result = str(messages[0])
-
-        return result
+        messages = await self.read_messages(queue_name, 1)
+        if len(messages) == 0:
+            return None
+        return messages[0]
+
+    async def mark_messages_as_completed(
+        self,
+        queue_name,
+        messages: List[QueueMessage]
+    ) -> int:
+        """
+        Mark messages as completed.
+        """
+        if len(messages) == 0:
+            return 0
+        return await self._backend.complete_messages(queue_name, messages)
 
     async def mark_message_as_completed(self, queue_name, message):
         """
         Mark a message as completed.
         """
+        await self.mark_messages_as_completed(queue_name, [message])
 
-        assert self._service_bus_client is not None
+    async def renew_message_locks(
+        self,
+        queue_name,
+        messages: List[QueueMessage]
+    ) -> int:
+        """
+        Extend the locks of messages that
+        are still being processed.
+        """
+        if len(messages) == 0:
+            return 0
+        return await self._backend.renew_message_locks(
+            queue_name, messages, self._visibility_timeout)
 
-        receiver = self._service_bus_client.get_queue_receiver(
-            queue_name
-        )
+    def get_lock_seconds(self, messages: List[QueueMessage]) -> float:
+        """
+        Get the number of seconds until the first lock
+        of the messages expires.
+        """
+        return self._backend.get_lock_seconds(
+            messages, self._visibility_timeout)
 
-        receiver.complete_message(message)
+    async def send_messages_async(self, queue_name, messages: List[str]):
+        """
+        Send messages to a queue.
+        """
+        await self._backend.send_messages(queue_name, messages)
 
     async def send_message_async(self, queue_name, message):
         """
         Send a message to a queue.
         """
+        await self.send_messages_async(queue_name, [message])
 
-        assert self._service_bus_client is not None
-
-        sender = self._service_bus_client.get_queue_sender(
-            queue_name
-        )
-
-        sender.send_messages(ServiceBusMessage(message))
+    async def close(self):
+        """
+        Close the connections of the queue backend.
+        """
+        await self._backend.close()
@@ -0,0 +1,172 @@
+# services/tests/local_queue_backend_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=redefined-outer-name
+"""
+This module contains unit tests for the local queue backends,
+InMemoryQueueBackend and SqliteQueueBackend.
+"""
+import asyncio
+
+import pytest_asyncio
+
+import pytest
+from services.local_queue_backend import (InMemoryQueueBackend,
+                                          SqliteQueueBackend)
+from services.queue_backend import QueueBackend
+from services.queue_manager import QueueManager, create_queue_backend
+
+QUEUE_NAME = "test-queue"
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite"])
+async def backend(request, tmp_path):
+    """
+    Fixture that returns each local queue backend.
+    """
+    if request.param == "memory":
+        queue_backend = InMemoryQueueBackend()
+    else:
+        queue_backend = SqliteQueueBackend(str(tmp_path / "queue.db"))
+    yield queue_backend
+    await queue_backend.close()
+
+
+@pytest.mark.asyncio
+async def test_send_receive_complete(backend):
+    """
+    Test that messages are received in order
+    and removed when completed.
+    """
+    await backend.send_messages(QUEUE_NAME, ["a", "b", "c"])
+
+    assert await backend.get_message_count(QUEUE_NAME) == 3
+
+    messages = await backend.receive_messages(QUEUE_NAME, 2, 0, 30)
+
+    assert [message.body for message in messages] == ["a", "b"]
+    assert all(message.delivery_count == 1 for message in messages)
+
+    assert await backend.complete_messages(QUEUE_NAME, messages) == 2
+    assert await backend.get_message_count(QUEUE_NAME) == 1
+
+    messages = await backend.receive_messages(QUEUE_NAME, 10, 0, 30)
+
+    assert [message.body for message in messages] == ["c"]
+
+
+@pytest.mark.asyncio
+async def test_locked_messages_are_hidden(backend):
+    """
+    Test that a received message is not received again
+    until its visibility timeout expires.
+    """
+    await backend.send_messages(QUEUE_NAME, ["a"])
+
+    first = await backend.receive_messages(QUEUE_NAME, 1, 0, 0.2)
+
+    assert len(first) == 1
+    assert await backend.receive_messages(QUEUE_NAME, 1, 0, 0.2) == []
+
+    await asyncio.sleep(0.3)
+
+    second = await backend.receive_messages(QUEUE_NAME, 1, 0, 30)
+
+    assert len(second) == 1
+    assert second[0].delivery_count == 2
+
+    # the first lock expired, so it can not complete the message
+    assert await backend.complete_messages(QUEUE_NAME, first) == 0
+    assert await backend.complete_messages(QUEUE_NAME, second) == 1
+
+
+@pytest.mark.asyncio
+async def test_renew_message_locks(backend):
+    """
+    Test that renewing a lock keeps the message hidden.
+    """
+    await backend.send_messages(QUEUE_NAME, ["a"])
+
+    messages = await backend.receive_messages(QUEUE_NAME, 1, 0, 0.2)
+
+    assert await backend.renew_message_locks(QUEUE_NAME, messages, 30) == 1
+
+    await asyncio.sleep(0.3)
+
+    assert await backend.receive_messages(QUEUE_NAME, 1, 0, 30) == []
+    assert await backend.complete_messages(QUEUE_NAME, messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_receive_waits_for_message(backend):
+    """
+    Test that receive waits up to max_wait_time
+    for a message to be sent.
+    """
+    async def send_later():
+        await asyncio.sleep(0.1)
+        await backend.send_messages(QUEUE_NAME, ["late"])
+
+    sender = asyncio.create_task(send_later())
+
+    messages = await backend.receive_messages(QUEUE_NAME, 5, 2, 30)
+    await sender
+
+    assert [message.body for message in messages] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_queue_manager():
+    """
+    Test the QueueManager with the in-memory backend.
+    """
+    queue_manager = QueueManager(create_queue_backend("memory"))
+
+    await queue_manager.send_messages_async(QUEUE_NAME, ["a", "b"])
+
+    assert await queue_manager.get_message_count_async(QUEUE_NAME) == 2
+
+    message = await queue_manager.read_next_message(QUEUE_NAME)
+
+    assert message is not None
+    assert str(message) == "a"
+
+    await queue_manager.mark_message_as_completed(QUEUE_NAME, message)
+
+    assert await queue_manager.get_message_count_async(QUEUE_NAME) == 1
+
+    await queue_manager.close()
+
+
+def test_create_queue_backend_unknown():
+    """
+    Test that an unknown backend name raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_queue_backend("unknown")
+
+
+def test_incomplete_queue_backend():
+    """
+    Test that a backend that does not implement every
+    abstract method cannot be created.
+    """
+    class IncompleteQueueBackend(QueueBackend):  # pylint: disable=abstract-method # noqa: E501
+        """
+        A backend without get_message_count.
+        """
+        async def send_messages(self, queue_name, body_list):
+            pass
+
+        async def receive_messages(
+                self, queue_name, max_message_count,
+                max_wait_time, visibility_timeout):
+            return []
+
+        async def complete_messages(self, queue_name, message_list):
+            return 0
+
+        async def renew_message_locks(
+                self, queue_name, message_list, visibility_timeout):
+            return 0
+
+    with pytest.raises(TypeError):
+        IncompleteQueueBackend()  # pylint: disable=abstract-class-instantiated # noqa: E501
@@ -0,0 +1,159 @@
+# services/tests/metrics_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=redefined-outer-name
+"""
+This module contains unit tests for the metrics registry
+and the metrics endpoint.
+"""
+import asyncio
+
+import pytest
+from services.metrics import Metric, MetricsRegistry, start_metrics_server
+
+
+@pytest.fixture
+def registry():
+    """
+    Fixture that returns an empty metrics registry.
+    """
+    return MetricsRegistry()
+
+
+def test_counter(registry):
+    """
+    Test that a counter adds up by label values.
+    """
+    counter = registry.counter("task_total", "Tasks.", ["task_type"])
+
+    counter.inc(task_type="a")
+    counter.inc(2, task_type="a")
+    counter.inc(task_type="b")
+
+    assert counter.get_value(task_type="a") == 3
+    assert counter.get_value(task_type="b") == 1
+    assert counter.get_value(task_type="c") == 0
+
+    with pytest.raises(ValueError):
+        counter.inc(-1, task_type="a")
+
+    with pytest.raises(ValueError):
+        counter.inc(outcome="a")
+
+
+def test_registry_returns_existing_metric(registry):
+    """
+    Test that asking for a metric again returns the
+    same metric, and that its type can not change.
+    """
+    counter = registry.counter("task_total", "Tasks.")
+
+    assert registry.counter("task_total", "Tasks.") is counter
+
+    with pytest.raises(ValueError):
+        registry.gauge("task_total", "Tasks.")
+
+
+def test_gauge(registry):
+    """
+    Test that a gauge keeps the last value set.
+    """
+    gauge = registry.gauge("backlog", "Backlog.", ["backlog_type"])
+
+    gauge.set(10, backlog_type="task_run")
+    gauge.set(4, backlog_type="task_run")
+
+    assert gauge.get_value(backlog_type="task_run") == 4
+
+
+def test_histogram(registry):
+    """
+    Test that a histogram counts values
+    into cumulative buckets.
+    """
+    histogram = registry.histogram(
+        "run_seconds", "Run time.", ["outcome"], [1, 5])
+
+    histogram.observe(0.5, outcome="ok")
+    histogram.observe(1, outcome="ok")
+    histogram.observe(3, outcome="ok")
+    histogram.observe(10, outcome="ok")
+
+    assert histogram.get_count(outcome="ok") == 4
+    assert histogram.get_count(outcome="failed") == 0
+
+    snapshot = registry.get_snapshot()["run_seconds"]
+
+    assert snapshot["type"] == "histogram"
+    assert snapshot["series"] == [{
+        "labels": {"outcome": "ok"},
+        "count": 4,
+        "sum": 14.5,
+        "buckets": {"1": 2, "5": 3},
+    }]
+
+
+def test_render_prometheus(registry):
+    """
+    Test the Prometheus text of the metrics.
+    """
+    registry.counter("task_total", "Tasks.", ["task_type"]).inc(
+        task_type='a"b')
+    registry.histogram("run_seconds", "Run time.", [], [1]).observe(2)
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE task_total counter" in text
+    assert 'task_total{task_type="a\\"b"} 1' in text
+    assert "# TYPE run_seconds histogram" in text
+    assert 'run_seconds_bucket{le="1"} 0' in text
+    assert 'run_seconds_bucket{le="+Inf"} 1' in text
+    assert "run_seconds_sum 2" in text
+    assert "run_seconds_count 1" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_server(registry):
+    """
+    Test that the metrics are served at /metrics.
+    """
+    registry.counter("task_total", "Tasks.").inc()
+
+    server = await start_metrics_server("127.0.0.1", 0, registry)
+    port = server.sockets[0].getsockname()[1]
+
+    async def get(path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    try:
+        response = await get("/metrics")
+        assert response.startswith(b"HTTP/1.1 200 OK")
+        assert b"task_total 1" in response
+
+        response = await get("/other")
+        assert response.startswith(b"HTTP/1.1 404")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+def test_incomplete_metric():
+    """
+    Test that a metric that does not implement every
+    abstract method cannot be created.
+    """
+    class IncompleteMetric(Metric):  # pylint: disable=abstract-method
+        """
+        A metric without render.
+        """
+        def get_snapshot(self):
+            return []
+
+    with pytest.raises(TypeError):
+        IncompleteMetric("incomplete", "An incomplete metric")  # pylint: disable=abstract-class-instantiated # noqa: E501
+
+    with pytest.raises(TypeError):
+        Metric("base", "The base metric")  # pylint: disable=abstract-class-instantiated # noqa: E501
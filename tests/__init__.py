@@ -0,0 +1,5 @@
+# tests/__init__.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This is the __init__ module for the 'tests' package,
+the unit tests of the top level modules.
+"""
@@ -0,0 +1,265 @@
+# tests/current_runtime_test.py  # pylint: disable=duplicate-code # noqa: E501
+# pylint: disable=protected-access, redefined-outer-name
+"""
+This module contains unit tests for the lookup seeding of
+`current_runtime.initialize`, and the schema version and
+the fast start of `current_runtime.initialize_database`.
+"""
+from enum import Enum
+
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+import current_runtime
+import managers
+import pytest
+from config import TEST_DATABASE_URL
+from helpers.session_context import SessionContext
+from current_runtime import (get_schema_version, initialize_database,
+                             is_database_current)
+from models import (Base, DateGreaterThanFilter, DynaFlowTaskType, Pac,
+                    Role, SchemaVersion)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_engine():
+    """
+    Fixture that returns the engine of an empty
+    in-memory SQLite database.
+    """
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def session_local(db_engine):
+    """
+    Fixture that returns the sessionmaker of the database.
+    """
+    return sessionmaker(
+        bind=db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture(scope="function")
+def call_list(monkeypatch):
+    """
+    Fixture that records the seeding and the table checks
+    of `initialize_database` instead of running them.
+    """
+    call_list = []
+
+    async def initialize(session_context):  # pylint: disable=unused-argument # noqa: E501
+        call_list.append("initialize")
+
+    def create_missing_indexes(conn):  # pylint: disable=unused-argument
+        call_list.append("create_missing_indexes")
+
+    monkeypatch.setattr(current_runtime, "initialize", initialize)
+    monkeypatch.setattr(
+        current_runtime, "create_missing_indexes", create_missing_indexes)
+    return call_list
+
+
+async def _get_recorded_version(db_engine) -> str:
+    """
+    Returns the version of the SchemaVersion row.
+    """
+    async with db_engine.connect() as conn:
+        result = await conn.execute(select(SchemaVersion._version))
+        return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_fast_start_skips_current_database(
+    db_engine,
+    session_local,
+    call_list,
+    monkeypatch
+):
+    """
+    Test that with DATABASE_FAST_START a database with the
+    version of the code is neither checked nor seeded again,
+    and that without it, it is.
+    """
+    monkeypatch.setattr(current_runtime, "DATABASE_FAST_START", True)
+
+    await initialize_database(db_engine, session_local)
+
+    assert call_list == ["create_missing_indexes", "initialize"]
+    assert await _get_recorded_version(db_engine) == get_schema_version()
+    assert await is_database_current(
+        db_engine, get_schema_version()) is True
+
+    call_list.clear()
+    await initialize_database(db_engine, session_local)
+
+    assert call_list == []
+
+    monkeypatch.setattr(current_runtime, "DATABASE_FAST_START", False)
+    await initialize_database(db_engine, session_local)
+
+    assert call_list == ["create_missing_indexes", "initialize"]
+
+
+@pytest.mark.asyncio
+async def test_fast_start_seeds_changed_version(
+    db_engine,
+    session_local,
+    call_list,
+    monkeypatch
+):
+    """
+    Test that with DATABASE_FAST_START a database with
+    another version is checked and seeded again.
+    """
+    monkeypatch.setattr(current_runtime, "DATABASE_FAST_START", True)
+    await initialize_database(db_engine, session_local)
+
+    monkeypatch.setattr(
+        current_runtime, "SEED_VERSION", current_runtime.SEED_VERSION + 1)
+    call_list.clear()
+
+    assert await is_database_current(
+        db_engine, get_schema_version()) is False
+
+    await initialize_database(db_engine, session_local)
+
+    assert call_list == ["create_missing_indexes", "initialize"]
+    assert await _get_recorded_version(db_engine) == get_schema_version()
+
+
+@pytest.mark.asyncio
+async def test_missing_table_falls_through(
+    db_engine,
+    session_local,
+    monkeypatch
+):
+    """
+    Test that a database without the SchemaVersion table is
+    not current, and that the fast start then creates the
+    tables and seeds the lookup rows.
+    """
+    monkeypatch.setattr(current_runtime, "DATABASE_FAST_START", True)
+
+    assert await is_database_current(
+        db_engine, get_schema_version()) is False
+
+    await initialize_database(db_engine, session_local)
+
+    assert await _get_recorded_version(db_engine) == get_schema_version()
+
+    async with session_local() as session:
+        pac_list = await managers.PacManager(
+            SessionContext({}, session)).get_list()
+
+    assert len(pac_list) > 0
+
+
+@pytest.mark.asyncio
+async def test_initialize_seeds_each_table_with_one_insert(
+    db_engine,
+    session_local
+):
+    """
+    Test that the lookup rows of each table are seeded with
+    one INSERT, in the order of the lookup enum, and that a
+    second seeding inserts nothing.
+    """
+    async with db_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statement_list = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):  # pylint: disable=unused-argument # noqa: E501
+        statement_list.append(statement)
+
+    event.listen(
+        db_engine.sync_engine, "before_cursor_execute",
+        before_cursor_execute)
+
+    async with session_local() as session:
+        await current_runtime.initialize(SessionContext({}, session))
+        await session.commit()
+
+    insert_list = [x for x in statement_list if x.startswith("INSERT")]
+    for model in [Pac, Role, DateGreaterThanFilter, DynaFlowTaskType]:
+        assert len([
+            x for x in insert_list
+            if x.startswith(f"INSERT INTO {model.__tablename__} ")
+        ]) == 1
+
+    async with session_local() as session:
+        role_list = await managers.RoleManager(
+            SessionContext({}, session)).get_list()
+
+    assert sorted(
+        (x.display_order, x.lookup_enum_name) for x in role_list) == [
+            (index, x.value) for index, x in enumerate(managers.RoleEnum)]
+    assert len({x.code for x in role_list}) == len(role_list)
+    for role in role_list:
+        assert role.last_change_code == 1
+        assert role.insert_utc_date_time.year > 1753
+        assert role.last_update_utc_date_time == role.insert_utc_date_time
+
+    statement_list.clear()
+    async with session_local() as session:
+        await current_runtime.initialize(SessionContext({}, session))
+        await session.commit()
+
+    assert [x for x in statement_list if x.startswith("INSERT")] == []
+
+
+def test_get_schema_version_changes(monkeypatch):
+    """
+    Test that the version is stable, and changes with a
+    column, an index, a lookup enum or the seed version.
+    """
+    version = get_schema_version()
+
+    assert get_schema_version() == version
+
+    table = Base.metadata.sorted_tables[0]
+    column = list(table.columns)[-1]
+    with monkeypatch.context() as patch:
+        patch.setattr(column, "nullable", not column.nullable)
+
+        assert get_schema_version() != version
+
+    index = next(
+        index
+        for table in Base.metadata.sorted_tables
+        for index in table.indexes)
+    with monkeypatch.context() as patch:
+        patch.setattr(index, "name", f"{index.name}_new")
+
+        assert get_schema_version() != version
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            managers, "NewLookupEnum",
+            Enum("NewLookupEnum", {"UNKNOWN": "Unknown"}),
+            raising=False)
+
+        assert get_schema_version() != version
+
+    enum_class = managers.PacEnum
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            managers, "PacEnum",
+            Enum("PacEnum", {
+                **{x.name: x.value for x in enum_class},
+                "NEW_PAC": "NewPac",
+            }))
+
+        assert get_schema_version() != version
+
+    with monkeypatch.context() as patch:
+        patch.setattr(current_runtime, "SEED_VERSION", -1)
+
+        assert get_schema_version() != version
+
+    assert get_schema_version() == version
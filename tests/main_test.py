@@ -0,0 +1,48 @@
+# tests/main_test.py  # pylint: disable=duplicate-code # noqa: E501
+"""
+This module contains unit tests for the endpoints
+of the `main` module.
+"""
+from httpx import AsyncClient
+
+import pytest
+from apis.fs_farm_api.v1_0.endpoints.tests import test_constants
+from helpers.api_token import ApiToken
+from main import app
+
+
+@pytest.mark.asyncio
+async def test_read_database_pools():
+    """
+    Test that the pool statistics of the API engines are
+    returned for a valid API key.
+    """
+    test_api_key = ApiToken.create_token({}, 1)
+
+    async with AsyncClient(
+        app=app, base_url=test_constants.TEST_DOMAIN
+    ) as ac:
+        response = await ac.get(
+            "/health/database-pools",
+            headers={'API_KEY': test_api_key})
+
+    assert response.status_code == 200
+    assert "api" in response.json()
+    assert "dyna_flow" not in response.json()
+    assert "pool_class" in response.json()["api"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{}, {'API_KEY': 'xxx'}])
+async def test_read_database_pools_unauthorized(headers):
+    """
+    Test that the pool statistics need a valid API key.
+    """
+    async with AsyncClient(
+        app=app, base_url=test_constants.TEST_DOMAIN
+    ) as ac:
+        response = await ac.get(
+            "/health/database-pools",
+            headers=headers)
+
+    assert response.status_code == 401